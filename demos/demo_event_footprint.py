@@ -0,0 +1,155 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+ Description:
+ Benchmark for Event construction - measures per-event construction time
+ and retained memory for THREAD and CORELET events.
+ Log:
+ v1.0.0 : Initial implementation
+=============================================================================
+"""
+
+# =============================================================================
+# IMPORTS
+# =============================================================================
+# Standard Library
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any
+
+# Project imports
+import basefunctions
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+DEFAULT_COUNT = 200_000
+DEFAULT_ROUNDS = 3
+BENCHMARK_EVENT_TYPE = "_footprint_benchmark"
+
+
+# =============================================================================
+# CLASSES
+# =============================================================================
+
+
+class FootprintHandler(basefunctions.EventHandler):
+    """Handler registered so CORELET events resolve their corelet metadata."""
+
+    def handle(self, event: basefunctions.Event, context: basefunctions.EventContext) -> basefunctions.EventResult:
+        return basefunctions.EventResult.business_result(event.event_id, True, None)
+
+
+# =============================================================================
+# FUNCTIONS
+# =============================================================================
+
+
+def parse_arguments() -> dict[str, Any]:
+    """
+    Parse CLI arguments.
+
+    Returns
+    -------
+    dict[str, Any]
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Event construction cost and memory footprint")
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=DEFAULT_COUNT,
+        help=f"Events created per measurement (default: {DEFAULT_COUNT})",
+    )
+    parser.add_argument(
+        "--rounds",
+        type=int,
+        default=DEFAULT_ROUNDS,
+        help=f"Timing rounds, the best one is reported (default: {DEFAULT_ROUNDS})",
+    )
+    return vars(parser.parse_args())
+
+
+def measure_construction(exec_mode: str, count: int, rounds: int) -> float:
+    """
+    Measure the best construction time per event over several rounds.
+
+    Parameters
+    ----------
+    exec_mode : str
+        Execution mode of the created events
+    count : int
+        Events created per round
+    rounds : int
+        Number of rounds
+
+    Returns
+    -------
+    float
+        Microseconds per event
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for index in range(count):
+            basefunctions.Event(BENCHMARK_EVENT_TYPE, exec_mode, event_data=index)
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+
+def measure_footprint(exec_mode: str, count: int, touch_ids: bool) -> float:
+    """
+    Measure memory retained per live event.
+
+    Parameters
+    ----------
+    exec_mode : str
+        Execution mode of the created events
+    count : int
+        Events kept alive during the measurement
+    touch_ids : bool
+        Read event_id of every event (as publishing does) before measuring
+
+    Returns
+    -------
+    float
+        Bytes per event
+    """
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    events = [basefunctions.Event(BENCHMARK_EVENT_TYPE, exec_mode, event_data=None) for _ in range(count)]
+    if touch_ids:
+        for event in events:
+            event.event_id
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    # The list holding the events is not part of an event's footprint
+    retained -= events.__sizeof__()
+    return retained / count
+
+
+def main() -> None:
+    """
+    Run the benchmark and print one line per execution mode.
+    """
+    args = parse_arguments()
+    basefunctions.EventFactory().register_event_type(BENCHMARK_EVENT_TYPE, FootprintHandler)
+
+    print(f"Event construction, {args['count']:,} events, best of {args['rounds']} rounds")
+    print(f"{'mode':<10}{'us/event':>10}{'bytes/event':>14}{'with event_id':>16}")
+    for exec_mode in (basefunctions.EXECUTION_MODE_THREAD, basefunctions.EXECUTION_MODE_CORELET):
+        micros = measure_construction(exec_mode, args["count"], args["rounds"])
+        footprint = measure_footprint(exec_mode, args["count"], touch_ids=False)
+        touched = measure_footprint(exec_mode, args["count"], touch_ids=True)
+        print(f"{exec_mode:<10}{micros:>10.2f}{footprint:>14.0f}{touched:>16.0f}")
+
+
+if __name__ == "__main__":
+    main()
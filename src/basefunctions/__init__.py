@@ -236,33 +236,56 @@ from basefunctions.events.event_exceptions import (
     EventConnectionError,
     EventExecutionError,
     EventShutdownError,
+    EventCancelledError,
+    EventDependencyError,
+    EventQueueFullError,
     InvalidEventError,
     NoHandlerAvailableError,
 )
-from basefunctions.events.event_context import EventContext
+from basefunctions.events.event_context import CancellationToken, EventContext
 from basefunctions.events.event import (
     Event,
     EXECUTION_MODE_SYNC,
     EXECUTION_MODE_THREAD,
     EXECUTION_MODE_CORELET,
     EXECUTION_MODE_CMD,
+    EXECUTION_MODE_ASYNC,
 )
 from basefunctions.events.event_handler import (
     EventHandler,
+    BatchEventHandler,
     EventResult,
     DefaultCmdHandler,
     CoreletHandle,
     CoreletForwardingHandler,
+    MapChunkHandler,
     register_internal_handlers,
 )
 
+from basefunctions.events.deadline_scheduler import DeadlineHandle, DeadlineScheduler, get_deadline_scheduler
+from basefunctions.events.event_queue import (
+    EventQueue,
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_REJECT,
+    QUEUE_POLICY_DROP_LOWEST,
+    QUEUE_POLICY_DROP_OLDEST,
+)
+from basefunctions.events.thread_autoscaler import ThreadAutoscaler
 from basefunctions.events.timer_thread import TimerThread
 
 # Event Management
 from basefunctions.events.event_factory import EventFactory
+from basefunctions.events.event_future import EventFuture
+from basefunctions.events.event_group import EventGroup
+from basefunctions.events.event_schedule import EventSchedule
+from basefunctions.events.result_store import ResultStore
+from basefunctions.events.event_metrics import EventMetrics, LatencyHistogram
+from basefunctions.events.event_tracer import EventTracer, get_event_tracer
 
 # Worker System
 from basefunctions.events.corelet_worker import CoreletWorker, worker_main
+from basefunctions.events.shared_memory_transport import DEFAULT_SHARED_MEMORY_THRESHOLD
+from basefunctions.events.corelet_pool import CoreletPool
 
 from basefunctions.events.event_bus import (
     EventBus,
@@ -491,13 +514,33 @@ __all__ = [
     # Messaging Framework
     "Event",
     "EventHandler",
+    "BatchEventHandler",
     "EventContext",
+    "CancellationToken",
     "EventResult",
     "DefaultCmdHandler",
     "CoreletForwardingHandler",
+    "MapChunkHandler",
     "register_internal_handlers",
     "TimerThread",
+    "DeadlineScheduler",
+    "DeadlineHandle",
+    "get_deadline_scheduler",
+    "EventQueue",
+    "QUEUE_POLICY_BLOCK",
+    "QUEUE_POLICY_REJECT",
+    "QUEUE_POLICY_DROP_LOWEST",
+    "QUEUE_POLICY_DROP_OLDEST",
+    "ThreadAutoscaler",
     "EventFactory",
+    "EventFuture",
+    "EventGroup",
+    "EventSchedule",
+    "ResultStore",
+    "EventMetrics",
+    "LatencyHistogram",
+    "EventTracer",
+    "get_event_tracer",
     "EventBus",
     "CoreletHandle",
     "DEFAULT_TIMEOUT",
@@ -508,16 +551,22 @@ __all__ = [
     "INTERNAL_SHUTDOWN_EVENT",
     "CoreletWorker",
     "worker_main",
+    "CoreletPool",
+    "DEFAULT_SHARED_MEMORY_THRESHOLD",
     "EventValidationError",
     "EventExecutionError",
     "EventConnectionError",
     "InvalidEventError",
     "EventShutdownError",
+    "EventCancelledError",
+    "EventDependencyError",
+    "EventQueueFullError",
     "NoHandlerAvailableError",
     "EXECUTION_MODE_SYNC",
     "EXECUTION_MODE_THREAD",
     "EXECUTION_MODE_CORELET",
     "EXECUTION_MODE_CMD",
+    "EXECUTION_MODE_ASYNC",
     # Progress Tracking
     "ProgressTracker",
     "AliveProgressTracker",
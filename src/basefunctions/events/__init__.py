@@ -24,14 +24,17 @@ from basefunctions.events.event import (
     EXECUTION_MODE_THREAD,
     EXECUTION_MODE_CORELET,
     EXECUTION_MODE_CMD,
+    EXECUTION_MODE_ASYNC,
 )
-from basefunctions.events.event_context import EventContext
+from basefunctions.events.event_context import CancellationToken, EventContext
 from basefunctions.events.event_handler import (
     EventHandler,
+    BatchEventHandler,
     EventResult,
     DefaultCmdHandler,
     CoreletHandle,
     CoreletForwardingHandler,
+    MapChunkHandler,
     register_internal_handlers,
 )
 
@@ -46,6 +49,12 @@ from basefunctions.events.event_bus import (
     INTERNAL_SHUTDOWN_EVENT,
 )
 from basefunctions.events.event_factory import EventFactory
+from basefunctions.events.event_future import EventFuture, as_completed
+from basefunctions.events.event_group import EventGroup
+from basefunctions.events.event_schedule import EventSchedule
+from basefunctions.events.result_store import ResultStore
+from basefunctions.events.event_metrics import EventMetrics, LatencyHistogram
+from basefunctions.events.event_tracer import EventTracer, get_event_tracer
 
 # Rate Limiting
 from basefunctions.events.ticked_rate_limiter import (
@@ -56,8 +65,26 @@ from basefunctions.events.ticked_rate_limiter import (
 
 # Worker System
 from basefunctions.events.corelet_worker import CoreletWorker, worker_main
+from basefunctions.events.corelet_pool import CoreletPool
+from basefunctions.events.shared_memory_transport import (
+    SharedMemoryEnvelope,
+    DEFAULT_SHARED_MEMORY_THRESHOLD,
+    encode_message,
+    decode_message,
+    unlink_segments,
+    sweep_segments,
+)
 
 # Timer Support
+from basefunctions.events.deadline_scheduler import DeadlineHandle, DeadlineScheduler, get_deadline_scheduler
+from basefunctions.events.event_queue import (
+    EventQueue,
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_REJECT,
+    QUEUE_POLICY_DROP_LOWEST,
+    QUEUE_POLICY_DROP_OLDEST,
+)
+from basefunctions.events.thread_autoscaler import ThreadAutoscaler
 from basefunctions.events.timer_thread import TimerThread
 
 # Event Exceptions
@@ -66,6 +93,9 @@ from basefunctions.events.event_exceptions import (
     EventConnectionError,
     EventExecutionError,
     EventShutdownError,
+    EventCancelledError,
+    EventDependencyError,
+    EventQueueFullError,
     InvalidEventError,
     NoHandlerAvailableError,
 )
@@ -77,15 +107,27 @@ __all__ = [
     # Event Core
     "Event",
     "EventContext",
+    "CancellationToken",
     "EventHandler",
+    "BatchEventHandler",
     "EventResult",
     "DefaultCmdHandler",
     "CoreletHandle",
     "CoreletForwardingHandler",
+    "MapChunkHandler",
     "register_internal_handlers",
     # Event Management
     "EventBus",
     "EventFactory",
+    "EventFuture",
+    "EventGroup",
+    "EventSchedule",
+    "ResultStore",
+    "EventMetrics",
+    "LatencyHistogram",
+    "EventTracer",
+    "get_event_tracer",
+    "as_completed",
     "DEFAULT_TIMEOUT",
     "DEFAULT_RETRY_COUNT",
     "DEFAULT_PRIORITY",
@@ -99,13 +141,32 @@ __all__ = [
     # Worker System
     "CoreletWorker",
     "worker_main",
+    "CoreletPool",
+    "SharedMemoryEnvelope",
+    "DEFAULT_SHARED_MEMORY_THRESHOLD",
+    "encode_message",
+    "decode_message",
+    "unlink_segments",
+    "sweep_segments",
     # Timer Support
+    "DeadlineHandle",
+    "DeadlineScheduler",
+    "get_deadline_scheduler",
+    "EventQueue",
+    "QUEUE_POLICY_BLOCK",
+    "QUEUE_POLICY_REJECT",
+    "QUEUE_POLICY_DROP_LOWEST",
+    "QUEUE_POLICY_DROP_OLDEST",
+    "ThreadAutoscaler",
     "TimerThread",
     # Event Exceptions
     "EventValidationError",
     "EventConnectionError",
     "EventExecutionError",
     "EventShutdownError",
+    "EventCancelledError",
+    "EventDependencyError",
+    "EventQueueFullError",
     "InvalidEventError",
     "NoHandlerAvailableError",
     # Execution Modes
@@ -113,4 +174,5 @@ __all__ = [
     "EXECUTION_MODE_THREAD",
     "EXECUTION_MODE_CORELET",
     "EXECUTION_MODE_CMD",
+    "EXECUTION_MODE_ASYNC",
 ]
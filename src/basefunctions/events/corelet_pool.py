@@ -0,0 +1,946 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Corelet process pool served by a single multiplexing dispatcher thread
+
+  Log:
+  v1.5 : Sampled events are traced (pickle, pipe send, unpickle and corelet spans)
+  v1.4 : cancel() removes pending events
+  v1.3 : Corelet recycling by task count and RSS
+  v1.2 : Configurable start method, module preloading and prewarming
+  v1.1 : Pipelined in-flight window and batched messages per corelet
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import heapq
+import importlib
+import multiprocessing
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from multiprocessing.connection import Connection, wait
+
+import basefunctions
+from basefunctions.events.corelet_worker import CORELET_RETIREMENT_NOTICE
+from basefunctions.events.event_tracer import SPAN_PIPE_SEND, get_event_tracer
+from basefunctions.events.shared_memory_transport import (
+    decode_message,
+    encode_message,
+    sweep_segments,
+    unlink_segments,
+)
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+SHUTDOWN_ACK_TIMEOUT = 5.0
+PROCESS_JOIN_TIMEOUT = 2.0
+DEFAULT_CORELET_WINDOW = 1
+DEFAULT_CORELET_BATCH_SIZE = 1
+# Unconsumed bytes allowed in a corelet input pipe. Keeping pipelined messages
+# below the kernel pipe buffer guarantees the dispatcher never blocks in send()
+# while the corelet is blocked sending a result.
+PIPELINE_BUFFER_BYTES = 16 * 1024
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class _PoolRequest:
+    """
+    Corelet event waiting for or being processed by a pooled corelet.
+    """
+
+    __slots__ = ("event", "callback", "sequence", "attempt", "isolated", "last_exception", "last_failure")
+
+    def __init__(
+        self,
+        event: basefunctions.Event,
+        callback: Callable[[basefunctions.EventResult], None],
+        sequence: int,
+    ) -> None:
+        self.event = event
+        self.callback = callback
+        self.sequence = sequence
+        self.attempt = 0
+        self.isolated = False
+        self.last_exception: Exception | None = None
+        self.last_failure: basefunctions.EventResult | None = None
+
+
+class _PoolMessage:
+    """
+    One pipe message sent to a corelet: a single event or a batch.
+    """
+
+    __slots__ = ("requests", "batched", "size", "segment_names", "deadline", "traced")
+
+    def __init__(
+        self,
+        requests: list[_PoolRequest],
+        batched: bool,
+        size: int,
+        segment_names: list[str],
+        traced: bool = False,
+    ) -> None:
+        self.requests = requests
+        self.batched = batched
+        self.size = size
+        self.segment_names = segment_names
+        self.deadline = 0.0
+        # Sent as TracedMessage, the reply carries the corelet spans
+        self.traced = traced
+
+    def start(self) -> None:
+        """Start the deadline once the corelet begins processing this message."""
+        self.deadline = time.monotonic() + sum(request.event.timeout for request in self.requests)
+
+
+class _PooledCorelet:
+    """
+    Corelet process owned by the pool and its in-flight messages (FIFO).
+    """
+
+    __slots__ = ("handle", "in_flight", "retiring")
+
+    def __init__(self, handle: basefunctions.CoreletHandle) -> None:
+        self.handle = handle
+        self.in_flight: deque[_PoolMessage] = deque()
+        self.retiring = False
+
+    def in_flight_bytes(self) -> int:
+        return sum(message.size for message in self.in_flight)
+
+
+class CoreletPool:
+    """
+    Pool of corelet processes decoupled from EventBus worker threads.
+
+    Without a pool every worker thread owns one corelet and blocks on its
+    pipe while the corelet runs. The pool instead owns its corelets and a
+    single dispatcher thread that multiplexes all corelet pipes with
+    multiprocessing.connection.wait, so the number of processes and the
+    number of threads scale independently.
+
+    For many small tasks IPC latency dominates. Two options amortize it:
+    window lets the dispatcher keep several messages in flight per corelet
+    (the next message is already in the pipe when a result is returned), and
+    batch_size packs up to that many pending events into one message, which
+    the corelet answers with one list of results.
+
+    Attributes
+    ----------
+    size : int
+        Maximum number of corelet processes
+
+    Notes
+    -----
+    - Corelets are started on demand up to size and reused afterwards;
+      prewarm() starts them ahead of the first event
+    - With start_method="forkserver", corelets are forked from a server
+      that has basefunctions and preload_modules already imported, so a
+      new corelet starts in milliseconds
+    - Pending events are served in priority order (lower value first)
+    - Idle corelets are preferred; a busy corelet only receives more
+      messages while it has fewer than window in flight and the unconsumed
+      bytes stay below PIPELINE_BUFFER_BYTES
+    - Deadlines start when a message reaches the head of the corelet's
+      queue; a batch gets the sum of its events' timeouts
+    - With max_tasks or max_rss_mb, a corelet reaching the limit finishes
+      its in-flight messages and is replaced by a fresh process
+    - Timeouts, retries and crash recovery mirror the worker thread path:
+      a timed-out or crashed corelet is terminated and replaced, and the
+      event is retried up to event.max_retries times
+    - Callbacks run on the dispatcher thread and must not block
+
+    Examples
+    --------
+    >>> pool = CoreletPool(size=8, window=4, batch_size=16)
+    >>> pool.submit(event, callback=lambda result: print(result.success))
+    >>> pool.shutdown()
+
+    See Also
+    --------
+    EventBus : Uses the pool for CORELET events when corelet_pool_size is set
+    CoreletWorker : Worker process implementation
+    """
+
+    __slots__ = (
+        "_size",
+        "_window",
+        "_batch_size",
+        "_shared_memory_threshold",
+        "_context",
+        "_preload_modules",
+        "_prewarm_target",
+        "_max_tasks",
+        "_max_rss_mb",
+        "_retired_count",
+        "_corelets",
+        "_corelet_by_pipe",
+        "_pending",
+        "_counter",
+        "_lock",
+        "_wakeup_reader",
+        "_wakeup_writer",
+        "_wakeup_pending",
+        "_dispatcher",
+        "_stopping",
+        "_next_corelet_id",
+        "_logger",
+    )
+
+    def __init__(
+        self,
+        size: int | None = None,
+        shared_memory_threshold: int | None = None,
+        window: int = DEFAULT_CORELET_WINDOW,
+        batch_size: int = DEFAULT_CORELET_BATCH_SIZE,
+        start_method: str | None = None,
+        preload_modules: Sequence[str] | None = None,
+        max_tasks: int | None = None,
+        max_rss_mb: float | None = None,
+    ) -> None:
+        """
+        Initialize corelet pool.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum number of corelet processes. Defaults to os.cpu_count().
+        shared_memory_threshold : int, optional
+            Minimum buffer size in bytes sent via shared memory, None disables it.
+        window : int, optional
+            Maximum messages in flight per corelet. Default is 1 (strict
+            request/response).
+        batch_size : int, optional
+            Maximum events per message. Default is 1 (no batching).
+        start_method : str, optional
+            Process start method: "fork", "forkserver" or "spawn". Defaults
+            to the platform default.
+        preload_modules : Sequence[str], optional
+            Modules imported before corelets handle their first event, e.g.
+            handler modules or heavy dependencies such as pandas.
+        max_tasks : int, optional
+            Events after which a corelet is recycled. None disables it.
+        max_rss_mb : float, optional
+            Resident memory in MB above which a corelet is recycled. None
+            disables it.
+
+        Raises
+        ------
+        ValueError
+            If size, window or batch_size is not positive, or start_method
+            is not available on this platform.
+        ModuleNotFoundError
+            If a preload module cannot be imported.
+        """
+        if size is None:
+            size = os.cpu_count() or 1
+        if size <= 0:
+            raise ValueError("corelet pool size must be positive")
+        if window <= 0:
+            raise ValueError("corelet window must be positive")
+        if batch_size <= 0:
+            raise ValueError("corelet batch size must be positive")
+
+        self._size = size
+        self._window = window
+        self._batch_size = batch_size
+        self._shared_memory_threshold = shared_memory_threshold
+        self._context = multiprocessing.get_context(start_method)
+        self._preload_modules = tuple(preload_modules or ())
+        self._prewarm_target = 0
+        self._max_tasks = max_tasks
+        self._max_rss_mb = max_rss_mb
+        self._retired_count = 0
+        self._corelets: list[_PooledCorelet] = []
+        self._corelet_by_pipe: dict[Connection, _PooledCorelet] = {}
+        self._pending: list[tuple[int, int, _PoolRequest]] = []
+        self._counter = 0
+        self._lock = threading.Lock()
+        self._wakeup_reader, self._wakeup_writer = multiprocessing.Pipe(duplex=False)
+        self._wakeup_pending = False
+        self._dispatcher: threading.Thread | None = None
+        self._stopping = False
+        self._next_corelet_id = 0
+        self._logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+        # Import preload modules where corelets inherit or start from them:
+        # forked corelets share the parent's modules, a forkserver imports
+        # them once and forks every corelet from that warm process.
+        for module in self._preload_modules:
+            importlib.import_module(module)
+        if self._context.get_start_method() == "forkserver":
+            self._context.set_forkserver_preload(["basefunctions", *self._preload_modules])
+
+    @property
+    def size(self) -> int:
+        """Maximum number of corelet processes."""
+        return self._size
+
+    # =============================================================================
+    # PUBLIC API
+    # =============================================================================
+
+    def submit(
+        self,
+        event: basefunctions.Event,
+        callback: Callable[[basefunctions.EventResult], None],
+    ) -> None:
+        """
+        Queue an event for execution on a pooled corelet.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Corelet event to execute
+        callback : Callable[[EventResult], None]
+            Called on the dispatcher thread with the final result after retries
+
+        Raises
+        ------
+        EventShutdownError
+            If the pool is shutting down.
+        """
+        with self._lock:
+            if self._stopping:
+                raise basefunctions.EventShutdownError("CoreletPool is shutting down")
+            self._counter += 1
+            request = _PoolRequest(event, callback, self._counter)
+            heapq.heappush(self._pending, (event.priority, self._counter, request))
+            self._ensure_dispatcher()
+            # One wakeup byte per dispatcher round is enough
+            notify = not self._wakeup_pending
+            self._wakeup_pending = True
+        if notify:
+            self._wakeup()
+
+    def prewarm(self, count: int | None = None) -> None:
+        """
+        Start corelet processes ahead of the first event.
+
+        Corelets are started on the dispatcher thread, so the call returns
+        immediately. Events submitted meanwhile are served as soon as a
+        corelet is up.
+
+        Parameters
+        ----------
+        count : int, optional
+            Number of corelets to keep started, capped at size. Defaults to size.
+
+        Raises
+        ------
+        ValueError
+            If count is not positive.
+        EventShutdownError
+            If the pool is shutting down.
+        """
+        if count is not None and count <= 0:
+            raise ValueError("prewarm count must be positive")
+        with self._lock:
+            if self._stopping:
+                raise basefunctions.EventShutdownError("CoreletPool is shutting down")
+            self._prewarm_target = min(self._size if count is None else count, self._size)
+            self._ensure_dispatcher()
+        self._wakeup()
+
+    def cancel(self, event_id: str) -> bool:
+        """
+        Remove a pending event and complete it with EventCancelledError.
+
+        Events already sent to a corelet are not interrupted.
+
+        Parameters
+        ----------
+        event_id : str
+            ID of the submitted event
+
+        Returns
+        -------
+        bool
+            True if the event was pending and has been removed
+        """
+        with self._lock:
+            for index, (_, _, request) in enumerate(self._pending):
+                if request.event.event_id == event_id:
+                    self._pending[index] = self._pending[-1]
+                    self._pending.pop()
+                    heapq.heapify(self._pending)
+                    break
+            else:
+                return False
+
+        error = basefunctions.EventCancelledError(f"Event {event_id} cancelled")
+        self._complete(request, basefunctions.EventResult.exception_result(event_id, error))
+        return True
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """
+        Finish outstanding events, then stop all corelet processes.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum seconds to wait for the dispatcher thread. None waits forever.
+        """
+        with self._lock:
+            self._stopping = True
+            dispatcher = self._dispatcher
+        self._wakeup()
+
+        if dispatcher is not None:
+            dispatcher.join(timeout=timeout)
+        else:
+            self._stop_corelets()
+
+        if dispatcher is None or not dispatcher.is_alive():
+            self._wakeup_reader.close()
+            self._wakeup_writer.close()
+
+    def set_shared_memory_threshold(self, threshold: int | None) -> None:
+        """
+        Set shared memory transport threshold for corelets started afterwards.
+
+        Parameters
+        ----------
+        threshold : int or None
+            Minimum buffer size in bytes sent via shared memory, None disables it
+        """
+        self._shared_memory_threshold = threshold
+
+    def get_corelet_count(self) -> int:
+        """
+        Get number of running corelet processes in the pool.
+
+        Returns
+        -------
+        int
+            Number of corelet processes
+        """
+        with self._lock:
+            return len(self._corelets)
+
+    def get_metrics(self) -> dict[str, int]:
+        """
+        Get pool metrics.
+
+        Returns
+        -------
+        dict[str, int]
+            - size: Maximum number of corelets
+            - corelets: Running corelet processes
+            - busy: Corelets processing an event
+            - in_flight: Events sent to corelets and not yet answered
+            - pending: Events waiting for a free corelet
+            - retired: Corelets recycled after reaching a limit
+        """
+        with self._lock:
+            return {
+                "size": self._size,
+                "corelets": len(self._corelets),
+                "busy": sum(1 for corelet in self._corelets if corelet.in_flight),
+                "in_flight": sum(len(message.requests) for corelet in self._corelets for message in corelet.in_flight),
+                "pending": len(self._pending),
+                "retired": self._retired_count,
+            }
+
+    # =============================================================================
+    # DISPATCHER
+    # =============================================================================
+
+    def _ensure_dispatcher(self) -> None:
+        """
+        Start the dispatcher thread on first use (caller holds the lock).
+        """
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="CoreletPoolDispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def _dispatch_loop(self) -> None:
+        """
+        Dispatcher thread: assign pending events and multiplex corelet pipes.
+        """
+        try:
+            while True:
+                self._assign_pending()
+                self._prewarm_corelets()
+
+                with self._lock:
+                    busy = [corelet for corelet in self._corelets if corelet.in_flight]
+                    if self._stopping and not busy and not self._pending:
+                        break
+
+                ready = wait(
+                    [corelet.handle.output_pipe for corelet in busy] + [self._wakeup_reader],
+                    timeout=self._next_timeout(busy),
+                )
+                for connection in ready:
+                    if connection is self._wakeup_reader:
+                        self._drain_wakeups()
+                    else:
+                        self._receive(self._corelet_by_pipe[connection])
+
+                self._expire_deadlines()
+        except Exception as e:
+            self._logger.error("Corelet pool dispatcher failed: %s", str(e))
+            self._fail_outstanding(e)
+        finally:
+            self._stop_corelets()
+
+    def _assign_pending(self) -> None:
+        """
+        Send pending events to corelets, starting corelets up to size.
+
+        Idle corelets are served first; busy corelets are filled up to the
+        in-flight window afterwards.
+        """
+        saturated: set[int] = set()
+        while True:
+            with self._lock:
+                if not self._pending:
+                    return
+                corelet = self._select_corelet(saturated)
+                if corelet is None and self._active_count() >= self._size:
+                    return
+                requests = [heapq.heappop(self._pending)[2]]
+                while (
+                    len(requests) < self._batch_size
+                    and self._pending
+                    and not requests[0].isolated
+                    and not self._pending[0][2].isolated
+                ):
+                    requests.append(heapq.heappop(self._pending)[2])
+
+            if corelet is None:
+                corelet = self._start_corelet()
+            elif not corelet.in_flight and not corelet.handle.process.is_alive():
+                # Corelet exited on its own (idle timeout) - replace it
+                self._remove_corelet(corelet, terminate=False)
+                corelet = self._start_corelet()
+
+            if not self._send(corelet, requests):
+                saturated.add(id(corelet))
+
+    def _prewarm_corelets(self) -> None:
+        """
+        Start corelets until the prewarm target is reached.
+        """
+        while True:
+            with self._lock:
+                if self._stopping or self._active_count() >= self._prewarm_target:
+                    return
+            self._start_corelet()
+
+    def _select_corelet(self, saturated: set[int]) -> _PooledCorelet | None:
+        """
+        Pick the corelet for the next message (caller holds the lock).
+
+        Returns an idle corelet, None if a new corelet should be started, or
+        the least loaded corelet with room in its window. Returns None as well
+        when nothing can be assigned and the pool is full.
+        """
+        active = [corelet for corelet in self._corelets if not corelet.retiring]
+        for corelet in active:
+            if not corelet.in_flight:
+                return corelet
+        if len(active) < self._size:
+            return None
+        candidates = [
+            corelet for corelet in active if len(corelet.in_flight) < self._window and id(corelet) not in saturated
+        ]
+        return min(candidates, key=lambda corelet: len(corelet.in_flight), default=None)
+
+    def _active_count(self) -> int:
+        """
+        Number of corelets accepting new messages (caller holds the lock).
+
+        Retiring corelets only finish their in-flight messages, so their
+        replacements may already be started.
+        """
+        return sum(1 for corelet in self._corelets if not corelet.retiring)
+
+    def _send(self, corelet: _PooledCorelet, requests: list[_PoolRequest]) -> bool:
+        """
+        Send one message with the given requests to a corelet.
+
+        Returns
+        -------
+        bool
+            False if the message was not pipelined because the corelet's
+            input pipe is too full; the requests are requeued.
+        """
+        batched = len(requests) > 1
+        payload = [request.event for request in requests] if batched else requests[0].event
+        tracer = get_event_tracer()
+        trace_event = requests[0].event
+        traced = tracer.enabled and tracer.is_sampled(trace_event)
+        try:
+            if traced:
+                data, segment_names = tracer.encode(payload, trace_event, corelet.handle.shared_memory_threshold)
+            else:
+                data, segment_names = encode_message(payload, corelet.handle.shared_memory_threshold)
+        except Exception as e:
+            if batched:
+                # Fail only the unpicklable events of the batch, requeue the others
+                for request in requests:
+                    try:
+                        pickle.dumps(request.event)
+                    except Exception as event_error:
+                        result = basefunctions.EventResult.exception_result(request.event.event_id, event_error)
+                        self._complete(request, result)
+                    else:
+                        self._requeue(request)
+                return True
+            # Unpicklable event - no retry can fix this
+            event = requests[0].event
+            self._complete(requests[0], basefunctions.EventResult.exception_result(event.event_id, e))
+            return True
+
+        if corelet.in_flight and corelet.in_flight_bytes() + len(data) > PIPELINE_BUFFER_BYTES:
+            unlink_segments(segment_names)
+            for request in requests:
+                self._requeue(request)
+            return False
+
+        message = _PoolMessage(requests, batched, len(data), segment_names, traced)
+        with self._lock:
+            corelet.in_flight.append(message)
+        if len(corelet.in_flight) == 1:
+            message.start()
+        try:
+            started = time.perf_counter_ns() if traced else 0
+            corelet.handle.input_pipe.send(data)
+            if traced:
+                tracer.add_span(SPAN_PIPE_SEND, trace_event, started)
+        except (BrokenPipeError, EOFError, OSError) as e:
+            self._logger.warning("Failed to send event to corelet (PID: %s): %s", corelet.handle.process.pid, str(e))
+            self._fail_corelet(corelet, e)
+        return True
+
+    def _receive(self, corelet: _PooledCorelet) -> None:
+        """
+        Receive the reply to the oldest in-flight message of a corelet.
+        """
+        head = corelet.in_flight[0] if corelet.in_flight else None
+        try:
+            data = corelet.handle.output_pipe.recv()
+            if head is not None and head.traced:
+                reply = get_event_tracer().decode(data, head.requests[0].event)
+            else:
+                reply, _ = decode_message(data)
+        except (EOFError, OSError) as e:
+            self._logger.warning(
+                "Corelet process terminated unexpectedly (PID: %s): %s", corelet.handle.process.pid, str(e)
+            )
+            self._fail_corelet(corelet, basefunctions.EventExecutionError("Corelet process terminated unexpectedly"))
+            return
+        except Exception as e:
+            reply = e
+
+        if isinstance(reply, str) and reply == CORELET_RETIREMENT_NOTICE:
+            # Recycling limit reached: stop assigning, retire once drained
+            with self._lock:
+                corelet.retiring = True
+            return
+
+        with self._lock:
+            message = corelet.in_flight.popleft()
+            if corelet.in_flight:
+                corelet.in_flight[0].start()
+        unlink_segments(message.segment_names)
+
+        if isinstance(reply, Exception):
+            results = [reply] * len(message.requests)
+        elif message.batched:
+            results = reply if isinstance(reply, list) and len(reply) == len(message.requests) else None
+            if results is None:
+                error = basefunctions.EventExecutionError("Invalid batch reply from corelet")
+                results = [error] * len(message.requests)
+        else:
+            results = [reply]
+
+        for request, result in zip(message.requests, results):
+            if isinstance(result, basefunctions.EventResult) and result.success:
+                self._complete(request, result)
+            else:
+                self._retry_or_complete(request, result)
+
+        if corelet.retiring and not corelet.in_flight:
+            self._retire_corelet(corelet)
+
+    def _expire_deadlines(self) -> None:
+        """
+        Terminate corelets whose current message exceeded its timeout.
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [c for c in self._corelets if c.in_flight and c.in_flight[0].deadline <= now]
+
+        for corelet in expired:
+            message = corelet.in_flight[0]
+            timeout = sum(request.event.timeout for request in message.requests)
+            self._logger.warning(
+                "Corelet timeout after %ds (PID: %s) - terminating process",
+                timeout,
+                corelet.handle.process.pid,
+            )
+            self._fail_corelet(corelet, TimeoutError(f"No response from corelet within {timeout} seconds"))
+
+    def _fail_corelet(self, corelet: _PooledCorelet, exception: Exception) -> None:
+        """
+        Replace a broken or hung corelet and reschedule its in-flight events.
+
+        Events of the message being processed count a failed attempt; events
+        of messages queued behind it never started and are requeued as-is.
+        If the failed message was a batch, the culprit is unknown: its events
+        are requeued without counting an attempt and are sent individually
+        from now on.
+        """
+        with self._lock:
+            messages = list(corelet.in_flight)
+            corelet.in_flight.clear()
+        self._remove_corelet(corelet, terminate=True)
+
+        for index, message in enumerate(messages):
+            unlink_segments(message.segment_names)
+            for request in message.requests:
+                if index == 0 and not message.batched:
+                    self._retry_or_complete(request, exception)
+                else:
+                    request.isolated = request.isolated or (index == 0)
+                    self._requeue(request)
+
+    def _requeue(self, request: _PoolRequest) -> None:
+        """
+        Put a request back into the pending heap at its original position.
+        """
+        with self._lock:
+            heapq.heappush(self._pending, (request.event.priority, request.sequence, request))
+
+    def _retry_or_complete(
+        self,
+        request: _PoolRequest,
+        outcome: Exception | basefunctions.EventResult,
+    ) -> None:
+        """
+        Requeue a failed attempt or deliver the final result.
+
+        Parameters
+        ----------
+        request : _PoolRequest
+            Failed request
+        outcome : Exception | EventResult
+            Exception of the attempt or its unsuccessful business result
+        """
+        if isinstance(outcome, Exception):
+            request.last_exception = outcome
+        else:
+            request.last_failure = outcome
+
+        request.attempt += 1
+        event = request.event
+        if request.attempt < event.max_retries:
+            self._requeue(request)
+            return
+
+        # All retries exhausted - same precedence as EventBus._retry_with_timeout
+        if request.last_exception is not None:
+            result = basefunctions.EventResult.exception_result(event.event_id, request.last_exception)
+        elif request.last_failure is not None:
+            result = request.last_failure
+        else:
+            result = basefunctions.EventResult.business_result(
+                event.event_id,
+                False,
+                f"Event failed after {event.max_retries} attempts without result",
+            )
+        self._complete(request, result)
+
+    def _complete(self, request: _PoolRequest, result: basefunctions.EventResult) -> None:
+        """
+        Deliver the final result of a request to its callback.
+        """
+        try:
+            request.callback(result)
+        except Exception as e:
+            self._logger.error("Corelet pool callback failed: %s", str(e))
+
+    def _fail_outstanding(self, exception: Exception) -> None:
+        """
+        Complete all pending and in-flight requests with an exception result.
+        """
+        with self._lock:
+            requests = [request for _, _, request in self._pending]
+            for corelet in self._corelets:
+                for message in corelet.in_flight:
+                    requests.extend(message.requests)
+                corelet.in_flight.clear()
+            self._pending.clear()
+
+        for request in requests:
+            self._complete(request, basefunctions.EventResult.exception_result(request.event.event_id, exception))
+
+    def _next_timeout(self, busy: list[_PooledCorelet]) -> float | None:
+        """
+        Seconds until the nearest deadline of a busy corelet, None if idle.
+        """
+        if not busy:
+            return None
+        return max(0.0, min(corelet.in_flight[0].deadline for corelet in busy) - time.monotonic())
+
+    def _wakeup(self) -> None:
+        try:
+            self._wakeup_writer.send_bytes(b"\0")
+        except OSError:
+            pass
+
+    def _drain_wakeups(self) -> None:
+        with self._lock:
+            self._wakeup_pending = False
+        while self._wakeup_reader.poll():
+            self._wakeup_reader.recv_bytes()
+
+    # =============================================================================
+    # CORELET LIFECYCLE
+    # =============================================================================
+
+    def _start_corelet(self) -> _PooledCorelet:
+        """
+        Start a new corelet process and add it to the pool.
+        """
+        input_pipe_a, input_pipe_b = self._context.Pipe()
+        output_pipe_a, output_pipe_b = self._context.Pipe()
+
+        with self._lock:
+            corelet_id = self._next_corelet_id
+            self._next_corelet_id += 1
+
+        process = self._context.Process(
+            target=basefunctions.worker_main,
+            args=(
+                f"pool_corelet_{corelet_id}",
+                input_pipe_b,
+                output_pipe_b,
+                self._preload_modules,
+                self._max_tasks,
+                self._max_rss_mb,
+            ),
+            daemon=True,  # Safety: Auto-terminate on parent process exit
+        )
+        process.start()
+        input_pipe_b.close()
+        output_pipe_b.close()
+
+        handle = basefunctions.CoreletHandle(process, input_pipe_a, output_pipe_a, self._shared_memory_threshold)
+        corelet = _PooledCorelet(handle)
+        with self._lock:
+            self._corelets.append(corelet)
+            self._corelet_by_pipe[output_pipe_a] = corelet
+
+        self._logger.info("Created pool corelet process (PID: %d, Total: %d)", process.pid, len(self._corelets))
+        return corelet
+
+    def _remove_corelet(self, corelet: _PooledCorelet, terminate: bool) -> None:
+        """
+        Remove a corelet from the pool and release its process resources.
+        """
+        with self._lock:
+            if corelet in self._corelets:
+                self._corelets.remove(corelet)
+            self._corelet_by_pipe.pop(corelet.handle.output_pipe, None)
+
+        handle = corelet.handle
+        try:
+            if terminate and handle.process.is_alive():
+                handle.process.terminate()
+            handle.process.join(timeout=PROCESS_JOIN_TIMEOUT)
+            if handle.process.is_alive():
+                handle.process.kill()
+                handle.process.join(timeout=PROCESS_JOIN_TIMEOUT)
+        except Exception as e:
+            self._logger.error("Failed to stop corelet process: %s", str(e))
+
+        for pipe in (handle.input_pipe, handle.output_pipe):
+            try:
+                pipe.close()
+            except Exception:
+                pass
+
+        # Unlink shared memory segments the corelet left behind
+        if handle.process.pid is not None:
+            sweep_segments(handle.process.pid)
+
+    def _retire_corelet(self, corelet: _PooledCorelet) -> None:
+        """
+        Shut down a drained corelet that requested recycling.
+        """
+        handle = corelet.handle
+        try:
+            shutdown_event = basefunctions.Event(
+                basefunctions.INTERNAL_SHUTDOWN_EVENT,
+                event_exec_mode=basefunctions.EXECUTION_MODE_CORELET,
+            )
+            handle.input_pipe.send(encode_message(shutdown_event)[0])
+            terminate = False
+        except (BrokenPipeError, EOFError, OSError):
+            terminate = True
+        self._remove_corelet(corelet, terminate=terminate)
+
+        with self._lock:
+            self._retired_count += 1
+        self._logger.info("Recycled pool corelet (PID: %s)", handle.process.pid)
+
+    def _stop_corelets(self) -> None:
+        """
+        Send graceful shutdown to all corelets and release their resources.
+        """
+        with self._lock:
+            corelets = list(self._corelets)
+
+        for corelet in corelets:
+            handle = corelet.handle
+            try:
+                shutdown_event = basefunctions.Event(
+                    basefunctions.INTERNAL_SHUTDOWN_EVENT,
+                    event_exec_mode=basefunctions.EXECUTION_MODE_CORELET,
+                )
+                message, _ = encode_message(shutdown_event)
+                handle.input_pipe.send(message)
+                if handle.output_pipe.poll(timeout=SHUTDOWN_ACK_TIMEOUT):
+                    handle.output_pipe.recv()
+            except (BrokenPipeError, EOFError, OSError):
+                pass
+            except Exception as e:
+                self._logger.error("Corelet pool shutdown failed: %s", str(e))
+            self._remove_corelet(corelet, terminate=True)
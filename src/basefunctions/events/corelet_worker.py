@@ -13,6 +13,14 @@
   Corelet worker with queue-based health monitoring
 
   Log:
+  v1.10 : Sampled events (TracedMessage) reply with unpickle, handler and pickle spans
+  v1.9 : Register the handler named by corelet_meta (map chunks name the mapped type)
+  v1.8 : Batch messages pass events of a BatchEventHandler type to handle_batch()
+  v1.7 : Handlers see the event deadline via context.cancel_token
+  v1.6 : Recycling by task count and RSS (max_tasks, max_rss_mb)
+  v1.5 : worker_main imports preload modules before the first event
+  v1.4 : Batched messages (list of events in, list of results out)
+  v1.3 : Shared memory transport for large events and results
   v1.2 : Logging audit - removed debug calls
   v1.1 : Improved exception handling with specific exception types
   v1.0 : Initial implementation
@@ -33,13 +41,23 @@ import sys
 import threading
 import time
 import traceback
+from collections.abc import Sequence
 from datetime import datetime
 from multiprocessing.connection import Connection
+from typing import Any
 
 import psutil
 
 import basefunctions
 from basefunctions.utils.logging import get_logger, get_logger
+from basefunctions.events.shared_memory_transport import decode_message, encode_message
+from basefunctions.events.event_tracer import (
+    SPAN_HANDLER,
+    SPAN_PICKLE,
+    SPAN_UNPICKLE,
+    TracedMessage,
+    make_span,
+)
 
 # -------------------------------------------------------------
 # DEFINITIONS
@@ -47,6 +65,9 @@ from basefunctions.utils.logging import get_logger, get_logger
 HANDLER_CACHE_CLEANUP_INTERVAL = 300.0  # 5 minutes
 MAX_CACHED_HANDLERS = 50  # Limit handler cache size
 IDLE_TIMEOUT = 600.0  # 10 minutes - terminate worker after inactivity
+# Sent ahead of the result that reached a recycling limit; the parent then
+# drains the worker and stops it with the regular shutdown event.
+CORELET_RETIREMENT_NOTICE = "__corelet_retirement__"
 
 # -------------------------------------------------------------
 # VARIABLE DEFINITIONS
@@ -74,7 +95,8 @@ class CoreletWorker:
     The worker receives pickled events via input pipe, dynamically loads and
     executes the appropriate handler, and sends results back via output pipe.
     Handlers can be auto-registered via corelet_meta or pre-registered in the
-    worker's EventFactory.
+    worker's EventFactory. A message may also carry a list of events (batch);
+    the worker then replies with the list of results in one message.
 
     Attributes
     ----------
@@ -90,6 +112,12 @@ class CoreletWorker:
         Worker loop control flag
     _registered_handlers : set
         Set of registered event types for tracking
+    _shared_memory_threshold : int or None
+        Shared memory threshold of the last received event, reused for results
+    _max_tasks : int or None
+        Events after which the worker asks to be recycled
+    _max_rss_mb : float or None
+        Resident set size in MB above which the worker asks to be recycled
 
     Notes
     -----
@@ -106,7 +134,9 @@ class CoreletWorker:
     **Process Lifecycle:**
     - Created on first corelet event for a thread
     - Runs until shutdown event received
-    - WARNING: Currently no automatic cleanup (see process leak issue)
+    - Recycling: once max_tasks or max_rss_mb is reached, the worker sends
+      CORELET_RETIREMENT_NOTICE before the result and keeps serving until
+      the parent sends the shutdown event
 
     **Signal Handling:**
     - SIGTERM: Graceful shutdown
@@ -143,6 +173,11 @@ class CoreletWorker:
         "_signal_handlers_setup",
         "_registered_handlers",
         "_redirector",
+        "_shared_memory_threshold",
+        "_max_tasks",
+        "_max_rss_mb",
+        "_tasks_processed",
+        "_retiring",
     )
 
     def __init__(
@@ -150,6 +185,8 @@ class CoreletWorker:
         worker_id: str,
         input_pipe: Connection,
         output_pipe: Connection,
+        max_tasks: int | None = None,
+        max_rss_mb: float | None = None,
     ) -> None:
         """
         Initialize corelet worker for thread integration.
@@ -162,6 +199,10 @@ class CoreletWorker:
             Pipe for receiving business events.
         output_pipe : multiprocessing.Connection
             Pipe for sending business results.
+        max_tasks : int, optional
+            Events after which the worker asks to be recycled. None disables it.
+        max_rss_mb : float, optional
+            RSS in MB above which the worker asks to be recycled. None disables it.
         """
         self._worker_id = worker_id
         self._input_pipe = input_pipe
@@ -172,6 +213,11 @@ class CoreletWorker:
         self._last_handler_cleanup = time.time()
         self._signal_handlers_setup = False
         self._registered_handlers = set()
+        self._shared_memory_threshold = None
+        self._max_tasks = max_tasks
+        self._max_rss_mb = max_rss_mb
+        self._tasks_processed = 0
+        self._retiring = False
 
     def run(self) -> None:
         """
@@ -208,11 +254,23 @@ class CoreletWorker:
                     # Poll for events with 5 second timeout (allows signal checking)
                     if self._input_pipe.poll(timeout=5.0):
                         pickled_data = self._input_pipe.recv()
-                        event = pickle.loads(pickled_data)
+                        # Large buffers may arrive via shared memory; reply the same way
+                        event, spans = self._decode_event(pickled_data)
 
                         # Update activity timestamp
                         last_activity_time = time.time()
 
+                        # Batch message - one result list per message
+                        if isinstance(event, list):
+                            batch, event = event, None
+                            started = time.perf_counter_ns() if spans is not None else 0
+                            results = self._process_batch(batch, context)
+                            if spans is not None:
+                                spans.append(make_span(SPAN_HANDLER, batch[0], started))
+                            self._check_retirement(len(batch))
+                            self._send_batch_results(results, batch[0], spans)
+                            continue
+
                         # Check for shutdown event - graceful termination
                         if event.event_type == basefunctions.INTERNAL_SHUTDOWN_EVENT:
                             shutdown_result = basefunctions.EventResult.business_result(
@@ -223,8 +281,12 @@ class CoreletWorker:
                             break
 
                         # Process event and send result
+                        started = time.perf_counter_ns() if spans is not None else 0
                         result = self._process_event(event, context)
-                        self._send_result(event, result)
+                        if spans is not None:
+                            spans.append(make_span(SPAN_HANDLER, event, started))
+                        self._check_retirement(1)
+                        self._send_result(event, result, spans)
                     else:
                         # No event - check idle timeout
                         idle_time = time.time() - last_activity_time
@@ -268,6 +330,29 @@ class CoreletWorker:
                     )
                 self._send_result(event, result)
 
+    def _decode_event(self, data: bytes) -> tuple[Any, list[tuple] | None]:
+        """
+        Decode an event message, unwrapping the TracedMessage of a sampled event.
+
+        Parameters
+        ----------
+        data : bytes
+            Message bytes from the input pipe.
+
+        Returns
+        -------
+        tuple[Any, list[tuple] | None]
+            Event or batch of events, and the spans to return with the
+            reply (None if the event is not traced).
+        """
+        message, self._shared_memory_threshold = decode_message(data)
+        if message.__class__ is not TracedMessage:
+            return message, None
+        started = time.perf_counter_ns()
+        message, self._shared_memory_threshold = decode_message(message.payload)
+        trace_event = message[0] if isinstance(message, list) else message
+        return message, [make_span(SPAN_UNPICKLE, trace_event, started)]
+
     def _process_event(
         self,
         event: basefunctions.Event,
@@ -291,13 +376,17 @@ class CoreletWorker:
         try:
             # Auto-register handler if not known and corelet_meta available
             # This enables dynamic handler loading when first corelet event arrives
-            if not self._is_handler_registered(event.event_type) and event.corelet_meta:
+            # (map chunks carry the meta of the mapped event type)
+            if event.corelet_meta and not self._is_handler_registered(event.corelet_meta["event_type"]):
                 self._register_from_meta(event.corelet_meta)
 
             # Get handler from cache or create via factory
             # Handlers are cached per-thread to avoid repeated instantiation
             handler = self._get_handler(event.event_type, context)
 
+            # Expose the deadline so handlers can stop before the parent kills the process
+            context.cancel_token = basefunctions.CancellationToken(time.monotonic() + event.timeout)
+
             # Execute handler with context for thread-local state access
             return handler.handle(event, context)
 
@@ -305,6 +394,136 @@ class CoreletWorker:
             self._logger.error("Failed to process event: %s", str(e))
             raise
 
+    def _process_batch(
+        self,
+        events: list[basefunctions.Event],
+        context: basefunctions.EventContext,
+    ) -> list[basefunctions.EventResult]:
+        """
+        Process a batch of events, converting handler errors into results.
+
+        Parameters
+        ----------
+        events : list[basefunctions.Event]
+            Events of one batch message.
+        context : basefunctions.EventContext
+            Context with thread_local_data for handler cache.
+
+        Returns
+        -------
+        list[basefunctions.EventResult]
+            One result per event, in batch order.
+        """
+        results: list[basefunctions.EventResult | None] = [None] * len(events)
+
+        # Events of batch handler types are handled together, one call per type
+        batch_groups: dict[str, list[int]] = {}
+        for index, event in enumerate(events):
+            if self._get_batch_handler(event, context) is not None:
+                batch_groups.setdefault(event.event_type, []).append(index)
+        for indices in batch_groups.values():
+            group = [events[index] for index in indices]
+            for index, result in zip(indices, self._process_batch_group(group, context)):
+                results[index] = result
+
+        for index, event in enumerate(events):
+            if results[index] is not None:
+                continue
+            try:
+                result = self._process_event(event, context)
+            except Exception as e:
+                result = basefunctions.EventResult.exception_result(event.event_id, e)
+            result.event_id = event.event_id
+            results[index] = result
+        return results
+
+    def _get_batch_handler(
+        self,
+        event: basefunctions.Event,
+        context: basefunctions.EventContext,
+    ) -> basefunctions.BatchEventHandler | None:
+        """
+        Get the handler of an event if it is a BatchEventHandler.
+
+        Lookup errors return None; _process_event() then reports them per event.
+        """
+        try:
+            if event.corelet_meta and not self._is_handler_registered(event.corelet_meta["event_type"]):
+                self._register_from_meta(event.corelet_meta)
+            handler = self._get_handler(event.event_type, context)
+        except Exception:
+            return None
+        return handler if isinstance(handler, basefunctions.BatchEventHandler) else None
+
+    def _process_batch_group(
+        self,
+        events: list[basefunctions.Event],
+        context: basefunctions.EventContext,
+    ) -> list[basefunctions.EventResult]:
+        """
+        Process events of one BatchEventHandler type with a single handle_batch() call.
+
+        Parameters
+        ----------
+        events : list[basefunctions.Event]
+            Events of the same type, in batch order.
+        context : basefunctions.EventContext
+            Context with thread_local_data for handler cache.
+
+        Returns
+        -------
+        list[basefunctions.EventResult]
+            One result per event, in batch order.
+        """
+        try:
+            handler = self._get_handler(events[0].event_type, context)
+            context.cancel_token = basefunctions.CancellationToken(
+                time.monotonic() + max(event.timeout for event in events)
+            )
+            results = handler.handle_batch(events, context)
+            if len(results) != len(events):
+                raise ValueError(f"handle_batch returned {len(results)} results for {len(events)} events")
+        except Exception as e:
+            self._logger.error("Failed to process batch: %s", str(e))
+            results = [basefunctions.EventResult.exception_result(event.event_id, e) for event in events]
+
+        for event, result in zip(events, results):
+            result.event_id = event.event_id
+        return list(results)
+
+    def _check_retirement(self, task_count: int) -> None:
+        """
+        Count processed events and request recycling once a limit is reached.
+
+        The notice is sent before the pending result, so the parent knows the
+        worker is retiring by the time it reads that result.
+
+        Parameters
+        ----------
+        task_count : int
+            Events processed since the last call.
+        """
+        self._tasks_processed += task_count
+        if self._retiring:
+            return
+
+        reason = None
+        if self._max_tasks is not None and self._tasks_processed >= self._max_tasks:
+            reason = f"{self._tasks_processed} tasks processed"
+        elif self._max_rss_mb is not None:
+            rss_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+            if rss_mb > self._max_rss_mb:
+                reason = f"RSS {rss_mb:.0f} MB exceeds {self._max_rss_mb} MB"
+        if reason is None:
+            return
+
+        self._retiring = True
+        self._logger.info("Worker %s requests recycling: %s", self._worker_id, reason)
+        try:
+            self._output_pipe.send(encode_message(CORELET_RETIREMENT_NOTICE)[0])
+        except (BrokenPipeError, OSError):
+            pass
+
     def _is_handler_registered(self, event_type: str) -> bool:
         """
         Check if handler is registered for event type.
@@ -351,7 +570,12 @@ class CoreletWorker:
             self._logger.error(error_msg)
             raise RuntimeError(error_msg) from e
 
-    def _send_result(self, event: basefunctions.Event, result: basefunctions.EventResult) -> None:
+    def _send_result(
+        self,
+        event: basefunctions.Event,
+        result: basefunctions.EventResult,
+        spans: list[tuple] | None = None,
+    ) -> None:
         """
         Send business result via output pipe.
 
@@ -361,20 +585,63 @@ class CoreletWorker:
             Original event for ID tracking.
         result : basefunctions.EventResult
             Result from handler execution with success flag, data and optional exception.
+        spans : list[tuple], optional
+            Spans of a traced event, sent along with the result.
         """
         try:
             # Ensure result has correct event ID
             result.event_id = event.event_id
 
-            # Send result directly
-            pickled_result = pickle.dumps(result)
-            self._output_pipe.send(pickled_result)
+            # Send result directly (large buffers via shared memory if the parent enabled it)
+            self._output_pipe.send(self._encode_reply(result, event, spans))
 
         except BrokenPipeError:
             pass
         except Exception as e:
             self._logger.error("Failed to send result: %s", str(e))
 
+    def _send_batch_results(
+        self,
+        results: list[basefunctions.EventResult],
+        trace_event: basefunctions.Event | None = None,
+        spans: list[tuple] | None = None,
+    ) -> None:
+        """
+        Send the results of a batch message via output pipe.
+
+        Parameters
+        ----------
+        results : list[basefunctions.EventResult]
+            Results in batch order.
+        trace_event : basefunctions.Event, optional
+            First event of the batch, spans of a traced batch belong to it.
+        spans : list[tuple], optional
+            Spans of a traced batch, sent along with the results.
+        """
+        try:
+            self._output_pipe.send(self._encode_reply(results, trace_event, spans))
+        except BrokenPipeError:
+            pass
+        except Exception as e:
+            self._logger.error("Failed to send batch results: %s", str(e))
+            # Report the failure per event instead of leaving the batch unanswered
+            try:
+                failed = [basefunctions.EventResult.exception_result(result.event_id, e) for result in results]
+                self._output_pipe.send(encode_message(failed)[0])
+            except Exception:
+                pass
+
+    def _encode_reply(self, reply: Any, event: basefunctions.Event | None, spans: list[tuple] | None) -> bytes:
+        """
+        Encode a reply, as TracedMessage with the spans and a pickle span if the event is traced.
+        """
+        if spans is None:
+            return encode_message(reply, self._shared_memory_threshold)[0]
+        started = time.perf_counter_ns()
+        payload, _ = encode_message(reply, self._shared_memory_threshold)
+        spans.append(make_span(SPAN_PICKLE, event, started))
+        return pickle.dumps(TracedMessage(payload, spans))
+
     def _setup_signal_handlers(self) -> None:
         """
         Setup signal handlers for graceful shutdown.
@@ -471,6 +738,9 @@ def worker_main(
     worker_id: str,
     input_pipe: Connection,
     output_pipe: Connection,
+    preload_modules: Sequence[str] = (),
+    max_tasks: int | None = None,
+    max_rss_mb: float | None = None,
 ) -> None:
     """
     Main entry point for worker process.
@@ -483,6 +753,13 @@ def worker_main(
         Pipe for receiving business events.
     output_pipe : multiprocessing.Connection
         Pipe for sending business results.
+    preload_modules : Sequence[str], optional
+        Modules imported before the first event. Already imported modules
+        (fork, forkserver preload) cost nothing.
+    max_tasks : int, optional
+        Events after which the worker asks to be recycled.
+    max_rss_mb : float, optional
+        RSS in MB above which the worker asks to be recycled.
     """
     logger = get_logger(__name__)
 
@@ -491,8 +768,14 @@ def worker_main(
         logger.error("Invalid parameters for worker %s", worker_id)
         sys.exit(1)
 
+    for module in preload_modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning("Failed to preload module %s: %s", module, str(e))
+
     try:
-        worker = CoreletWorker(worker_id, input_pipe, output_pipe)
+        worker = CoreletWorker(worker_id, input_pipe, output_pipe, max_tasks, max_rss_mb)
         worker.run()
     except Exception as e:
         logger.error("Worker process failed: %s", str(e))
@@ -0,0 +1,273 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Shared deadline scheduler running all timeouts on a single thread
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import heapq
+import os
+import threading
+import time
+from collections.abc import Callable
+
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+DEADLINE_PENDING = 0
+DEADLINE_FIRED = 1
+DEADLINE_CANCELLED = 2
+
+# Rebuild the heap once cancelled entries dominate it
+COMPACT_MIN_SIZE = 64
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+_shared_scheduler: DeadlineScheduler | None = None
+_shared_scheduler_lock = threading.Lock()
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class DeadlineHandle:
+    """
+    Registered deadline returned by DeadlineScheduler.schedule().
+
+    Attributes
+    ----------
+    deadline : float
+        Expiry time on the time.monotonic() clock
+    callback : Callable[[], None]
+        Function called on the scheduler thread at expiry
+    """
+
+    __slots__ = ("deadline", "callback", "state", "_scheduler")
+
+    def __init__(self, deadline: float, callback: Callable[[], None], scheduler: DeadlineScheduler) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.state = DEADLINE_PENDING
+        self._scheduler = scheduler
+
+    @property
+    def cancelled(self) -> bool:
+        """True if the deadline was cancelled before it expired."""
+        return self.state == DEADLINE_CANCELLED
+
+    @property
+    def fired(self) -> bool:
+        """True if the callback was (or is being) called."""
+        return self.state == DEADLINE_FIRED
+
+    def cancel(self) -> bool:
+        """
+        Cancel the deadline.
+
+        Returns
+        -------
+        bool
+            True if the deadline was pending and will not fire.
+        """
+        return self._scheduler.cancel(self)
+
+
+class DeadlineScheduler:
+    """
+    Single-thread scheduler for many short-lived deadlines.
+
+    Deadlines live in a binary heap ordered by expiry time and are served by
+    one daemon thread that sleeps until the nearest deadline. Registering a
+    deadline is O(log n); cancelling is O(1) because cancelled entries are
+    only marked and dropped lazily when they reach the top of the heap.
+
+    Notes
+    -----
+    - The thread is started on the first schedule() call
+    - Callbacks run on the scheduler thread and must return quickly
+    - A callback never runs after cancel() returned True
+    - The heap is rebuilt when more than half of it is cancelled entries
+
+    Examples
+    --------
+    >>> scheduler = get_deadline_scheduler()
+    >>> handle = scheduler.schedule(5.0, lambda: print("expired"))
+    >>> handle.cancel()
+    True
+
+    See Also
+    --------
+    TimerThread : Handler timeout enforcement built on the shared scheduler
+    """
+
+    __slots__ = ("_heap", "_counter", "_cancelled", "_condition", "_thread", "_logger")
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, DeadlineHandle]] = []
+        self._counter = 0
+        self._cancelled = 0
+        self._condition = threading.Condition(threading.Lock())
+        self._thread: threading.Thread | None = None
+        self._logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> DeadlineHandle:
+        """
+        Register a callback to run after delay seconds.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds until expiry. Values <= 0 expire immediately.
+        callback : Callable[[], None]
+            Function called on the scheduler thread at expiry
+
+        Returns
+        -------
+        DeadlineHandle
+            Handle to cancel the deadline
+        """
+        handle = DeadlineHandle(time.monotonic() + delay, callback, self)
+        with self._condition:
+            self._counter += 1
+            heapq.heappush(self._heap, (handle.deadline, self._counter, handle))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="DeadlineScheduler", daemon=True)
+                self._thread.start()
+            # Only wake the thread if the new deadline is the nearest one
+            if self._heap[0][2] is handle:
+                self._condition.notify()
+        return handle
+
+    def cancel(self, handle: DeadlineHandle) -> bool:
+        """
+        Cancel a pending deadline.
+
+        Parameters
+        ----------
+        handle : DeadlineHandle
+            Handle returned by schedule()
+
+        Returns
+        -------
+        bool
+            True if the deadline was pending, False if it already fired or
+            was cancelled before.
+        """
+        with self._condition:
+            if handle.state != DEADLINE_PENDING:
+                return False
+            handle.state = DEADLINE_CANCELLED
+            self._cancelled += 1
+            if self._cancelled > COMPACT_MIN_SIZE and self._cancelled * 2 > len(self._heap):
+                self._compact()
+            return True
+
+    def pending_count(self) -> int:
+        """
+        Get number of deadlines that have neither fired nor been cancelled.
+
+        Returns
+        -------
+        int
+            Number of pending deadlines
+        """
+        with self._condition:
+            return len(self._heap) - self._cancelled
+
+    def _run(self) -> None:
+        """
+        Scheduler thread: sleep until the nearest deadline and fire it.
+        """
+        while True:
+            with self._condition:
+                handle = self._next_expired()
+                while handle is None:
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._condition.wait(timeout)
+                    handle = self._next_expired()
+
+            try:
+                handle.callback()
+            except Exception as e:
+                self._logger.error("Deadline callback failed: %s", str(e))
+
+    def _next_expired(self) -> DeadlineHandle | None:
+        """
+        Pop the next expired pending deadline and mark it fired (caller holds the lock).
+        """
+        now = time.monotonic()
+        while self._heap:
+            deadline, _, handle = self._heap[0]
+            if handle.state == DEADLINE_CANCELLED:
+                heapq.heappop(self._heap)
+                self._cancelled -= 1
+                continue
+            if deadline > now:
+                return None
+            heapq.heappop(self._heap)
+            handle.state = DEADLINE_FIRED
+            return handle
+        return None
+
+    def _compact(self) -> None:
+        """
+        Drop cancelled entries and restore the heap (caller holds the lock).
+        """
+        self._heap = [entry for entry in self._heap if entry[2].state == DEADLINE_PENDING]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
+
+
+def get_deadline_scheduler() -> DeadlineScheduler:
+    """
+    Get the process-wide deadline scheduler.
+
+    Returns
+    -------
+    DeadlineScheduler
+        Shared scheduler instance, created on first use
+    """
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            _shared_scheduler = DeadlineScheduler()
+        return _shared_scheduler
+
+
+def _reset_after_fork() -> None:
+    # The scheduler thread does not survive fork, and inherited deadlines
+    # target threads of the parent. A forked child starts with a fresh one.
+    global _shared_scheduler, _shared_scheduler_lock
+    _shared_scheduler = None
+    _shared_scheduler_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -13,6 +13,11 @@
   Event classes for the messaging system with corelet factory methods
 
   Log:
+  v1.8 : Added partition_key for key-affinity routing
+  v1.7 : Added created_ns for latency measurement
+  v1.6 : Compact events: lazy 64-bit IDs and timestamps, corelet meta cached per event type
+  v1.5 : Added depends_on/inject_results for dependency-aware publishing
+  v1.4 : Added EXECUTION_MODE_ASYNC for coroutine handlers
   v1.3 : Logging audit - added warning before raises
   v1.0 : Initial implementation
   v1.1 : Added progress tracking support (progress_tracker, progress_steps)
@@ -25,9 +30,12 @@ from __future__ import annotations
 # -------------------------------------------------------------
 # IMPORTS
 # -------------------------------------------------------------
+from collections.abc import Hashable
 from typing import Any, TYPE_CHECKING
-from datetime import datetime
-import uuid
+from datetime import datetime, timedelta
+import itertools
+import os
+import time
 from basefunctions.utils.logging import get_logger
 import basefunctions
 
@@ -42,18 +50,23 @@ EXECUTION_MODE_SYNC = "sync"
 EXECUTION_MODE_THREAD = "thread"
 EXECUTION_MODE_CORELET = "corelet"
 EXECUTION_MODE_CMD = "cmd"
+EXECUTION_MODE_ASYNC = "async"
 
 VALID_EXECUTION_MODES = {
     EXECUTION_MODE_SYNC,
     EXECUTION_MODE_THREAD,
     EXECUTION_MODE_CORELET,
     EXECUTION_MODE_CMD,
+    EXECUTION_MODE_ASYNC,
 }
 
 DEFAULT_PRIORITY = 5
 DEFAULT_TIMEOUT = 30
 DEFAULT_MAX_RETRIES = 3
 
+# Event IDs: random per-process prefix in the high bits, sequence number in the low bits
+EVENT_ID_SEQUENCE_BITS = 40
+
 # -------------------------------------------------------------
 # VARIABLE DEFINITIONS
 # -------------------------------------------------------------
@@ -84,11 +97,11 @@ class Event:
     Attributes
     ----------
     event_id : str
-        Unique identifier (UUID) for this event instance
+        Unique identifier for this event instance (16 hex digits)
     event_type : str
         Event type identifier used for handler routing
     event_exec_mode : str
-        Execution mode: "sync", "thread", "corelet", or "cmd"
+        Execution mode: "sync", "thread", "corelet", "cmd", or "async"
     event_name : Optional[str]
         Human-readable name for the event
     event_source : Optional[Any]
@@ -104,18 +117,28 @@ class Event:
     priority : int
         Execution priority (0-10, higher = more important)
     timestamp : datetime
-        Timestamp when event was created
+        Local time when event was created
     corelet_meta : Optional[dict]
         Handler metadata for corelet registration
     progress_tracker : Optional[ProgressTracker]
         Progress tracker instance for automatic progress updates
     progress_steps : int
         Number of steps to advance progress tracker after event completion
+    depends_on : list | tuple
+        Event IDs (or EventFutures) that must complete before this event runs,
+        an empty tuple if there are none
+    inject_results : bool
+        Whether upstream result data is added to event_data when released
+    partition_key : Hashable | None
+        Key binding the event to one worker thread (and its corelet), None if unbound
 
     Notes
     -----
-    - Event IDs are automatically generated as UUIDs
-    - For corelet mode, corelet_meta is auto-populated from EventFactory
+    - Event IDs are 64-bit sequence numbers of the creating process (with a
+      random per-process prefix), formatted as hex string on first access
+    - The creation time is kept as integer and converted to a datetime on access
+    - For corelet mode, corelet_meta is auto-populated from EventFactory and
+      shared by all events of the type
     - Events are immutable after creation (enforced via __slots__)
     - Thread-safe when used with EventBus
     - Progress tracking is optional and integrated with EventBus
@@ -152,7 +175,7 @@ class Event:
     """
 
     __slots__ = (
-        "event_id",
+        "_event_id",
         "event_type",
         "event_exec_mode",
         "event_name",
@@ -162,10 +185,13 @@ class Event:
         "max_retries",
         "timeout",
         "priority",
-        "timestamp",
+        "_timestamp",
         "corelet_meta",
         "progress_tracker",
         "progress_steps",
+        "depends_on",
+        "inject_results",
+        "partition_key",
     )
 
     def __init__(
@@ -182,6 +208,9 @@ class Event:
         corelet_meta: dict | None = None,
         progress_tracker: ProgressTracker | None = None,
         progress_steps: int = 0,
+        depends_on: list[Any] | None = None,
+        inject_results: bool = False,
+        partition_key: Hashable | None = None,
     ):
         """
         Initialize a new event.
@@ -212,9 +241,21 @@ class Event:
             Progress tracker instance for automatic progress updates after event completion.
         progress_steps : int, optional
             Number of steps to advance progress tracker after event completion. Default is 0 (disabled).
+        depends_on : list, optional
+            Event IDs or EventFutures of published events. The EventBus holds
+            this event back until all of them completed and skips it with
+            EventDependencyError if one of them did not succeed.
+        inject_results : bool, optional
+            If True, event_data (None or a dict) gets the key "upstream_results"
+            with the result data of depends_on, in the same order. Default is False.
+        partition_key : Hashable, optional
+            Queued events (THREAD, CMD, CORELET) with the same key run on the
+            same worker thread, one at a time and in publish order, e.g. a
+            symbol or customer ID. Keyed CORELET events use the corelet of
+            that worker instead of the corelet pool. Default is None.
         """
-        # Generate unique event ID for tracking and correlation
-        self.event_id = str(uuid.uuid4())
+        # Unique event ID for tracking and correlation, formatted lazily (see event_id)
+        self._event_id: int | str = next(_event_ids)
         self.event_type = event_type
         self.event_exec_mode = event_exec_mode
         self.event_name = event_name
@@ -224,9 +265,13 @@ class Event:
         self.max_retries = max_retries
         self.timeout = timeout
         self.priority = priority
-        self.timestamp = datetime.now()
+        self._timestamp: int | datetime = time.time_ns()
         self.progress_tracker = progress_tracker
         self.progress_steps = progress_steps
+        # Shared empty tuple: no list allocated for events without dependencies
+        self.depends_on = list(depends_on) if depends_on else ()
+        self.inject_results = inject_results
+        self.partition_key = partition_key
 
         # Auto-populate corelet metadata for corelet execution mode
         # This allows corelet workers to dynamically load the correct handler class
@@ -242,6 +287,40 @@ class Event:
 
         self._validate_parameters()
 
+    @property
+    def event_id(self) -> str:
+        """Unique identifier of the event, formatted on first access."""
+        event_id = self._event_id
+        if event_id.__class__ is int:
+            event_id = self._event_id = f"{event_id:016x}"
+        return event_id
+
+    @event_id.setter
+    def event_id(self, event_id: str) -> None:
+        self._event_id = event_id
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time when the event was created."""
+        timestamp = self._timestamp
+        if timestamp.__class__ is int:
+            # Truncated to microseconds like datetime.now()
+            seconds, nanoseconds = divmod(timestamp, 1_000_000_000)
+            return datetime.fromtimestamp(seconds) + timedelta(microseconds=nanoseconds // 1000)
+        return timestamp
+
+    @timestamp.setter
+    def timestamp(self, timestamp: datetime) -> None:
+        self._timestamp = timestamp
+
+    @property
+    def created_ns(self) -> int:
+        """Creation time in nanoseconds since the epoch, like time.time_ns()."""
+        timestamp = self._timestamp
+        if timestamp.__class__ is int:
+            return timestamp
+        return int(timestamp.timestamp() * 1_000_000_000)
+
     def _validate_parameters(self) -> None:
         """
         Validate event parameters for correctness.
@@ -259,6 +338,10 @@ class Event:
             logger.warning("Event validation failed: invalid execution mode '%s'", self.event_exec_mode)
             raise ValueError(f"Invalid execution mode: {self.event_exec_mode}")
 
+        if self.inject_results and not (self.event_data is None or isinstance(self.event_data, dict)):
+            logger.warning("Event validation failed: inject_results requires dict event_data")
+            raise ValueError("inject_results requires event_data to be None or a dict")
+
     def __repr__(self) -> str:
         """
         Get detailed string representation for debugging.
@@ -276,3 +359,26 @@ class Event:
             f"timestamp={self.timestamp}, corelet_meta={self.corelet_meta}, "
             f"progress_steps={self.progress_steps})"
         )
+
+
+def _new_id_sequence() -> itertools.count:
+    """
+    Create the event ID sequence of this process.
+    """
+    # Random prefix per process, so IDs of forked or spawned processes do not collide
+    prefix = int.from_bytes(os.urandom(3), "big")
+    return itertools.count((prefix << EVENT_ID_SEQUENCE_BITS) + 1)
+
+
+# next() on itertools.count is atomic under the GIL
+_event_ids = _new_id_sequence()
+
+
+def _reset_after_fork() -> None:
+    # A forked child would continue the parent's sequence
+    global _event_ids
+    _event_ids = _new_id_sequence()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
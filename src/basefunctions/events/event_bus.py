@@ -18,8 +18,31 @@
   Features LRU-based result caching with smart cleanup:
   - Specific event_id requests consume results (remove from cache)
   - Bulk requests preserve results (LRU eviction handles memory)
+  - Results are kept in a lock-sharded ResultStore, optionally with a TTL
 
   Log:
+  v1.24 : Added key-affinity routing (Event.partition_key) to per-worker partition lanes
+  v1.23 : Added sampled event lifecycle tracing in Chrome trace format (enable_tracing, get_event_tracer)
+  v1.22 : Added per event type latency histograms and counters (enable_metrics, get_event_metrics)
+  v1.21 : Replaced output queue and result cache with a lock-sharded ResultStore (result_ttl, store_result=False)
+  v1.20 : Added delayed and periodic publishing (delay, publish_at, schedule_every) and retry backoff
+  v1.19 : Added queue_aging (priority aging of queued events) and per-priority queue wait metrics
+  v1.18 : Added group() for scoped publishing with per-group join and results
+  v1.17 : Added depends_on dependency tracking (dependents released as soon as upstream events complete)
+  v1.16 : Added map() with chunked, windowed, lazily streamed results
+  v1.15 : Coalesce queued events of BatchEventHandler types into handle_batch() calls
+  v1.14 : Added per-event-type concurrency limits (register_concurrency_limit)
+  v1.13 : Added autoscaling worker thread pool (min_threads/max_threads)
+  v1.12 : Added bounded input queue (max_queue_size, queue_policy, water marks)
+  v1.11 : Added cooperative cancellation (cancel(), EventContext cancel tokens)
+  v1.10 : Added max_tasks_per_corelet/max_rss_mb corelet recycling
+  v1.9 : Added prewarm_corelets/preload_modules/corelet_start_method for warm corelet pools
+  v1.8 : Added corelet_window/corelet_batch_size for pipelined and batched pool messaging
+  v1.7 : Added CoreletPool for corelet execution decoupled from worker threads
+  v1.6 : Added shared memory transport option for corelet payloads
+  v1.5 : Added EXECUTION_MODE_ASYNC with bus-owned event loop and publish_async()
+  v1.4 : Added future-based result delivery (publish(return_future=True), as_completed)
+  v1.3 : Added publish_many/publish_iter bulk publishing
   v1.2.2 : Logging audit - removed debug calls
   v1.2.1 : Fix get_results(join_before=True) to wait for rate-limited events
   v1.2 : Fix join() to wait for rate-limited events
@@ -33,15 +56,49 @@ from __future__ import annotations
 # -------------------------------------------------------------
 # IMPORTS
 # -------------------------------------------------------------
-from collections import OrderedDict
+import asyncio
+import heapq
+import inspect
+import random
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 import threading
 import queue
 import pickle
+from collections import deque
+from datetime import datetime
+from functools import partial
 import psutil
+from typing import Any
 import time
 from basefunctions.utils.logging import get_logger, get_logger
 import basefunctions
 from basefunctions.events.ticked_rate_limiter import TickedRateLimiter
+from basefunctions.events.event_future import EventFuture, as_completed
+from basefunctions.events.event_group import EventGroup
+from basefunctions.events.event_schedule import EventSchedule
+from basefunctions.events.result_store import ResultStore
+from basefunctions.events.event_metrics import EventMetrics
+from basefunctions.events.event_tracer import (
+    DEFAULT_MAX_SPANS,
+    SPAN_HANDLER,
+    SPAN_PUBLISH,
+    EventTracer,
+    get_event_tracer,
+)
+from basefunctions.events.deadline_scheduler import DeadlineHandle, get_deadline_scheduler
+from basefunctions.events.shared_memory_transport import sweep_segments
+from basefunctions.events.corelet_pool import CoreletPool
+from basefunctions.events.event import EXECUTION_MODE_CORELET, EXECUTION_MODE_THREAD
+from basefunctions.events.event_context import CancellationToken
+from basefunctions.events.event_queue import QUEUE_POLICIES, QUEUE_POLICY_BLOCK, EventQueue
+from basefunctions.events.thread_autoscaler import (
+    AUTOSCALE_INTERVAL,
+    DEFAULT_SCALE_COOLDOWN,
+    ThreadAutoscaler,
+    WorkerActivity,
+)
 
 # -------------------------------------------------------------
 # DEFINITIONS REGISTRY
@@ -53,9 +110,20 @@ from basefunctions.events.ticked_rate_limiter import TickedRateLimiter
 DEFAULT_TIMEOUT = 5
 DEFAULT_RETRY_COUNT = 3
 DEFAULT_PRIORITY = 5
+DEFAULT_PUBLISH_CHUNK_SIZE = 1000
 INTERNAL_CORELET_FORWARDING_EVENT = "_corelet_forwarding"
 INTERNAL_CMD_EXECUTION_EVENT = "_cmd_execution"
 INTERNAL_SHUTDOWN_EVENT = "_shutdown"
+INTERNAL_MAP_CHUNK_EVENT = "_map_chunk"
+# Chunks map() keeps in flight per worker thread (or pooled corelet) by default
+MAP_WINDOW_PER_WORKER = 2
+# Upper bound of a retry backoff delay in seconds by default
+DEFAULT_MAX_RETRY_DELAY = 30.0
+
+# event_data key of the upstream result data injected into dependent events
+DEPENDENCY_RESULTS_KEY = "upstream_results"
+# Execution modes whose queued events are coalesced for BatchEventHandler types
+_BATCH_EXEC_MODES = (EXECUTION_MODE_THREAD, EXECUTION_MODE_CORELET)
 
 # -------------------------------------------------------------
 # VARIABLE DEFINITIONS
@@ -72,6 +140,67 @@ get_logger(__name__)
 # -------------------------------------------------------------
 
 
+class _DependencyWait:
+    """
+    Event held back by the EventBus until its dependencies completed.
+    """
+
+    __slots__ = ("event", "remaining", "results")
+
+    def __init__(self, event: basefunctions.Event) -> None:
+        self.event = event
+        self.remaining: set[str] = set(event.depends_on)
+        self.results: dict[str, basefunctions.EventResult] = {}
+
+
+class _RetryBackoff:
+    """
+    Exponential backoff between retry attempts of an event type, with optional full jitter.
+    """
+
+    __slots__ = ("base_delay", "max_delay", "jitter")
+
+    def __init__(self, base_delay: float, max_delay: float, jitter: bool) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """
+        Get the seconds to wait before retry number attempt (1 = first retry).
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** min(attempt - 1, 64))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class _DiscardedResult:
+    """
+    Result sink registered as future of events published with store_result=False.
+
+    Keeps the event visible as pending (cancel(), depends_on) while its result
+    is dropped on completion.
+    """
+
+    __slots__ = ()
+
+    def done(self) -> bool:
+        return False
+
+    def set_result(self, result: basefunctions.EventResult) -> None:
+        pass
+
+
+_DISCARDED_RESULT = _DiscardedResult()
+
+
+def _task_partition_key(task: tuple[int, int, basefunctions.Event]) -> Any:
+    """
+    Partition key of an input queue task, None for unkeyed events.
+    """
+    # Malformed tasks are reported by the worker loop, not by the queue
+    return task[2].partition_key if len(task) == 3 else None
+
+
 @basefunctions.singleton
 class EventBus:
     """
@@ -90,16 +219,12 @@ class EventBus:
     ----------
     _num_threads : int
         Number of worker threads for async processing
-    _input_queue : queue.PriorityQueue
-        Priority queue for incoming events
-    _output_queue : queue.Queue
-        Queue for completed event results
+    _input_queue : EventQueue
+        Priority queue for incoming events, optionally bounded
     _worker_threads : List[threading.Thread]
         Pool of worker threads for async event processing
-    _result_list : OrderedDict
-        LRU cache for event results
-    _max_cached_results : int
-        Maximum number of cached results before LRU eviction
+    _result_store : ResultStore
+        Lock-sharded LRU cache for event results, bounded by max_results
     _event_factory : EventFactory
         Factory for creating and managing event handlers
     _progress_context : Dict[int, tuple]
@@ -112,6 +237,7 @@ class EventBus:
     - THREAD: Events processed asynchronously in worker thread pool
     - CORELET: Events forwarded to isolated worker processes
     - CMD: Special mode for subprocess command execution
+    - ASYNC: Coroutine handlers run concurrently on a bus-owned event loop thread
 
     **Internal Events:**
     - `_shutdown`: Graceful shutdown signal
@@ -168,24 +294,81 @@ class EventBus:
     __slots__ = (
         "_logger",
         "_input_queue",
-        "_output_queue",
         "_worker_threads",
         "_num_threads",
         "_next_thread_id",
         "_event_counter",
-        "_result_list",
+        "_result_store",
         "_publish_lock",
         "_sync_event_context",
         "_event_factory",
-        "_max_cached_results",
         "_initialized",
         "_progress_context",
         "_active_corelets",
         "_corelet_lock",
         "_ticked_rate_limiter",
+        "_futures",
+        "_future_lock",
+        "_async_loop",
+        "_async_thread",
+        "_async_context",
+        "_async_lock",
+        "_detached_count",
+        "_detached_cond",
+        "_shared_memory_threshold",
+        "_corelet_pool",
+        "_corelet_max_tasks",
+        "_corelet_max_rss_mb",
+        "_running_tokens",
+        "_cancelled_ids",
+        "_worker_activity",
+        "_autoscaler",
+        "_autoscale_thread",
+        "_autoscale_stop",
+        "_scaling_stopped",
+        "_concurrency_limits",
+        "_concurrency_in_flight",
+        "_parked_events",
+        "_concurrency_lock",
+        "_dependents",
+        "_waiting_events",
+        "_dependency_lock",
+        "_release_count",
+        "_delayed_events",
+        "_schedules",
+        "_timers_stopped",
+        "_release_queue",
+        "_release_thread",
+        "_release_lock",
+        "_release_closed",
+        "_retry_backoffs",
+        "_retry_attempts",
+        "_metrics",
+        "_run_started",
+        "_tracer",
     )
 
-    def __init__(self, num_threads: int | None = None) -> None:
+    def __init__(
+        self,
+        num_threads: int | None = None,
+        shared_memory_threshold: int | None = None,
+        corelet_pool_size: int | None = None,
+        corelet_window: int = 1,
+        corelet_batch_size: int = 1,
+        prewarm_corelets: int | None = None,
+        preload_modules: list[str] | None = None,
+        corelet_start_method: str | None = None,
+        max_tasks_per_corelet: int | None = None,
+        max_rss_mb: float | None = None,
+        max_queue_size: int | None = None,
+        queue_policy: str = QUEUE_POLICY_BLOCK,
+        queue_timeout: float | None = None,
+        min_threads: int | None = None,
+        max_threads: int | None = None,
+        scale_cooldown: float = DEFAULT_SCALE_COOLDOWN,
+        queue_aging: float | None = None,
+        result_ttl: float | None = None,
+    ) -> None:
         """
         Initialize EventBus singleton.
 
@@ -196,6 +379,70 @@ class EventBus:
             If None, auto-detects logical CPU core count.
             If EventBus is already initialized, a higher num_threads value
             will dynamically expand the worker thread pool.
+        shared_memory_threshold : int, optional
+            Minimum buffer size in bytes that corelet events and results
+            transfer via shared memory instead of the pipe (NumPy arrays,
+            DataFrame blocks, bytes). None keeps plain pipe transport.
+            See set_shared_memory_threshold().
+        corelet_pool_size : int, optional
+            Number of corelet processes in a shared CoreletPool. When set,
+            CORELET events are served by the pool and its dispatcher thread
+            instead of one corelet per worker thread, so worker threads stay
+            free for THREAD/CMD work. None keeps per-thread corelets.
+        corelet_window : int, optional
+            Messages in flight per pooled corelet (pipelining). Default is 1.
+        corelet_batch_size : int, optional
+            Maximum CORELET events per pooled corelet message. Default is 1.
+            Larger values amortize IPC latency for many small tasks.
+        prewarm_corelets : int, optional
+            Number of pooled corelets started at construction instead of on
+            first use. Creates a pool of this size if corelet_pool_size is
+            not set.
+        preload_modules : list[str], optional
+            Modules pooled corelets import before their first event (handler
+            modules, pandas, numpy, ...).
+        corelet_start_method : str, optional
+            Start method of pooled corelets: "fork", "forkserver" or "spawn".
+            With "forkserver" the server preloads basefunctions and
+            preload_modules, so new corelets start in milliseconds.
+            Defaults to the platform default.
+        max_tasks_per_corelet : int, optional
+            Events after which a corelet is recycled (shut down cleanly and
+            replaced). None disables task-count recycling.
+        max_rss_mb : float, optional
+            Resident memory in MB above which a corelet is recycled after
+            its current event. None disables memory recycling.
+        max_queue_size : int, optional
+            Maximum number of events waiting in the input queue. None keeps
+            the queue unbounded. Only applied on first construction.
+        queue_policy : str, optional
+            What publish() does when the input queue is full:
+            "block" (default) waits for space up to queue_timeout,
+            "reject" raises EventQueueFullError, "drop_lowest" and
+            "drop_oldest" evict a queued event, which then completes with
+            EventQueueFullError.
+        queue_timeout : float, optional
+            Seconds the "block" policy waits before raising
+            EventQueueFullError. None waits indefinitely.
+        min_threads : int, optional
+            Lower bound of an autoscaled worker pool. Requires max_threads.
+            Default is 1.
+        max_threads : int, optional
+            Enables autoscaling: worker threads are added up to max_threads
+            while events wait in the queue, and idle workers (with their
+            corelets) are retired down to min_threads. The pool starts with
+            num_threads, or min_threads if num_threads is None.
+        scale_cooldown : float, optional
+            Seconds a worker must be idle, and since the last growth, before
+            it is retired. Default is 30.
+        queue_aging : float, optional
+            Seconds of queue wait after which an event is served as if its
+            priority were one level better, so low-priority events cannot
+            starve. None (default) serves strictly by priority.
+        result_ttl : float, optional
+            Seconds a stored result is kept before it expires, unless the
+            event was published with its own result_ttl. None (default)
+            keeps results until they are consumed or evicted.
 
         Raises
         ------
@@ -216,22 +463,74 @@ class EventBus:
 
         if num_threads is not None and num_threads <= 0:
             raise ValueError("num_threads must be positive")
+        if shared_memory_threshold is not None and shared_memory_threshold <= 0:
+            raise ValueError("shared_memory_threshold must be positive")
+        if corelet_pool_size is not None and corelet_pool_size <= 0:
+            raise ValueError("corelet_pool_size must be positive")
+        if prewarm_corelets is not None and prewarm_corelets <= 0:
+            raise ValueError("prewarm_corelets must be positive")
+        if max_tasks_per_corelet is not None and max_tasks_per_corelet <= 0:
+            raise ValueError("max_tasks_per_corelet must be positive")
+        if max_rss_mb is not None and max_rss_mb <= 0:
+            raise ValueError("max_rss_mb must be positive")
+        if max_queue_size is not None and max_queue_size <= 0:
+            raise ValueError("max_queue_size must be positive")
+        if queue_policy not in QUEUE_POLICIES:
+            raise ValueError(f"queue_policy must be one of {', '.join(QUEUE_POLICIES)}")
+        if queue_timeout is not None and queue_timeout < 0:
+            raise ValueError("queue_timeout must not be negative")
+        if queue_aging is not None and queue_aging <= 0:
+            raise ValueError("queue_aging must be positive")
+        if result_ttl is not None and result_ttl <= 0:
+            raise ValueError("result_ttl must be positive")
+        if min_threads is not None and max_threads is None:
+            raise ValueError("min_threads requires max_threads")
+        if max_threads is not None:
+            min_threads = 1 if min_threads is None else min_threads
+            if min_threads <= 0:
+                raise ValueError("min_threads must be positive")
+            if max_threads < min_threads:
+                raise ValueError("max_threads must be >= min_threads")
+            if num_threads is None:
+                requested_threads = min_threads
+            elif not min_threads <= num_threads <= max_threads:
+                raise ValueError("num_threads must be between min_threads and max_threads")
+            if scale_cooldown < 0:
+                raise ValueError("scale_cooldown must not be negative")
+        if corelet_pool_size is None:
+            corelet_pool_size = prewarm_corelets
 
         # Smart init check for singleton pattern
         if hasattr(self, "_initialized") and self._initialized:
             # Already initialized: use public API to ensure minimum thread count
             # Note: Due to singleton pattern, __init__() is only called once.
             # Use ensure_thread_count() for dynamic thread pool expansion.
-            self.ensure_thread_count(requested_threads)
+            # An autoscaled pool is only resized on explicit num_threads.
+            if num_threads is not None or self._autoscaler is None:
+                self.ensure_thread_count(requested_threads)
+            if shared_memory_threshold is not None:
+                self.set_shared_memory_threshold(shared_memory_threshold)
+            if corelet_pool_size is not None and self._corelet_pool is None:
+                self._corelet_pool = self._create_corelet_pool(
+                    corelet_pool_size,
+                    corelet_window,
+                    corelet_batch_size,
+                    prewarm_corelets,
+                    preload_modules,
+                    corelet_start_method,
+                )
+            elif prewarm_corelets is not None and self._corelet_pool is not None:
+                self._corelet_pool.prewarm(prewarm_corelets)
             return
 
         self._logger = get_logger(f"{__name__}.{self.__class__.__name__}")
 
         self._num_threads = requested_threads
 
-        # Queue system
-        self._input_queue = queue.PriorityQueue()
-        self._output_queue = queue.Queue()
+        # Queue system (bounded input queue applies queue_policy when full)
+        # Keyed events go to the partition lane of one worker (added by _worker_loop)
+        self._input_queue = EventQueue(max_queue_size or 0, queue_policy, queue_timeout, queue_aging)
+        self._input_queue.partition_key = _task_partition_key
 
         # Rate limiting system
         self._ticked_rate_limiter = TickedRateLimiter(
@@ -240,20 +539,101 @@ class EventBus:
 
         # Threading system
         self._worker_threads: list[threading.Thread] = []
+        self._worker_activity: dict[int, WorkerActivity] = {}
         self._next_thread_id = 0
         self._event_counter = 0
 
-        # Response tracking system
-        self._max_cached_results = num_threads * 1000 if num_threads else 10000
-        self._result_list = OrderedDict()
+        # Autoscaling system (decision thread started after the initial workers)
+        self._autoscaler: ThreadAutoscaler | None = None
+        self._autoscale_thread: threading.Thread | None = None
+        self._autoscale_stop = threading.Event()
+        self._scaling_stopped = False
+        if max_threads is not None:
+            self._autoscaler = ThreadAutoscaler(min_threads, max_threads, scale_cooldown)
+
+        # Response tracking system (sharded, so result consumers do not contend with publishers)
+        self._result_store = ResultStore(num_threads * 1000 if num_threads else 10000, default_ttl=result_ttl)
         self._publish_lock = threading.RLock()
 
+        # Future-based result delivery (event_id -> EventFuture)
+        self._futures: dict[str, EventFuture] = {}
+        self._future_lock = threading.Lock()
+
+        # Asyncio execution system (event loop thread started on first ASYNC event)
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._async_thread: threading.Thread | None = None
+        self._async_context: basefunctions.EventContext | None = None
+        self._async_lock = threading.Lock()
+
+        # Events processed outside the input queue accounting (e.g. on the event loop)
+        self._detached_count = 0
+        self._detached_cond = threading.Condition()
+
+        # Cooperative cancellation (event_id -> token of running events, cancelled pending ids)
+        # Plain dict/set operations are atomic under the GIL; cancel() and the workers
+        # publish their side first and check the other afterwards, so no lock is needed.
+        self._running_tokens: dict[str, CancellationToken] = {}
+        self._cancelled_ids: set[str] = set()
+
+        # Concurrency limits (event_type -> max in flight, in flight, parked task heap)
+        self._concurrency_limits: dict[str, int] = {}
+        self._concurrency_in_flight: dict[str, int] = {}
+        self._parked_events: dict[str, list[tuple[int, int, basefunctions.Event]]] = {}
+        self._concurrency_lock = threading.Lock()
+
+        # Dependency tracking (upstream id -> waiting dependents, dependent id -> wait).
+        # _dependency_lock is never held while acquiring another lock.
+        self._dependents: dict[str, list[_DependencyWait]] = {}
+        self._waiting_events: dict[str, _DependencyWait] = {}
+        self._dependency_lock = threading.Lock()
+
+        # Events routed after being held back (dependencies, delays, retry backoff)
+        self._release_count = 0
+
+        # Delayed events (event_id -> deadline and event) and periodic schedules,
+        # all timed by the shared deadline scheduler
+        self._delayed_events: dict[str, tuple[DeadlineHandle, basefunctions.Event]] = {}
+        self._schedules: weakref.WeakSet[EventSchedule] = weakref.WeakSet()
+        self._timers_stopped = False
+
+        # Release thread: deadline callbacks only hand timed work over to it, so the
+        # scheduler thread, which also fires every handler timeout, never blocks
+        self._release_queue: queue.SimpleQueue[Callable[[], None] | None] = queue.SimpleQueue()
+        self._release_thread: threading.Thread | None = None
+        self._release_lock = threading.Lock()
+        self._release_closed = False
+
+        # Retry backoff (event_type -> backoff, event_id -> attempts made so far)
+        self._retry_backoffs: dict[str, _RetryBackoff] = {}
+        self._retry_attempts: dict[str, int] = {}
+
+        # Instrumentation (off until enable_metrics() / enable_tracing(),
+        # event_id -> perf_counter_ns() at run start while on)
+        self._metrics = EventMetrics(self._input_queue.get_metrics)
+        self._run_started: dict[str, int] = {}
+        self._tracer = get_event_tracer()
+
         # Progress tracking context per thread
         self._progress_context: dict[int, tuple] = {}
 
         # Corelet process tracking (thread_id -> process_id)
         self._active_corelets: dict[int, int] = {}
         self._corelet_lock = threading.Lock()
+        self._shared_memory_threshold = shared_memory_threshold
+        self._corelet_max_tasks = max_tasks_per_corelet
+        self._corelet_max_rss_mb = max_rss_mb
+
+        # Optional corelet pool (processes started on demand, served by one dispatcher thread)
+        self._corelet_pool: CoreletPool | None = None
+        if corelet_pool_size is not None:
+            self._corelet_pool = self._create_corelet_pool(
+                corelet_pool_size,
+                corelet_window,
+                corelet_batch_size,
+                prewarm_corelets,
+                preload_modules,
+                corelet_start_method,
+            )
 
         # Create sync event context once
         self._sync_event_context = basefunctions.EventContext(thread_local_data=threading.local())
@@ -267,6 +647,8 @@ class EventBus:
 
         # Initialize threading system
         self._setup_thread_system()
+        if self._autoscaler is not None:
+            self._start_autoscaler()
         self._logger.info(f"EventBus initialized with {self._num_threads} worker threads")
 
         # Mark as initialized
@@ -304,6 +686,152 @@ class EventBus:
         if num_threads > self._num_threads:
             self._expand_thread_pool(num_threads)
 
+    def get_autoscale_metrics(self) -> dict[str, Any]:
+        """
+        Get worker pool autoscaling metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Metrics dictionary with:
+            - enabled: False without max_threads (remaining keys omitted)
+            - min_threads, max_threads, cooldown: Configuration
+            - scale_ups, scale_downs: Number of grow/shrink decisions
+            - threads, queue_depth, queue_wait, utilisation: Last sample
+            - decisions: Recent decisions with action, thread counts,
+              reason and the sample they were based on
+        """
+        if self._autoscaler is None:
+            return {"enabled": False, "threads": self._num_threads}
+        return {"enabled": True, **self._autoscaler.get_metrics(), "threads": self._num_threads}
+
+    # =============================================================================
+    # PUBLIC API - METRICS
+    # =============================================================================
+
+    def enable_metrics(self, enabled: bool = True) -> None:
+        """
+        Switch collection of per event type latency histograms and counters on or off.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            True starts collecting from empty metrics, False stops collecting
+            and keeps the values collected so far. Default is True.
+
+        Notes
+        -----
+        While off, the bus only checks one flag per event; while on, each
+        event costs a few microseconds (timestamps and histogram updates).
+        """
+        if enabled and not self._metrics.enabled:
+            self._metrics.reset()
+        self._metrics.enabled = enabled
+        self._update_wait_listener()
+
+    def get_event_metrics(self) -> EventMetrics:
+        """
+        Get the per event type metrics collected while enable_metrics() is on.
+
+        Returns
+        -------
+        EventMetrics
+            KPIProvider with queue wait, execution and end-to-end latency
+            histograms (p50/p95/p99/max), retry, timeout and failure counts
+            and throughput per event type
+
+        Examples
+        --------
+        >>> bus.enable_metrics()
+        >>> kpis = basefunctions.KPICollector().collect(bus.get_event_metrics())
+        >>> basefunctions.kpi.print_kpi_table(kpis)
+        >>> bus.get_event_metrics().get_metrics()["http_request"]["end_to_end"]["p99"]
+        0.412
+        """
+        return self._metrics
+
+    def enable_tracing(
+        self,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+        max_spans: int = DEFAULT_MAX_SPANS,
+    ) -> None:
+        """
+        Switch event lifecycle tracing on or off.
+
+        While on, sampled events record spans for publish, rate limiter and
+        input queue waits, handler runs and, for corelet events, pickling,
+        pipe transfer and the run inside the corelet process.
+
+        Parameters
+        ----------
+        enabled : bool, optional
+            True starts tracing from an empty buffer, False stops tracing and
+            keeps the spans recorded so far. Default is True.
+        sample_rate : float, optional
+            Fraction of events traced, decided per event ID. Default is 1.0.
+        max_spans : int, optional
+            Spans kept in the ring buffer, the oldest are dropped. Default is 100,000.
+
+        Raises
+        ------
+        ValueError
+            If sample_rate is not in (0, 1] or max_spans is not positive.
+
+        Notes
+        -----
+        While off, the bus only checks one flag per event. A sampled event
+        costs a few microseconds, an unsampled one a CRC32 of its ID per
+        hook, so a low sample_rate can stay enabled in production.
+
+        Examples
+        --------
+        >>> bus.enable_tracing(sample_rate=0.01)
+        >>> bus.get_event_tracer().write("events.trace.json")  # open in ui.perfetto.dev
+        """
+        if enabled:
+            self._tracer.configure(sample_rate, max_spans)
+        self._tracer.enabled = enabled
+        self._update_wait_listener()
+
+    def get_event_tracer(self) -> EventTracer:
+        """
+        Get the tracer that records spans while enable_tracing() is on.
+
+        Returns
+        -------
+        EventTracer
+            Tracer with get_spans(), get_trace() and write(path), which
+            writes a JSON trace file for chrome://tracing or Perfetto
+        """
+        return self._tracer
+
+    def _update_wait_listener(self) -> None:
+        """
+        Observe queue waits while metrics or tracing are on.
+        """
+        instrumented = self._metrics.enabled or self._tracer.enabled
+        self._input_queue.wait_listener = self._record_queue_wait if instrumented else None
+        if not instrumented:
+            self._run_started.clear()
+
+    def _record_queue_wait(self, task: tuple[int, int, basefunctions.Event], wait: float) -> None:
+        """
+        Record the queue wait of a dequeued task (called under the input queue lock).
+        """
+        event = task[2]
+        if self._metrics.enabled:
+            self._metrics.record_queue_wait(event.event_type, wait)
+        if self._tracer.enabled and self._tracer.is_sampled(event):
+            self._tracer.add_queue_wait(event, wait)
+
+    def _trace_rate_limit_wait(self, event: basefunctions.Event) -> None:
+        """
+        Start the rate limiter wait span of a sampled event (while tracing is on).
+        """
+        if self._tracer.is_sampled(event):
+            self._tracer.begin_rate_limit_wait(event)
+
     # =============================================================================
     # PUBLIC API - PROGRESS TRACKING
     # =============================================================================
@@ -340,10 +868,11 @@ class EventBus:
         Returns
         -------
         int
-            Number of active corelet worker processes
+            Number of active corelet worker processes, including pooled corelets
         """
+        pool_count = self._corelet_pool.get_corelet_count() if self._corelet_pool is not None else 0
         with self._corelet_lock:
-            return len(self._active_corelets)
+            return len(self._active_corelets) + pool_count
 
     def get_corelet_metrics(self) -> dict[str, int]:
         """
@@ -356,6 +885,11 @@ class EventBus:
             - active_corelets: Number of active corelet processes
             - worker_threads: Number of worker threads
             - max_corelets: Maximum possible corelets (= worker_threads)
+            - pool_size: Corelet pool size (0 without pool)
+            - pool_corelets: Running pooled corelet processes
+            - pool_busy: Pooled corelets processing an event
+            - pool_pending: Events waiting for a pooled corelet
+            - pool_retired: Pooled corelets recycled after reaching a limit
 
         Notes
         -----
@@ -364,19 +898,156 @@ class EventBus:
         - Corelets reused for subsequent events in same thread
         - Corelets cleaned up on worker thread shutdown
         - Corelets auto-terminate after 10 minutes idle time
+        - With corelet_pool_size, corelets belong to the pool instead
         """
+        pool_metrics = self._corelet_pool.get_metrics() if self._corelet_pool is not None else {}
         with self._corelet_lock:
             return {
                 "active_corelets": len(self._active_corelets),
                 "worker_threads": self._num_threads,
                 "max_corelets": self._num_threads,
+                "pool_size": pool_metrics.get("size", 0),
+                "pool_corelets": pool_metrics.get("corelets", 0),
+                "pool_busy": pool_metrics.get("busy", 0),
+                "pool_pending": pool_metrics.get("pending", 0),
+                "pool_retired": pool_metrics.get("retired", 0),
             }
 
+    def get_shared_memory_threshold(self) -> int | None:
+        """
+        Get shared memory transport threshold for corelet payloads.
+
+        Returns
+        -------
+        int or None
+            Minimum buffer size in bytes sent via shared memory, None if disabled
+        """
+        return self._shared_memory_threshold
+
+    def get_corelet_limits(self) -> tuple[int | None, float | None]:
+        """
+        Get recycling limits applied to new corelets.
+
+        Returns
+        -------
+        tuple[int | None, float | None]
+            max_tasks_per_corelet and max_rss_mb, None where disabled
+        """
+        return self._corelet_max_tasks, self._corelet_max_rss_mb
+
+    def set_shared_memory_threshold(self, threshold: int | None) -> None:
+        """
+        Enable, change or disable shared memory transport for corelet payloads.
+
+        Buffers of at least threshold bytes inside corelet events (NumPy
+        arrays, DataFrame blocks, bytes) are placed in shared memory segments
+        using pickle protocol 5 out-of-band buffers; only a small descriptor
+        is sent over the pipe. The corelet replies with the same threshold,
+        and the receiver maps the results without copying.
+
+        Parameters
+        ----------
+        threshold : int or None
+            Minimum buffer size in bytes, None disables the transport
+
+        Raises
+        ------
+        ValueError
+            If threshold is not positive.
+
+        Notes
+        -----
+        - Applies to corelets created after the call
+        - Receivers unlink segments on attach; memory is freed once the
+          unpickled objects are released
+        - Segments of crashed or timed-out corelets are unlinked by the parent
+        - POSIX only; on other platforms the pipe transport is used
+        """
+        if threshold is not None and threshold <= 0:
+            raise ValueError("shared_memory_threshold must be positive")
+        self._shared_memory_threshold = threshold
+        if self._corelet_pool is not None:
+            self._corelet_pool.set_shared_memory_threshold(threshold)
+
+    # =============================================================================
+    # PUBLIC API - INPUT QUEUE BACKPRESSURE
+    # =============================================================================
+
+    def set_queue_watermarks(
+        self,
+        high: int | None,
+        low: int | None = None,
+        on_high: Callable[[int], None] | None = None,
+        on_low: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Register callbacks that let producers throttle before the queue is full.
+
+        Parameters
+        ----------
+        high : int or None
+            Queued events at which on_high is called. None disables water marks.
+        low : int, optional
+            Queued events at which on_low is called once the queue drained
+            after reaching the high mark. Defaults to high // 2.
+        on_high : Callable[[int], None], optional
+            Called with the queue size when the high water mark is reached
+        on_low : Callable[[int], None], optional
+            Called with the queue size when the low water mark is reached again
+
+        Raises
+        ------
+        ValueError
+            If high is not positive or low is not below high.
+
+        Examples
+        --------
+        >>> throttle = threading.Event()
+        >>> bus.set_queue_watermarks(800, 200, on_high=lambda n: throttle.set(),
+        ...                          on_low=lambda n: throttle.clear())
+
+        Notes
+        -----
+        - Callbacks run in the publishing or worker thread that crossed the
+          mark and must return quickly
+        - Works with unbounded queues as well
+        """
+        self._input_queue.set_watermarks(high, low, on_high, on_low)
+
+    def get_queue_metrics(self) -> dict[str, Any]:
+        """
+        Get input queue metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Metrics dictionary with:
+            - size: Events waiting in the input queue
+            - max_size: Queue bound (0 = unbounded)
+            - reserved: Rate-limited events counted against max_size while
+              they wait for a token
+            - policy: Policy applied when full
+            - aging_interval: queue_aging, None without aging
+            - dropped: Events dropped by drop_lowest/drop_oldest
+            - rejected: Events rejected by reject/block timeout
+            - above_high_water: True between high and low water mark
+            - priorities: Per priority value {queued, dequeued, avg_wait, max_wait}
+              (waits in seconds, since construction)
+        """
+        return self._input_queue.get_metrics()
+
     # =============================================================================
     # PUBLIC API - EVENT PUBLISHING
     # =============================================================================
 
-    def publish(self, event: basefunctions.Event) -> str:
+    def publish(
+        self,
+        event: basefunctions.Event,
+        return_future: bool = False,
+        delay: float | None = None,
+        store_result: bool = True,
+        result_ttl: float | None = None,
+    ) -> str | EventFuture:
         """
         Publish an event to all registered handlers.
 
@@ -384,11 +1055,27 @@ class EventBus:
         ----------
         event : Event
             The event to publish.
+        return_future : bool, optional
+            If True, return an EventFuture resolved with the EventResult as
+            soon as the event is processed. The result is then delivered
+            only through the future and not stored in the result cache.
+            Default is False.
+        delay : float, optional
+            Seconds to hold the event back before it is routed. The event
+            is validated and registered at once, so it can be cancelled and
+            join() waits for it. None (default) routes it immediately.
+        store_result : bool, optional
+            If False, the result is dropped instead of stored (fire and
+            forget); join() and cancel() still cover the event. Ignored with
+            return_future=True. Default is True.
+        result_ttl : float, optional
+            Seconds the stored result is kept, overriding the result_ttl of
+            the bus. Default is None.
 
         Returns
         -------
-        str
-            Event ID for result tracking.
+        str | EventFuture
+            Event ID for result tracking, or an EventFuture if return_future is True.
 
         Raises
         ------
@@ -398,145 +1085,618 @@ class EventBus:
             If EventBus is shutting down.
         NoHandlerAvailableError
             If no handler is available for the event type.
-        """
-        # Validate event
-        if not isinstance(event, basefunctions.Event):
-            raise basefunctions.InvalidEventError(f"Invalid event type: {type(event).__name__}")
-
-        if not hasattr(event, "event_id") or not event.event_id:
-            raise basefunctions.InvalidEventError("Event must have a valid event_id")
-
-        if not hasattr(event, "event_type") or not event.event_type:
-            raise basefunctions.InvalidEventError("Event must have a valid event_type")
+        EventQueueFullError
+            If a bounded input queue rejects the event (queue_policy "reject",
+            or "block" after queue_timeout).
+        ValueError
+            If delay is negative or given for a SYNC event, a SYNC event has
+            depends_on, or result_ttl is not positive.
 
-        if not hasattr(event, "event_exec_mode"):
-            raise basefunctions.InvalidEventError("Event must have a valid event_exec_mode")
+        Notes
+        -----
+        Events with depends_on are held back until all upstream events
+        completed and are then routed like any other event. Reference
+        upstream events published with return_future=True by their
+        EventFuture; an event ID is only resolvable while the event is
+        pending or its result is in the result cache.
+
+        Delayed events are timed by the shared deadline scheduler; no
+        thread waits for them. They bypass the input queue bound, their
+        dependencies are resolved once the delay expired, and shutdown()
+        cancels the ones still pending.
+        """
+        # Spans of sampled events; one flag check while tracing is off
+        started = time.perf_counter_ns() if self._tracer.enabled else 0
 
-        # Thread-safe publish with lock to prevent race conditions
-        with self._publish_lock:
+        # Validate event
+        self._validate_event(event)
 
-            # Auto-enrich event with progress context if not explicitly set
-            # This allows thread-level progress tracking without modifying event creation
-            thread_id = threading.get_ident()
-            if thread_id in self._progress_context and not event.progress_tracker:
-                tracker, steps = self._progress_context[thread_id]
-                event.progress_tracker = tracker
-                event.progress_steps = steps
+        try:
+            if result_ttl is not None and result_ttl <= 0:
+                raise ValueError("result_ttl must be positive")
+            if delay is not None:
+                return self._publish_delayed(event, return_future, delay, store_result, result_ttl)
 
-            event_type = event.event_type
-            execution_mode = event.event_exec_mode
+            # Thread-safe publish with lock to prevent race conditions
+            with self._publish_lock:
+                future = self._admit_event(event, return_future, store_result, result_ttl)
+                event_type = event.event_type
+                execution_mode = event.event_exec_mode
 
-            # Check handler availability BEFORE rate limiting or routing
-            # Skip check for CMD mode - uses internal handler
-            if execution_mode != basefunctions.EXECUTION_MODE_CMD:
-                if not self._event_factory.is_handler_available(event_type):
-                    raise basefunctions.NoHandlerAvailableError(event_type)
+                # Hold back events with dependencies, they are routed once released
+                if event.depends_on:
+                    self._hold_event(event)
+                    return future if future is not None else event.event_id
 
-            # Check for rate limit BEFORE routing
-            if self._ticked_rate_limiter.has_limit(event_type):
-                # Thread-safe event counter and response registration
+                # Thread-safe event counter
                 self._event_counter += 1
-                self._result_list[event.event_id] = None
 
-                # Submit to rate limiter (bypasses normal routing)
-                self._ticked_rate_limiter.submit(
-                    event_type=event_type,
-                    priority=event.priority,
-                    counter=self._event_counter,
-                    event=event
-                )
-                return event.event_id
-
-            # Thread-safe event counter and response registration
-            self._event_counter += 1
-            self._result_list[event.event_id] = None
+                # Route event based on execution mode
+                queued = False
+                limited_task = None
+                if self._ticked_rate_limiter.has_limit(event_type):
+                    # Rate limiter bypasses normal routing, checked BEFORE the execution mode
+                    limited_task = (event.priority, self._event_counter, event)
+                elif execution_mode == basefunctions.EXECUTION_MODE_SYNC:
+                    self._handle_sync_event(event=event)
+                elif execution_mode == basefunctions.EXECUTION_MODE_THREAD:
+                    queued = True
+                elif execution_mode == basefunctions.EXECUTION_MODE_CORELET:
+                    if self._uses_corelet_pool(event):
+                        self._handle_pooled_corelet_event(event=event)
+                    else:
+                        queued = True
+                elif execution_mode == basefunctions.EXECUTION_MODE_CMD:
+                    queued = True
+                elif execution_mode == basefunctions.EXECUTION_MODE_ASYNC:
+                    self._handle_async_event(event=event)
+                else:
+                    self._discard_future(event.event_id)
+                    self._result_store.pop(event.event_id)
+                    raise basefunctions.InvalidEventError(f"Unknown execution mode: {execution_mode}")
 
-            # Route event based on execution mode
-            if execution_mode == basefunctions.EXECUTION_MODE_SYNC:
-                self._handle_sync_event(event=event)
-            elif execution_mode == basefunctions.EXECUTION_MODE_THREAD:
-                self._handle_thread_and_corelet_event(event=event)
-            elif execution_mode == basefunctions.EXECUTION_MODE_CORELET:
+            # Enqueue outside the publish lock: a full input queue may block
+            if queued:
                 self._handle_thread_and_corelet_event(event=event)
-            elif execution_mode == basefunctions.EXECUTION_MODE_CMD:
-                self._handle_thread_and_corelet_event(event=event)
-            else:
-                raise basefunctions.InvalidEventError(f"Unknown execution mode: {execution_mode}")
-
-            return event.event_id
+            elif limited_task is not None:
+                try:
+                    self._submit_rate_limited(limited_task)
+                except basefunctions.EventQueueFullError:
+                    # Rejected: the caller gets the exception, nothing is left registered
+                    self._discard_future(event.event_id)
+                    self._result_store.pop(event.event_id)
+                    raise
+
+            return future if future is not None else event.event_id
+        finally:
+            if started and self._tracer.is_sampled(event):
+                self._tracer.add_span(SPAN_PUBLISH, event, started)
 
-    def join(self) -> None:
+    def publish_at(
+        self,
+        event: basefunctions.Event,
+        when: datetime | float,
+        return_future: bool = False,
+    ) -> str | EventFuture:
         """
-        Wait for all async tasks to complete and collect results.
+        Publish an event at a point in time.
 
-        This waits for:
-        1. All rate-limited events to be forwarded to input queue
-        2. All events in input queue to be processed
-        """
-        # Phase 1: Wait for rate limiter to forward all events
-        self._ticked_rate_limiter.wait_until_empty()
+        Parameters
+        ----------
+        event : Event
+            The event to publish.
+        when : datetime | float
+            Time to route the event at, as datetime (naive values are local
+            time) or POSIX timestamp. Times in the past route it at once.
+        return_future : bool, optional
+            If True, return an EventFuture. Default is False.
 
-        # Phase 2: Wait for input queue to process all events
-        self._input_queue.join()
+        Returns
+        -------
+        str | EventFuture
+            Event ID for result tracking, or an EventFuture if return_future is True.
 
-    def get_results(
+        Raises
+        ------
+        InvalidEventError, NoHandlerAvailableError, ValueError
+            As raised by publish(event, delay=...).
+
+        Examples
+        --------
+        >>> bus.publish_at(Event("daily_report"), datetime(2026, 1, 1, 6, 0))
+        """
+        timestamp = when.timestamp() if isinstance(when, datetime) else float(when)
+        return self.publish(event, return_future=return_future, delay=max(timestamp - time.time(), 0.0))
+
+    def schedule_every(
         self,
-        event_ids: list[str] | None = None,
-        join_before: bool = True,
-    ) -> dict[str, basefunctions.EventResult]:
+        event_factory: Callable[[], basefunctions.Event],
+        interval: float,
+        start_delay: float | None = None,
+        on_result: Callable[[basefunctions.EventResult], None] | None = None,
+    ) -> EventSchedule:
         """
-        Get response(s) from processed events with smart cleanup strategy.
+        Publish a new event at a fixed rate until the schedule is cancelled.
 
-        This method implements a dual-mode result retrieval system:
-        - Specific event_ids: Consumer pattern (results removed from cache)
-        - No event_ids: Observer pattern (results preserved in cache)
+        Replaces own cron threads for recurring work (KPI collection, cache
+        refresh, polling): all schedules share the deadline scheduler thread.
 
         Parameters
         ----------
-        event_ids : List[str], optional
-            List of event_ids to retrieve. If None, returns all cached events.
-            Specific IDs will be consumed (removed from cache) and returned as Dict.
-            Can also be a single string event_id (will be normalized to list).
-        join_before : bool, optional
-            If True, waits for input queue to be empty before retrieving results.
-            Set to False for non-blocking result retrieval (default: True).
+        event_factory : Callable[[], Event]
+            Creates the event of each run. Called on the bus release thread
+            that also routes delayed events, so it must return quickly.
+        interval : float
+            Seconds between runs
+        start_delay : float, optional
+            Seconds until the first run. Defaults to interval.
+        on_result : Callable[[EventResult], None], optional
+            Called with the result of every run. Results of scheduled events
+            are not stored in the result cache.
 
         Returns
         -------
-        Dict[str, EventResult]
-            Dictionary mapping event_ids to EventResult objects.
-            When specific event_ids are given, they are consumed (removed from cache).
-            When None, returns all cached results (preserved in cache).
-
-        Notes
-        -----
-        **Result Cleanup Strategy:**
-        - Specific IDs: Results are removed from cache (consumer pattern)
-        - Bulk request (None): Results preserved, LRU handles eviction
-        - This prevents unbounded memory growth while supporting both patterns
+        EventSchedule
+            Handle to cancel the schedule
 
-        **Thread Safety:**
-        - Output queue draining uses try/except to avoid race conditions
-        - Result list operations are protected by _publish_lock
+        Raises
+        ------
+        ValueError
+            If interval is not positive or start_delay is negative.
 
         Examples
         --------
-        Get specific event results (consumer pattern):
-
-        >>> event_id = bus.publish(event)
-        >>> results = bus.get_results([event_id])  # Result removed from cache
-        >>> results[event_id].success
+        >>> schedule = bus.schedule_every(lambda: Event("collect_kpis"), interval=60)
+        >>> schedule.cancel()
         True
 
-        Get all results without consuming (observer pattern):
+        Notes
+        -----
+        - Runs that fail to publish (e.g. no handler) are logged and skipped
+        - Runs missed while the process was busy are skipped, not caught up
+        - join() does not wait for future runs; shutdown() cancels all schedules
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        if start_delay is not None and start_delay < 0:
+            raise ValueError("start_delay must not be negative")
 
-        >>> results = bus.get_results()  # All results, preserved in cache
-        >>> len(results)
-        42
+        schedule = EventSchedule(self, event_factory, interval, on_result)
+        self._schedules.add(schedule)
+        schedule.start(interval if start_delay is None else start_delay)
+        return schedule
 
-        Non-blocking result check:
+    def publish_many(
+        self,
+        events: Iterable[basefunctions.Event],
+        chunk_size: int = DEFAULT_PUBLISH_CHUNK_SIZE,
+        return_futures: bool = False,
+        store_result: bool = True,
+    ) -> list[str] | list[EventFuture]:
+        """
+        Publish multiple events with a single lock acquisition per chunk.
 
-        >>> results = bus.get_results([event_id], join_before=False)
+        Parameters
+        ----------
+        events : Iterable[Event]
+            Events to publish.
+        chunk_size : int, optional
+            Number of events validated and enqueued together. Default is 1000.
+        return_futures : bool, optional
+            If True, return EventFutures instead of event IDs. Default is False.
+        store_result : bool, optional
+            If False, results are dropped instead of stored (fire and
+            forget). Ignored with return_futures=True. Default is True.
+
+        Returns
+        -------
+        list[str] | list[EventFuture]
+            Event IDs (or futures) in the order the events were given.
+
+        Raises
+        ------
+        InvalidEventError
+            If an event is invalid or missing required attributes.
+        NoHandlerAvailableError
+            If no handler is available for an event type.
+        ValueError
+            If chunk_size is not positive or a SYNC event has depends_on.
+
+        Notes
+        -----
+        Each chunk is validated completely before any of its events is
+        enqueued, so a failing chunk leaves the bus untouched. Chunks
+        published before the failing one remain published. Events that a
+        bounded input queue rejects or drops complete with
+        EventQueueFullError instead of raising.
+        """
+        return self.publish_iter(
+            events, chunk_size=chunk_size, return_futures=return_futures, store_result=store_result
+        )
+
+    def publish_iter(
+        self,
+        events: Iterable[basefunctions.Event],
+        chunk_size: int = DEFAULT_PUBLISH_CHUNK_SIZE,
+        return_futures: bool = False,
+        store_result: bool = True,
+    ) -> list[str] | list[EventFuture]:
+        """
+        Publish events from an iterable, consuming it lazily in chunks.
+
+        Handler availability and rate limits are resolved once per event
+        type and chunk, event counters are assigned in bulk, and queued
+        events are pushed into the input queue under one queue lock.
+
+        Parameters
+        ----------
+        events : Iterable[Event]
+            Iterable (e.g. generator) yielding events to publish.
+        chunk_size : int, optional
+            Number of events validated and enqueued together. Default is 1000.
+        return_futures : bool, optional
+            If True, return EventFutures instead of event IDs. Default is False.
+        store_result : bool, optional
+            If False, results are dropped instead of stored (fire and
+            forget). Ignored with return_futures=True. Default is True.
+
+        Returns
+        -------
+        list[str] | list[EventFuture]
+            Event IDs (or futures) in the order the events were yielded.
+
+        Raises
+        ------
+        InvalidEventError
+            If an event is invalid or missing required attributes.
+        NoHandlerAvailableError
+            If no handler is available for an event type.
+        ValueError
+            If chunk_size is not positive or a SYNC event has depends_on.
+
+        Examples
+        --------
+        >>> events = (Event("task", event_data=i) for i in range(100_000))
+        >>> event_ids = bus.publish_iter(events, chunk_size=5000)
+        >>> bus.join()
+        >>> results = bus.get_results(event_ids)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        published: list = []
+        iterator = iter(events)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            published.extend(self._publish_chunk(chunk, return_futures, store_result))
+        return published
+
+    def map(
+        self,
+        event_type: str,
+        iterable: Iterable[Any],
+        chunksize: int = 1,
+        ordered: bool = True,
+        mode: str = EXECUTION_MODE_CORELET,
+        window: int | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_RETRY_COUNT,
+        priority: int = DEFAULT_PRIORITY,
+    ) -> Iterator[basefunctions.EventResult]:
+        """
+        Apply the handler of an event type to every input, streaming the results.
+
+        Inputs are consumed lazily and sent in chunks of chunksize, one event
+        per chunk. At most window chunks are in flight; a new chunk is sent
+        as soon as one completes, so memory stays bounded for any input size.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type whose handler receives each input as event_data
+        iterable : Iterable[Any]
+            Inputs (e.g. a generator)
+        chunksize : int, optional
+            Inputs per chunk event. Default is 1.
+        ordered : bool, optional
+            True yields results in input order, False in completion order
+            (chunk by chunk). Default is True.
+        mode : str, optional
+            EXECUTION_MODE_CORELET (default) or EXECUTION_MODE_THREAD
+        window : int, optional
+            Maximum chunks in flight. Defaults to twice the number of workers.
+        timeout : int, optional
+            Timeout in seconds per input; a chunk may run chunksize * timeout.
+        max_retries : int, optional
+            Attempts per input. Default is 3.
+        priority : int, optional
+            Priority of the chunk events. Default is 5.
+
+        Returns
+        -------
+        Iterator[EventResult]
+            One result per input; failed inputs yield failed results
+
+        Raises
+        ------
+        NoHandlerAvailableError
+            If no handler is registered for event_type.
+        ValueError
+            If chunksize or window is not positive, max_retries is below 1
+            or mode is not supported.
+
+        Examples
+        --------
+        >>> for result in bus.map("square", range(1_000_000), chunksize=500):
+        ...     total += result.data
+
+        Notes
+        -----
+        - A timeout or crash of a chunk fails all of its inputs; the chunk is
+          not re-run, so completed inputs are not repeated
+        - A BatchEventHandler receives each chunk in one handle_batch() call
+        - Closing the generator early cancels chunks still in flight
+        - Rate and concurrency limits of event_type do not apply to map chunks
+        """
+        if chunksize <= 0:
+            raise ValueError("chunksize must be positive")
+        if max_retries < 1:
+            raise ValueError("max_retries must be at least 1")
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive")
+        if mode not in (EXECUTION_MODE_THREAD, EXECUTION_MODE_CORELET):
+            raise ValueError(f"map() supports thread and corelet mode, not {mode}")
+        if not self._event_factory.is_handler_available(event_type):
+            raise basefunctions.NoHandlerAvailableError(event_type)
+
+        corelet_meta = self._event_factory.get_handler_meta(event_type) if mode == EXECUTION_MODE_CORELET else None
+        if window is None:
+            workers = self._num_threads
+            if mode == EXECUTION_MODE_CORELET and self._corelet_pool is not None:
+                workers = self._corelet_pool.size
+            window = MAP_WINDOW_PER_WORKER * max(workers, 1)
+
+        chunk_template = {
+            "event_exec_mode": mode,
+            "max_retries": 1,
+            "priority": priority,
+            "corelet_meta": corelet_meta,
+        }
+        return self._map_results(
+            event_type, iter(iterable), chunksize, ordered, window, timeout, max_retries, chunk_template
+        )
+
+    def group(self) -> EventGroup:
+        """
+        Create a group to publish, join and query events independently of other bus users.
+
+        Returns
+        -------
+        EventGroup
+            Empty group publishing on this bus
+
+        Examples
+        --------
+        >>> with bus.group() as group:
+        ...     group.publish(event)
+        ...     group.join(timeout=10)
+        >>> group.get_results()[event.event_id].success
+        True
+        """
+        return EventGroup(self)
+
+    def join(self) -> None:
+        """
+        Wait for all async tasks to complete and collect results.
+
+        This waits for every event on the bus, including those published by
+        other components; use group() to wait for a set of own events only.
+
+        This waits for:
+        1. All rate-limited events to be forwarded to input queue
+        2. All events in input queue to be processed
+        3. All ASYNC events running on the event loop to complete
+        4. All events held back by depends_on to be released and processed
+        """
+        while True:
+            releases = self._release_count
+
+            # Phase 1: Wait for rate limiter to forward all events
+            self._ticked_rate_limiter.wait_until_empty()
+
+            # Phase 2: Wait for input queue to process all events
+            self._input_queue.join()
+
+            # Phase 3: Wait for events handed off to the event loop and held dependents
+            with self._detached_cond:
+                self._detached_cond.wait_for(lambda: self._detached_count == 0)
+
+            # Events released meanwhile may have been queued after phase 2
+            if self._release_count == releases:
+                break
+
+    def cancel(self, event_id: str) -> bool:
+        """
+        Cancel a published event that has not completed yet.
+
+        Queued events are dropped without running. Running events get their
+        cancellation token set: handlers checking context.cancelled or calling
+        context.check_cancelled() exit early, and no retry is attempted. Either
+        way the event completes with an EventResult whose exception is
+        EventCancelledError (unless a running handler finishes successfully
+        without checking the token).
+
+        Parameters
+        ----------
+        event_id : str
+            ID returned by publish()
+
+        Returns
+        -------
+        bool
+            True if the event was pending or running, False if it is unknown
+            or already completed.
+
+        Notes
+        -----
+        - Running CORELET events are not interrupted; they complete normally
+        - Pending events of the corelet pool are removed from the pool
+        - Events held back by depends_on complete at once; their dependents are skipped
+        - Delayed events and events waiting for a retry complete at once
+        """
+        token = self._running_tokens.get(event_id)
+        if token is not None:
+            return token.cancel(f"Event {event_id} cancelled")
+
+        if self._corelet_pool is not None and self._corelet_pool.cancel(event_id):
+            return True
+
+        if self._delayed_events:
+            entry = self._delayed_events.pop(event_id, None)
+            # A deadline that already fired is treated like a queued event below
+            if entry is not None and entry[0].cancel():
+                try:
+                    self._complete_event(entry[1], self._cancelled_result(entry[1]))
+                finally:
+                    self._end_detached()
+                return True
+
+        if self._waiting_events:
+            with self._dependency_lock:
+                wait = self._waiting_events.pop(event_id, None)
+            if wait is not None:
+                try:
+                    self._complete_event(wait.event, self._cancelled_result(wait.event))
+                finally:
+                    self._end_detached()
+                return True
+
+        pending = event_id in self._futures or self._result_store.is_pending(event_id)
+        if not pending:
+            return False
+
+        self._cancelled_ids.add(event_id)
+        # The event may have started between the first lookup and now
+        token = self._running_tokens.get(event_id)
+        if token is not None:
+            token.cancel(f"Event {event_id} cancelled")
+        return True
+
+    async def publish_async(self, event: basefunctions.Event) -> basefunctions.EventResult:
+        """
+        Publish an event and await its result without blocking the caller's event loop.
+
+        Parameters
+        ----------
+        event : Event
+            The event to publish. Any execution mode is supported; SYNC events
+            are processed in the calling thread before the coroutine yields.
+
+        Returns
+        -------
+        EventResult
+            Final result of the event after retries.
+
+        Raises
+        ------
+        InvalidEventError
+            If event is invalid or missing required attributes.
+        NoHandlerAvailableError
+            If no handler is available for the event type.
+
+        Examples
+        --------
+        >>> event = Event("http_request", event_exec_mode=EXECUTION_MODE_ASYNC, event_data=url)
+        >>> result = await bus.publish_async(event)
+        """
+        future = self.publish(event, return_future=True)
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def as_completed(futures: Iterable[EventFuture], timeout: float | None = None) -> Iterator[EventFuture]:
+        """
+        Iterate over event futures as they complete.
+
+        Parameters
+        ----------
+        futures : Iterable[EventFuture]
+            Futures returned by publish(..., return_future=True)
+        timeout : float, optional
+            Maximum number of seconds to wait for all futures. None waits forever.
+
+        Returns
+        -------
+        Iterator[EventFuture]
+            Futures in completion order
+
+        Raises
+        ------
+        TimeoutError
+            If not all futures complete within timeout.
+        """
+        return as_completed(futures, timeout=timeout)
+
+    def get_results(
+        self,
+        event_ids: list[str] | None = None,
+        join_before: bool = True,
+    ) -> dict[str, basefunctions.EventResult]:
+        """
+        Get response(s) from processed events with smart cleanup strategy.
+
+        This method implements a dual-mode result retrieval system:
+        - Specific event_ids: Consumer pattern (results removed from cache)
+        - No event_ids: Observer pattern (results preserved in cache)
+
+        Parameters
+        ----------
+        event_ids : List[str], optional
+            List of event_ids to retrieve. If None, returns all cached events.
+            Specific IDs will be consumed (removed from cache) and returned as Dict.
+            Can also be a single string event_id (will be normalized to list).
+        join_before : bool, optional
+            If True, waits for input queue to be empty before retrieving results.
+            Set to False for non-blocking result retrieval (default: True).
+
+        Returns
+        -------
+        Dict[str, EventResult]
+            Dictionary mapping event_ids to EventResult objects.
+            When specific event_ids are given, they are consumed (removed from cache).
+            When None, returns all cached results (preserved in cache).
+
+        Notes
+        -----
+        **Result Cleanup Strategy:**
+        - Specific IDs: Results are removed from cache (consumer pattern)
+        - Bulk request (None): Results preserved, LRU handles eviction
+        - This prevents unbounded memory growth while supporting both patterns
+
+        **Thread Safety:**
+        - Results live in a lock-sharded ResultStore; reading them never
+          takes _publish_lock, so consumers do not stall publishers
+        - Results past their TTL (see result_ttl) are no longer returned
+
+        Examples
+        --------
+        Get specific event results (consumer pattern):
+
+        >>> event_id = bus.publish(event)
+        >>> results = bus.get_results([event_id])  # Result removed from cache
+        >>> results[event_id].success
+        True
+
+        Get all results without consuming (observer pattern):
+
+        >>> results = bus.get_results()  # All results, preserved in cache
+        >>> len(results)
+        42
+
+        Non-blocking result check:
+
+        >>> results = bus.get_results([event_id], join_before=False)
         >>> if event_id in results:
         ...     print("Event completed")
         """
@@ -545,34 +1705,21 @@ class EventBus:
         if join_before:
             self.join()
 
-        # Drain output queue and populate result cache with LRU eviction
-        # Use try/except pattern to avoid race condition between empty() and get_nowait()
-        while True:
-            try:
-                event_result = self._output_queue.get_nowait()
-                # Store result in LRU cache (oldest results auto-evicted when limit reached)
-                self._add_result_with_lru(event_result.event_id, event_result)
-            except queue.Empty:
-                break
-
         # Normalize event_ids parameter to list
         if isinstance(event_ids, str):
             event_ids = [event_ids]
         elif event_ids is None:
             # CASE 2: Bulk request - return all but keep in cache (LRU handles cleanup)
             # Observer pattern: Multiple consumers can read the same results
-            with self._publish_lock:
-                event_ids = list(self._result_list.keys())
-                return {eid: self._result_list[eid] for eid in event_ids if eid in self._result_list}
+            return self._result_store.snapshot()
 
         # CASE 1: Specific IDs requested - Consumer pattern (remove from cache)
         # One-time consumption: Results are removed after retrieval
         results = {}
-        with self._publish_lock:
-            for eid in event_ids:
-                result = self._result_list.pop(eid, None)  # pop() removes from cache!
-                if result:
-                    results[eid] = result
+        for eid in event_ids:
+            result = self._result_store.pop(eid)  # pop() removes from cache!
+            if result:
+                results[eid] = result
         return results
 
     def shutdown(self, immediately: bool = False) -> None:
@@ -582,12 +1729,31 @@ class EventBus:
         Parameters
         ----------
         immediately : bool, optional
-            If True: Drop rate-limited events and shutdown fast
+            If True: Drop rate-limited and queued events and shutdown fast
             If False: Flush rate-limited events before shutdown
+
+        Notes
+        -----
+        Periodic schedules are cancelled; delayed events and events waiting
+        for a retry complete with EventCancelledError. Events dropped by an
+        immediate shutdown complete with EventShutdownError; running events
+        finish.
         """
+        # 0. Freeze the worker pool so every worker receives a shutdown event,
+        #    and stop timed events, they could not be queued after the workers exit
+        self._stop_autoscaler()
+        self._stop_timers()
+        self._stop_release_thread()
+
         # 1. Shutdown rate limiter first
         flush = not immediately
-        self._ticked_rate_limiter.shutdown(flush=flush)
+        for event in self._ticked_rate_limiter.shutdown(flush=flush):
+            self._complete_event(event, self._shutdown_result(event))
+
+        # Workers exit on their shutdown event, events queued behind it would never run
+        if immediately:
+            for _, _, event in self._input_queue.drain():
+                self._complete_event(event, self._shutdown_result(event))
 
         # 2. Create shutdown event with corelet execution mode
         shutdown_event = basefunctions.Event(
@@ -603,59 +1769,1270 @@ class EventBus:
         # Wait for worker threads to finish
         self.join()
 
+        # Stop event loop thread of ASYNC mode
+        self._stop_async_loop()
+
+        # Stop pooled corelet processes
+        if self._corelet_pool is not None:
+            self._corelet_pool.shutdown()
+
+        # Results stay readable; expired ones are dropped on access from now on
+        self._result_store.close()
+
         self._logger.info("EventBus shutdown complete")
 
     # =============================================================================
     # EVENT ROUTING & PROCESSING
     # =============================================================================
 
-    def _handle_sync_event(self, event: basefunctions.Event) -> None:
+    def _validate_event(self, event: basefunctions.Event) -> None:
         """
-        Handle a synchronous event with timeout and retry logic.
+        Validate that an object is a publishable event.
 
         Parameters
         ----------
         event : basefunctions.Event
-            The event to handle
+            The event to validate
+
+        Raises
+        ------
+        InvalidEventError
+            If event is invalid or missing required attributes.
+        ValueError
+            If a SYNC event has depends_on.
         """
-        # Get handler from cache or create a new one
-        handler = self._get_handler(event_type=event.event_type, context=self._sync_event_context)
+        if not isinstance(event, basefunctions.Event):
+            raise basefunctions.InvalidEventError(f"Invalid event type: {type(event).__name__}")
 
-        # Execute with retry logic
-        event_result = self._retry_with_timeout(event, handler, self._sync_event_context)
+        if not hasattr(event, "event_id") or not event.event_id:
+            raise basefunctions.InvalidEventError("Event must have a valid event_id")
 
-        # Put result in output queue
-        self._output_queue.put(item=event_result)
+        if not hasattr(event, "event_type") or not event.event_type:
+            raise basefunctions.InvalidEventError("Event must have a valid event_type")
 
-        # Update progress tracker if attached
-        if event.progress_tracker and event.progress_steps > 0:
-            event.progress_tracker.progress(event.progress_steps)
+        if not hasattr(event, "event_exec_mode"):
+            raise basefunctions.InvalidEventError("Event must have a valid event_exec_mode")
 
-    def _handle_thread_and_corelet_event(self, event: basefunctions.Event) -> None:
+        if event.depends_on and any(
+            getattr(dependency, "event_id", dependency) == event.event_id for dependency in event.depends_on
+        ):
+            raise basefunctions.InvalidEventError(f"Event {event.event_id} cannot depend on itself")
+        if event.depends_on and event.event_exec_mode == basefunctions.EXECUTION_MODE_SYNC:
+            # The handler would run under the publish lock on the thread completing the upstream event
+            raise ValueError("depends_on is not supported for sync events")
+
+    def _admit_event(
+        self,
+        event: basefunctions.Event,
+        return_future: bool,
+        store_result: bool = True,
+        result_ttl: float | None = None,
+    ) -> EventFuture | None:
+        """
+        Check handler availability and register result delivery (caller holds _publish_lock).
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Validated event to admit
+        return_future : bool
+            Register a future instead of a result cache placeholder
+        store_result : bool, optional
+            False registers a sink that drops the result. Default is True.
+        result_ttl : float, optional
+            Seconds the stored result is kept, overriding the bus result_ttl
+
+        Returns
+        -------
+        EventFuture or None
+            Registered future if return_future is True
+
+        Raises
+        ------
+        NoHandlerAvailableError
+            If no handler is available for the event type.
+        """
+        # Auto-enrich event with progress context if not explicitly set
+        # This allows thread-level progress tracking without modifying event creation
+        thread_id = threading.get_ident()
+        if thread_id in self._progress_context and not event.progress_tracker:
+            tracker, steps = self._progress_context[thread_id]
+            event.progress_tracker = tracker
+            event.progress_steps = steps
+
+        # Check handler availability BEFORE rate limiting or routing
+        # Skip check for CMD mode - uses internal handler
+        if event.event_exec_mode != basefunctions.EXECUTION_MODE_CMD:
+            if not self._event_factory.is_handler_available(event.event_type):
+                raise basefunctions.NoHandlerAvailableError(event.event_type)
+
+        # Register result delivery: future, result sink or result cache placeholder
+        if return_future:
+            return self._register_future(event.event_id)
+        if not store_result:
+            with self._future_lock:
+                self._futures[event.event_id] = _DISCARDED_RESULT
+            return None
+        self._result_store.reserve(event.event_id, result_ttl)
+        return None
+
+    def _publish_delayed(
+        self,
+        event: basefunctions.Event,
+        return_future: bool,
+        delay: float,
+        store_result: bool = True,
+        result_ttl: float | None = None,
+    ) -> str | EventFuture:
+        """
+        Admit an event now and route it once delay seconds expired.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Validated event to publish
+        return_future : bool
+            Return an EventFuture instead of the event ID
+        delay : float
+            Seconds until the event is routed
+        store_result : bool, optional
+            Drop the result instead of storing it
+        result_ttl : float, optional
+            Seconds the stored result is kept
+
+        Returns
+        -------
+        str | EventFuture
+            Event ID, or an EventFuture if return_future is True
+        """
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        if event.event_exec_mode == basefunctions.EXECUTION_MODE_SYNC:
+            # The handler would run on the scheduler thread
+            raise ValueError("delay is not supported for sync events")
+
+        with self._publish_lock:
+            future = self._admit_event(event, return_future, store_result, result_ttl)
+        self._schedule_release(event, delay)
+        return future if future is not None else event.event_id
+
+    def _publish_chunk(
+        self,
+        events: list[basefunctions.Event],
+        return_futures: bool = False,
+        store_result: bool = True,
+    ) -> list[str] | list[EventFuture]:
+        """
+        Validate, register and route a chunk of events in bulk.
+
+        Parameters
+        ----------
+        events : list[basefunctions.Event]
+            Events to publish
+        return_futures : bool, optional
+            If True, register and return EventFutures instead of event IDs
+        store_result : bool, optional
+            If False, register result sinks instead of result cache placeholders
+
+        Returns
+        -------
+        list[str] | list[EventFuture]
+            Event IDs (or futures) in input order
+        """
+        queued_modes = (
+            basefunctions.EXECUTION_MODE_THREAD,
+            basefunctions.EXECUTION_MODE_CORELET,
+            basefunctions.EXECUTION_MODE_CMD,
+        )
+        inline_modes = (
+            basefunctions.EXECUTION_MODE_SYNC,
+            basefunctions.EXECUTION_MODE_ASYNC,
+        )
+
+        # Validate the whole chunk first - handler lookups are done once per event type
+        handler_available: dict[str, bool] = {}
+        for event in events:
+            self._validate_event(event)
+            execution_mode = event.event_exec_mode
+            if execution_mode not in inline_modes and execution_mode not in queued_modes:
+                raise basefunctions.InvalidEventError(f"Unknown execution mode: {execution_mode}")
+            if execution_mode == basefunctions.EXECUTION_MODE_CMD:
+                continue
+            event_type = event.event_type
+            if event_type not in handler_available:
+                handler_available[event_type] = self._event_factory.is_handler_available(event_type)
+            if not handler_available[event_type]:
+                raise basefunctions.NoHandlerAvailableError(event_type)
+
+        rate_limited: dict[str, bool] = {}
+        sync_events: list[basefunctions.Event] = []
+        async_events: list[basefunctions.Event] = []
+        pooled_events: list[basefunctions.Event] = []
+        held_events: list[basefunctions.Event] = []
+        limited_tasks: list[tuple[int, int, basefunctions.Event]] = []
+        queued_tasks: list[tuple[int, int, basefunctions.Event]] = []
+        rejected: list[tuple[int, int, basefunctions.Event]] = []
+
+        futures: list[EventFuture] = []
+
+        with self._publish_lock:
+            progress = self._progress_context.get(threading.get_ident())
+
+            if return_futures:
+                futures = [EventFuture(event.event_id) for event in events]
+                with self._future_lock:
+                    for future in futures:
+                        future.set_running_or_notify_cancel()
+                        self._futures[future.event_id] = future
+            elif not store_result:
+                with self._future_lock:
+                    for event in events:
+                        self._futures[event.event_id] = _DISCARDED_RESULT
+
+            for event in events:
+                if progress is not None and not event.progress_tracker:
+                    event.progress_tracker, event.progress_steps = progress
+
+                event_type = event.event_type
+                if event_type not in rate_limited:
+                    rate_limited[event_type] = self._ticked_rate_limiter.has_limit(event_type)
+
+                self._event_counter += 1
+                if not return_futures and store_result:
+                    self._result_store.reserve(event.event_id)
+                task = (event.priority, self._event_counter, event)
+
+                if event.depends_on:
+                    held_events.append(event)
+                elif rate_limited[event_type]:
+                    limited_tasks.append(task)
+                elif event.event_exec_mode == basefunctions.EXECUTION_MODE_SYNC:
+                    sync_events.append(event)
+                elif event.event_exec_mode == basefunctions.EXECUTION_MODE_ASYNC:
+                    async_events.append(event)
+                elif self._uses_corelet_pool(event):
+                    pooled_events.append(event)
+                else:
+                    queued_tasks.append(task)
+
+        if queued_tasks:
+            self._enqueue_tasks(queued_tasks)
+
+        for task in limited_tasks:
+            if rejected:
+                rejected.append(task)
+                continue
+            try:
+                self._submit_rate_limited(task)
+            except basefunctions.EventQueueFullError:
+                rejected.append(task)
+        self._complete_queue_overflow(rejected, "rejected")
+
+        for event in pooled_events:
+            self._handle_pooled_corelet_event(event=event)
+
+        for event in async_events:
+            self._handle_async_event(event=event)
+
+        for event in sync_events:
+            self._handle_sync_event(event=event)
+
+        for event in held_events:
+            self._hold_event(event)
+
+        if return_futures:
+            return futures
+        return [event.event_id for event in events]
+
+    def _enqueue_tasks(self, tasks: list[tuple[int, int, basefunctions.Event]]) -> None:
+        """
+        Push multiple tasks into the input queue under a single queue lock.
+
+        Tasks dropped or rejected by a bounded queue complete with
+        EventQueueFullError instead of raising, since earlier tasks of the
+        batch are already queued.
+
+        Parameters
+        ----------
+        tasks : list[tuple[int, int, basefunctions.Event]]
+            Task tuples (priority, counter, event)
+        """
+        dropped, rejected = self._input_queue.offer_many(tasks)
+        self._complete_queue_overflow(dropped, "dropped")
+        self._complete_queue_overflow(rejected, "rejected")
+
+    def _submit_rate_limited(self, task: tuple[int, int, basefunctions.Event]) -> None:
+        """
+        Apply the input queue bound to a rate-limited event and submit it to the rate limiter.
+
+        The bound is applied once, here: the event reserves a queue slot
+        while it waits for a token, and the rate limiter later forwards it
+        into that slot with put_internal(), so its scheduler thread never
+        blocks on a full queue.
+
+        Parameters
+        ----------
+        task : tuple[int, int, basefunctions.Event]
+            Task tuple (priority, counter, event)
+
+        Raises
+        ------
+        EventQueueFullError
+            If the bounded input queue rejects the event.
+        """
+        priority, counter, event = task
+        dropped = self._input_queue.admit(task)
+        self._complete_queue_overflow(dropped, "dropped")
+        if dropped and dropped[0] is task:
+            return
+
+        if self._tracer.enabled:
+            self._trace_rate_limit_wait(event)
+        self._ticked_rate_limiter.submit(
+            event_type=event.event_type,
+            priority=priority,
+            counter=counter,
+            event=event,
+        )
+
+    def _complete_queue_overflow(self, tasks: list[tuple[int, int, basefunctions.Event]], reason: str) -> None:
+        """
+        Complete events that did not fit into the bounded input queue.
+
+        Parameters
+        ----------
+        tasks : list[tuple[int, int, basefunctions.Event]]
+            Dropped or rejected task tuples
+        reason : str
+            "dropped" or "rejected", used in the error message
+        """
+        for _, _, event in tasks:
+            error = basefunctions.EventQueueFullError(f"Event {event.event_id} {reason}: input queue full")
+            self._complete_event(event, basefunctions.EventResult.exception_result(event.event_id, error))
+
+    def _map_results(
+        self,
+        event_type: str,
+        iterator: Iterator[Any],
+        chunksize: int,
+        ordered: bool,
+        window: int,
+        timeout: int,
+        max_retries: int,
+        chunk_template: dict[str, Any],
+    ) -> Iterator[basefunctions.EventResult]:
+        """
+        Generator behind map(): keep window chunks in flight and yield their item results.
+        """
+        in_flight: deque[EventFuture] = deque()
+        completed: queue.SimpleQueue[EventFuture] = queue.SimpleQueue()
+        sizes: dict[EventFuture, int] = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(sizes) < window:
+                    items = list(islice(iterator, chunksize))
+                    if not items:
+                        exhausted = True
+                        break
+                    chunk = basefunctions.Event(
+                        INTERNAL_MAP_CHUNK_EVENT,
+                        event_data=(event_type, max_retries, items),
+                        timeout=timeout * len(items),
+                        **chunk_template,
+                    )
+                    future = self.publish(chunk, return_future=True)
+                    sizes[future] = len(items)
+                    if ordered:
+                        in_flight.append(future)
+                    else:
+                        future.add_done_callback(completed.put)
+                if not sizes:
+                    return
+
+                future = in_flight.popleft() if ordered else completed.get()
+                size = sizes.pop(future)
+                yield from self._map_chunk_results(future.result(), size)
+        finally:
+            for future in sizes:
+                if not future.done():
+                    self.cancel(future.event_id)
+
+    @staticmethod
+    def _map_chunk_results(chunk_result: basefunctions.EventResult, size: int) -> list[basefunctions.EventResult]:
+        """
+        Item results of a map chunk; a failed chunk fails each of its inputs.
+        """
+        if chunk_result.success and isinstance(chunk_result.data, tuple):
+            values, failures = chunk_result.data
+            prefix = chunk_result.event_id
+            results = [
+                basefunctions.EventResult(f"{prefix}:{index}", True, value) for index, value in enumerate(values)
+            ]
+            for index, failure in failures.items():
+                results[index] = failure
+            return results
+        error = chunk_result.exception or basefunctions.EventExecutionError(
+            f"Map chunk failed: {chunk_result.data}"
+        )
+        return [basefunctions.EventResult.exception_result(chunk_result.event_id, error) for _ in range(size)]
+
+    def _handle_sync_event(self, event: basefunctions.Event) -> None:
+        """
+        Handle a synchronous event with timeout and retry logic.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The event to handle
+        """
+        # Get handler from cache or create a new one
+        handler = self._get_handler(event_type=event.event_type, context=self._sync_event_context)
+
+        # Execute with retry logic
+        event_result = self._retry_with_timeout(event, handler, self._sync_event_context)
+
+        # Deliver result to future or result store
+        self._complete_event(event, event_result)
+
+    def _handle_thread_and_corelet_event(self, event: basefunctions.Event) -> None:
+        """
+        Handle a threading or corelet event by queuing for async processing.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The event to handle
+        """
+
+        # Create task tuple: (priority, counter, event)
+        with self._publish_lock:
+            self._event_counter += 1
+            task = (
+                event.priority,
+                self._event_counter,
+                event,
+            )  # priority bereits gesetzt
+
+        try:
+            if event.event_type == INTERNAL_SHUTDOWN_EVENT:
+                # Shutdown events must reach every worker, whatever the queue bound
+                self._input_queue.put_internal(task)
+            else:
+                self._complete_queue_overflow(self._input_queue.offer(task), "dropped")
+        except basefunctions.EventQueueFullError:
+            # Rejected: the caller gets the exception, nothing is left registered
+            self._discard_future(event.event_id)
+            self._result_store.pop(event.event_id)
+            raise
+        except Exception as e:
+            self._logger.error("Failed to queue event %s: %s", event.event_type, str(e))
+            error_result = basefunctions.EventResult.exception_result(event.event_id, e)
+            self._complete_event(event, error_result)
+
+    def _complete_event(self, event: basefunctions.Event, event_result: basefunctions.EventResult) -> None:
+        """
+        Deliver the final result of an event and update progress tracking.
+
+        Resolves the event's future if one was requested, otherwise stores the
+        result for get_results() (unless it was published with
+        store_result=False). Events waiting for this event via depends_on are
+        released afterwards.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The processed event
+        event_result : basefunctions.EventResult
+            Final result after retries
+        """
+        if self._cancelled_ids:
+            self._cancelled_ids.discard(event.event_id)
+        if self._retry_attempts:
+            self._retry_attempts.pop(event.event_id, None)
+
+        future = None
+        if self._futures:
+            with self._future_lock:
+                future = self._futures.pop(event.event_id, None)
+
+        if future is not None:
+            future.set_result(event_result)
+        else:
+            self._result_store.put(event.event_id, event_result)
+
+        if self._metrics.enabled:
+            self._metrics.record_completion(event, event_result)
+        if self._tracer.enabled:
+            self._tracer.discard(event.event_id)
+
+        # Update progress tracker if attached
+        if event.progress_tracker and event.progress_steps > 0:
+            event.progress_tracker.progress(event.progress_steps)
+
+        # Checked after delivery: _hold_event() registers first and looks for results afterwards
+        if self._dependents:
+            self._release_dependents(event.event_id, event_result)
+
+    def _is_cancelled(self, event: basefunctions.Event) -> bool:
+        """
+        Check whether a not yet started event was cancelled via cancel().
+        """
+        return bool(self._cancelled_ids) and event.event_id in self._cancelled_ids
+
+    def _cancelled_result(self, event: basefunctions.Event) -> basefunctions.EventResult:
+        """
+        Create the result of an event dropped or stopped by cancel().
+        """
+        error = basefunctions.EventCancelledError(f"Event {event.event_id} cancelled")
+        return basefunctions.EventResult.exception_result(event.event_id, error)
+
+    def _shutdown_result(self, event: basefunctions.Event) -> basefunctions.EventResult:
+        """
+        Create the result of an event dropped by shutdown(immediately=True).
+        """
+        error = basefunctions.EventShutdownError(f"Event {event.event_id} dropped on shutdown")
+        return basefunctions.EventResult.exception_result(event.event_id, error)
+
+    def _begin_cancellable(self, event: basefunctions.Event) -> CancellationToken:
+        """
+        Register the cancellation token of an event that starts running.
+        """
+        token = CancellationToken()
+        self._running_tokens[event.event_id] = token
+        if self._metrics.enabled or (self._tracer.enabled and self._tracer.is_sampled(event)):
+            self._run_started[event.event_id] = time.perf_counter_ns()
+        # cancel() may have recorded the id before the token was visible
+        if self._is_cancelled(event):
+            token.cancel(f"Event {event.event_id} cancelled")
+        return token
+
+    def _end_cancellable(self, event: basefunctions.Event) -> None:
+        """
+        Unregister the cancellation token of a finished event.
+        """
+        self._running_tokens.pop(event.event_id, None)
+        if self._run_started:
+            started = self._run_started.pop(event.event_id, None)
+            if started is not None:
+                ended = time.perf_counter_ns()
+                if self._metrics.enabled:
+                    self._metrics.record_execution(event.event_type, (ended - started) / 1_000_000_000)
+                if self._tracer.enabled and self._tracer.is_sampled(event):
+                    self._tracer.add_span(SPAN_HANDLER, event, started, ended)
+
+    def _register_future(self, event_id: str) -> EventFuture:
+        """
+        Create and register a running future for an event.
+
+        Parameters
+        ----------
+        event_id : str
+            Event ID the future is resolved for
+
+        Returns
+        -------
+        EventFuture
+            Registered future
+        """
+        future = EventFuture(event_id)
+        future.set_running_or_notify_cancel()
+        with self._future_lock:
+            self._futures[event_id] = future
+        return future
+
+    def _discard_future(self, event_id: str) -> None:
+        """
+        Remove a registered future without resolving it.
+
+        Parameters
+        ----------
+        event_id : str
+            Event ID of the future to discard
+        """
+        with self._future_lock:
+            self._futures.pop(event_id, None)
+
+    # =============================================================================
+    # ASYNCIO EXECUTION
+    # =============================================================================
+
+    def _handle_async_event(self, event: basefunctions.Event) -> None:
+        """
+        Hand an ASYNC event over to the bus-owned event loop.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The event to handle
+        """
+        loop = self._get_async_loop()
+        self._begin_detached()
+        try:
+            asyncio.run_coroutine_threadsafe(self._process_event_async(event), loop)
+        except Exception as e:
+            self._logger.error("Failed to schedule async event %s: %s", event.event_type, str(e))
+            self._complete_event(event, basefunctions.EventResult.exception_result(event.event_id, e))
+            self._end_detached()
+
+    async def _process_event_async(self, event: basefunctions.Event) -> None:
+        """
+        Process an ASYNC event on the event loop and deliver its result.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event to process
+        """
+        try:
+            if self._is_cancelled(event):
+                self._complete_event(event, self._cancelled_result(event))
+                return
+            token = self._begin_cancellable(event)
+            try:
+                # Concurrent events share the loop thread - give each its own token
+                context = self._async_context.with_cancel_token(token)
+                handler = self._get_handler(event.event_type, context)
+                event_result = await self._retry_with_timeout_async(event, handler, context)
+            except Exception as e:
+                event_result = basefunctions.EventResult.exception_result(event.event_id, e)
+            finally:
+                self._end_cancellable(event)
+            self._complete_event(event, event_result)
+        finally:
+            self._end_detached()
+
+    async def _retry_with_timeout_async(
+        self,
+        event: basefunctions.Event,
+        handler: basefunctions.EventHandler,
+        context: basefunctions.EventContext,
+    ) -> basefunctions.EventResult:
+        """
+        Execute event on the event loop with timeout and retry logic.
+
+        Coroutine handlers (async def handle) are awaited directly and
+        cancelled on timeout. Regular handlers run in the default executor
+        so they cannot block the event loop; a thread cannot be interrupted,
+        so a timed-out attempt whose thread still runs ends the retries
+        instead of starting a second copy of the handler next to it.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event to process.
+        handler : basefunctions.EventHandler
+            Handler to execute.
+        context : basefunctions.EventContext
+            Execution context.
+
+        Returns
+        -------
+        basefunctions.EventResult
+            EventResult from handler execution or retry exhaustion.
+        """
+        last_exception = None
+        last_business_failure = None
+        is_coroutine_handler = inspect.iscoroutinefunction(handler.handle)
+        running: asyncio.Future | None = None
+        token = context.cancel_token
+
+        backoff = self._retry_backoffs.get(event.event_type) if self._retry_backoffs else None
+
+        for attempt in range(event.max_retries):
+            if backoff is not None and attempt > 0:
+                # Waits on the event loop, other ASYNC events keep running
+                await asyncio.sleep(backoff.delay(attempt))
+            if token is not None:
+                if token.reason is not None:
+                    return self._cancelled_result(event)
+                token.deadline = time.monotonic() + event.timeout
+            if attempt and self._metrics.enabled:
+                self._metrics.record_retry(event.event_type)
+            try:
+                if is_coroutine_handler:
+                    awaitable = handler.handle(event, context)
+                else:
+                    # Shielded: on timeout only the wait ends, running tells whether the thread still runs
+                    running = asyncio.ensure_future(asyncio.to_thread(handler.handle, event, context))
+                    awaitable = asyncio.shield(running)
+                event_result = await asyncio.wait_for(awaitable, timeout=event.timeout)
+
+                if event_result.success:
+                    return event_result
+                else:
+                    last_business_failure = event_result
+
+            except basefunctions.EventCancelledError:
+                return self._cancelled_result(event)
+
+            except asyncio.TimeoutError as e:
+                last_exception = TimeoutError(f"Async handler timed out after {event.timeout} seconds")
+                last_exception.__cause__ = e
+                self._logger.warning("Timeout on attempt %d: %s", attempt + 1, str(last_exception))
+                if self._metrics.enabled:
+                    self._metrics.record_timeout(event.event_type)
+
+                if hasattr(handler, "terminate"):
+                    try:
+                        handler.terminate(context=context)
+                    except Exception as terminate_error:
+                        self._logger.error(
+                            "Failed to terminate handler process: %s",
+                            str(terminate_error),
+                        )
+
+                if running is not None and not running.done():
+                    # Retrieve the late outcome so it is not reported as never retrieved
+                    running.add_done_callback(lambda task: task.cancelled() or task.exception())
+                    self._logger.warning(
+                        "Handler thread of %s still running after timeout, not retrying", event.event_id
+                    )
+                    break
+
+            except Exception as e:
+                last_exception = e
+                self._logger.warning("Exception on attempt %d: %s", attempt + 1, str(e))
+
+        # All retries exhausted
+        if last_exception:
+            return basefunctions.EventResult.exception_result(event.event_id, last_exception)
+        elif last_business_failure is not None:
+            return last_business_failure
+        else:
+            return basefunctions.EventResult.business_result(
+                event.event_id,
+                False,
+                f"Event failed after {event.max_retries} attempts without result",
+            )
+
+    def _get_async_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the bus-owned event loop, starting its thread on first use.
+
+        Returns
+        -------
+        asyncio.AbstractEventLoop
+            Running event loop for ASYNC events
+        """
+        if self._async_loop is not None:
+            return self._async_loop
+
+        with self._async_lock:
+            if self._async_loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                self._async_context = basefunctions.EventContext(thread_local_data=threading.local())
+
+                def run_loop() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    try:
+                        loop.run_forever()
+                    finally:
+                        loop.run_until_complete(loop.shutdown_asyncgens())
+                        loop.run_until_complete(loop.shutdown_default_executor())
+                        loop.close()
+
+                thread = threading.Thread(target=run_loop, name="EventBusAsyncLoop", daemon=True)
+                thread.start()
+                started.wait()
+
+                self._async_thread = thread
+                self._async_loop = loop
+                self._logger.info("EventBus async event loop started")
+
+        return self._async_loop
+
+    def _stop_async_loop(self) -> None:
+        """
+        Stop the event loop thread of ASYNC mode if it was started.
+        """
+        with self._async_lock:
+            loop, thread = self._async_loop, self._async_thread
+            self._async_loop = None
+            self._async_thread = None
+
+        if loop is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    # =============================================================================
+    # CORELET POOL EXECUTION
+    # =============================================================================
+
+    def _create_corelet_pool(
+        self,
+        size: int,
+        window: int,
+        batch_size: int,
+        prewarm_corelets: int | None,
+        preload_modules: list[str] | None,
+        start_method: str | None,
+    ) -> CoreletPool:
+        """
+        Create the corelet pool and start prewarmed corelets.
+
+        Parameters
+        ----------
+        size : int
+            Maximum number of pooled corelets
+        window : int
+            Messages in flight per corelet
+        batch_size : int
+            Maximum events per message
+        prewarm_corelets : int or None
+            Corelets to start immediately, None starts them on demand
+        preload_modules : list[str] or None
+            Modules imported by corelets before their first event
+        start_method : str or None
+            Process start method, None for the platform default
+
+        Returns
+        -------
+        CoreletPool
+            New corelet pool
+        """
+        pool = CoreletPool(
+            size,
+            self._shared_memory_threshold,
+            window,
+            batch_size,
+            start_method=start_method,
+            preload_modules=preload_modules,
+            max_tasks=self._corelet_max_tasks,
+            max_rss_mb=self._corelet_max_rss_mb,
+        )
+        if prewarm_corelets is not None:
+            pool.prewarm(prewarm_corelets)
+        return pool
+
+    def _uses_corelet_pool(self, event: basefunctions.Event) -> bool:
+        """
+        Check whether an event is executed by the corelet pool.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event to check
+
+        Returns
+        -------
+        bool
+            True for CORELET events when a pool is configured (except shutdown
+            events and events with a partition_key, which stay with the
+            corelet of their worker thread)
+        """
+        return (
+            self._corelet_pool is not None
+            and event.event_exec_mode == basefunctions.EXECUTION_MODE_CORELET
+            and event.event_type != INTERNAL_SHUTDOWN_EVENT
+            and event.partition_key is None
+        )
+
+    def _handle_pooled_corelet_event(self, event: basefunctions.Event) -> None:
+        """
+        Hand a CORELET event over to the corelet pool.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The event to handle
+        """
+        self._begin_detached()
+        started = time.perf_counter() if self._metrics.enabled else None
+        try:
+            self._corelet_pool.submit(event, partial(self._complete_pooled_event, event, started=started))
+        except Exception as e:
+            self._logger.error("Failed to submit corelet event %s: %s", event.event_type, str(e))
+            self._complete_pooled_event(event, basefunctions.EventResult.exception_result(event.event_id, e))
+
+    def _complete_pooled_event(
+        self,
+        event: basefunctions.Event,
+        event_result: basefunctions.EventResult,
+        started: float | None = None,
+    ) -> None:
+        """
+        Deliver the result of a pooled corelet event (runs on the pool dispatcher).
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The processed event
+        event_result : basefunctions.EventResult
+            Final result after retries
+        started : float, optional
+            perf_counter() at submission while metrics are enabled
+        """
+        if started is not None:
+            self._metrics.record_execution(event.event_type, time.perf_counter() - started)
+        try:
+            self._complete_event(event, event_result)
+        finally:
+            self._end_detached()
+
+    def _begin_detached(self) -> None:
+        """
+        Register an event processed outside the input queue accounting.
+        """
+        with self._detached_cond:
+            self._detached_count += 1
+
+    def _end_detached(self) -> None:
+        """
+        Mark a detached event as finished and wake up join() callers.
+        """
+        with self._detached_cond:
+            self._detached_count -= 1
+            if self._detached_count <= 0:
+                self._detached_cond.notify_all()
+
+    # =============================================================================
+    # DEPENDENCY TRACKING
+    # =============================================================================
+
+    def _hold_event(self, event: basefunctions.Event) -> None:
+        """
+        Hold back an event until all events in its depends_on completed.
+
+        The event is registered as waiting first and the upstream events are
+        checked afterwards, while _complete_event() delivers a result first
+        and looks for waiting dependents afterwards. Either side therefore
+        sees the other, without a lock spanning both.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event with depends_on, its future or result placeholder already registered
+        """
+        upstream_futures: dict[str, EventFuture] = {}
+        upstream_ids: list[str] = []
+        for dependency in event.depends_on:
+            if isinstance(dependency, EventFuture):
+                upstream_futures[dependency.event_id] = dependency
+                upstream_ids.append(dependency.event_id)
+            else:
+                upstream_ids.append(dependency)
+        # Futures stay out of the event, it may be pickled for a corelet
+        event.depends_on = upstream_ids
+        wait = _DependencyWait(event)
+
+        self._begin_detached()
+        with self._dependency_lock:
+            self._waiting_events[event.event_id] = wait
+            for upstream_id in wait.remaining:
+                self._dependents.setdefault(upstream_id, []).append(wait)
+
+        # Upstream events that completed before the registration above
+        settled: dict[str, basefunctions.EventResult] = {}
+        for upstream_id in dict.fromkeys(upstream_ids):
+            future = upstream_futures.get(upstream_id) or self._futures.get(upstream_id)
+            if future is not None:
+                if future.done():
+                    settled[upstream_id] = future.result()
+                continue
+
+            known = upstream_id in self._result_store
+            result = self._result_store.get(upstream_id)
+            if result is not None:
+                settled[upstream_id] = result
+            elif not known:
+                error = basefunctions.EventDependencyError(
+                    f"Dependency {upstream_id} is unknown or its result was already consumed"
+                )
+                settled[upstream_id] = basefunctions.EventResult.exception_result(upstream_id, error)
+
+        if settled:
+            self._settle_dependencies(upstream_ids=settled, waits=[wait], detach=True)
+
+    def _release_dependents(self, upstream_id: str, event_result: basefunctions.EventResult) -> None:
+        """
+        Pass the result of a completed event to the events waiting for it.
+
+        Parameters
+        ----------
+        upstream_id : str
+            ID of the completed event
+        event_result : basefunctions.EventResult
+            Its final result
+        """
+        with self._dependency_lock:
+            waits = self._dependents.pop(upstream_id, None)
+        if waits:
+            self._settle_dependencies(upstream_ids={upstream_id: event_result}, waits=waits)
+
+    def _settle_dependencies(
+        self,
+        upstream_ids: dict[str, basefunctions.EventResult],
+        waits: list[_DependencyWait],
+        detach: bool = False,
+    ) -> None:
+        """
+        Record upstream results for waiting events and dispatch the ready ones.
+
+        Parameters
+        ----------
+        upstream_ids : dict[str, basefunctions.EventResult]
+            Completed upstream event IDs and their results
+        waits : list[_DependencyWait]
+            Waiting events that depend on (some of) them
+        detach : bool, optional
+            Also remove the waits from _dependents (the upstream events
+            completed before the waits were registered). Default is False.
+        """
+        ready: list[_DependencyWait] = []
+        with self._dependency_lock:
+            for wait in waits:
+                for upstream_id, event_result in upstream_ids.items():
+                    if upstream_id not in wait.remaining:
+                        continue
+                    wait.remaining.discard(upstream_id)
+                    wait.results[upstream_id] = event_result
+                    if detach:
+                        dependents = self._dependents.get(upstream_id)
+                        if dependents is not None and wait in dependents:
+                            dependents.remove(wait)
+                            if not dependents:
+                                del self._dependents[upstream_id]
+                # A wait removed by cancel() is not dispatched
+                if not wait.remaining and self._waiting_events.pop(wait.event.event_id, None) is wait:
+                    ready.append(wait)
+
+        for wait in ready:
+            self._dispatch_dependent(wait)
+
+    def _dispatch_dependent(self, wait: _DependencyWait) -> None:
+        """
+        Route a released event, or skip it if a dependency did not succeed.
+
+        Parameters
+        ----------
+        wait : _DependencyWait
+            Waiting event whose dependencies all completed
+        """
+        event = wait.event
+        try:
+            failed = next((wait.results[i] for i in event.depends_on if not wait.results[i].success), None)
+            if self._is_cancelled(event):
+                self._complete_event(event, self._cancelled_result(event))
+            elif failed is not None:
+                error = basefunctions.EventDependencyError(
+                    f"Event {event.event_id} skipped: dependency {failed.event_id} did not succeed"
+                )
+                self._complete_event(event, basefunctions.EventResult.exception_result(event.event_id, error))
+            else:
+                if event.inject_results:
+                    event.event_data = {
+                        **(event.event_data or {}),
+                        DEPENDENCY_RESULTS_KEY: [wait.results[i].data for i in event.depends_on],
+                    }
+                self._route_released_event(event)
+        except Exception as e:
+            self._logger.error("Failed to release event %s: %s", event.event_type, str(e))
+            self._complete_event(event, basefunctions.EventResult.exception_result(event.event_id, e))
+        finally:
+            self._end_released()
+
+    def _route_released_event(self, event: basefunctions.Event) -> None:
+        """
+        Route a released event like publish() does.
+
+        Queued events bypass the input queue bound, they were admitted when
+        published.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event whose dependencies all succeeded
+        """
+        execution_mode = event.event_exec_mode
+        with self._publish_lock:
+            self._event_counter += 1
+            task = (event.priority, self._event_counter, event)
+            if self._ticked_rate_limiter.has_limit(event.event_type):
+                if self._tracer.enabled:
+                    self._trace_rate_limit_wait(event)
+                self._ticked_rate_limiter.submit(
+                    event_type=event.event_type,
+                    priority=event.priority,
+                    counter=self._event_counter,
+                    event=event,
+                )
+                return
+
+        # Never SYNC: publish() rejects delay and depends_on for sync events
+        if execution_mode == basefunctions.EXECUTION_MODE_ASYNC:
+            self._handle_async_event(event=event)
+        elif self._uses_corelet_pool(event):
+            self._handle_pooled_corelet_event(event=event)
+        else:
+            self._input_queue.put_internal(task)
+
+    def _end_released(self) -> None:
+        """
+        Count a released event and free its detached slot.
+        """
+        # Counted before the detached slot is freed, join() checks it afterwards
+        with self._detached_cond:
+            self._release_count += 1
+        self._end_detached()
+
+    # =============================================================================
+    # DELAYED EVENTS & RETRY BACKOFF
+    # =============================================================================
+
+    def _schedule_release(self, event: basefunctions.Event, delay: float, retry: bool = False) -> None:
+        """
+        Route an admitted event after delay seconds via the shared deadline scheduler.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event with its future or result placeholder already registered
+        delay : float
+            Seconds until the event is routed
+        retry : bool, optional
+            The event is retried after a failed attempt; its dependencies
+            are not resolved again. Default is False.
+        """
+        self._begin_detached()
+        release = partial(self._release_delayed, event, retry)
+        handle = get_deadline_scheduler().schedule(delay, partial(self._defer_release, release))
+        self._delayed_events[event.event_id] = (handle, event)
+        # The deadline may have expired before the entry above was visible
+        if handle.fired:
+            self._delayed_events.pop(event.event_id, None)
+
+    def _release_delayed(self, event: basefunctions.Event, retry: bool) -> None:
+        """
+        Route a delayed event whose delay expired (runs on the release thread).
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            The delayed event
+        retry : bool
+            The event is retried after a failed attempt
+        """
+        self._delayed_events.pop(event.event_id, None)
+        try:
+            if self._timers_stopped or self._is_cancelled(event):
+                self._complete_event(event, self._cancelled_result(event))
+            elif event.depends_on and not retry:
+                self._hold_event(event)
+            else:
+                self._route_released_event(event)
+        except Exception as e:
+            self._logger.error("Failed to release event %s: %s", event.event_type, str(e))
+            self._complete_event(event, basefunctions.EventResult.exception_result(event.event_id, e))
+        finally:
+            self._end_released()
+
+    def _retry_later(self, event: basefunctions.Event, event_result: basefunctions.EventResult) -> bool:
+        """
+        Re-enqueue a failed queued event after its retry backoff instead of completing it.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event whose attempt failed
+        event_result : basefunctions.EventResult
+            Result of the failed attempt
+
+        Returns
+        -------
+        bool
+            True if a retry was scheduled, False if the result is final
+        """
+        backoff = self._retry_backoffs.get(event.event_type)
+        if (
+            backoff is None
+            or self._timers_stopped
+            or self._is_cancelled(event)
+            or isinstance(event_result.exception, basefunctions.EventCancelledError)
+        ):
+            return False
+
+        attempt = self._retry_attempts.get(event.event_id, 0) + 1
+        if attempt >= event.max_retries:
+            return False
+        self._retry_attempts[event.event_id] = attempt
+        self._schedule_release(event, backoff.delay(attempt), retry=True)
+        return True
+
+    def _defer_release(self, release: Callable[[], None]) -> None:
+        """
+        Hand timed work over to the release thread (called on the scheduler thread).
+
+        Releases take _publish_lock and may publish, so they must not run on
+        the deadline scheduler thread: a SYNC handler holding _publish_lock
+        would block every handler timeout until it returns. Once the release
+        thread stopped, the work runs at once; it then only completes events
+        as cancelled.
+
+        Parameters
+        ----------
+        release : Callable[[], None]
+            Work to run on the release thread
+        """
+        with self._release_lock:
+            if not self._release_closed:
+                if self._release_thread is None:
+                    self._release_thread = threading.Thread(
+                        target=self._release_loop, name="EventBusRelease", daemon=True
+                    )
+                    self._release_thread.start()
+                self._release_queue.put(release)
+                return
+        release()
+
+    def _release_loop(self) -> None:
+        """
+        Release thread: run handed-over releases in order until None arrives.
+        """
+        while True:
+            release = self._release_queue.get()
+            if release is None:
+                return
+            try:
+                release()
+            except Exception as e:
+                self._logger.error("Release failed: %s", str(e))
+
+    def _stop_release_thread(self) -> None:
+        """
+        Run the releases still handed over, then stop the release thread.
+        """
+        with self._release_lock:
+            self._release_closed = True
+            thread = self._release_thread
+            if thread is not None:
+                self._release_queue.put(None)
+        if thread is not None:
+            thread.join(timeout=5)
+
+    def _stop_timers(self) -> None:
         """
-        Handle a threading or corelet event by queuing for async processing.
-
-        Parameters
-        ----------
-        event : basefunctions.Event
-            The event to handle
+        Cancel all periodic schedules and complete pending delayed events as cancelled.
         """
-
-        # Create task tuple: (priority, counter, event)
-        with self._publish_lock:
-            self._event_counter += 1
-            task = (
-                event.priority,
-                self._event_counter,
-                event,
-            )  # priority bereits gesetzt
-
-        try:
-            self._input_queue.put(item=task)
-        except Exception as e:
-            self._logger.error("Failed to queue event %s: %s", event.event_type, str(e))
-            error_result = basefunctions.EventResult.exception_result(event.event_id, e)
-            self._output_queue.put(item=error_result)
+        self._timers_stopped = True
+        for schedule in list(self._schedules):
+            schedule.cancel()
+
+        for event_id in list(self._delayed_events):
+            entry = self._delayed_events.pop(event_id, None)
+            # A deadline that already fired is completed by _release_delayed()
+            if entry is None or not entry[0].cancel():
+                continue
+            event = entry[1]
+            try:
+                self._complete_event(event, self._cancelled_result(event))
+            finally:
+                self._end_detached()
 
     # =============================================================================
     # THREAD POOL MANAGEMENT
@@ -685,7 +3062,7 @@ class EventBus:
 
         Notes
         -----
-        - Updates _num_threads and _max_cached_results accordingly
+        - Updates _num_threads and the result store max_results accordingly
         - Logs thread pool expansion with details
         - Thread-safe through _publish_lock
         """
@@ -708,7 +3085,7 @@ class EventBus:
 
             # Update configuration
             self._num_threads = new_thread_count
-            self._max_cached_results = new_thread_count * 1000
+            self._result_store.max_results = new_thread_count * 1000
 
         self._logger.info(
             f"EventBus thread pool expanded from {old_thread_count} "
@@ -721,6 +3098,7 @@ class EventBus:
         """
         thread_id = self._next_thread_id
         self._next_thread_id += 1
+        self._worker_activity[thread_id] = WorkerActivity()
 
         thread = threading.Thread(
             target=self._worker_loop,
@@ -731,6 +3109,108 @@ class EventBus:
         thread.start()
         self._worker_threads.append(thread)
 
+    # =============================================================================
+    # THREAD POOL AUTOSCALING
+    # =============================================================================
+
+    def _start_autoscaler(self) -> None:
+        """
+        Start the thread taking scaling decisions every AUTOSCALE_INTERVAL seconds.
+        """
+        self._autoscale_thread = threading.Thread(
+            target=self._autoscale_loop,
+            name="EventBusAutoscaler",
+            daemon=True,
+        )
+        self._autoscale_thread.start()
+
+    def _stop_autoscaler(self) -> None:
+        """
+        Stop scaling decisions and worker retirement (called on shutdown).
+        """
+        with self._publish_lock:
+            self._scaling_stopped = True
+            for activity in self._worker_activity.values():
+                activity.retire = False
+        self._autoscale_stop.set()
+        if self._autoscale_thread is not None and self._autoscale_thread is not threading.current_thread():
+            self._autoscale_thread.join(timeout=5.0)
+
+    def _autoscale_loop(self) -> None:
+        """
+        Autoscaler thread: sample queue and worker activity, apply decisions.
+        """
+        while not self._autoscale_stop.wait(AUTOSCALE_INTERVAL):
+            try:
+                self._autoscale_once()
+            except Exception as e:
+                self._logger.error("Autoscaling failed: %s", str(e))
+
+    def _autoscale_once(self) -> None:
+        """
+        Take and apply one scaling decision.
+        """
+        autoscaler = self._autoscaler
+        _, queue_wait = self._input_queue.take_wait_stats()
+        now = time.monotonic()
+
+        with self._publish_lock:
+            if self._scaling_stopped:
+                return
+            activities = list(self._worker_activity.values())
+            idle = [a for a in activities if not a.retire and a.idle_for(now) >= autoscaler.cooldown]
+            delta = autoscaler.decide(
+                now,
+                threads=len(activities),
+                busy_time=sum(a.busy_time(now) for a in activities),
+                queue_depth=self._input_queue.qsize(),
+                queue_wait=queue_wait,
+                idle_workers=len(idle),
+            )
+
+            if delta > 0:
+                # Pending retirements are pointless now
+                for activity in activities:
+                    activity.retire = False
+                for _ in range(delta):
+                    self._add_worker_thread()
+                self._num_threads += delta
+                self._result_store.max_results = max(self._result_store.max_results, self._num_threads * 1000)
+            elif delta < 0:
+                for activity in idle[:-delta]:
+                    activity.retire = True
+
+        if delta:
+            self._logger.info("Autoscaler %s worker pool by %d threads", "grew" if delta > 0 else "shrank", abs(delta))
+
+    def _retire_worker(self, thread_id: int, worker_context: basefunctions.EventContext) -> bool:
+        """
+        Remove the calling worker thread from the pool and clean up its corelet.
+
+        Parameters
+        ----------
+        thread_id : int
+            ID of the calling worker thread
+        worker_context : basefunctions.EventContext
+            Context holding the worker's corelet handle
+
+        Returns
+        -------
+        bool
+            True if the worker must exit, False if retirement was revoked
+        """
+        with self._publish_lock:
+            activity = self._worker_activity.get(thread_id)
+            if self._scaling_stopped or activity is None or not activity.retire:
+                return False
+            del self._worker_activity[thread_id]
+            current = threading.current_thread()
+            self._worker_threads = [thread for thread in self._worker_threads if thread is not current]
+            self._num_threads -= 1
+
+        self._cleanup_corelet(worker_context)
+        return True
+
     def _worker_loop(self, thread_id: int) -> None:
         """
         Main worker thread loop for processing async events.
@@ -744,12 +3224,26 @@ class EventBus:
         _worker_context = basefunctions.EventContext(thread_local_data=threading.local())
         _worker_context.thread_id = thread_id
         _running_flag = True
+        activity = self._worker_activity[thread_id]
+        # Autoscaled workers wake up more often to notice retirement
+        poll_timeout = AUTOSCALE_INTERVAL * 2 if self._autoscaler is not None else 5.0
+
+        # Parked task handed over when this worker frees a concurrency slot
+        next_task = None
+
+        # Keyed events whose partition key maps to this worker are queued in its lane
+        self._input_queue.add_lane(thread_id)
 
         while _running_flag:
             task = None
+            limited_type = None
             try:
                 # Get new task from input queue with timeout
-                task = self._input_queue.get(timeout=5.0)
+                if next_task is not None:
+                    task, next_task = next_task, None
+                else:
+                    task = self._input_queue.get(timeout=poll_timeout, lane=thread_id)
+                activity.begin()
 
                 # Extract task components: (priority, counter, event)
                 if not task or len(task) != 3:
@@ -758,6 +3252,39 @@ class EventBus:
 
                 priority, counter, event = task
 
+                # Cancelled while queued - drop without running
+                if self._is_cancelled(event):
+                    self._complete_event(event, self._cancelled_result(event))
+                    continue
+
+                # ASYNC events (forwarded by the rate limiter) run on the event loop
+                if event.event_exec_mode == basefunctions.EXECUTION_MODE_ASYNC:
+                    self._handle_async_event(event)
+                    continue
+
+                # Pooled CORELET events (forwarded by the rate limiter) go to the corelet pool
+                if self._uses_corelet_pool(event):
+                    self._handle_pooled_corelet_event(event)
+                    continue
+
+                # Event type at its concurrency limit - park it, it stays unfinished
+                if self._concurrency_limits and event.event_type in self._concurrency_limits:
+                    if not self._acquire_concurrency_slot(task):
+                        task = None
+                        continue
+                    limited_type = event.event_type
+
+                # Batch handlers: coalesce queued events of the same type into one call
+                if event.event_exec_mode in _BATCH_EXEC_MODES and event.event_type != INTERNAL_SHUTDOWN_EVENT:
+                    batch_tasks = self._collect_batch(event, _worker_context)
+                    if batch_tasks:
+                        try:
+                            self._process_event_batch([event, *(task[2] for task in batch_tasks)], _worker_context)
+                        finally:
+                            for _ in batch_tasks:
+                                self._input_queue.task_done()
+                        continue
+
                 # Route based on execution mode to specific process functions
                 if event.event_exec_mode == basefunctions.EXECUTION_MODE_THREAD:
                     event_result = self._process_event_thread_worker(event, _worker_context)
@@ -768,12 +3295,12 @@ class EventBus:
                 else:
                     raise ValueError(f"Unknown execution mode: {event.event_exec_mode}")
 
-                # Put result in output queue
-                self._output_queue.put(item=event_result)
+                # Failed attempt with retry backoff: re-enqueued later, the worker moves on
+                if not event_result.success and self._retry_backoffs and self._retry_later(event, event_result):
+                    continue
 
-                # Update progress tracker if attached
-                if event.progress_tracker and event.progress_steps > 0:
-                    event.progress_tracker.progress(event.progress_steps)
+                # Deliver result to future or result store
+                self._complete_event(event, event_result)
 
                 # Check for shutdown event after processing
                 if event.event_type == INTERNAL_SHUTDOWN_EVENT:
@@ -783,6 +3310,8 @@ class EventBus:
                     break
 
             except queue.Empty:
+                if activity.retire and self._retire_worker(thread_id, _worker_context):
+                    break
                 continue
 
             except Exception as e:
@@ -790,11 +3319,65 @@ class EventBus:
                 if task is not None:
                     _, _, event = task
                     error_result = basefunctions.EventResult.exception_result(event.event_id, e)
-                    self._output_queue.put(item=error_result)
+                    self._complete_event(event, error_result)
             finally:
+                activity.end()
+                if limited_type is not None:
+                    next_task = self._release_concurrency_slot(limited_type)
                 if task is not None:
+                    # Parked tasks (task is None) keep their partition key until they ran
+                    self._input_queue.release_key(task)
                     self._input_queue.task_done()
 
+        # Queued tasks of this lane move to the workers now owning their keys
+        self._input_queue.remove_lane(thread_id)
+
+    def _acquire_concurrency_slot(self, task: tuple[int, int, basefunctions.Event]) -> bool:
+        """
+        Take a concurrency slot for the task's event type or park the task.
+
+        Parameters
+        ----------
+        task : tuple[int, int, basefunctions.Event]
+            Task tuple (priority, counter, event) taken from the input queue
+
+        Returns
+        -------
+        bool
+            True if a slot was taken, False if the task was parked
+        """
+        event_type = task[2].event_type
+        with self._concurrency_lock:
+            limit = self._concurrency_limits.get(event_type)
+            in_flight = self._concurrency_in_flight.get(event_type, 0)
+            if limit is not None and in_flight >= limit:
+                heapq.heappush(self._parked_events.setdefault(event_type, []), task)
+                return False
+            self._concurrency_in_flight[event_type] = in_flight + 1
+            return True
+
+    def _release_concurrency_slot(self, event_type: str) -> tuple[int, int, basefunctions.Event] | None:
+        """
+        Release a concurrency slot and hand over the next parked task.
+
+        The slot is not reserved for the returned task; the worker competes
+        for it again, so a task may be parked once more.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type whose slot is released
+
+        Returns
+        -------
+        tuple[int, int, basefunctions.Event] or None
+            Highest-priority parked task of the event type, None if none is parked
+        """
+        with self._concurrency_lock:
+            self._concurrency_in_flight[event_type] -= 1
+            parked = self._parked_events.get(event_type)
+            return heapq.heappop(parked) if parked else None
+
     # =============================================================================
     # EVENT PROCESSING ENGINE
     # =============================================================================
@@ -899,10 +3482,48 @@ class EventBus:
         basefunctions.EventResult
             EventResult from handler execution or retry exhaustion.
         """
+        token = self._begin_cancellable(event)
+        context.cancel_token = token
+        try:
+            return self._run_attempts(event, handler, context, token)
+        finally:
+            context.cancel_token = None
+            self._end_cancellable(event)
+
+    def _run_attempts(
+        self,
+        event: basefunctions.Event,
+        handler: basefunctions.EventHandler,
+        context: basefunctions.EventContext,
+        token: CancellationToken,
+    ) -> basefunctions.EventResult:
+        """
+        Run the attempts of _retry_with_timeout() while the event is registered as cancellable.
+
+        With a retry backoff, worker threads run one attempt per dequeue and
+        re-enqueue the event (see _retry_later()); SYNC events sleep between
+        attempts in the publishing thread.
+        """
         last_exception = None
         last_business_failure = None
-
-        for attempt in range(event.max_retries):
+        backoff = self._retry_backoffs.get(event.event_type) if self._retry_backoffs else None
+
+        attempts = range(event.max_retries)
+        if backoff is not None and context is not self._sync_event_context:
+            done = self._retry_attempts.get(event.event_id, 0)
+            attempts = range(done, done + 1)
+
+        for attempt in attempts:
+            # Cancelled via cancel(): no further attempts
+            if token.reason is not None:
+                return self._cancelled_result(event)
+            if attempt and self._metrics.enabled:
+                self._metrics.record_retry(event.event_type)
+            if backoff is not None and attempt > attempts.start:
+                time.sleep(backoff.delay(attempt))
+                if token.reason is not None:
+                    return self._cancelled_result(event)
+            token.deadline = time.monotonic() + event.timeout
             try:
                 # For corelet mode: Add 1 second safety buffer to TimerThread
                 timer_timeout = (
@@ -919,9 +3540,14 @@ class EventBus:
                 else:
                     last_business_failure = event_result
 
+            except basefunctions.EventCancelledError:
+                return self._cancelled_result(event)
+
             except TimeoutError as e:
                 last_exception = e
                 self._logger.warning("Timeout on attempt %d: %s", attempt + 1, str(e))
+                if self._metrics.enabled:
+                    self._metrics.record_timeout(event.event_type)
 
                 # Terminate handler process if timeout occurs
                 if hasattr(handler, "terminate"):
@@ -950,6 +3576,184 @@ class EventBus:
                 f"Event failed after {event.max_retries} attempts without result",
             )
 
+    def _batch_limits(
+        self,
+        event: basefunctions.Event,
+        worker_context: basefunctions.EventContext,
+    ) -> tuple[int, float] | None:
+        """
+        Get (max_batch_size, max_batch_delay_ms) if the event type has a BatchEventHandler.
+
+        THREAD events check the worker's (cached) handler instance, CORELET
+        events the limits the EventFactory caches per event type, so neither
+        takes the factory lock per event. Lookup errors return None; the
+        regular processing path then reports them.
+        """
+        try:
+            if event.event_exec_mode != basefunctions.EXECUTION_MODE_THREAD:
+                return self._event_factory.get_batch_limits(event.event_type)
+            handler = self._get_handler(event.event_type, worker_context)
+        except Exception:
+            return None
+        if isinstance(handler, basefunctions.BatchEventHandler):
+            return handler.max_batch_size, handler.max_batch_delay_ms
+        return None
+
+    def _collect_batch(
+        self,
+        event: basefunctions.Event,
+        worker_context: basefunctions.EventContext,
+    ) -> list[tuple[int, int, basefunctions.Event]]:
+        """
+        Take queued events to process together with event in one handle_batch() call.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Event taken from the input queue (leads the batch)
+        worker_context : basefunctions.EventContext
+            Worker thread context with thread_local_data for handler cache
+
+        Returns
+        -------
+        list[tuple[int, int, basefunctions.Event]]
+            Tasks of the same event type and execution mode, removed from the
+            input queue (task_done() pending). Empty if the type is not batched.
+        """
+        limits = self._batch_limits(event, worker_context)
+        if limits is None or limits[0] <= 1:
+            return []
+
+        max_batch_size, max_batch_delay_ms = limits
+        event_type, exec_mode = event.event_type, event.event_exec_mode
+        return self._input_queue.take_matching(
+            lambda task: task[2].event_type == event_type and task[2].event_exec_mode == exec_mode,
+            max_batch_size - 1,
+            max_batch_delay_ms / 1000,
+        )
+
+    def _process_event_batch(
+        self,
+        events: list[basefunctions.Event],
+        worker_context: basefunctions.EventContext,
+    ) -> None:
+        """
+        Process coalesced events of one type and complete each of them.
+
+        Parameters
+        ----------
+        events : list[basefunctions.Event]
+            Events of the same type and execution mode, leading event first
+        worker_context : basefunctions.EventContext
+            Worker thread context with thread_local_data for handler cache
+        """
+        tokens = {event.event_id: self._begin_cancellable(event) for event in events}
+        try:
+            if events[0].event_exec_mode == basefunctions.EXECUTION_MODE_CORELET:
+                handler = self._get_handler(INTERNAL_CORELET_FORWARDING_EVENT, worker_context)
+            else:
+                handler = self._get_handler(events[0].event_type, worker_context)
+            results = self._run_batch_attempts(events, handler, worker_context, tokens)
+        except Exception as e:
+            self._logger.error("Batch processing failed: %s", str(e))
+            results = {
+                event.event_id: basefunctions.EventResult.exception_result(event.event_id, e) for event in events
+            }
+        finally:
+            worker_context.cancel_token = None
+            for event in events:
+                self._end_cancellable(event)
+
+        for event in events:
+            self._complete_event(event, results[event.event_id])
+
+    def _run_batch_attempts(
+        self,
+        events: list[basefunctions.Event],
+        handler: Any,
+        context: basefunctions.EventContext,
+        tokens: dict[str, CancellationToken],
+    ) -> dict[str, basefunctions.EventResult]:
+        """
+        Run handle_batch() attempts, retrying failed events individually.
+
+        Each attempt passes the events that still need one; an event leaves
+        the batch once it succeeds, is cancelled or used up its max_retries.
+        A timeout or exception of the whole call fails every event of the
+        attempt. The attempt timeout is the longest timeout of its events.
+
+        Returns
+        -------
+        dict[str, basefunctions.EventResult]
+            Final result per event_id
+        """
+        results: dict[str, basefunctions.EventResult] = {}
+        last_failure: dict[str, basefunctions.EventResult] = {}
+        pending = list(events)
+        attempt = 0
+
+        while pending:
+            remaining = []
+            for event in pending:
+                if tokens[event.event_id].reason is not None:
+                    results[event.event_id] = self._cancelled_result(event)
+                elif attempt >= event.max_retries:
+                    failure = last_failure.get(event.event_id)
+                    results[event.event_id] = failure or basefunctions.EventResult.business_result(
+                        event.event_id,
+                        False,
+                        f"Event failed after {event.max_retries} attempts without result",
+                    )
+                else:
+                    remaining.append(event)
+            pending = remaining
+            if not pending:
+                break
+            if attempt and self._metrics.enabled:
+                for event in pending:
+                    self._metrics.record_retry(event.event_type)
+
+            timeout = max(event.timeout for event in pending)
+            context.cancel_token = CancellationToken(time.monotonic() + timeout)
+            # For corelet mode: Add 1 second safety buffer to TimerThread
+            timer_timeout = (
+                timeout + 1 if pending[0].event_exec_mode == basefunctions.EXECUTION_MODE_CORELET else timeout
+            )
+            try:
+                with basefunctions.TimerThread(timer_timeout, threading.get_ident()):
+                    batch_results = handler.handle_batch(pending, context)
+                if len(batch_results) != len(pending):
+                    raise ValueError(f"handle_batch returned {len(batch_results)} results for {len(pending)} events")
+
+            except TimeoutError as e:
+                self._logger.warning("Timeout on batch attempt %d: %s", attempt + 1, str(e))
+                if self._metrics.enabled:
+                    for event in pending:
+                        self._metrics.record_timeout(event.event_type)
+                if hasattr(handler, "terminate"):
+                    try:
+                        handler.terminate(context=context)
+                    except Exception as terminate_error:
+                        self._logger.error("Failed to terminate handler process: %s", str(terminate_error))
+                batch_results = [basefunctions.EventResult.exception_result(event.event_id, e) for event in pending]
+
+            except Exception as e:
+                self._logger.warning("Exception on batch attempt %d: %s", attempt + 1, str(e))
+                batch_results = [basefunctions.EventResult.exception_result(event.event_id, e) for event in pending]
+
+            failed = []
+            for event, event_result in zip(pending, batch_results):
+                event_result.event_id = event.event_id
+                if event_result.success:
+                    results[event.event_id] = event_result
+                else:
+                    last_failure[event.event_id] = event_result
+                    failed.append(event)
+            pending = failed
+            attempt += 1
+
+        return results
+
     def _cleanup_corelet(self, context: basefunctions.EventContext) -> None:
         """
         Clean up corelet process and pipes when worker thread shuts down.
@@ -982,6 +3786,12 @@ class EventBus:
             handle.process.terminate()
             handle.process.join(timeout=2)
 
+            # Unlink shared memory segments the corelet left behind (e.g. unread replies)
+            try:
+                sweep_segments(handle.process.pid)
+            except Exception as e:
+                self._logger.warning("Shared memory sweep failed: %s", str(e))
+
             # Close pipes
             handle.input_pipe.close()
             handle.output_pipe.close()
@@ -1076,30 +3886,6 @@ class EventBus:
         except Exception as e:
             raise RuntimeError(f"Failed to create handler for event_type '{event_type}': {str(e)}") from e
 
-    def _add_result_with_lru(self, event_id: str, result: basefunctions.EventResult) -> None:
-        """
-        Add result with LRU eviction policy.
-
-        Parameters
-        ----------
-        event_id : str
-            Event ID for result storage
-        result : basefunctions.EventResult
-            Result to store
-        """
-        with self._publish_lock:  # Thread-safe
-            # Entfernen falls bereits vorhanden (für move-to-end)
-            if event_id in self._result_list:
-                del self._result_list[event_id]
-
-            # Hinzufügen (ans Ende)
-            self._result_list[event_id] = result
-
-            # LRU eviction: älteste entfernen wenn Limit überschritten
-            while len(self._result_list) > self._max_cached_results:
-                oldest_id = next(iter(self._result_list))  # erstes Element
-                del self._result_list[oldest_id]
-
     # =============================================================================
     # PUBLIC API - RATE LIMITING
     # =============================================================================
@@ -1111,14 +3897,14 @@ class EventBus:
         burst: int = 0
     ) -> None:
         """
-        Register second-ticked rate limit for event type.
+        Register rate limit for event type.
 
         Parameters
         ----------
         event_type : str
             Event type to rate limit
         requests_per_second : int
-            Maximum requests per second (enforced via 1-second tick)
+            Maximum requests per second, events are spaced 1/requests_per_second apart
         burst : int, optional
             Number of events to process immediately without rate limiting.
             Default is 0 (no burst).
@@ -1137,9 +3923,9 @@ class EventBus:
 
         Notes
         -----
-        - Rate limiting is enforced in 1-second intervals
-        - Starts dedicated worker thread for this event_type
-        - Thread lifecycle: Created on register, terminated on shutdown
+        - Tokens refill continuously; idle periods accumulate at most max(burst, 1)
+        - All event types share one scheduler thread
+        - Thread lifecycle: Created on first register, terminated on shutdown
         """
         self._ticked_rate_limiter.register(event_type, requests_per_second, burst)
         self._logger.info(
@@ -1211,3 +3997,145 @@ class EventBus:
         >>> print(f"Throughput: {metrics['total_processed'] / metrics['seconds_elapsed']:.2f}/s")
         """
         return self._ticked_rate_limiter.get_metrics(event_type)
+
+    # =============================================================================
+    # PUBLIC API - CONCURRENCY LIMITS
+    # =============================================================================
+
+    def register_concurrency_limit(self, event_type: str, max_in_flight: int) -> None:
+        """
+        Limit how many events of a type worker threads process at once.
+
+        A worker that takes an event whose type is at its limit parks it and
+        moves on to the next queued event instead of waiting, so a slow event
+        type can never occupy the whole pool. Parked events run in priority
+        order as soon as an event of their type completes.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type to limit
+        max_in_flight : int
+            Maximum number of events of this type processed at the same time
+
+        Raises
+        ------
+        ValueError
+            If max_in_flight <= 0
+
+        Examples
+        --------
+        Keep slow HTTP requests from starving other event types:
+
+        >>> bus = EventBus(num_threads=8)
+        >>> bus.register_concurrency_limit("http_request", 4)
+
+        Notes
+        -----
+        - Applies to THREAD, CMD and thread-bound CORELET events; ASYNC and
+          pooled CORELET events are not bound to worker threads
+        - Complements register_rate_limit(), which limits the start rate
+        - Parked events still count for join() and can be cancelled
+        - Raising the limit returns parked events to the input queue
+        """
+        if max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+
+        with self._concurrency_lock:
+            self._concurrency_limits[event_type] = max_in_flight
+            parked = self._parked_events.get(event_type)
+            free = max_in_flight - self._concurrency_in_flight.get(event_type, 0)
+            released = [heapq.heappop(parked) for _ in range(min(free, len(parked)))] if parked else []
+
+        if released:
+            self._input_queue.requeue(released)
+        self._logger.info(f"Registered concurrency limit for '{event_type}': {max_in_flight} in flight")
+
+    def get_concurrency_metrics(self, event_type: str) -> dict[str, int]:
+        """
+        Get concurrency limit metrics for an event type.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type to query
+
+        Returns
+        -------
+        dict[str, int]
+            Metrics dictionary with:
+            - limit: Configured max_in_flight
+            - in_flight: Events of this type being processed
+            - parked: Events waiting for a free slot
+
+        Raises
+        ------
+        ValueError
+            If event_type has no concurrency limit configured
+        """
+        with self._concurrency_lock:
+            limit = self._concurrency_limits.get(event_type)
+            if limit is None:
+                raise ValueError(f"No concurrency limit registered for event type: {event_type}")
+            return {
+                "limit": limit,
+                "in_flight": self._concurrency_in_flight.get(event_type, 0),
+                "parked": len(self._parked_events.get(event_type, ())),
+            }
+
+    # =============================================================================
+    # PUBLIC API - RETRY BACKOFF
+    # =============================================================================
+
+    def register_retry_backoff(
+        self,
+        event_type: str,
+        base_delay: float,
+        max_delay: float = DEFAULT_MAX_RETRY_DELAY,
+        jitter: bool = True,
+    ) -> None:
+        """
+        Wait with exponential backoff between the retry attempts of an event type.
+
+        Retry n waits base_delay * 2 ** (n - 1) seconds, capped at max_delay.
+        With jitter the wait is drawn uniformly from zero to that value, so
+        many failing events do not retry in lockstep. Worker threads do not
+        wait: a failed event is re-enqueued once its backoff expired and the
+        worker processes other events meanwhile.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type to retry with backoff
+        base_delay : float
+            Seconds to wait before the first retry
+        max_delay : float, optional
+            Maximum seconds to wait before a retry. Default is 30.
+        jitter : bool, optional
+            Randomize the waits (full jitter). Default is True.
+
+        Raises
+        ------
+        ValueError
+            If base_delay <= 0 or max_delay < base_delay
+
+        Examples
+        --------
+        >>> bus.register_retry_backoff("http_request", base_delay=0.5, max_delay=10)
+
+        Notes
+        -----
+        - The number of attempts stays event.max_retries
+        - ASYNC events wait on the event loop, SYNC events in the publishing thread
+        - Pooled CORELET events and BatchEventHandler batches retry immediately
+        - Events waiting for a retry count for join() and can be cancelled
+        """
+        if base_delay <= 0:
+            raise ValueError("base_delay must be positive")
+        if max_delay < base_delay:
+            raise ValueError("max_delay must be >= base_delay")
+
+        self._retry_backoffs[event_type] = _RetryBackoff(base_delay, max_delay, jitter)
+        self._logger.info(
+            f"Registered retry backoff for '{event_type}': base={base_delay}s, max={max_delay}s, jitter={jitter}"
+        )
@@ -20,8 +20,10 @@ from __future__ import annotations
 # -------------------------------------------------------------
 # IMPORTS
 # -------------------------------------------------------------
+import time
 from datetime import datetime
 from typing import Any
+from basefunctions.events.event_exceptions import EventCancelledError
 from basefunctions.utils.logging import get_logger
 
 # -------------------------------------------------------------
@@ -48,6 +50,83 @@ get_logger(__name__)
 # -------------------------------------------------------------
 
 
+class CancellationToken:
+    """
+    Cooperative cancellation state of one event.
+
+    A token is cancelled explicitly via cancel() (EventBus.cancel()) or
+    implicitly once its deadline has passed. Handlers observe it through
+    EventContext.cancelled / check_cancelled() and exit early instead of
+    relying on the asynchronous TimeoutError injected by TimerThread.
+
+    Attributes
+    ----------
+    deadline : float or None
+        Expiry time of the current attempt on the time.monotonic() clock
+    reason : str or None
+        Reason passed to cancel(), None while not explicitly cancelled
+    """
+
+    __slots__ = ("deadline", "reason")
+
+    def __init__(self, deadline: float | None = None) -> None:
+        self.deadline = deadline
+        self.reason: str | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """True if cancelled explicitly or the deadline has passed."""
+        return self.reason is not None or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def cancel(self, reason: str = "cancelled") -> bool:
+        """
+        Cancel the token.
+
+        Parameters
+        ----------
+        reason : str, optional
+            Reason reported by check()
+
+        Returns
+        -------
+        bool
+            True if the token was not explicitly cancelled before
+        """
+        if self.reason is not None:
+            return False
+        self.reason = reason
+        return True
+
+    def remaining(self) -> float | None:
+        """
+        Seconds until the deadline.
+
+        Returns
+        -------
+        float or None
+            Remaining seconds (0.0 once expired), None without deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self) -> None:
+        """
+        Raise if the token is cancelled.
+
+        Raises
+        ------
+        EventCancelledError
+            If cancelled explicitly.
+        TimeoutError
+            If the deadline has passed (handled like any handler timeout).
+        """
+        if self.reason is not None:
+            raise EventCancelledError(self.reason)
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise TimeoutError("Event deadline exceeded")
+
+
 class EventContext:
     """
     Context data container for event processing across different execution modes.
@@ -73,6 +152,9 @@ class EventContext:
         Additional event-specific context data
     worker : Optional[Any]
         Reference to CoreletWorker instance (corelet mode only)
+    cancel_token : Optional[CancellationToken]
+        Cancellation state of the event currently being handled, set by
+        EventBus / CoreletWorker for the duration of the handler call
 
     Notes
     -----
@@ -109,6 +191,13 @@ class EventContext:
     - Each thread/process gets isolated storage
     - No locking required for thread_local_data access
 
+    **Cooperative Cancellation:**
+    Long-running handlers should check for cancellation and timeouts:
+
+    >>> for chunk in chunks:
+    ...     context.check_cancelled()  # raises EventCancelledError / TimeoutError
+    ...     process(chunk)
+
     Examples
     --------
     Create context for sync execution:
@@ -143,6 +232,7 @@ class EventContext:
         "timestamp",
         "event_data",
         "worker",
+        "cancel_token",
     )
 
     def __init__(
@@ -181,3 +271,70 @@ class EventContext:
         self.event_data = event_data
         # Worker reference for corelet mode
         self.worker = worker
+        # Cancellation state of the event being handled
+        self.cancel_token: CancellationToken | None = None
+
+    @property
+    def cancelled(self) -> bool:
+        """True if the current event was cancelled or its deadline passed."""
+        return self.cancel_token is not None and self.cancel_token.cancelled
+
+    @property
+    def deadline(self) -> float | None:
+        """Deadline of the current attempt (time.monotonic()), None if unknown."""
+        return self.cancel_token.deadline if self.cancel_token is not None else None
+
+    def remaining(self) -> float | None:
+        """
+        Seconds left until the deadline of the current attempt.
+
+        Useful to bound blocking calls, e.g. requests.get(url, timeout=context.remaining()).
+
+        Returns
+        -------
+        float or None
+            Remaining seconds, None without deadline
+        """
+        return self.cancel_token.remaining() if self.cancel_token is not None else None
+
+    def check_cancelled(self) -> None:
+        """
+        Raise if the current event was cancelled or its deadline passed.
+
+        Raises
+        ------
+        EventCancelledError
+            If the event was cancelled via EventBus.cancel().
+        TimeoutError
+            If the deadline of the current attempt has passed.
+        """
+        if self.cancel_token is not None:
+            self.cancel_token.check()
+
+    def with_cancel_token(self, cancel_token: CancellationToken | None) -> EventContext:
+        """
+        Copy of this context bound to another cancellation token.
+
+        Used where one context is shared by concurrently handled events
+        (event loop). Thread-local data and worker reference are shared.
+
+        Parameters
+        ----------
+        cancel_token : CancellationToken or None
+            Token of the event handled with the copy
+
+        Returns
+        -------
+        EventContext
+            New context sharing all other attributes
+        """
+        context = EventContext(
+            thread_local_data=self.thread_local_data,
+            thread_id=self.thread_id,
+            process_id=self.process_id,
+            timestamp=self.timestamp,
+            event_data=self.event_data,
+            worker=self.worker,
+        )
+        context.cancel_token = cancel_token
+        return context
@@ -156,3 +156,52 @@ class InvalidEventError(Exception):
     """
 
     pass
+
+
+class EventCancelledError(Exception):
+    """
+    Event was cancelled before it produced a result.
+
+    Raised by EventContext.check_cancelled() inside handlers and used as the
+    exception of the EventResult of events cancelled via EventBus.cancel(),
+    either dropped from the queue or stopped while running.
+
+    Examples
+    --------
+    >>> raise EventCancelledError("Event 42 cancelled")
+    """
+
+    pass
+
+
+class EventQueueFullError(Exception):
+    """
+    EventBus input queue is full.
+
+    Raised by publish() when a bounded input queue rejects an event (policy
+    "reject", or "block" after its timeout) and used as the exception of the
+    EventResult of events dropped by the "drop_lowest" / "drop_oldest"
+    policies.
+
+    Examples
+    --------
+    >>> raise EventQueueFullError("Input queue full (1000 events)")
+    """
+
+    pass
+
+
+class EventDependencyError(Exception):
+    """
+    Event was skipped because one of its dependencies did not succeed.
+
+    Used as the exception of the EventResult of events published with
+    depends_on when an upstream event failed, was cancelled or is unknown
+    to the EventBus. The dependent event is not executed.
+
+    Examples
+    --------
+    >>> raise EventDependencyError("Event 43 skipped: dependency 42 failed")
+    """
+
+    pass
@@ -13,6 +13,8 @@
  Factory for creating event handlers
 
  Log:
+ v2.3 : Cache batch limits per event type (get_batch_limits)
+ v2.2 : Cache handler metadata per event type (shared by all corelet events of the type)
  v2.1 : Logging audit - added warning/error before raises
  v1.0 : Initial implementation
  v2.0 : Converted from class methods to instance methods for proper singleton pattern
@@ -32,6 +34,8 @@ import basefunctions
 # -------------------------------------------------------------
 # DEFINITIONS
 # -------------------------------------------------------------
+# get_batch_limits() cache miss marker (None is a cached result)
+_NOT_CACHED = object()
 
 # -------------------------------------------------------------
 # VARIABLE DEFINITIONS
@@ -88,6 +92,7 @@ class EventFactory:
 
     **Corelet Support:**
     - get_handler_meta() provides serializable handler metadata
+    - get_batch_limits() tells workers which queued events to coalesce
     - Enables dynamic handler loading in worker processes
     - Handler classes must be importable in worker process
 
@@ -133,6 +138,9 @@ class EventFactory:
     def __init__(self) -> None:
         self._lock = threading.RLock()
         self._handler_registry: dict[str, type[basefunctions.EventHandler]] = {}
+        # get_handler_meta() and get_batch_limits() results, dropped when an event type is registered again
+        self._handler_meta: dict[str, dict[str, str]] = {}
+        self._batch_limits: dict[str, tuple[int, float] | None] = {}
 
     def register_event_type(self, event_type: str, event_handler_class: type[basefunctions.EventHandler]) -> None:
         """
@@ -159,6 +167,8 @@ class EventFactory:
 
         with self._lock:
             self._handler_registry[event_type] = event_handler_class
+            self._handler_meta.pop(event_type, None)
+            self._batch_limits.pop(event_type, None)
 
     def create_handler(self, event_type: str, *args, **kwargs) -> basefunctions.EventHandler:
         """
@@ -259,13 +269,19 @@ class EventFactory:
         Returns
         -------
         dict
-            Handler metadata with module_path and class_name
+            Handler metadata with module_path and class_name. The dict is
+            cached and shared by all callers; do not modify it.
 
         Raises
         ------
         ValueError
             If event_type is not registered
         """
+        # Lock-free fast path, dict lookups are atomic under the GIL
+        meta = self._handler_meta.get(event_type)
+        if meta is not None:
+            return meta
+
         if not event_type:
             logger.warning("get_handler_meta failed: event_type cannot be empty")
             raise ValueError("event_type cannot be empty")
@@ -276,11 +292,43 @@ class EventFactory:
                 raise ValueError(f"No handler registered for event type '{event_type}'")
 
             handler_class = self._handler_registry[event_type]
-            return {
+            meta = self._handler_meta[event_type] = {
                 "module_path": handler_class.__module__,
                 "class_name": handler_class.__name__,
                 "event_type": event_type,
             }
+            return meta
+
+    def get_batch_limits(self, event_type: str) -> tuple[int, float] | None:
+        """
+        Get the batch limits of the handler class registered for an event type.
+
+        Parameters
+        ----------
+        event_type : str
+            Event type identifier
+
+        Returns
+        -------
+        tuple[int, float] | None
+            (max_batch_size, max_batch_delay_ms) if the handler class is a
+            BatchEventHandler, None for other handler classes and
+            unregistered event types. Cached per registered event type.
+        """
+        # Lock-free fast path, dict lookups are atomic under the GIL
+        limits = self._batch_limits.get(event_type, _NOT_CACHED)
+        if limits is not _NOT_CACHED:
+            return limits
+
+        with self._lock:
+            handler_class = self._handler_registry.get(event_type)
+            if handler_class is None:
+                return None
+            limits = None
+            if isinstance(handler_class, type) and issubclass(handler_class, basefunctions.BatchEventHandler):
+                limits = (handler_class.max_batch_size, handler_class.max_batch_delay_ms)
+            self._batch_limits[event_type] = limits
+            return limits
 
     def get_supported_event_types(self) -> list[str]:
         """
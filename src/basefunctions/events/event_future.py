@@ -0,0 +1,124 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Future-based result handles for published events
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import concurrent.futures
+from collections.abc import Iterable, Iterator
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class EventFuture(concurrent.futures.Future):
+    """
+    Future resolved with the EventResult of a single published event.
+
+    EventFuture is a concurrent.futures.Future returned by
+    EventBus.publish(event, return_future=True). The worker that processes
+    the event resolves it as soon as the result is produced, so callers
+    wait only for their own events instead of the whole input queue.
+
+    Attributes
+    ----------
+    event_id : str
+        Event ID of the published event
+
+    Notes
+    -----
+    - The future is marked running on publish, so cancel() returns False;
+      use EventBus.cancel() to cancel the underlying event
+    - result() returns the EventResult, including failed results; handler
+      exceptions are reported via EventResult.exception, not raised
+    - Results delivered via a future are not stored in the result cache
+
+    Examples
+    --------
+    >>> future = bus.publish(event, return_future=True)
+    >>> result = future.result(timeout=10)
+    >>> result.success
+    True
+    """
+
+    def __init__(self, event_id: str) -> None:
+        """
+        Initialize event future.
+
+        Parameters
+        ----------
+        event_id : str
+            Event ID of the published event
+        """
+        super().__init__()
+        self.event_id = event_id
+
+    def __repr__(self) -> str:
+        return f"EventFuture(event_id={self.event_id}, state={self._state})"
+
+
+def as_completed(
+    futures: Iterable[EventFuture],
+    timeout: float | None = None,
+) -> Iterator[EventFuture]:
+    """
+    Iterate over event futures as they complete.
+
+    Parameters
+    ----------
+    futures : Iterable[EventFuture]
+        Futures returned by EventBus.publish(..., return_future=True)
+    timeout : float, optional
+        Maximum number of seconds to wait for all futures. None waits forever.
+
+    Returns
+    -------
+    Iterator[EventFuture]
+        Futures in completion order
+
+    Raises
+    ------
+    TimeoutError
+        If not all futures complete within timeout.
+
+    Examples
+    --------
+    >>> futures = [bus.publish(e, return_future=True) for e in events]
+    >>> for future in as_completed(futures):
+    ...     handle(future.result())
+    """
+    return concurrent.futures.as_completed(futures, timeout=timeout)
@@ -0,0 +1,266 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Scoped event groups joined and queried independently of other bus users
+
+  Log:
+  v1.1 : publish_many() tracks chunk by chunk, a failing chunk keeps earlier ones
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import threading
+from collections.abc import Iterable
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+from basefunctions.utils.logging import get_logger
+import basefunctions
+
+if TYPE_CHECKING:
+    from basefunctions.events.event_bus import EventBus
+    from basefunctions.events.event_future import EventFuture
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+# Matches EventBus.publish_many(), each group chunk is one bus chunk
+DEFAULT_PUBLISH_CHUNK_SIZE = 1000
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class EventGroup:
+    """
+    Events published through a group, joined and queried on their own.
+
+    EventBus.join() waits for every event on the (singleton) bus, so a
+    component joining its own work also waits for the work of all other
+    components. An EventGroup publishes with futures and counts down as its
+    own events complete: join() and get_results() only wait for them.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        Bus the events are published on
+
+    Notes
+    -----
+    - Results are kept by the group, not in the bus result cache
+    - Leaving the with block joins the group; if the block raises, the
+      group's pending events are cancelled instead
+
+    Examples
+    --------
+    >>> with bus.group() as group:
+    ...     for url in urls:
+    ...         group.publish(Event("http_request", event_data={"url": url}))
+    ...     group.join(timeout=10)
+    >>> results = group.get_results()
+    """
+
+    __slots__ = ("_event_bus", "_futures", "_results", "_pending", "_condition")
+
+    def __init__(self, event_bus: EventBus) -> None:
+        self._event_bus = event_bus
+        self._futures: dict[str, EventFuture] = {}
+        self._results: dict[str, basefunctions.EventResult] = {}
+        self._pending = 0
+        self._condition = threading.Condition()
+
+    def __enter__(self) -> EventGroup:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        if exc_type is None:
+            self.join()
+        else:
+            self.cancel()
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    @property
+    def pending(self) -> int:
+        """Number of published events of the group that have not completed yet."""
+        return self._pending
+
+    def publish(self, event: basefunctions.Event) -> str:
+        """
+        Publish an event as part of the group.
+
+        Parameters
+        ----------
+        event : Event
+            The event to publish
+
+        Returns
+        -------
+        str
+            Event ID for result retrieval via get_results()
+
+        Raises
+        ------
+        InvalidEventError, NoHandlerAvailableError, EventQueueFullError
+            As raised by EventBus.publish(); the event is then not part of the group.
+        """
+        self._track([self._event_bus.publish(event, return_future=True)])
+        return event.event_id
+
+    def publish_many(
+        self, events: Iterable[basefunctions.Event], chunk_size: int = DEFAULT_PUBLISH_CHUNK_SIZE
+    ) -> list[str]:
+        """
+        Publish multiple events as part of the group.
+
+        Events are published and tracked chunk by chunk, so a failing chunk
+        leaves the chunks published before it in the group: join() waits
+        for them and cancel() reaches them.
+
+        Parameters
+        ----------
+        events : Iterable[Event]
+            Events to publish
+        chunk_size : int, optional
+            Number of events published together. Default is 1000.
+
+        Returns
+        -------
+        list[str]
+            Event IDs in the order the events were given
+
+        Raises
+        ------
+        InvalidEventError, NoHandlerAvailableError
+            As raised by EventBus.publish_many(); the failing chunk is then
+            not part of the group.
+        ValueError
+            If chunk_size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        event_ids: list[str] = []
+        iterator = iter(events)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            futures = self._event_bus.publish_many(chunk, return_futures=True)
+            self._track(futures)
+            event_ids.extend(future.event_id for future in futures)
+        return event_ids
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all events of the group completed.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum number of seconds to wait. None waits forever.
+
+        Returns
+        -------
+        bool
+            True if all events completed, False if timeout expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def get_results(
+        self,
+        event_ids: list[str] | None = None,
+        join_before: bool = True,
+        timeout: float | None = None,
+    ) -> dict[str, basefunctions.EventResult]:
+        """
+        Get the results of completed events of the group.
+
+        Parameters
+        ----------
+        event_ids : list[str], optional
+            Event IDs to retrieve. If None, returns all completed events of the group.
+        join_before : bool, optional
+            If True, wait for the group (see join()) first. Default is True.
+        timeout : float, optional
+            Maximum number of seconds to wait when join_before is True.
+
+        Returns
+        -------
+        dict[str, EventResult]
+            Completed results by event ID; events still pending are missing
+        """
+        if join_before:
+            self.join(timeout)
+        with self._condition:
+            if event_ids is None:
+                return dict(self._results)
+            if isinstance(event_ids, str):
+                event_ids = [event_ids]
+            return {event_id: self._results[event_id] for event_id in event_ids if event_id in self._results}
+
+    def cancel(self) -> int:
+        """
+        Cancel all pending events of the group.
+
+        Returns
+        -------
+        int
+            Number of events that were still pending or running
+        """
+        with self._condition:
+            pending_ids = [event_id for event_id in self._futures if event_id not in self._results]
+        return sum(1 for event_id in pending_ids if self._event_bus.cancel(event_id))
+
+    def _track(self, futures: list[EventFuture]) -> None:
+        """
+        Count the futures down as they resolve.
+
+        Parameters
+        ----------
+        futures : list[EventFuture]
+            Futures returned by the bus for the group's events
+        """
+        with self._condition:
+            self._pending += len(futures)
+            for future in futures:
+                self._futures[future.event_id] = future
+        for future in futures:
+            # Runs at once for futures that already completed
+            future.add_done_callback(self._on_done)
+
+    def _on_done(self, future: EventFuture) -> None:
+        """
+        Store the result of a completed event and wake up join() callers.
+        """
+        with self._condition:
+            self._results[future.event_id] = future.result()
+            self._pending -= 1
+            if self._pending == 0:
+                self._condition.notify_all()
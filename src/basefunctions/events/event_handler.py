@@ -7,6 +7,12 @@
  Description:
  Event handler interface for the messaging system with execution modes
  Log:
+ v1.11 : Sampled corelet events are traced (pickle, pipe send, unpickle spans)
+ v1.10 : Added MapChunkHandler for EventBus.map()
+ v1.9 : Added BatchEventHandler (handle_batch) and batched corelet forwarding
+ v1.8 : Recycle corelets on retirement notice (task count / RSS limits)
+ v1.7 : Added shared memory transport for large corelet payloads
+ v1.6 : Documented coroutine handlers for async execution mode
  v1.5 : Added corelet lifecycle management with tracking and monitoring
  v1.4 : Removed ExceptionResult, fixed race conditions
  v1.3 : Added terminate interface for process cleanup
@@ -26,11 +32,19 @@ from abc import ABC, abstractmethod
 from multiprocessing import Process
 from multiprocessing.connection import Connection
 import subprocess
-import pickle
 import threading
+import time
 import multiprocessing
 from basefunctions.utils.logging import get_logger, get_logger
 import basefunctions
+from basefunctions.events.corelet_worker import CORELET_RETIREMENT_NOTICE
+from basefunctions.events.event_tracer import SPAN_PIPE_SEND, get_event_tracer
+from basefunctions.events.shared_memory_transport import (
+    decode_message,
+    encode_message,
+    sweep_segments,
+    unlink_segments,
+)
 
 # -------------------------------------------------------------
 # DEFINITIONS
@@ -227,6 +241,11 @@ class EventHandler(ABC):
     - Use EventResult.exception_result() for unexpected errors
     - Override terminate() if handler spawns subprocesses
 
+    **Async Handlers:**
+    - handle() may be declared `async def` for EXECUTION_MODE_ASYNC
+    - Coroutine handlers run concurrently on the EventBus event loop thread
+    - Regular handlers published in ASYNC mode run in the loop's executor
+
     **Context Usage:**
     - context.thread_local_data: For thread-specific caching
     - context.process_id: For corelet process identification
@@ -324,6 +343,88 @@ class EventHandler(ABC):
         pass
 
 
+class BatchEventHandler(EventHandler):
+    """
+    Event handler that processes several events of its type in one call.
+
+    The EventBus coalesces queued THREAD and CORELET events of the handler's
+    event type and passes them to handle_batch() together. Each event still
+    gets its own EventResult; failed events are retried individually in the
+    next batch attempt.
+
+    Attributes
+    ----------
+    max_batch_size : int
+        Maximum number of events per handle_batch() call. Default is 32.
+    max_batch_delay_ms : float
+        Milliseconds the bus waits for more events while a batch is not full.
+        Default is 0 (only events already queued are coalesced).
+
+    Notes
+    -----
+    - handle() delegates to handle_batch() with a single event (SYNC and
+      ASYNC modes, events published alone)
+    - context.cancel_token carries the deadline of the whole batch
+    - Corelet workers also group pooled batch messages by event type
+
+    Examples
+    --------
+    >>> class InsertHandler(BatchEventHandler):
+    ...     max_batch_size = 500
+    ...     max_batch_delay_ms = 20
+    ...
+    ...     def handle_batch(self, events, context):
+    ...         rows = [event.event_data for event in events]
+    ...         ids = database.insert_many(rows)
+    ...         return [
+    ...             EventResult.business_result(event.event_id, True, row_id)
+    ...             for event, row_id in zip(events, ids)
+    ...         ]
+    """
+
+    max_batch_size: int = 32
+    max_batch_delay_ms: float = 0.0
+
+    @abstractmethod
+    def handle_batch(
+        self,
+        events: list[basefunctions.Event],
+        context: basefunctions.EventContext,
+    ) -> list[EventResult]:
+        """
+        Handle a batch of events of the same type.
+
+        Parameters
+        ----------
+        events : list[Event]
+            Events to handle, in priority order.
+        context : basefunctions.EventContext
+            Context data for event processing.
+
+        Returns
+        -------
+        list[EventResult]
+            One result per event, in the order of events.
+        """
+        return [
+            EventResult.exception_result(
+                event.event_id,
+                NotImplementedError("Subclasses must implement handle_batch method"),
+            )
+            for event in events
+        ]
+
+    def handle(
+        self,
+        event: basefunctions.Event,
+        context: basefunctions.EventContext,
+    ) -> EventResult:
+        """
+        Handle a single event as a batch of one.
+        """
+        return self.handle_batch([event], context)[0]
+
+
 class DefaultCmdHandler(EventHandler):
     """
     Default handler for CMD mode events with timeout support.
@@ -491,11 +592,15 @@ class CoreletHandle:
         Pipe for sending pickled events to the corelet
     output_pipe : multiprocessing.Connection
         Pipe for receiving pickled results from the corelet
+    shared_memory_threshold : int or None
+        Minimum buffer size in bytes sent via shared memory, None disables it
 
     Notes
     -----
     - Handles are stored in thread-local storage (one per thread)
     - Communication uses pickle serialization for events and results
+    - With shared_memory_threshold set, large buffers (NumPy arrays, DataFrame
+      blocks, bytes) travel via shared memory in both directions
     - Pipes must be properly closed to avoid resource leaks
     - Process should be terminated when no longer needed
 
@@ -505,13 +610,14 @@ class CoreletHandle:
     CoreletForwardingHandler : Handler that manages CoreletHandle lifecycle
     """
 
-    __slots__ = ("process", "input_pipe", "output_pipe")
+    __slots__ = ("process", "input_pipe", "output_pipe", "shared_memory_threshold")
 
     def __init__(
         self,
         process: Process,
         input_pipe: Connection,
         output_pipe: Connection,
+        shared_memory_threshold: int | None = None,
     ):
         """
         Initialize corelet handle.
@@ -524,10 +630,13 @@ class CoreletHandle:
             Pipe for sending events to corelet.
         output_pipe : multiprocessing.Connection
             Pipe for receiving results from corelet.
+        shared_memory_threshold : int, optional
+            Minimum buffer size in bytes sent via shared memory.
         """
         self.process = process
         self.input_pipe = input_pipe
         self.output_pipe = output_pipe
+        self.shared_memory_threshold = shared_memory_threshold
 
 
 class CoreletForwardingHandler(EventHandler):
@@ -556,6 +665,12 @@ class CoreletForwardingHandler(EventHandler):
        - Graceful shutdown on timeout
        - Process removed from tracking
 
+    3b. RECYCLING: Corelet replaced after max_tasks_per_corelet events or
+       above max_rss_mb resident memory (EventBus options)
+       - CoreletWorker sends a retirement notice ahead of the result
+       - Handler returns the result, then shuts the corelet down
+       - Next event for the thread starts a fresh corelet
+
     4. EXPLICIT CLEANUP: Corelet terminated on worker thread shutdown
        - EventBus._cleanup_corelet() called on shutdown event
        - Graceful shutdown signal sent to corelet
@@ -600,19 +715,95 @@ class CoreletForwardingHandler(EventHandler):
         EventResult
             Result from corelet execution
         """
+        try:
+            return self._forward(event, event.timeout, context)
+        except TimeoutError as e:
+            raise e
+        except Exception as e:
+            return EventResult.exception_result(event.event_id, e)
+
+    def handle_batch(
+        self, events: list[basefunctions.Event], context: basefunctions.EventContext
+    ) -> list[EventResult]:
+        """
+        Forward a batch of events to the corelet process in one message.
+
+        The corelet passes events of a BatchEventHandler type to
+        handle_batch() and replies with one result per event.
+
+        Parameters
+        ----------
+        events : list[basefunctions.Event]
+            Events to forward to corelet
+        context : basefunctions.EventContext
+            Context with thread_local_data for corelet management
+
+        Returns
+        -------
+        list[EventResult]
+            Results from corelet execution, in the order of events
+        """
+        try:
+            return self._forward(list(events), max(event.timeout for event in events), context)
+        except TimeoutError as e:
+            raise e
+        except Exception as e:
+            return [EventResult.exception_result(event.event_id, e) for event in events]
+
+    def _forward(self, message: Any, timeout: float, context: basefunctions.EventContext) -> Any:
+        """
+        Send an event or a batch of events to the corelet and wait for the reply.
+
+        Parameters
+        ----------
+        message : basefunctions.Event or list[basefunctions.Event]
+            Event or batch of events to forward
+        timeout : float
+            Seconds to wait for the reply
+        context : basefunctions.EventContext
+            Context with thread_local_data for corelet management
+
+        Returns
+        -------
+        EventResult or list[EventResult]
+            Reply of the corelet
+
+        Raises
+        ------
+        TimeoutError
+            If the corelet does not reply within timeout; the corelet is terminated
+        """
+        segment_names: list[str] = []
+        # Sampled events travel as TracedMessage and come back with the corelet spans
+        tracer = get_event_tracer()
+        trace_event = message[0] if isinstance(message, list) else message
+        traced = tracer.enabled and tracer.is_sampled(trace_event)
         try:
             # Ensure corelet is running
             corelet_handle = self._get_corelet(context)
 
             # Send pickled event to corelet via input pipe
             # Corelet worker handles handler registration automatically via corelet_meta
-            pickled_event = pickle.dumps(event)
-            corelet_handle.input_pipe.send(pickled_event)
+            # Large buffers go via shared memory; the worker replies with the same threshold
+            threshold = corelet_handle.shared_memory_threshold
+            if traced:
+                pickled_event, segment_names = tracer.encode(message, trace_event, threshold)
+                started = time.perf_counter_ns()
+                corelet_handle.input_pipe.send(pickled_event)
+                tracer.add_span(SPAN_PIPE_SEND, trace_event, started)
+            else:
+                pickled_event, segment_names = encode_message(message, threshold)
+                corelet_handle.input_pipe.send(pickled_event)
 
             # Wait for result with timeout using poll (non-blocking check)
-            if corelet_handle.output_pipe.poll(timeout=event.timeout):
-                pickled_result = corelet_handle.output_pipe.recv()
-                result = pickle.loads(pickled_result)
+            if corelet_handle.output_pipe.poll(timeout=timeout):
+                result = self._receive(corelet_handle, trace_event if traced else None)
+
+                # Corelet reached a recycling limit - its result follows immediately
+                if isinstance(result, str) and result == CORELET_RETIREMENT_NOTICE:
+                    result = self._receive(corelet_handle, trace_event if traced else None)
+                    self._retire_corelet(context)
+                    return result
 
                 # SESSION-BASED LIFECYCLE: Keep corelet alive for thread session
                 # Corelet handle remains in thread_local_data for reuse by subsequent events
@@ -624,7 +815,7 @@ class CoreletForwardingHandler(EventHandler):
                 thread_id = threading.get_ident()
                 logger.warning(
                     "Corelet timeout after %ds (Thread: %d, PID: %d) - terminating process",
-                    event.timeout,
+                    timeout,
                     thread_id,
                     corelet_handle.process.pid,
                 )
@@ -650,6 +841,9 @@ class CoreletForwardingHandler(EventHandler):
                         except Exception:
                             pass
 
+                        # Release shared memory the corelet did not consume or left behind
+                        _release_segments(corelet_handle, segment_names)
+
                         # Remove from tracking
                         event_bus = basefunctions.EventBus()
                         with event_bus._corelet_lock:
@@ -665,12 +859,14 @@ class CoreletForwardingHandler(EventHandler):
                     finally:
                         delattr(context.thread_local_data, "corelet_handle")
 
-                raise TimeoutError(f"No response from corelet within {event.timeout} seconds")
+                raise TimeoutError(f"No response from corelet within {timeout} seconds")
 
         except TimeoutError as e:
             raise e
-        except Exception as e:
-            return EventResult.exception_result(event.event_id, e)
+        except Exception:
+            # Corelet may have crashed before consuming or after producing segments
+            _release_segments(getattr(context.thread_local_data, "corelet_handle", None), segment_names)
+            raise
 
     def terminate(self, context: basefunctions.EventContext) -> None:
         """
@@ -705,6 +901,48 @@ class CoreletForwardingHandler(EventHandler):
                 # Clean up corelet reference after termination
                 delattr(context.thread_local_data, "corelet_handle")
 
+    @staticmethod
+    def _receive(corelet_handle: CoreletHandle, trace_event: basefunctions.Event | None) -> Any:
+        """
+        Receive and decode the next reply of the corelet.
+
+        Parameters
+        ----------
+        corelet_handle : CoreletHandle
+            Corelet to read the reply from
+        trace_event : basefunctions.Event or None
+            Sampled event whose corelet spans come with the reply, None if not traced
+
+        Returns
+        -------
+        Any
+            Decoded reply
+        """
+        data = corelet_handle.output_pipe.recv()
+        if trace_event is None:
+            return decode_message(data)[0]
+        return get_event_tracer().decode(data, trace_event)
+
+    def _retire_corelet(self, context: basefunctions.EventContext) -> None:
+        """
+        Shut down a corelet that requested recycling.
+
+        The corelet is idle at this point, so the regular graceful cleanup is
+        used. The next event of this thread creates a fresh corelet.
+
+        Parameters
+        ----------
+        context : basefunctions.EventContext
+            Event context containing thread_local_data with corelet_handle
+        """
+        event_bus = basefunctions.EventBus()
+        event_bus._cleanup_corelet(context)
+        logger.info(
+            "Recycled corelet (Thread: %d, remaining: %d)",
+            threading.get_ident(),
+            event_bus.get_corelet_count(),
+        )
+
     def _stop_all_corelet_processes(self) -> None:
         """
         Stop all corelet processes gracefully.
@@ -757,15 +995,16 @@ class CoreletForwardingHandler(EventHandler):
         # daemon=True ensures automatic cleanup when main process exits (safety net),
         # but does NOT auto-cleanup during runtime - explicit lifecycle management required
         thread_id = threading.get_ident()
+        event_bus = basefunctions.EventBus()
+        max_tasks, max_rss_mb = event_bus.get_corelet_limits()
         process = Process(
             target=basefunctions.worker_main,
-            args=(f"corelet_{thread_id}", input_pipe_b, output_pipe_b),
+            args=(f"corelet_{thread_id}", input_pipe_b, output_pipe_b, (), max_tasks, max_rss_mb),
             daemon=True,  # Safety: Auto-terminate on parent process exit
         )
         process.start()
 
         # Register corelet with EventBus for tracking
-        event_bus = basefunctions.EventBus()
         event_bus._register_corelet(thread_id, process.pid)
 
         logger.info(
@@ -775,7 +1014,134 @@ class CoreletForwardingHandler(EventHandler):
             event_bus.get_corelet_count(),
         )
 
-        return CoreletHandle(process, input_pipe_a, output_pipe_a)
+        return CoreletHandle(process, input_pipe_a, output_pipe_a, event_bus.get_shared_memory_threshold())
+
+
+class MapChunkHandler(EventHandler):
+    """
+    Run one chunk of EventBus.map() inputs through the mapped event type's handler.
+
+    The chunk event carries (event_type, max_retries, items). Each item is
+    wrapped in an Event of event_type and handled in order; a
+    BatchEventHandler receives the whole chunk in one handle_batch() call.
+    Failed items are retried individually up to max_retries attempts.
+
+    The chunk result is a business result whose data is (values, failures):
+    the data of every item in input order (None for failed items) and the
+    results of failed items by index. Item event IDs are
+    "<chunk event ID>:<index>". This keeps the reply compact; EventBus.map()
+    rebuilds one EventResult per item. Timeouts and cancellation of the
+    chunk are not caught per item; they fail the whole chunk.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, EventHandler] = {}
+
+    def handle(self, event: basefunctions.Event, context: basefunctions.EventContext) -> EventResult:
+        """
+        Handle all items of a map chunk.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Chunk event with event_data (event_type, max_retries, items)
+        context : basefunctions.EventContext
+            Context passed on to the mapped handler
+
+        Returns
+        -------
+        EventResult
+            Business result with (values, failures) as data
+        """
+        event_type, max_retries, items = event.event_data
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            handler = self._handlers[event_type] = basefunctions.EventFactory().create_handler(event_type)
+
+        item_events = [
+            basefunctions.Event(
+                event_type,
+                event_exec_mode=event.event_exec_mode,
+                event_data=item,
+                max_retries=max_retries,
+                timeout=event.timeout,
+                priority=event.priority,
+                corelet_meta=event.corelet_meta,
+            )
+            for item in items
+        ]
+        for index, item_event in enumerate(item_events):
+            item_event.event_id = f"{event.event_id}:{index}"
+
+        values: list[Any] = [None] * len(item_events)
+        failures: dict[int, EventResult] = {}
+        pending = list(range(len(item_events)))
+        for _ in range(max_retries):
+            attempt = [item_events[index] for index in pending]
+            if isinstance(handler, BatchEventHandler):
+                attempt_results = self._handle_batch(handler, attempt, context)
+            else:
+                attempt_results = [self._handle_item(handler, item_event, context) for item_event in attempt]
+
+            failed = []
+            for index, result in zip(pending, attempt_results):
+                if result.success:
+                    values[index] = result.data
+                    failures.pop(index, None)
+                else:
+                    result.event_id = item_events[index].event_id
+                    failures[index] = result
+                    failed.append(index)
+            pending = failed
+            if not pending:
+                break
+
+        return EventResult.business_result(event.event_id, True, (values, failures))
+
+    @staticmethod
+    def _handle_item(
+        handler: EventHandler, event: basefunctions.Event, context: basefunctions.EventContext
+    ) -> EventResult:
+        try:
+            return handler.handle(event, context)
+        except (TimeoutError, basefunctions.EventCancelledError):
+            raise
+        except Exception as e:
+            return EventResult.exception_result(event.event_id, e)
+
+    @staticmethod
+    def _handle_batch(
+        handler: BatchEventHandler, events: list[basefunctions.Event], context: basefunctions.EventContext
+    ) -> list[EventResult]:
+        try:
+            results = handler.handle_batch(events, context)
+            if len(results) != len(events):
+                raise ValueError(f"handle_batch returned {len(results)} results for {len(events)} events")
+            return results
+        except (TimeoutError, basefunctions.EventCancelledError):
+            raise
+        except Exception as e:
+            return [EventResult.exception_result(event.event_id, e) for event in events]
+
+
+def _release_segments(corelet_handle: CoreletHandle | None, segment_names: list[str]) -> None:
+    """
+    Unlink shared memory segments left over by a failed corelet exchange.
+
+    Parameters
+    ----------
+    corelet_handle : CoreletHandle or None
+        Handle of the corelet involved in the exchange
+    segment_names : list[str]
+        Segments sent to the corelet that may not have been consumed
+    """
+    try:
+        unlink_segments(segment_names)
+        if corelet_handle is not None and corelet_handle.process.pid is not None:
+            if not corelet_handle.process.is_alive():
+                sweep_segments(corelet_handle.process.pid)
+    except Exception as e:
+        logger.warning(f"Failed to release shared memory segments: {e}")
 
 
 # -------------------------------------------------------------
@@ -790,6 +1156,7 @@ def register_internal_handlers() -> None:
     This function registers the core system handlers required for EventBus operation:
     - DefaultCmdHandler: For subprocess command execution
     - CoreletForwardingHandler: For corelet process communication and shutdown
+    - MapChunkHandler: For EventBus.map() chunks
 
     These handlers are registered automatically when basefunctions is imported.
     Safe to call multiple times (idempotent).
@@ -803,6 +1170,7 @@ def register_internal_handlers() -> None:
     from basefunctions.events.event_bus import (
         INTERNAL_CMD_EXECUTION_EVENT,
         INTERNAL_CORELET_FORWARDING_EVENT,
+        INTERNAL_MAP_CHUNK_EVENT,
         INTERNAL_SHUTDOWN_EVENT,
     )
 
@@ -810,3 +1178,4 @@ def register_internal_handlers() -> None:
     factory.register_event_type(INTERNAL_CMD_EXECUTION_EVENT, DefaultCmdHandler)
     factory.register_event_type(INTERNAL_CORELET_FORWARDING_EVENT, CoreletForwardingHandler)
     factory.register_event_type(INTERNAL_SHUTDOWN_EVENT, CoreletForwardingHandler)
+    factory.register_event_type(INTERNAL_MAP_CHUNK_EVENT, MapChunkHandler)
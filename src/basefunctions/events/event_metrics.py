@@ -0,0 +1,388 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Per event type latency histograms and counters of the EventBus, exposed
+  as KPIProvider
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from basefunctions.utils.logging import get_logger
+from basefunctions.kpi.utils import KPIValue
+import basefunctions
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+# Sub-buckets per power of two: values are kept with a relative error below 1/64
+HISTOGRAM_SUB_BUCKET_BITS = 6
+# Percentiles reported per latency histogram
+REPORTED_PERCENTILES = (50, 95, 99)
+# Package segment of the KPI keys ("technical.<package>.<event type>.<metric>")
+KPI_PACKAGE = "event_bus"
+
+_SUB_BUCKET_COUNT = 1 << HISTOGRAM_SUB_BUCKET_BITS
+# Values below this limit get one bucket each
+_LINEAR_LIMIT = _SUB_BUCKET_COUNT * 2
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram of latencies in microseconds.
+
+    Values are counted in log-linear buckets: exact below 128 µs, above
+    that 64 buckets per power of two, so every recorded value is
+    reproduced with a relative error below 1.6 %. Recording is O(1) and
+    memory grows with the largest value only (under 8 KB up to one hour).
+    Not thread-safe; EventMetrics serialises access.
+
+    Attributes
+    ----------
+    count : int
+        Number of recorded values
+    total : int
+        Sum of recorded values in microseconds
+    min : int
+        Smallest recorded value, 0 while empty
+    max : int
+        Largest recorded value, 0 while empty
+    """
+
+    __slots__ = ("count", "total", "min", "max", "_counts")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+        self._counts: list[int] = []
+
+    def record(self, micros: int) -> None:
+        """
+        Count one value.
+
+        Parameters
+        ----------
+        micros : int
+            Latency in microseconds, negative values count as 0
+        """
+        if micros < 0:
+            micros = 0
+        if micros < _LINEAR_LIMIT:
+            index = micros
+        else:
+            shift = micros.bit_length() - HISTOGRAM_SUB_BUCKET_BITS - 1
+            index = (shift << HISTOGRAM_SUB_BUCKET_BITS) + (micros >> shift)
+
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+
+        if not self.count or micros < self.min:
+            self.min = micros
+        if micros > self.max:
+            self.max = micros
+        self.count += 1
+        self.total += micros
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Get the value below or at which percentile % of the values lie.
+
+        Parameters
+        ----------
+        percentile : float
+            Percentile between 0 and 100
+
+        Returns
+        -------
+        int
+            Highest value of the bucket holding the percentile, in
+            microseconds (never above max); 0 while empty
+        """
+        if not self.count:
+            return 0
+        # Rank of the value, at least the first one
+        rank = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(self._highest_value(index), self.max)
+        return self.max
+
+    def mean(self) -> float:
+        """
+        Get the mean of the recorded values in microseconds (0.0 while empty).
+        """
+        return self.total / self.count if self.count else 0.0
+
+    @staticmethod
+    def _highest_value(index: int) -> int:
+        """
+        Get the highest value counted in the bucket at index.
+        """
+        if index < _LINEAR_LIMIT:
+            return index
+        shift = (index >> HISTOGRAM_SUB_BUCKET_BITS) - 1
+        mantissa = (index & (_SUB_BUCKET_COUNT - 1)) | _SUB_BUCKET_COUNT
+        return ((mantissa + 1) << shift) - 1
+
+
+class _EventTypeStats:
+    """
+    Histograms and counters of one event type.
+    """
+
+    __slots__ = (
+        "lock",
+        "queue_wait",
+        "execution",
+        "end_to_end",
+        "completed",
+        "failed",
+        "cancelled",
+        "retries",
+        "timeouts",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.queue_wait = LatencyHistogram()
+        self.execution = LatencyHistogram()
+        self.end_to_end = LatencyHistogram()
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.retries = 0
+        self.timeouts = 0
+
+
+class EventMetrics:
+    """
+    Latency histograms and counters per event type, collected by the EventBus.
+
+    Implements the KPIProvider protocol, so KPICollector and
+    print_kpi_table() report it directly. Collection is off until the bus
+    enables it (EventBus.enable_metrics()); while off, the recording
+    methods are not called at all.
+
+    Per event type it tracks:
+
+    - queue_wait: time between entering and leaving the input queue
+    - execution: time a worker, the SYNC caller or the event loop spent
+      running the handler, retries included (with a retry backoff, each
+      attempt counts as one run); for pooled corelets the pool round trip
+    - end_to_end: time from event creation to its final result
+    - completed, failed, cancelled, retries, timeouts: counters
+    - throughput: completed events per second since enabling or reset()
+
+    Parameters
+    ----------
+    queue_metrics : Callable[[], dict[str, Any]], optional
+        Returns EventQueue.get_metrics() of the bus; adds queue size,
+        dropped and rejected counts to the KPIs.
+    """
+
+    __slots__ = ("enabled", "_stats", "_lock", "_started", "_queue_metrics")
+
+    def __init__(self, queue_metrics: Callable[[], dict[str, Any]] | None = None) -> None:
+        self.enabled = False
+        self._stats: dict[str, _EventTypeStats] = {}
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._queue_metrics = queue_metrics
+
+    # =============================================================================
+    # RECORDING (called by the EventBus while enabled)
+    # =============================================================================
+
+    def record_queue_wait(self, event_type: str, seconds: float) -> None:
+        """
+        Record how long an event of event_type waited in the input queue.
+        """
+        stats = self._get_stats(event_type)
+        with stats.lock:
+            stats.queue_wait.record(int(seconds * 1_000_000))
+
+    def record_execution(self, event_type: str, seconds: float) -> None:
+        """
+        Record how long the handler of an event of event_type ran.
+        """
+        stats = self._get_stats(event_type)
+        with stats.lock:
+            stats.execution.record(int(seconds * 1_000_000))
+
+    def record_retry(self, event_type: str) -> None:
+        """
+        Count an attempt after the first one.
+        """
+        stats = self._get_stats(event_type)
+        with stats.lock:
+            stats.retries += 1
+
+    def record_timeout(self, event_type: str) -> None:
+        """
+        Count an attempt that exceeded the event timeout.
+        """
+        stats = self._get_stats(event_type)
+        with stats.lock:
+            stats.timeouts += 1
+
+    def record_completion(self, event: basefunctions.Event, event_result: basefunctions.EventResult) -> None:
+        """
+        Count the final result of an event and its end-to-end latency.
+        """
+        micros = (time.time_ns() - event.created_ns) // 1000
+        stats = self._get_stats(event.event_type)
+        with stats.lock:
+            stats.end_to_end.record(micros)
+            stats.completed += 1
+            if not event_result.success:
+                if isinstance(event_result.exception, basefunctions.EventCancelledError):
+                    stats.cancelled += 1
+                else:
+                    stats.failed += 1
+
+    # =============================================================================
+    # REPORTING
+    # =============================================================================
+
+    def reset(self) -> None:
+        """
+        Drop all recorded values and restart the throughput window.
+        """
+        with self._lock:
+            self._stats = {}
+            self._started = time.monotonic()
+
+    def get_metrics(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the metrics of every event type seen so far.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            Per event type: completed, failed, cancelled, retries, timeouts,
+            throughput (events/s), and for queue_wait, execution and
+            end_to_end a dict with count, mean, p50, p95, p99 and max in
+            seconds
+        """
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        metrics: dict[str, dict[str, Any]] = {}
+        for event_type, stats in list(self._stats.items()):
+            with stats.lock:
+                metrics[event_type] = {
+                    "completed": stats.completed,
+                    "failed": stats.failed,
+                    "cancelled": stats.cancelled,
+                    "retries": stats.retries,
+                    "timeouts": stats.timeouts,
+                    "throughput": stats.completed / elapsed,
+                    "queue_wait": self._summarize(stats.queue_wait),
+                    "execution": self._summarize(stats.execution),
+                    "end_to_end": self._summarize(stats.end_to_end),
+                }
+        return metrics
+
+    def get_kpis(self) -> dict[str, KPIValue]:
+        """
+        Get the metrics as KPIs keyed "technical.event_bus.<event type>.<metric>".
+
+        Latencies are reported in milliseconds. The section "bus" holds the
+        totals over all event types and, if available, the input queue state.
+
+        Returns
+        -------
+        dict[str, KPIValue]
+            KPI values with units
+        """
+        metrics = self.get_metrics()
+        kpis: dict[str, KPIValue] = {}
+        prefix = f"technical.{KPI_PACKAGE}"
+
+        totals = {
+            name: sum(type_metrics[name] for type_metrics in metrics.values())
+            for name in ("completed", "failed", "throughput")
+        }
+        kpis[f"{prefix}.bus.completed"] = {"value": float(totals["completed"]), "unit": None}
+        kpis[f"{prefix}.bus.failed"] = {"value": float(totals["failed"]), "unit": None}
+        kpis[f"{prefix}.bus.throughput"] = {"value": totals["throughput"], "unit": "1/s"}
+        if self._queue_metrics is not None:
+            queue_metrics = self._queue_metrics()
+            for name in ("size", "dropped", "rejected"):
+                kpis[f"{prefix}.bus.queue_{name}"] = {"value": float(queue_metrics[name]), "unit": None}
+
+        for event_type, type_metrics in metrics.items():
+            # Dots would split the event type into further key levels
+            section = f"{prefix}.{event_type.replace('.', '_')}"
+            for name in ("completed", "failed", "cancelled", "retries", "timeouts"):
+                kpis[f"{section}.{name}"] = {"value": float(type_metrics[name]), "unit": None}
+            kpis[f"{section}.throughput"] = {"value": type_metrics["throughput"], "unit": "1/s"}
+            for histogram in ("queue_wait", "execution", "end_to_end"):
+                summary = type_metrics[histogram]
+                for statistic in (*(f"p{percentile}" for percentile in REPORTED_PERCENTILES), "max"):
+                    kpis[f"{section}.{histogram}_{statistic}"] = {"value": summary[statistic] * 1000, "unit": "ms"}
+        return kpis
+
+    def get_subproviders(self) -> None:
+        """
+        EventMetrics has no subproviders; event types are part of the KPI keys.
+        """
+        return None
+
+    def _get_stats(self, event_type: str) -> _EventTypeStats:
+        """
+        Get the stats of an event type, creating them on first use.
+        """
+        stats = self._stats.get(event_type)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(event_type, _EventTypeStats())
+        return stats
+
+    @staticmethod
+    def _summarize(histogram: LatencyHistogram) -> dict[str, float]:
+        """
+        Get count, mean, percentiles and max of a histogram, latencies in seconds.
+        """
+        summary: dict[str, float] = {"count": histogram.count, "mean": histogram.mean() / 1_000_000}
+        for percentile in REPORTED_PERCENTILES:
+            summary[f"p{percentile}"] = histogram.percentile(percentile) / 1_000_000
+        summary["max"] = histogram.max / 1_000_000
+        return summary
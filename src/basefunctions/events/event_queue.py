@@ -0,0 +1,1117 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Bounded priority queue with backpressure policies and water-mark callbacks
+
+  Log:
+  v1.11 : drain() removes all queued tasks
+  v1.10 : take_matching() stops scanning once the batch is full
+  v1.9 : admit() reserves a slot until put_internal() or discard_admitted(),
+         so tasks held back by a rate limiter count against the bound
+  v1.8 : Lane tasks of held keys are skipped, lanes compete with the buckets
+         by priority and aging
+  v1.7 : admit() applies the policy to tasks added later with put_internal()
+  v1.6 : Partition lanes: keyed tasks are routed to one consumer lane per key
+         (consistent hashing) with per-key ordering
+  v1.5 : wait_listener called with every dequeued task and its queue wait
+  v1.4 : FIFO bucket per priority instead of a heap, optional aging and
+         per-priority wait statistics
+  v1.3 : take_matching() for coalescing batches of one event type
+  v1.2 : requeue() for tasks parked by a consumer
+  v1.1 : Optional queue wait tracking for the thread pool autoscaler
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import bisect
+import hashlib
+import queue
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from typing import Any
+
+import basefunctions
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+QUEUE_POLICY_BLOCK = "block"
+QUEUE_POLICY_REJECT = "reject"
+QUEUE_POLICY_DROP_LOWEST = "drop_lowest"
+QUEUE_POLICY_DROP_OLDEST = "drop_oldest"
+
+QUEUE_POLICIES = (
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_REJECT,
+    QUEUE_POLICY_DROP_LOWEST,
+    QUEUE_POLICY_DROP_OLDEST,
+)
+
+WATERMARK_HIGH = "high"
+WATERMARK_LOW = "low"
+
+# Points per lane on the partition ring; more points spread keys more evenly
+PARTITION_VIRTUAL_NODES = 64
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+def _task_rank(
+    put_time: float, item: tuple[int, int, Any], now: float, aging_interval: float | None
+) -> tuple[int, int]:
+    """
+    Service rank of a queued task, lower is served first.
+
+    A task that waited n * aging_interval seconds competes n priority
+    levels better; ties go to the older task (lower counter).
+    """
+    if aging_interval:
+        return item[0] - int((now - put_time) / aging_interval), item[1]
+    return item[0], item[1]
+
+
+class PriorityBuckets:
+    """
+    FIFO deque of (enqueue time, task) per priority value.
+
+    Storage of EventQueue: push and pop are O(1) per task plus a scan over
+    the priority values currently queued (a handful, events use 0-10).
+    Lower priority values are served first; tasks of equal priority in
+    arrival order.
+    """
+
+    __slots__ = ("_buckets", "_levels", "_size")
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, deque[tuple[float, tuple[int, int, Any]]]] = {}
+        # Sorted priority values whose bucket is not empty
+        self._levels: list[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[int, int, Any]]:
+        """Iterate over the queued tasks in service order (ignoring aging)."""
+        for level in self._levels:
+            for _, item in self._buckets[level]:
+                yield item
+
+    def push(self, item: tuple[int, int, Any], now: float, front: bool = False) -> None:
+        """
+        Append a task to its priority bucket (or put it first with front=True).
+        """
+        priority = item[0]
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = deque()
+        if not bucket:
+            bisect.insort(self._levels, priority)
+        if front:
+            bucket.appendleft((now, item))
+        else:
+            bucket.append((now, item))
+        self._size += 1
+
+    def pop(self, now: float, aging_interval: float | None) -> tuple[float, tuple[int, int, Any]]:
+        """
+        Remove and return the next (enqueue time, task).
+
+        Without aging the head of the lowest priority value is served. With
+        aging, a head that waited n * aging_interval seconds competes n
+        priority levels better; ties go to the older task.
+        """
+        level, _ = self._select(now, aging_interval)
+        levels = self._levels
+        bucket = self._buckets[level]
+        entry = bucket.popleft()
+        if not bucket:
+            levels.remove(level)
+        self._size -= 1
+        return entry
+
+    def head_rank(self, now: float, aging_interval: float | None) -> tuple[int, int]:
+        """
+        Rank (see _task_rank()) of the task pop() would return next.
+        """
+        return self._select(now, aging_interval)[1]
+
+    def _select(self, now: float, aging_interval: float | None) -> tuple[int, tuple[int, int]]:
+        """
+        Priority value whose head is served next, and the rank of that head.
+        """
+        levels = self._levels
+        level = levels[0]
+        put_time, item = self._buckets[level][0]
+        best = _task_rank(put_time, item, now, aging_interval)
+        if aging_interval and len(levels) > 1:
+            for candidate in levels[1:]:
+                put_time, item = self._buckets[candidate][0]
+                rank = _task_rank(put_time, item, now, aging_interval)
+                if rank < best:
+                    best = rank
+                    level = candidate
+        return level, best
+
+    def remove(self, victim: tuple[int, int, Any]) -> float | None:
+        """
+        Remove a queued task (identity) and return its enqueue time.
+        """
+        bucket = self._buckets.get(victim[0])
+        if not bucket:
+            return None
+        for index, (put_time, item) in enumerate(bucket):
+            if item is victim:
+                del bucket[index]
+                if not bucket:
+                    self._levels.remove(victim[0])
+                self._size -= 1
+                return put_time
+        return None
+
+    def take(
+        self,
+        predicate: Callable[[tuple[int, int, Any]], bool],
+        count: int,
+    ) -> list[tuple[float, tuple[int, int, Any]]]:
+        """
+        Remove up to count matching entries, in service order.
+
+        Scans each bucket from its head only until count entries are taken;
+        skipped entries are put back in front in their order.
+        """
+        taken: list[tuple[float, tuple[int, int, Any]]] = []
+        for level in list(self._levels):
+            if len(taken) >= count:
+                break
+            bucket = self._buckets[level]
+            skipped: list[tuple[float, tuple[int, int, Any]]] = []
+            while bucket and len(taken) < count:
+                entry = bucket.popleft()
+                if predicate(entry[1]):
+                    taken.append(entry)
+                else:
+                    skipped.append(entry)
+            if skipped:
+                bucket.extendleft(reversed(skipped))
+            elif not bucket:
+                self._levels.remove(level)
+        self._size -= len(taken)
+        return taken
+
+    def newest_lowest(self, skip: set[int]) -> tuple[int, int, Any] | None:
+        """
+        Last task of the highest priority value whose id() is not in skip.
+        """
+        for level in reversed(self._levels):
+            for _, item in reversed(self._buckets[level]):
+                if id(item) not in skip:
+                    return item
+        return None
+
+    def oldest(self, skip: set[int]) -> tuple[int, int, Any] | None:
+        """
+        Task with the lowest counter whose id() is not in skip.
+        """
+        oldest: tuple[int, int, Any] | None = None
+        for level in self._levels:
+            for _, item in self._buckets[level]:
+                if id(item) not in skip:
+                    if oldest is None or item[1] < oldest[1]:
+                        oldest = item
+                    break
+        return oldest
+
+    def level_sizes(self) -> dict[int, int]:
+        """
+        Number of queued tasks per priority value.
+        """
+        return {level: len(self._buckets[level]) for level in self._levels}
+
+
+def _ring_hash(value: str) -> int:
+    """
+    Stable 64-bit hash of a string (unlike hash(), not salted per process).
+    """
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class PartitionRing:
+    """
+    Consistent hash ring assigning partition keys to lanes.
+
+    Every lane owns PARTITION_VIRTUAL_NODES points on a 64-bit ring; a key
+    belongs to the lane of the first point at or after the hash of str(key).
+    Adding or removing a lane only moves the keys of the ring segments it
+    gains or loses, about 1/n of all keys for n lanes.
+    """
+
+    __slots__ = ("_points", "_owners", "_lanes")
+
+    def __init__(self) -> None:
+        # Sorted ring points and the lane owning each point
+        self._points: list[int] = []
+        self._owners: list[Hashable] = []
+        self._lanes: list[Hashable] = []
+
+    def __len__(self) -> int:
+        return len(self._lanes)
+
+    def __contains__(self, lane: Hashable) -> bool:
+        return lane in self._lanes
+
+    def add(self, lane: Hashable) -> None:
+        """
+        Add a lane (no-op if present).
+        """
+        if lane not in self._lanes:
+            self._lanes.append(lane)
+            self._rebuild()
+
+    def remove(self, lane: Hashable) -> None:
+        """
+        Remove a lane (no-op if absent).
+        """
+        if lane in self._lanes:
+            self._lanes.remove(lane)
+            self._rebuild()
+
+    def lookup(self, key: Hashable) -> Hashable | None:
+        """
+        Get the lane owning a key, None while the ring has no lanes.
+        """
+        if not self._points:
+            return None
+        index = bisect.bisect_left(self._points, _ring_hash(str(key)))
+        return self._owners[index if index < len(self._owners) else 0]
+
+    def _rebuild(self) -> None:
+        points = sorted(
+            (_ring_hash(f"{lane}#{replica}"), lane)
+            for lane in self._lanes
+            for replica in range(PARTITION_VIRTUAL_NODES)
+        )
+        self._points = [point for point, _ in points]
+        self._owners = [lane for _, lane in points]
+
+
+class EventQueue(queue.PriorityQueue):
+    """
+    Priority queue of (priority, counter, event) tasks with a size bound.
+
+    Tasks are kept in one FIFO bucket per priority value (PriorityBuckets)
+    instead of a heap; lower values are served first. With aging_interval
+    set, a task gains one priority level for every aging_interval seconds
+    it waits, so low-priority events cannot starve under sustained
+    high-priority load.
+
+    offer() applies the configured policy when the queue is full:
+
+    - "block": wait for space, up to put_timeout seconds
+    - "reject": raise EventQueueFullError immediately
+    - "drop_lowest": evict the task with the lowest priority (highest value)
+    - "drop_oldest": evict the task with the lowest counter
+
+    Under a drop policy the incoming task itself is dropped if it ranks
+    below every queued task. Dropped tasks are returned to the caller,
+    which is responsible for completing their events.
+
+    Water marks signal producers to throttle: on_high is called once the
+    size reaches the high water mark, on_low once it falls back to the low
+    water mark. Callbacks run outside the queue lock in the thread whose
+    put or get crossed the mark.
+
+    Partition lanes bind tasks with a partition key to one consumer: with
+    partition_key set and lanes added (add_lane()), a keyed task is put
+    into the FIFO lane the PartitionRing assigns to its key, and only
+    get(lane=...) of that lane returns it. A key is held from get() until
+    release_key(), so tasks of one key never run concurrently and keep
+    their order, also while lanes are added or removed.
+
+    Notes
+    -----
+    - maxsize 0 means unbounded; offer() then never blocks or drops
+    - put() keeps queue.Queue semantics (blocks while full)
+    - put_internal() ignores the bound, does not count against it and is
+      never dropped (shutdown events)
+    - admit() applies the policy to a task that is added later with
+      put_internal() (rate-limited events) and reserves a slot for it:
+      until it is added (or discard_admitted() is called) it counts against
+      the bound but cannot be dropped
+    - requeue() returns tasks a consumer took but did not process; like
+      internal tasks they ignore the bound and are never dropped
+    - get_metrics() reports queue wait statistics per priority value
+    - wait_listener, if set, is called with every dequeued task and its
+      wait in seconds, under the queue lock: it must be fast and must not
+      use the queue
+    - A consumer takes the best-ranked of its first lane task whose key is
+      not held and the next unkeyed task, so priorities and aging apply to
+      keyed tasks too; drop policies only evict unkeyed tasks, and
+      take_matching() only takes unkeyed tasks
+    - A keyed put wakes all waiting consumers, as the owner of the lane
+      cannot be woken alone
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        policy: str = QUEUE_POLICY_BLOCK,
+        put_timeout: float | None = None,
+        aging_interval: float | None = None,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Parameters
+        ----------
+        maxsize : int, optional
+            Maximum number of queued tasks, 0 for unbounded. Default is 0.
+        policy : str, optional
+            Policy applied by offer() when full. Default is "block".
+        put_timeout : float, optional
+            Seconds the "block" policy waits for space. None waits forever.
+        aging_interval : float, optional
+            Seconds of waiting after which a task competes one priority
+            level better. None disables aging (strict priority).
+
+        Raises
+        ------
+        ValueError
+            If maxsize or put_timeout is negative, aging_interval is not
+            positive or the policy is unknown.
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        if put_timeout is not None and put_timeout < 0:
+            raise ValueError("put_timeout must not be negative")
+        if aging_interval is not None and aging_interval <= 0:
+            raise ValueError("aging_interval must be positive")
+        super().__init__(maxsize)
+        self.aging_interval = aging_interval
+        self.policy = policy
+        self.put_timeout = put_timeout
+        self.dropped = 0
+        self.rejected = 0
+        self._pinned: set[int] = set()
+        # (priority, counter) of tasks admitted but not yet added
+        self._reserved: set[tuple[int, int]] = set()
+        self._high_water: int | None = None
+        self._low_water = 0
+        self._on_high: Callable[[int], None] | None = None
+        self._on_low: Callable[[int], None] | None = None
+        self._above_high = False
+        self._signals: list[tuple[str, int]] = []
+        # Wait since the last take_wait_stats() and per priority [dequeued, total, max]
+        self._wait_total = 0.0
+        self._wait_count = 0
+        self._priority_waits: dict[int, list[float]] = {}
+        self.wait_listener: Callable[[tuple[int, int, Any], float], None] | None = None
+        # Partition key of a task (None for unkeyed tasks); None disables lanes
+        self.partition_key: Callable[[tuple[int, int, Any]], Hashable | None] | None = None
+        self._ring = PartitionRing()
+        self._lanes: dict[Hashable, deque[tuple[float, tuple[int, int, Any]]]] = {}
+        self._lane_size = 0
+        # Key -> id() of the task holding it, keys a lane head waits for
+        self._held_keys: dict[Hashable, int] = {}
+        self._contended: set[Hashable] = set()
+        self._logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+    # =============================================================================
+    # PUBLIC API
+    # =============================================================================
+
+    def offer(self, item: tuple[int, int, Any]) -> list[tuple[int, int, Any]]:
+        """
+        Add a task, applying the queue policy when full.
+
+        Parameters
+        ----------
+        item : tuple[int, int, Any]
+            Task tuple (priority, counter, event)
+
+        Returns
+        -------
+        list[tuple[int, int, Any]]
+            Tasks dropped to make room, or [item] if the task itself was
+            dropped. Empty if nothing was dropped.
+
+        Raises
+        ------
+        EventQueueFullError
+            If the queue is full under the "reject" policy, or stays full
+            for put_timeout seconds under the "block" policy.
+        """
+        with self.not_full:
+            dropped = self._offer_locked(item)
+        if self._signals:
+            self._fire_signals()
+        return dropped
+
+    def offer_many(
+        self, items: Iterable[tuple[int, int, Any]]
+    ) -> tuple[list[tuple[int, int, Any]], list[tuple[int, int, Any]]]:
+        """
+        Add several tasks, applying the queue policy to each.
+
+        An unbounded queue adds all tasks under a single lock acquisition.
+        Once one task is rejected, the remaining tasks are rejected without
+        waiting again.
+
+        Parameters
+        ----------
+        items : Iterable[tuple[int, int, Any]]
+            Task tuples (priority, counter, event)
+
+        Returns
+        -------
+        tuple[list, list]
+            (dropped, rejected) tasks; both must be completed by the caller
+        """
+        dropped: list[tuple[int, int, Any]] = []
+        rejected: list[tuple[int, int, Any]] = []
+        with self.not_full:
+            if self.maxsize <= 0:
+                items = list(items)
+                for item in items:
+                    self._put(item)
+                self.unfinished_tasks += len(items)
+                self.not_empty.notify(len(items))
+            else:
+                for item in items:
+                    if rejected:
+                        rejected.append(item)
+                        self.rejected += 1
+                        continue
+                    try:
+                        dropped.extend(self._offer_locked(item))
+                    except basefunctions.EventQueueFullError:
+                        rejected.append(item)
+        if self._signals:
+            self._fire_signals()
+        return dropped, rejected
+
+    def admit(self, item: tuple[int, int, Any]) -> list[tuple[int, int, Any]]:
+        """
+        Apply the queue policy to a task without adding it.
+
+        For tasks that are added later with put_internal() (rate-limited
+        events): the bound is applied once, when the task is published, so
+        the later put never blocks or drops. An admitted task reserves a
+        slot until put_internal() adds it or discard_admitted() frees it.
+
+        Parameters
+        ----------
+        item : tuple[int, int, Any]
+            Task tuple (priority, counter, event)
+
+        Returns
+        -------
+        list[tuple[int, int, Any]]
+            Tasks dropped to make room, or [item] if the task itself must
+            be dropped. Empty if nothing was dropped.
+
+        Raises
+        ------
+        EventQueueFullError
+            If the queue is full under the "reject" policy, or stays full
+            for put_timeout seconds under the "block" policy.
+        """
+        with self.not_full:
+            dropped = self._make_room(item)
+            if not dropped or dropped[0] is not item:
+                self._reserved.add((item[0], item[1]))
+        if self._signals:
+            self._fire_signals()
+        return dropped
+
+    def discard_admitted(self, item: tuple[int, int, Any]) -> None:
+        """
+        Free the slot of an admitted task that will never be added.
+
+        Parameters
+        ----------
+        item : tuple[int, int, Any]
+            Task tuple (priority, counter, event) passed to admit()
+        """
+        with self.not_full:
+            key = (item[0], item[1])
+            if key in self._reserved:
+                self._reserved.discard(key)
+                self.not_full.notify()
+
+    def put_internal(self, item: tuple[int, int, Any]) -> None:
+        """
+        Add a task regardless of the size bound; it is never dropped.
+
+        A task admitted with admit() takes its reserved slot instead: it is
+        queued like an offered task and counts against the bound.
+
+        Parameters
+        ----------
+        item : tuple[int, int, Any]
+            Task tuple (priority, counter, event)
+        """
+        with self.not_full:
+            key = (item[0], item[1])
+            if key in self._reserved:
+                self._reserved.discard(key)
+            else:
+                self._pinned.add(id(item))
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+        if self._signals:
+            self._fire_signals()
+
+    def requeue(self, items: Iterable[tuple[int, int, Any]]) -> None:
+        """
+        Return tasks taken with get() but not yet marked task_done().
+
+        The tasks are still unfinished, so unfinished_tasks is not changed.
+
+        Parameters
+        ----------
+        items : Iterable[tuple[int, int, Any]]
+            Task tuples (priority, counter, event); each is served before
+            the tasks queued behind it with the same priority
+        """
+        with self.not_full:
+            count = 0
+            now = time.monotonic()
+            for item in items:
+                self._pinned.add(id(item))
+                # Taken before anything queued behind them of their priority (or in their lane)
+                lane = self._lane_for(item)
+                if lane is None:
+                    self.queue.push(item, now, front=True)
+                else:
+                    self._lanes[lane].appendleft((now, item))
+                    self._lane_size += 1
+                    self.not_empty.notify_all()
+                self._check_high_water()
+                count += 1
+            self.not_empty.notify(count)
+        if self._signals:
+            self._fire_signals()
+
+    def drain(self) -> list[tuple[int, int, Any]]:
+        """
+        Remove all queued tasks, internal and partitioned ones included.
+
+        The tasks count as done: join() no longer waits for them.
+
+        Returns
+        -------
+        list[tuple[int, int, Any]]
+            Removed tasks; their events must be completed by the caller
+        """
+        with self.not_full:
+            drained = list(self.queue)
+            for lane in self._lanes.values():
+                drained.extend(item for _, item in lane)
+                lane.clear()
+            self.queue = PriorityBuckets()
+            self._lane_size = 0
+            self._pinned.clear()
+            self.unfinished_tasks -= len(drained)
+            if self.unfinished_tasks == 0:
+                self.all_tasks_done.notify_all()
+            self.not_full.notify_all()
+            self._check_low_water()
+        if self._signals:
+            self._fire_signals()
+        return drained
+
+    def put(self, item: tuple[int, int, Any], block: bool = True, timeout: float | None = None) -> None:
+        """Put an item into the queue (queue.Queue semantics)."""
+        super().put(item, block, timeout)
+        if self._signals:
+            self._fire_signals()
+
+    def get(
+        self,
+        block: bool = True,
+        timeout: float | None = None,
+        lane: Hashable | None = None,
+    ) -> tuple[int, int, Any]:
+        """
+        Remove and return the next item (queue.Queue semantics).
+
+        Parameters
+        ----------
+        block : bool, optional
+            Wait for an item. Default is True.
+        timeout : float, optional
+            Seconds to wait, None waits forever.
+        lane : Hashable, optional
+            Lane of the consumer; its next task whose key is not held
+            competes with the next unkeyed task by priority (and aging).
+            Keyed tasks must then be passed to release_key() once processed.
+
+        Raises
+        ------
+        queue.Empty
+            If no item is available within timeout (or at once with block=False).
+        """
+        with self.not_empty:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while True:
+                item = self._take(lane)
+                if item is not None:
+                    break
+                if not block:
+                    raise queue.Empty
+                if deadline is None:
+                    self.not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise queue.Empty
+                    self.not_empty.wait(remaining)
+            self.not_full.notify()
+        if self._signals:
+            self._fire_signals()
+        return item
+
+    def add_lane(self, lane: Hashable) -> None:
+        """
+        Add a consumer lane; keys it now owns move over with their queued tasks.
+        """
+        with self.mutex:
+            self._ring.add(lane)
+            self._lanes.setdefault(lane, deque())
+            self._repartition()
+
+    def remove_lane(self, lane: Hashable) -> None:
+        """
+        Remove a consumer lane; its queued tasks move to the new owners of their keys.
+
+        Without lanes left, they move to the shared priority buckets.
+        """
+        with self.mutex:
+            self._ring.remove(lane)
+            self._repartition()
+            self._lanes.pop(lane, None)
+
+    def release_key(self, item: tuple[int, int, Any]) -> None:
+        """
+        Release the partition key of a processed task taken with get().
+
+        The next task of the key may start afterwards, in any lane.
+        """
+        if self.partition_key is None:
+            return
+        key = self.partition_key(item)
+        if key is None:
+            return
+        with self.mutex:
+            if self._held_keys.get(key) == id(item):
+                del self._held_keys[key]
+            if key in self._contended:
+                self._contended.discard(key)
+                self.not_empty.notify_all()
+
+    def take_matching(
+        self,
+        predicate: Callable[[tuple[int, int, Any]], bool],
+        limit: int,
+        timeout: float = 0.0,
+    ) -> list[tuple[int, int, Any]]:
+        """
+        Remove up to limit queued tasks accepted by predicate, in priority order.
+
+        While fewer than limit tasks were found, waits up to timeout seconds
+        for more to arrive. Taken tasks count as handed to a consumer: call
+        task_done() for each. Internal tasks are never taken.
+
+        Parameters
+        ----------
+        predicate : Callable[[tuple[int, int, Any]], bool]
+            Called with each queued task; True selects it
+        limit : int
+            Maximum number of tasks to take
+        timeout : float, optional
+            Seconds to wait for matching tasks. Default is 0 (no waiting).
+
+        Returns
+        -------
+        list[tuple[int, int, Any]]
+            Taken tasks, highest priority first
+        """
+        taken: list[tuple[int, int, Any]] = []
+        deadline = time.monotonic() + timeout
+        with self.not_empty:
+            while True:
+                if self.queue:
+                    self._take_matching_locked(predicate, limit - len(taken), taken)
+                remaining = deadline - time.monotonic()
+                if len(taken) >= limit or remaining <= 0:
+                    break
+                self.not_empty.wait(remaining)
+            # A wakeup consumed while waiting may have been meant for another consumer
+            if self.queue:
+                self.not_empty.notify()
+            if taken:
+                self.not_full.notify(len(taken))
+        if self._signals:
+            self._fire_signals()
+        return taken
+
+    def set_watermarks(
+        self,
+        high: int | None,
+        low: int | None = None,
+        on_high: Callable[[int], None] | None = None,
+        on_low: Callable[[int], None] | None = None,
+    ) -> None:
+        """
+        Configure water-mark callbacks.
+
+        Parameters
+        ----------
+        high : int or None
+            Size at which on_high is called. None disables water marks.
+        low : int, optional
+            Size at which on_low is called after the high mark was reached.
+            Defaults to high // 2.
+        on_high : Callable[[int], None], optional
+            Called with the current size when the high mark is reached
+        on_low : Callable[[int], None], optional
+            Called with the current size when the low mark is reached again
+
+        Raises
+        ------
+        ValueError
+            If high is not positive or low is not below high.
+        """
+        if high is not None:
+            if high <= 0:
+                raise ValueError("high water mark must be positive")
+            low = high // 2 if low is None else low
+            if not 0 <= low < high:
+                raise ValueError("low water mark must be >= 0 and below the high water mark")
+        with self.mutex:
+            self._high_water = high
+            self._low_water = low or 0
+            self._on_high = on_high
+            self._on_low = on_low
+            self._above_high = False
+
+    def take_wait_stats(self) -> tuple[int, float]:
+        """
+        Get and reset the wait statistics of tasks dequeued since the last call.
+
+        Returns
+        -------
+        tuple[int, float]
+            Number of dequeued tasks and their average wait in seconds
+        """
+        with self.mutex:
+            count, total = self._wait_count, self._wait_total
+            self._wait_count = 0
+            self._wait_total = 0.0
+        return count, total / count if count else 0.0
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get queue metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            size, max_size, reserved, policy, aging_interval, dropped,
+            rejected, above_high_water and priorities: per priority value the queued
+            and dequeued task counts and the average and maximum queue wait
+            in seconds
+        """
+        with self.mutex:
+            queued = self.queue.level_sizes()
+            priorities = {}
+            for priority in sorted(queued.keys() | self._priority_waits.keys()):
+                dequeued, total, longest = self._priority_waits.get(priority, (0, 0.0, 0.0))
+                priorities[priority] = {
+                    "queued": queued.get(priority, 0),
+                    "dequeued": int(dequeued),
+                    "avg_wait": total / dequeued if dequeued else 0.0,
+                    "max_wait": longest,
+                }
+            return {
+                "size": self._qsize(),
+                "max_size": self.maxsize,
+                "reserved": len(self._reserved),
+                "policy": self.policy,
+                "aging_interval": self.aging_interval,
+                "dropped": self.dropped,
+                "rejected": self.rejected,
+                "above_high_water": self._above_high,
+                "partitioned": self._lane_size,
+                "priorities": priorities,
+            }
+
+    # =============================================================================
+    # INTERNAL HELPERS (caller holds the lock unless noted)
+    # =============================================================================
+
+    def _offer_locked(self, item: tuple[int, int, Any]) -> list[tuple[int, int, Any]]:
+        """
+        Apply the policy and add the item.
+        """
+        dropped = self._make_room(item)
+        if dropped and dropped[0] is item:
+            return dropped
+
+        self._put(item)
+        self.unfinished_tasks += 1
+        self.not_empty.notify()
+        return dropped
+
+    def _make_room(self, item: tuple[int, int, Any]) -> list[tuple[int, int, Any]]:
+        """
+        Apply the policy when full: wait, reject, or drop a task (or [item]).
+        """
+        if not 0 < self.maxsize <= self._bounded_size():
+            return []
+        if self.policy == QUEUE_POLICY_BLOCK:
+            self._wait_for_space()
+            return []
+        if self.policy == QUEUE_POLICY_REJECT:
+            self.rejected += 1
+            raise basefunctions.EventQueueFullError(f"Input queue full ({self.maxsize} events)")
+
+        victim = self._select_victim(item)
+        self.dropped += 1
+        if victim is item:
+            return [item]
+        self._remove(victim)
+        return [victim]
+
+    def _wait_for_space(self) -> None:
+        """
+        Block until the queue has space or put_timeout expires.
+        """
+        if self.put_timeout is None:
+            while self._bounded_size() >= self.maxsize:
+                self.not_full.wait()
+            return
+
+        deadline = time.monotonic() + self.put_timeout
+        while self._bounded_size() >= self.maxsize:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.rejected += 1
+                raise basefunctions.EventQueueFullError(
+                    f"Input queue full ({self.maxsize} events) for {self.put_timeout}s"
+                )
+            self.not_full.wait(remaining)
+
+    def _bounded_size(self) -> int:
+        """
+        Number of tasks that count against maxsize: queued tasks except
+        internal ones, plus admitted tasks not yet added.
+        """
+        return self._qsize() - len(self._pinned) + len(self._reserved)
+
+    def _select_victim(self, item: tuple[int, int, Any]) -> tuple[int, int, Any]:
+        """
+        Pick the task to drop under a drop policy (may be the item itself).
+        """
+        if self.policy == QUEUE_POLICY_DROP_LOWEST:
+            victim = self.queue.newest_lowest(self._pinned)
+            if victim is None or (item[0], item[1]) >= (victim[0], victim[1]):
+                return item
+            return victim
+
+        victim = self.queue.oldest(self._pinned)
+        return item if victim is None else victim
+
+    def _remove(self, victim: tuple[int, int, Any]) -> None:
+        """
+        Remove a queued task that will never be handed to a consumer.
+        """
+        self.queue.remove(victim)
+        self.unfinished_tasks -= 1
+        self._check_low_water()
+
+    def _take_matching_locked(
+        self,
+        predicate: Callable[[tuple[int, int, Any]], bool],
+        count: int,
+        taken: list[tuple[int, int, Any]],
+    ) -> None:
+        """
+        Move up to count matching tasks from the heap to taken.
+        """
+        pinned = self._pinned
+        chosen = self.queue.take(lambda entry: id(entry) not in pinned and predicate(entry), count)
+        if not chosen:
+            return
+        now = time.monotonic()
+        for put_time, item in chosen:
+            self._record_wait(item, now - put_time)
+            taken.append(item)
+        self._check_low_water()
+
+    def _record_wait(self, item: tuple[int, int, Any], wait: float) -> None:
+        priority = item[0]
+        self._wait_total += wait
+        self._wait_count += 1
+        stats = self._priority_waits.get(priority)
+        if stats is None:
+            self._priority_waits[priority] = [1, wait, wait]
+        else:
+            stats[0] += 1
+            stats[1] += wait
+            if wait > stats[2]:
+                stats[2] = wait
+        if self.wait_listener is not None:
+            self.wait_listener(item, wait)
+
+    def _lane_for(self, item: tuple[int, int, Any]) -> Hashable | None:
+        """
+        Lane of a task, None for unkeyed tasks and while no lane exists.
+        """
+        if self.partition_key is None or not self._ring:
+            return None
+        key = self.partition_key(item)
+        return None if key is None else self._ring.lookup(key)
+
+    def _take(self, lane: Hashable | None) -> tuple[int, int, Any] | None:
+        """
+        Remove the next task for a consumer: the first task of its lane whose
+        key is not held by another task, or the next unkeyed task if that
+        one ranks better (priority and aging apply to both alike).
+
+        Skipping a task of a held key keeps the order per key: all tasks of
+        a key are in one lane, and the later ones are skipped as well.
+        """
+        entries = self._lanes.get(lane) if lane is not None else None
+        if entries:
+            for index, (put_time, item) in enumerate(entries):
+                key = self.partition_key(item)
+                holder = self._held_keys.get(key)
+                if holder is None or holder == id(item):
+                    break
+                # The previous task of the key still runs (or is parked, or in the lane it had before a resize)
+                self._contended.add(key)
+            else:
+                return self._get() if self.queue else None
+
+            now = time.monotonic()
+            if self.queue and self.queue.head_rank(now, self.aging_interval) < _task_rank(
+                put_time, item, now, self.aging_interval
+            ):
+                return self._get()
+            del entries[index]
+            self._lane_size -= 1
+            self._held_keys[key] = id(item)
+            if self._pinned:
+                self._pinned.discard(id(item))
+            self._record_wait(item, now - put_time)
+            self._check_low_water()
+            return item
+        return self._get() if self.queue else None
+
+    def _repartition(self) -> None:
+        """
+        Move lane tasks whose key changed its lane, keeping their order.
+
+        All tasks of a key are in one lane, so appending them lane by lane
+        keeps the order per key.
+        """
+        if not self._lane_size:
+            return
+        lanes, self._lanes = self._lanes, {lane: deque() for lane in self._lanes if lane in self._ring}
+        for entries in lanes.values():
+            for put_time, item in entries:
+                lane = self._lane_for(item)
+                if lane is None:
+                    self.queue.push(item, put_time)
+                    self._lane_size -= 1
+                else:
+                    self._lanes[lane].append((put_time, item))
+        self.not_empty.notify_all()
+
+    # queue.Queue storage hooks: PriorityBuckets replaces the heap of PriorityQueue
+
+    def _init(self, maxsize: int) -> None:
+        self.queue = PriorityBuckets()
+
+    def _qsize(self) -> int:
+        return len(self.queue) + self._lane_size
+
+    def _put(self, item: tuple[int, int, Any]) -> None:
+        lane = self._lane_for(item)
+        if lane is None:
+            self.queue.push(item, time.monotonic())
+        else:
+            self._lanes[lane].append((time.monotonic(), item))
+            self._lane_size += 1
+            # Only the owner of the lane can take the task
+            self.not_empty.notify_all()
+        self._check_high_water()
+
+    def _get(self) -> tuple[int, int, Any]:
+        now = time.monotonic()
+        put_time, item = self.queue.pop(now, self.aging_interval)
+        if self._pinned:
+            self._pinned.discard(id(item))
+        self._record_wait(item, now - put_time)
+        self._check_low_water()
+        return item
+
+    def _check_high_water(self) -> None:
+        if self._high_water is not None and not self._above_high and self._qsize() >= self._high_water:
+            self._above_high = True
+            self._signals.append((WATERMARK_HIGH, self._qsize()))
+
+    def _check_low_water(self) -> None:
+        if self._above_high and self._qsize() <= self._low_water:
+            self._above_high = False
+            self._signals.append((WATERMARK_LOW, self._qsize()))
+
+    def _fire_signals(self) -> None:
+        """
+        Call pending water-mark callbacks (caller must NOT hold the lock).
+        """
+        with self.mutex:
+            signals, self._signals = self._signals, []
+            on_high, on_low = self._on_high, self._on_low
+
+        for mark, size in signals:
+            callback = on_high if mark == WATERMARK_HIGH else on_low
+            if callback is None:
+                continue
+            try:
+                callback(size)
+            except Exception as e:
+                self._logger.error("Queue %s water-mark callback failed: %s", mark, str(e))
@@ -0,0 +1,185 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Recurring event publication driven by the shared deadline scheduler
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from basefunctions.utils.logging import get_logger
+from basefunctions.events.deadline_scheduler import DeadlineHandle, get_deadline_scheduler
+import basefunctions
+
+if TYPE_CHECKING:
+    from basefunctions.events.event_bus import EventBus
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class EventSchedule:
+    """
+    Event publication repeated at a fixed rate, created by EventBus.schedule_every().
+
+    Each run is timed by the deadline scheduler, which hands it over to the
+    bus release thread; there the event factory is called and the run
+    publishes the new event with a zero delay, so a run never blocks on a
+    full input queue. Runs follow a fixed rate: a slow run does not shift
+    the following ones, and runs missed while the process was busy are
+    skipped instead of being caught up.
+
+    Parameters
+    ----------
+    event_bus : EventBus
+        Bus the events are published on
+    event_factory : Callable[[], Event]
+        Creates the event of a run
+    interval : float
+        Seconds between runs
+    on_result : Callable[[EventResult], None], optional
+        Called with the result of every run. Results are not stored in the
+        bus result cache.
+
+    Attributes
+    ----------
+    interval : float
+        Seconds between runs
+    runs : int
+        Number of events published so far
+    """
+
+    __slots__ = (
+        "interval",
+        "runs",
+        "_event_bus",
+        "_event_factory",
+        "_on_result",
+        "_next_run",
+        "_handle",
+        "_cancelled",
+        "_lock",
+        "_logger",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        event_bus: EventBus,
+        event_factory: Callable[[], basefunctions.Event],
+        interval: float,
+        on_result: Callable[[basefunctions.EventResult], None] | None = None,
+    ) -> None:
+        self.interval = interval
+        self.runs = 0
+        self._event_bus = event_bus
+        self._event_factory = event_factory
+        self._on_result = on_result
+        self._next_run = 0.0
+        self._handle: DeadlineHandle | None = None
+        self._cancelled = False
+        self._lock = threading.Lock()
+        self._logger = get_logger(f"{__name__}.{self.__class__.__name__}")
+
+    @property
+    def cancelled(self) -> bool:
+        """True once cancel() was called."""
+        return self._cancelled
+
+    def start(self, delay: float) -> None:
+        """
+        Schedule the first run.
+
+        Parameters
+        ----------
+        delay : float
+            Seconds until the first run
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            self._next_run = time.monotonic() + delay
+            self._handle = get_deadline_scheduler().schedule(delay, self._run)
+
+    def cancel(self) -> bool:
+        """
+        Stop the schedule. Events already published are not affected.
+
+        Returns
+        -------
+        bool
+            True if the schedule was active, False if it was cancelled before
+        """
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._cancelled = True
+            if self._handle is not None:
+                self._handle.cancel()
+            return True
+
+    def _run(self) -> None:
+        """
+        Schedule the next run and hand the run over to the bus release thread (runs on the scheduler thread).
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            now = time.monotonic()
+            self._next_run += self.interval
+            if self._next_run <= now:
+                self._next_run = now + self.interval
+            self._handle = get_deadline_scheduler().schedule(self._next_run - now, self._run)
+
+        # publish() takes the bus publish lock, which must never block the scheduler thread
+        self._event_bus._defer_release(self._publish_run)
+
+    def _publish_run(self) -> None:
+        """
+        Create and publish the event of one run (runs on the bus release thread).
+        """
+        if self._cancelled:
+            return
+        try:
+            future = self._event_bus.publish(self._event_factory(), return_future=True, delay=0)
+        except Exception as e:
+            self._logger.error("Scheduled event could not be published: %s", str(e))
+            return
+
+        self.runs += 1
+        if self._on_result is not None:
+            future.add_done_callback(lambda done: self._on_result(done.result()))
@@ -0,0 +1,408 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Sampled event lifecycle tracing, exported in the Chrome trace event
+  format (chrome://tracing, Perfetto)
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import json
+import os
+import pickle
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Any
+from basefunctions.utils.logging import get_logger
+from basefunctions.events.shared_memory_transport import decode_message, encode_message
+import basefunctions
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+DEFAULT_MAX_SPANS = 100_000
+TRACE_CATEGORY = "events"
+
+# Span names
+SPAN_PUBLISH = "publish"
+SPAN_RATE_LIMIT_WAIT = "rate_limit_wait"
+SPAN_QUEUE_WAIT = "queue_wait"
+SPAN_HANDLER = "handler"
+SPAN_PICKLE = "pickle"
+SPAN_PIPE_SEND = "pipe_send"
+SPAN_UNPICKLE = "unpickle"
+
+# Waits overlap the work of other spans on a thread, they are exported as
+# async spans (one track per event) instead of complete spans
+WAIT_SPANS = frozenset((SPAN_RATE_LIMIT_WAIT, SPAN_QUEUE_WAIT))
+
+_SAMPLE_SPACE = 1 << 32
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+def make_span(name: str, event: basefunctions.Event, started: int, ended: int | None = None) -> tuple:
+    """
+    Create a span of the calling thread.
+
+    Parameters
+    ----------
+    name : str
+        Span name
+    event : basefunctions.Event
+        Event the span belongs to
+    started : int
+        time.perf_counter_ns() at the start of the span
+    ended : int, optional
+        time.perf_counter_ns() at its end. Defaults to now.
+
+    Returns
+    -------
+    tuple
+        (name, start ns, duration ns, pid, tid, event_id, event_type)
+    """
+    if ended is None:
+        ended = time.perf_counter_ns()
+    return (
+        name,
+        started,
+        ended - started,
+        os.getpid(),
+        threading.get_native_id(),
+        event.event_id,
+        event.event_type,
+    )
+
+
+class TracedMessage:
+    """
+    Corelet pipe message of a sampled event.
+
+    The parent wraps the encoded event, the corelet replies with the
+    encoded result and the spans it recorded. Encoding the payload
+    separately lets both sides time their own pickling.
+
+    Parameters
+    ----------
+    payload : bytes
+        Message encoded by encode_message()
+    spans : list[tuple], optional
+        Spans recorded by the corelet (reply only)
+    """
+
+    __slots__ = ("payload", "spans")
+
+    def __init__(self, payload: bytes, spans: list[tuple] | None = None) -> None:
+        self.payload = payload
+        self.spans = spans
+
+    def __getstate__(self) -> tuple:
+        return self.payload, self.spans
+
+    def __setstate__(self, state: tuple) -> None:
+        self.payload, self.spans = state
+
+
+class EventTracer:
+    """
+    Sampled lifecycle spans of events, exported as Chrome trace.
+
+    While enabled, the EventBus, the corelet forwarding handler, the corelet
+    pool and CoreletWorker record spans of sampled events:
+
+    - publish: the publish() call
+    - rate_limit_wait: time in the rate limiter (async span)
+    - queue_wait: time in the input queue until dequeued (async span)
+    - handler: the handler run on a worker thread, per attempt; in the
+      corelet the handler run itself
+    - pickle, pipe_send: encoding and sending an event to a corelet, and
+      encoding its result in the corelet
+    - unpickle: decoding an event in the corelet and its result in the
+      parent
+
+    Spans carry process and native thread IDs, so corelet spans show up as
+    their own processes. Timestamps come from time.perf_counter_ns(), which
+    is one clock for all processes of a host.
+
+    Sampling is decided per event ID (CRC32), the same way at every hook,
+    so a sampled event is traced completely. Unsampled events cost one
+    CRC32 per hook, sampled events a few microseconds in total. Spans are
+    kept in a ring buffer of max_spans, the oldest are dropped.
+
+    Attributes
+    ----------
+    enabled : bool
+        True while spans are recorded
+    sample_rate : float
+        Fraction of events traced
+    """
+
+    __slots__ = ("enabled", "sample_rate", "_threshold", "_spans", "_rate_limited")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.sample_rate = 1.0
+        self._threshold = _SAMPLE_SPACE
+        self._spans: deque[tuple] = deque(maxlen=DEFAULT_MAX_SPANS)
+        # event_id -> perf_counter_ns() when the event entered the rate limiter
+        self._rate_limited: dict[str, int] = {}
+
+    def configure(self, sample_rate: float = 1.0, max_spans: int = DEFAULT_MAX_SPANS) -> None:
+        """
+        Set sampling and buffer size and drop all recorded spans.
+
+        Parameters
+        ----------
+        sample_rate : float, optional
+            Fraction of events traced, between 0 (exclusive) and 1. Default is 1.
+        max_spans : int, optional
+            Spans kept, the oldest are dropped. Default is 100,000.
+
+        Raises
+        ------
+        ValueError
+            If sample_rate or max_spans is out of range.
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("sample_rate must be in (0, 1]")
+        if max_spans <= 0:
+            raise ValueError("max_spans must be positive")
+        self.sample_rate = sample_rate
+        self._threshold = int(sample_rate * _SAMPLE_SPACE)
+        self._spans = deque(maxlen=max_spans)
+        self._rate_limited.clear()
+
+    def is_sampled(self, event: basefunctions.Event) -> bool:
+        """
+        Check whether an event is traced (deterministic per event ID).
+        """
+        return zlib.crc32(event.event_id.encode()) < self._threshold
+
+    # =============================================================================
+    # RECORDING
+    # =============================================================================
+
+    def add_span(self, name: str, event: basefunctions.Event, started: int, ended: int | None = None) -> None:
+        """
+        Record a span of the calling thread, see make_span().
+        """
+        self._spans.append(make_span(name, event, started, ended))
+
+    def add_spans(self, spans: list[tuple]) -> None:
+        """
+        Record spans created elsewhere, e.g. by a corelet.
+        """
+        self._spans.extend(spans)
+
+    def add_queue_wait(self, event: basefunctions.Event, wait: float) -> None:
+        """
+        Record the input queue wait of a dequeued event, and its rate limiter wait if any.
+
+        Parameters
+        ----------
+        event : basefunctions.Event
+            Dequeued event
+        wait : float
+            Seconds it spent in the input queue
+        """
+        ended = time.perf_counter_ns()
+        enqueued = ended - int(wait * 1_000_000_000)
+        submitted = self._rate_limited.pop(event.event_id, None) if self._rate_limited else None
+        if submitted is not None:
+            self._spans.append(make_span(SPAN_RATE_LIMIT_WAIT, event, submitted, enqueued))
+        self._spans.append(make_span(SPAN_QUEUE_WAIT, event, enqueued, ended))
+
+    def begin_rate_limit_wait(self, event: basefunctions.Event) -> None:
+        """
+        Note that an event entered the rate limiter; the span ends when it enters the input queue.
+        """
+        self._rate_limited[event.event_id] = time.perf_counter_ns()
+
+    def discard(self, event_id: str) -> None:
+        """
+        Forget the open rate limiter wait of a completed event.
+        """
+        self._rate_limited.pop(event_id, None)
+
+    # =============================================================================
+    # CORELET TRANSPORT
+    # =============================================================================
+
+    def encode(self, message: Any, event: basefunctions.Event, threshold: int | None) -> tuple[bytes, list[str]]:
+        """
+        Encode a corelet message of a sampled event as TracedMessage, recording a pickle span.
+
+        Parameters
+        ----------
+        message : Any
+            Event or batch of events
+        event : basefunctions.Event
+            Event the spans belong to
+        threshold : int, optional
+            Shared memory threshold, see encode_message()
+
+        Returns
+        -------
+        tuple[bytes, list[str]]
+            Message bytes and names of the created segments
+        """
+        started = time.perf_counter_ns()
+        payload, segment_names = encode_message(message, threshold)
+        self.add_span(SPAN_PICKLE, event, started)
+        return pickle.dumps(TracedMessage(payload)), segment_names
+
+    def decode(self, data: bytes, event: basefunctions.Event) -> Any:
+        """
+        Decode a corelet reply to a TracedMessage, recording the corelet spans and an unpickle span.
+
+        Replies that are no TracedMessage (retirement notices) are returned as decoded.
+
+        Parameters
+        ----------
+        data : bytes
+            Reply bytes
+        event : basefunctions.Event
+            Event the spans belong to
+
+        Returns
+        -------
+        Any
+            Decoded reply
+        """
+        started = time.perf_counter_ns()
+        reply, _ = decode_message(data)
+        if reply.__class__ is not TracedMessage:
+            return reply
+        if reply.spans:
+            self.add_spans(reply.spans)
+        result, _ = decode_message(reply.payload)
+        self.add_span(SPAN_UNPICKLE, event, started)
+        return result
+
+    # =============================================================================
+    # EXPORT
+    # =============================================================================
+
+    def get_spans(self) -> list[tuple]:
+        """
+        Get the recorded spans as (name, start ns, duration ns, pid, tid, event_id, event_type).
+        """
+        return list(self._spans)
+
+    def clear(self) -> None:
+        """
+        Drop all recorded spans.
+        """
+        self._spans.clear()
+        self._rate_limited.clear()
+
+    def get_trace(self) -> dict[str, Any]:
+        """
+        Get the recorded spans in the Chrome trace event format.
+
+        Returns
+        -------
+        dict[str, Any]
+            {"traceEvents": [...], "displayTimeUnit": "ms"} with complete
+            events ("X") for work, async begin/end events ("b"/"e") keyed by
+            event ID for waits, and process and thread name metadata
+        """
+        own_pid = os.getpid()
+        thread_names = {thread.native_id: thread.name for thread in threading.enumerate()}
+        trace_events: list[dict[str, Any]] = []
+        threads: set[tuple[int, int]] = set()
+
+        for name, started, duration, pid, tid, event_id, event_type in self.get_spans():
+            threads.add((pid, tid))
+            entry = {
+                "name": name,
+                "cat": TRACE_CATEGORY,
+                "ts": started / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": {"event_id": event_id, "event_type": event_type},
+            }
+            if name in WAIT_SPANS:
+                entry["ph"] = "b"
+                entry["id"] = event_id
+                trace_events.append(entry)
+                trace_events.append({**entry, "ph": "e", "ts": (started + duration) / 1000})
+            else:
+                entry["ph"] = "X"
+                entry["dur"] = duration / 1000
+                trace_events.append(entry)
+
+        metadata: list[dict[str, Any]] = []
+        for pid in sorted({pid for pid, _ in threads}):
+            process_name = "EventBus" if pid == own_pid else f"Corelet {pid}"
+            metadata.append({"name": "process_name", "ph": "M", "pid": pid, "args": {"name": process_name}})
+        for pid, tid in sorted(threads):
+            if pid == own_pid and tid in thread_names:
+                metadata.append(
+                    {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread_names[tid]}}
+                )
+        return {"traceEvents": metadata + trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str) -> int:
+        """
+        Write the recorded spans as JSON trace file, loadable in chrome://tracing or Perfetto.
+
+        Parameters
+        ----------
+        path : str
+            Output file path
+
+        Returns
+        -------
+        int
+            Number of written spans
+        """
+        trace = self.get_trace()
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(trace, file)
+        return sum(1 for entry in trace["traceEvents"] if entry["ph"] in ("X", "b"))
+
+
+_event_tracer = EventTracer()
+
+
+def get_event_tracer() -> EventTracer:
+    """
+    Get the process-wide event tracer.
+
+    Returns
+    -------
+    EventTracer
+        Shared tracer, configured by EventBus.enable_tracing()
+    """
+    return _event_tracer
@@ -0,0 +1,373 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Lock-sharded, LRU-bounded store of event results with optional TTL
+
+  Log:
+  v1.1 : Expiry heap per shard, a purge only pops the expired results
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from basefunctions.utils.logging import get_logger
+from basefunctions.events.deadline_scheduler import DeadlineHandle, get_deadline_scheduler
+import basefunctions
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+DEFAULT_RESULT_SHARDS = 16
+# Seconds between purges of expired results
+RESULT_SWEEP_INTERVAL = 1.0
+
+# Entry layout: (sequence, result or None while pending, expiry on the monotonic clock, ttl)
+_SEQUENCE = 0
+_RESULT = 1
+_EXPIRES_AT = 2
+_TTL = 3
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class ResultStore:
+    """
+    Event results by event ID, split into shards with one lock each.
+
+    Event IDs are spread over the shards by hash, so threads storing and
+    consuming results of different events rarely wait for each other, and
+    never for publishers. Pending events hold a placeholder (None). The
+    store is bounded: once it holds more than max_results entries, the
+    least recently stored entries are evicted across all shards.
+
+    Parameters
+    ----------
+    max_results : int
+        Maximum number of entries (results and placeholders)
+    num_shards : int, optional
+        Number of shards, a power of two. Default is 16.
+    default_ttl : float, optional
+        Seconds a result is kept after it was stored, unless reserve() got
+        another ttl. None (default) keeps results until they are consumed
+        or evicted.
+
+    Attributes
+    ----------
+    max_results : int
+        Maximum number of entries, may be changed at runtime
+    default_ttl : float or None
+        TTL of results whose event was reserved without one
+
+    Notes
+    -----
+    - Expired results are invisible at once and purged by the shared
+      deadline scheduler every second; each shard keeps a heap of expiry
+      times, so a purge only touches the results that expired
+    - Eviction picks the shard whose oldest entry was stored first; it is
+      exact when stores do not race
+    """
+
+    __slots__ = (
+        "max_results",
+        "default_ttl",
+        "_locks",
+        "_entries",
+        "_expiry",
+        "_mask",
+        "_sequence",
+        "_evict_lock",
+        "_sweep_lock",
+        "_sweep_handle",
+        "_closed",
+    )
+
+    def __init__(
+        self,
+        max_results: int,
+        num_shards: int = DEFAULT_RESULT_SHARDS,
+        default_ttl: float | None = None,
+    ) -> None:
+        if max_results <= 0:
+            raise ValueError("max_results must be positive")
+        if num_shards <= 0 or num_shards & (num_shards - 1):
+            raise ValueError("num_shards must be a power of two")
+        if default_ttl is not None and default_ttl <= 0:
+            raise ValueError("default_ttl must be positive")
+
+        self.max_results = max_results
+        self.default_ttl = default_ttl
+        self._locks = tuple(threading.Lock() for _ in range(num_shards))
+        self._entries: tuple[OrderedDict[str, tuple], ...] = tuple(OrderedDict() for _ in range(num_shards))
+        # Per shard heap of (expiry, sequence, event ID); stale once the entry was replaced or removed
+        self._expiry: tuple[list[tuple[float, int, str]], ...] = tuple([] for _ in range(num_shards))
+        self._mask = num_shards - 1
+        # next() on itertools.count is atomic under the GIL
+        self._sequence = itertools.count()
+        self._evict_lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._sweep_handle: DeadlineHandle | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return sum(map(len, self._entries))
+
+    def __contains__(self, event_id: str) -> bool:
+        return self._lookup(event_id) is not None
+
+    def __getitem__(self, event_id: str) -> basefunctions.EventResult | None:
+        entry = self._lookup(event_id)
+        if entry is None:
+            raise KeyError(event_id)
+        return entry[_RESULT]
+
+    def __setitem__(self, event_id: str, result: basefunctions.EventResult | None) -> None:
+        self._store(event_id, result, None)
+
+    def reserve(self, event_id: str, ttl: float | None = None) -> None:
+        """
+        Add the placeholder of a pending event.
+
+        Parameters
+        ----------
+        event_id : str
+            ID of the published event
+        ttl : float, optional
+            Seconds its result is kept once stored. Defaults to default_ttl.
+        """
+        self._store(event_id, None, ttl)
+
+    def put(self, event_id: str, result: basefunctions.EventResult) -> None:
+        """
+        Store the result of an event, replacing its placeholder.
+
+        Parameters
+        ----------
+        event_id : str
+            ID of the completed event
+        result : EventResult
+            Its final result
+        """
+        self._store(event_id, result, None)
+
+    def get(self, event_id: str) -> basefunctions.EventResult | None:
+        """
+        Get a result without consuming it.
+
+        Returns
+        -------
+        EventResult or None
+            The result, None if the event is pending, unknown or expired
+        """
+        entry = self._lookup(event_id)
+        return None if entry is None else entry[_RESULT]
+
+    def pop(self, event_id: str) -> basefunctions.EventResult | None:
+        """
+        Remove an entry and return its result.
+
+        Returns
+        -------
+        EventResult or None
+            The result, None if the event was pending, unknown or expired
+        """
+        index = hash(event_id) & self._mask
+        with self._locks[index]:
+            entry = self._entries[index].pop(event_id, None)
+        if entry is None or self._expired(entry, time.monotonic()):
+            return None
+        return entry[_RESULT]
+
+    def is_pending(self, event_id: str) -> bool:
+        """
+        Check whether an event has a placeholder, i.e. was published and has no result yet.
+        """
+        entry = self._lookup(event_id)
+        return entry is not None and entry[_RESULT] is None
+
+    def snapshot(self) -> dict[str, basefunctions.EventResult | None]:
+        """
+        Get all entries, placeholders included, in the order they were stored.
+
+        Returns
+        -------
+        dict[str, EventResult | None]
+            Entries by event ID; pending events map to None
+        """
+        now = time.monotonic()
+        collected: list[tuple[int, str, Any]] = []
+        for lock, entries in zip(self._locks, self._entries):
+            with lock:
+                collected.extend(
+                    (entry[_SEQUENCE], event_id, entry[_RESULT])
+                    for event_id, entry in entries.items()
+                    if not self._expired(entry, now)
+                )
+        collected.sort(key=lambda item: item[0])
+        return {event_id: result for _, event_id, result in collected}
+
+    def purge_expired(self) -> int:
+        """
+        Remove all expired results.
+
+        Returns
+        -------
+        int
+            Number of removed results
+        """
+        now = time.monotonic()
+        removed = 0
+        for lock, entries, expiry in zip(self._locks, self._entries, self._expiry):
+            with lock:
+                while expiry and expiry[0][0] <= now:
+                    _, sequence, event_id = heapq.heappop(expiry)
+                    entry = entries.get(event_id)
+                    if entry is not None and entry[_SEQUENCE] == sequence:
+                        del entries[event_id]
+                        removed += 1
+        return removed
+
+    def close(self) -> None:
+        """
+        Stop the periodic purge. Expired results stay invisible.
+        """
+        with self._sweep_lock:
+            self._closed = True
+            if self._sweep_handle is not None:
+                self._sweep_handle.cancel()
+                self._sweep_handle = None
+
+    @staticmethod
+    def _expired(entry: tuple, now: float) -> bool:
+        expires_at = entry[_EXPIRES_AT]
+        return expires_at is not None and expires_at <= now
+
+    def _lookup(self, event_id: str) -> tuple | None:
+        """
+        Get the entry of an event, dropping it if it expired.
+        """
+        index = hash(event_id) & self._mask
+        with self._locks[index]:
+            entries = self._entries[index]
+            entry = entries.get(event_id)
+            if entry is not None and self._expired(entry, time.monotonic()):
+                del entries[event_id]
+                return None
+        return entry
+
+    def _store(self, event_id: str, result: basefunctions.EventResult | None, ttl: float | None) -> None:
+        """
+        Insert or replace an entry as the most recently stored one, then enforce max_results.
+        """
+        index = hash(event_id) & self._mask
+        with self._locks[index]:
+            entries = self._entries[index]
+            previous = entries.pop(event_id, None)
+            if ttl is None:
+                ttl = previous[_TTL] if previous is not None else self.default_ttl
+            expires_at = time.monotonic() + ttl if ttl is not None and result is not None else None
+            sequence = next(self._sequence)
+            entries[event_id] = (sequence, result, expires_at, ttl)
+            if expires_at is not None:
+                expiry = self._expiry[index]
+                heapq.heappush(expiry, (expires_at, sequence, event_id))
+                if len(expiry) > 2 * len(entries) + 64:
+                    self._compact_expiry(index)
+
+        if expires_at is not None and self._sweep_handle is None:
+            self._start_sweep()
+        if previous is None and len(self) > self.max_results:
+            self._evict()
+
+    def _compact_expiry(self, index: int) -> None:
+        """
+        Rebuild the expiry heap of a shard from its live entries (caller holds the shard lock).
+
+        Results consumed long before their expiry leave stale heap items
+        behind; rebuilding once they outnumber the entries keeps the heap
+        bounded at amortized O(1) per stored result.
+        """
+        expiry = [
+            (entry[_EXPIRES_AT], entry[_SEQUENCE], event_id)
+            for event_id, entry in self._entries[index].items()
+            if entry[_EXPIRES_AT] is not None
+        ]
+        heapq.heapify(expiry)
+        self._expiry[index][:] = expiry
+
+    def _evict(self) -> None:
+        """
+        Evict the least recently stored entries until the store fits max_results.
+        """
+        with self._evict_lock:
+            while len(self) > self.max_results:
+                index = self._oldest_shard()
+                if index is None:
+                    return
+                with self._locks[index]:
+                    entries = self._entries[index]
+                    if entries:
+                        entries.popitem(last=False)
+
+    def _oldest_shard(self) -> int | None:
+        """
+        Find the shard whose oldest entry has the lowest sequence number.
+        """
+        oldest_index = None
+        oldest_sequence = None
+        for index, entries in enumerate(self._entries):
+            # Peek without the shard lock; a concurrent change only skips the shard
+            try:
+                sequence = next(iter(entries.values()))[_SEQUENCE]
+            except (StopIteration, RuntimeError):
+                continue
+            if oldest_sequence is None or sequence < oldest_sequence:
+                oldest_index, oldest_sequence = index, sequence
+        return oldest_index
+
+    def _start_sweep(self) -> None:
+        """
+        Start the periodic purge of expired results.
+        """
+        with self._sweep_lock:
+            if self._sweep_handle is None and not self._closed:
+                self._sweep_handle = get_deadline_scheduler().schedule(RESULT_SWEEP_INTERVAL, self._sweep)
+
+    def _sweep(self) -> None:
+        """
+        Purge expired results and schedule the next purge (runs on the scheduler thread).
+        """
+        self.purge_expired()
+        with self._sweep_lock:
+            if not self._closed:
+                self._sweep_handle = get_deadline_scheduler().schedule(RESULT_SWEEP_INTERVAL, self._sweep)
@@ -0,0 +1,378 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Zero-copy shared-memory transport for large corelet payloads
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import io
+import os
+import pickle
+import secrets
+import threading
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any
+
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+SHARED_MEMORY_PREFIX = "bfshm"
+DEFAULT_SHARED_MEMORY_THRESHOLD = 1024 * 1024  # 1 MB
+SHARED_MEMORY_DIR = "/dev/shm"
+
+# Shared memory handoff relies on POSIX unlink semantics (segment survives
+# until the last mapping is closed). On Windows the pipe is used instead.
+SHARED_MEMORY_SUPPORTED = os.name == "posix"
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+# Segments attached by this process that still back unpickled objects
+_leases: list[shared_memory.SharedMemory] = []
+_lease_lock = threading.Lock()
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+logger = get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class SharedMemoryEnvelope:
+    """
+    Pipe message describing a payload whose large buffers live in shared memory.
+
+    Attributes
+    ----------
+    payload : bytes
+        Pickle protocol 5 stream with out-of-band buffers removed
+    segments : list[tuple[str, int]]
+        Shared memory segment name and size for each extracted buffer
+    buffer_segments : list[int]
+        Segment indices of the out-of-band pickle buffers, in stream order
+    threshold : int
+        Sender threshold, reused by the receiver for its reply
+    """
+
+    __slots__ = ("payload", "segments", "buffer_segments", "threshold")
+
+    def __init__(
+        self,
+        payload: bytes,
+        segments: list[tuple[str, int]],
+        buffer_segments: list[int],
+        threshold: int,
+    ) -> None:
+        self.payload = payload
+        self.segments = segments
+        self.buffer_segments = buffer_segments
+        self.threshold = threshold
+
+    def __getstate__(self) -> tuple:
+        return (self.payload, self.segments, self.buffer_segments, self.threshold)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.payload, self.segments, self.buffer_segments, self.threshold = state
+
+
+class _AttachedSegment(shared_memory.SharedMemory):
+    """
+    Receiver-side segment mapping that may outlive its Python handle.
+
+    Unpickled arrays reference the mapping directly, so the mapping can only
+    be closed once they are released. The segment name is unlinked on attach,
+    so the memory is returned to the system when the last view goes away.
+    """
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except BufferError:
+            # Still exported: the mapping is released together with its last view
+            pass
+
+
+class _SegmentPickler(pickle.Pickler):
+    """
+    Protocol 5 pickler placing buffers above threshold into shared memory.
+    """
+
+    def __init__(self, file: io.BytesIO, threshold: int) -> None:
+        super().__init__(file, protocol=5, buffer_callback=self._buffer_callback)
+        self.threshold = threshold
+        self.segments: list[tuple[str, int]] = []
+        self.buffer_segments: list[int] = []
+
+    def persistent_id(self, obj: Any) -> tuple[str, int] | None:
+        # bytes/bytearray never take the out-of-band buffer path, route them explicitly
+        obj_type = type(obj)
+        if (obj_type is bytes or obj_type is bytearray) and len(obj) >= self.threshold:
+            return (obj_type.__name__, self._store(memoryview(obj)))
+        return None
+
+    def _buffer_callback(self, buffer: pickle.PickleBuffer) -> bool:
+        try:
+            raw = buffer.raw()
+        except BufferError:
+            # Non-contiguous buffer: serialize in-band
+            return True
+        if raw.nbytes < self.threshold:
+            return True
+        self.buffer_segments.append(self._store(raw))
+        return False
+
+    def _store(self, data: memoryview) -> int:
+        size = data.nbytes
+        segment = shared_memory.SharedMemory(name=_new_segment_name(), create=True, size=max(size, 1))
+        try:
+            segment.buf[:size] = data.cast("B")
+            self.segments.append((segment.name, size))
+        finally:
+            # Ownership passes to the receiver, which unlinks the segment on attach
+            _untrack(segment)
+            segment.close()
+        return len(self.segments) - 1
+
+
+class _SegmentUnpickler(pickle.Unpickler):
+    """
+    Unpickler resolving bytes/bytearray references to shared memory views.
+    """
+
+    def __init__(self, file: io.BytesIO, views: list[memoryview], buffers: list[memoryview]) -> None:
+        super().__init__(file, buffers=buffers)
+        self.views = views
+
+    def persistent_load(self, pid: tuple[str, int]) -> Any:
+        type_name, index = pid
+        if type_name == "bytes":
+            return bytes(self.views[index])
+        if type_name == "bytearray":
+            return bytearray(self.views[index])
+        raise pickle.UnpicklingError(f"Unsupported persistent id: {type_name}")
+
+
+def encode_message(obj: Any, threshold: int | None = None) -> tuple[bytes, list[str]]:
+    """
+    Serialize an object for a corelet pipe.
+
+    Buffers of at least threshold bytes (NumPy arrays, DataFrame blocks,
+    bytes, bytearray) are written to shared memory segments and only a small
+    SharedMemoryEnvelope is pickled. Without threshold, or on platforms
+    without POSIX shared memory, a plain pickle is returned.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to serialize
+    threshold : int, optional
+        Minimum buffer size in bytes for shared memory placement. None disables
+        the shared memory transport.
+
+    Returns
+    -------
+    tuple[bytes, list[str]]
+        Message bytes and names of the created segments. Pass the names to
+        unlink_segments() if the message may not have been consumed.
+
+    Raises
+    ------
+    pickle.PicklingError
+        If the object cannot be pickled.
+    """
+    if threshold is None or not SHARED_MEMORY_SUPPORTED:
+        return pickle.dumps(obj), []
+
+    stream = io.BytesIO()
+    pickler = _SegmentPickler(stream, threshold)
+    try:
+        pickler.dump(obj)
+    except BaseException:
+        unlink_segments([name for name, _ in pickler.segments])
+        raise
+
+    if not pickler.segments:
+        return stream.getvalue(), []
+
+    envelope = SharedMemoryEnvelope(stream.getvalue(), pickler.segments, pickler.buffer_segments, threshold)
+    return pickle.dumps(envelope, protocol=5), [name for name, _ in pickler.segments]
+
+
+def decode_message(data: bytes) -> tuple[Any, int | None]:
+    """
+    Deserialize a corelet pipe message produced by encode_message().
+
+    Plain pickles are loaded as-is. For a SharedMemoryEnvelope the segments
+    are attached and unlinked immediately; NumPy arrays and DataFrame blocks
+    are returned as views onto the shared memory without copying.
+
+    Parameters
+    ----------
+    data : bytes
+        Message bytes
+
+    Returns
+    -------
+    tuple[Any, int | None]
+        Decoded object and the sender threshold (None for plain pickles)
+
+    Raises
+    ------
+    pickle.UnpicklingError
+        If the message cannot be unpickled.
+    FileNotFoundError
+        If a referenced segment no longer exists.
+    """
+    reclaim_leases()
+
+    obj = pickle.loads(data)
+    if not isinstance(obj, SharedMemoryEnvelope):
+        return obj, None
+
+    views = []
+    try:
+        for name, size in obj.segments:
+            views.append(_attach(name).buf[:size])
+    except BaseException:
+        unlink_segments([name for name, _ in obj.segments])
+        raise
+
+    buffers = [views[index] for index in obj.buffer_segments]
+    value = _SegmentUnpickler(io.BytesIO(obj.payload), views, buffers).load()
+    return value, obj.threshold
+
+
+def unlink_segments(names: list[str]) -> int:
+    """
+    Unlink shared memory segments that may not have been consumed.
+
+    Segments already unlinked by the receiver are ignored.
+
+    Parameters
+    ----------
+    names : list[str]
+        Segment names returned by encode_message()
+
+    Returns
+    -------
+    int
+        Number of segments unlinked
+    """
+    count = 0
+    for name in names:
+        try:
+            segment = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning("Failed to open shared memory segment %s: %s", name, str(e))
+            continue
+        try:
+            segment.unlink()
+            count += 1
+        except FileNotFoundError:
+            pass
+        finally:
+            segment.close()
+    return count
+
+
+def sweep_segments(pid: int) -> int:
+    """
+    Unlink all segments created by a process, e.g. after a corelet crash.
+
+    Segment names embed the creating process ID, so segments left behind by
+    a dead worker can be found without any bookkeeping. Only available where
+    shared memory is exposed as a directory (Linux); elsewhere returns 0.
+
+    Parameters
+    ----------
+    pid : int
+        Process ID of the segment creator
+
+    Returns
+    -------
+    int
+        Number of segments unlinked
+    """
+    if not os.path.isdir(SHARED_MEMORY_DIR):
+        return 0
+    prefix = f"{SHARED_MEMORY_PREFIX}_{pid:x}_"
+    try:
+        names = [name for name in os.listdir(SHARED_MEMORY_DIR) if name.startswith(prefix)]
+    except OSError:
+        return 0
+    count = unlink_segments(names)
+    if count:
+        logger.info("Swept %d orphaned shared memory segments of PID %d", count, pid)
+    return count
+
+
+def reclaim_leases() -> int:
+    """
+    Close attached segments whose unpickled objects have been released.
+
+    Called automatically on every decode_message().
+
+    Returns
+    -------
+    int
+        Number of segments still in use
+    """
+    with _lease_lock:
+        remaining = []
+        for segment in _leases:
+            try:
+                segment.close()
+            except BufferError:
+                remaining.append(segment)
+        _leases[:] = remaining
+        return len(remaining)
+
+
+def _attach(name: str) -> _AttachedSegment:
+    """
+    Attach to a segment, unlink its name and keep it leased until released.
+    """
+    segment = _AttachedSegment(name=name)
+    segment.unlink()
+    with _lease_lock:
+        _leases.append(segment)
+    return segment
+
+
+def _new_segment_name() -> str:
+    return f"{SHARED_MEMORY_PREFIX}_{os.getpid():x}_{secrets.token_hex(6)}"
+
+
+def _untrack(segment: shared_memory.SharedMemory) -> None:
+    # The resource tracker would unlink the segment when the creator exits,
+    # but the receiver owns it from now on (it unlinks after attaching).
+    try:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    except Exception:
+        pass
@@ -0,0 +1,298 @@
+"""
+=============================================================================
+  Licensed Materials, Property of neuraldevelopment, Munich
+
+  Project : basefunctions
+
+  Copyright (c) by neuraldevelopment
+
+  All rights reserved.
+
+  Description:
+
+  Scaling policy and worker activity tracking for the EventBus thread pool
+
+  Log:
+  v1.0 : Initial implementation
+=============================================================================
+"""
+
+from __future__ import annotations
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from basefunctions.utils.logging import get_logger
+
+# -------------------------------------------------------------
+# DEFINITIONS
+# -------------------------------------------------------------
+# Seconds between two scaling decisions
+AUTOSCALE_INTERVAL = 0.5
+
+# Seconds a worker must be idle (and since the last growth) before it is retired
+DEFAULT_SCALE_COOLDOWN = 30.0
+
+# Average queue wait in seconds that triggers growth
+DEFAULT_TARGET_QUEUE_WAIT = 0.05
+
+# Fraction of busy worker time that triggers growth while events are queued
+DEFAULT_TARGET_UTILISATION = 0.8
+
+# Number of scaling decisions kept for get_metrics()
+DECISION_HISTORY_SIZE = 32
+
+SCALE_ACTION_GROW = "grow"
+SCALE_ACTION_SHRINK = "shrink"
+
+# -------------------------------------------------------------
+# VARIABLE DEFINITIONS
+# -------------------------------------------------------------
+
+# -------------------------------------------------------------
+# LOGGING INITIALIZE
+# -------------------------------------------------------------
+# Enable logging for this module
+get_logger(__name__)
+
+# -------------------------------------------------------------
+# CLASS / FUNCTION DEFINITIONS
+# -------------------------------------------------------------
+
+
+class WorkerActivity:
+    """
+    Busy/idle bookkeeping of one worker thread.
+
+    Written only by its worker thread (begin/end) and read by the autoscaler.
+
+    Attributes
+    ----------
+    busy_since : float or None
+        time.monotonic() when the current event started, None while idle
+    busy_total : float
+        Accumulated seconds spent processing events
+    last_active : float
+        time.monotonic() when the worker last finished an event (or started)
+    retire : bool
+        Set by the autoscaler to ask an idle worker to exit
+    """
+
+    __slots__ = ("busy_since", "busy_total", "last_active", "retire")
+
+    def __init__(self) -> None:
+        self.busy_since: float | None = None
+        self.busy_total = 0.0
+        self.last_active = time.monotonic()
+        self.retire = False
+
+    def begin(self) -> None:
+        """Mark the worker busy; a worker that got work is no longer retired."""
+        self.busy_since = time.monotonic()
+        self.retire = False
+
+    def end(self) -> None:
+        """Mark the worker idle and account the busy time."""
+        busy_since = self.busy_since
+        if busy_since is not None:
+            now = time.monotonic()
+            self.busy_total += now - busy_since
+            self.last_active = now
+            self.busy_since = None
+
+    def busy_time(self, now: float) -> float:
+        """Busy seconds including the event in progress."""
+        busy_since = self.busy_since
+        return self.busy_total + (now - busy_since if busy_since is not None else 0.0)
+
+    def idle_for(self, now: float) -> float:
+        """Seconds since the worker finished its last event, 0.0 while busy."""
+        return 0.0 if self.busy_since is not None else now - self.last_active
+
+
+class ThreadAutoscaler:
+    """
+    Decide how many worker threads to add or retire.
+
+    The pool grows while events are queued and either the average queue
+    wait exceeds target_queue_wait or worker utilisation exceeds
+    target_utilisation. It grows by at most the current size (doubling) and
+    never by more events than are queued. Workers idle for cooldown seconds
+    are retired while the queue is empty, no sooner than cooldown after
+    the last growth, down to min_threads.
+
+    Parameters
+    ----------
+    min_threads : int
+        Lower bound of the pool
+    max_threads : int
+        Upper bound of the pool
+    cooldown : float, optional
+        Idle seconds before a worker is retired. Default is 30.
+    target_queue_wait : float, optional
+        Average queue wait in seconds that triggers growth. Default is 0.05.
+    target_utilisation : float, optional
+        Busy fraction that triggers growth. Default is 0.8.
+
+    Raises
+    ------
+    ValueError
+        If the bounds or thresholds are invalid.
+    """
+
+    __slots__ = (
+        "min_threads",
+        "max_threads",
+        "cooldown",
+        "target_queue_wait",
+        "target_utilisation",
+        "scale_ups",
+        "scale_downs",
+        "_last_tick",
+        "_last_busy_time",
+        "_last_growth",
+        "_last_sample",
+        "_decisions",
+        "_lock",
+    )
+
+    def __init__(
+        self,
+        min_threads: int,
+        max_threads: int,
+        cooldown: float = DEFAULT_SCALE_COOLDOWN,
+        target_queue_wait: float = DEFAULT_TARGET_QUEUE_WAIT,
+        target_utilisation: float = DEFAULT_TARGET_UTILISATION,
+    ) -> None:
+        if min_threads <= 0:
+            raise ValueError("min_threads must be positive")
+        if max_threads < min_threads:
+            raise ValueError("max_threads must be >= min_threads")
+        if cooldown < 0:
+            raise ValueError("scale_cooldown must not be negative")
+        if target_queue_wait < 0 or not 0 < target_utilisation <= 1:
+            raise ValueError("invalid autoscaling target")
+        self.min_threads = min_threads
+        self.max_threads = max_threads
+        self.cooldown = cooldown
+        self.target_queue_wait = target_queue_wait
+        self.target_utilisation = target_utilisation
+        self.scale_ups = 0
+        self.scale_downs = 0
+        self._last_tick: float | None = None
+        self._last_busy_time = 0.0
+        self._last_growth = float("-inf")
+        self._last_sample: dict[str, Any] = {}
+        self._decisions: deque[dict[str, Any]] = deque(maxlen=DECISION_HISTORY_SIZE)
+        self._lock = threading.Lock()
+
+    def decide(
+        self,
+        now: float,
+        threads: int,
+        busy_time: float,
+        queue_depth: int,
+        queue_wait: float,
+        idle_workers: int,
+    ) -> int:
+        """
+        Take one scaling decision.
+
+        Parameters
+        ----------
+        now : float
+            Current time.monotonic()
+        threads : int
+            Current number of worker threads
+        busy_time : float
+            Total busy seconds of all current workers
+        queue_depth : int
+            Events waiting in the input queue
+        queue_wait : float
+            Average queue wait in seconds of events dequeued since the last call
+        idle_workers : int
+            Workers idle for at least cooldown seconds
+
+        Returns
+        -------
+        int
+            Threads to add (> 0), to retire (< 0) or 0 to hold
+        """
+        with self._lock:
+            elapsed = now - self._last_tick if self._last_tick is not None else 0.0
+            busy_delta = max(0.0, busy_time - self._last_busy_time)
+            utilisation = min(1.0, busy_delta / (elapsed * threads)) if elapsed > 0 and threads > 0 else 0.0
+            self._last_tick = now
+            self._last_busy_time = busy_time
+
+            delta = 0
+            reason = ""
+            if queue_depth > 0 and threads < self.max_threads:
+                if queue_wait >= self.target_queue_wait:
+                    reason = f"queue wait {queue_wait * 1000:.1f}ms"
+                elif utilisation >= self.target_utilisation:
+                    reason = f"utilisation {utilisation:.0%}"
+                if reason:
+                    delta = min(self.max_threads - threads, threads, queue_depth)
+            elif (
+                queue_depth == 0
+                and threads > self.min_threads
+                and idle_workers > 0
+                and now - self._last_growth >= self.cooldown
+            ):
+                delta = -min(threads - self.min_threads, idle_workers)
+                reason = f"{idle_workers} workers idle for {self.cooldown:g}s"
+
+            self._last_sample = {
+                "threads": threads,
+                "queue_depth": queue_depth,
+                "queue_wait": queue_wait,
+                "utilisation": utilisation,
+            }
+            if delta:
+                if delta > 0:
+                    self.scale_ups += 1
+                    self._last_growth = now
+                else:
+                    self.scale_downs += 1
+                self._decisions.append(
+                    {
+                        "time": time.time(),
+                        "action": SCALE_ACTION_GROW if delta > 0 else SCALE_ACTION_SHRINK,
+                        "threads_before": threads,
+                        "threads_after": threads + delta,
+                        "reason": reason,
+                        **self._last_sample,
+                    }
+                )
+            return delta
+
+    def get_metrics(self) -> dict[str, Any]:
+        """
+        Get scaling metrics.
+
+        Returns
+        -------
+        dict[str, Any]
+            Metrics dictionary with:
+            - min_threads, max_threads, cooldown: Configuration
+            - scale_ups, scale_downs: Number of grow/shrink decisions
+            - threads, queue_depth, queue_wait, utilisation: Last sample
+            - decisions: Recent decisions (time, action, threads_before,
+              threads_after, reason and the sample they were based on)
+        """
+        with self._lock:
+            return {
+                "min_threads": self.min_threads,
+                "max_threads": self.max_threads,
+                "cooldown": self.cooldown,
+                "scale_ups": self.scale_ups,
+                "scale_downs": self.scale_downs,
+                **self._last_sample,
+                "decisions": list(self._decisions),
+            }
@@ -5,8 +5,11 @@
  Copyright (c) by neuraldevelopment
  All rights reserved.
  Description:
- Second-ticked rate limiter with burst support for event handling
+ Rate limiter with burst support for event handling, paced by one scheduler thread
  Log:
+ v1.1.2 : shutdown() returns the dropped events
+ v1.1.1 : Forward to an EventQueue with put_internal(), never blocking on its bound
+ v1.1.0 : One scheduler thread for all event types, continuous monotonic refill
  v1.0.3 : Logging audit - added warning before raises
  v1.0.0 : Initial implementation
  v1.0.1 : Fix burst semantics - tokens start with burst value (not additive)
@@ -17,12 +20,14 @@
 # =============================================================================
 # IMPORTS
 # =============================================================================
+import heapq
 import queue
 import threading
 import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from basefunctions.events.event_queue import EventQueue
 from basefunctions.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -62,7 +67,8 @@ class RateLimitConfig:
     burst : int
         Number of requests that bypass rate limiting
     max_tokens : int
-        Maximum token bucket capacity (requests_per_second * 60)
+        Maximum token bucket capacity (max(burst, 1)); tokens accumulated
+        while idle never exceed the configured burst
     """
 
     event_type: str
@@ -106,18 +112,76 @@ class RateLimitMetrics:
 # =============================================================================
 # CLASS DEFINITIONS
 # =============================================================================
+class _RateLimitLane:
+    """
+    Token bucket and pending events of one rate-limited event_type.
+
+    Tokens refill continuously at requests_per_second on the time.monotonic()
+    clock, capped at config.max_tokens.
+    """
+
+    __slots__ = (
+        "config",
+        "metrics",
+        "pending",
+        "tokens",
+        "refill_time",
+        "scheduled",
+        "window_start",
+        "window_count",
+    )
+
+    def __init__(self, config: RateLimitConfig, metrics: RateLimitMetrics, now: float) -> None:
+        self.config = config
+        self.metrics = metrics
+        self.pending: list[tuple[int, int, "Event"]] = []
+        self.tokens = float(config.burst)
+        self.refill_time = now
+        self.scheduled = False
+        self.window_start = now
+        self.window_count = 0
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last refill."""
+        if now > self.refill_time:
+            rate = self.config.requests_per_second
+            self.tokens = min(float(self.config.max_tokens), self.tokens + (now - self.refill_time) * rate)
+            self.refill_time = now
+
+    def next_release(self, now: float) -> float:
+        """Earliest monotonic time at which one token is available (after refill(now))."""
+        if self.tokens >= 1.0:
+            return now
+        return self.refill_time + (1.0 - self.tokens) / self.config.requests_per_second
+
+    def roll_window(self, now: float) -> None:
+        """Close elapsed one-second windows and update the IST metric."""
+        elapsed = now - self.window_start
+        if elapsed >= 1.0:
+            # A gap of more than one window means nothing was released last second
+            self.metrics.actual_last_second = self.window_count if elapsed < 2.0 else 0
+            self.window_start += int(elapsed)
+            self.window_count = 0
+
+
 class TickedRateLimiter:
     """
-    Second-ticked rate limiter with burst support.
+    Rate limiter with burst support, paced by a single scheduler thread.
 
-    Enforces rate limits using 1-second intervals with token bucket semantics.
-    Each event type gets dedicated worker thread and queue.
+    Every event type gets a token bucket refilled continuously from the
+    monotonic clock. One scheduler thread keeps a heap of the earliest
+    release time of each event type with pending events and forwards each
+    event exactly when its token becomes available, so pacing is smooth
+    (1 / requests_per_second apart) instead of released in 1-second waves.
 
     Features
     --------
     - Burst: Initial events bypass rate limiting
-    - Token accumulation: Up to max_tokens during idle periods
+    - Token accumulation: Up to max(burst, 1) tokens during idle periods
+    - One thread for any number of event types
     - Graceful shutdown: Flush or drop pending events
+    - Never blocks on a bounded EventQueue: events are forwarded with
+      put_internal(), the queue policy is applied when they are published
 
     Parameters
     ----------
@@ -128,14 +192,15 @@ class TickedRateLimiter:
     __slots__ = (
         "_logger",
         "_limits",
-        "_workers",
-        "_queues",
-        "_metrics",
+        "_lanes",
+        "_schedule",
+        "_schedule_counter",
+        "_scheduler",
         "_target_input_queue",
         "_shutdown_flag",
         "_lock",
+        "_condition",
         "_pending_events",
-        "_pending_lock",
     )
 
     def __init__(self, target_input_queue: queue.PriorityQueue) -> None:
@@ -149,14 +214,16 @@ class TickedRateLimiter:
         """
         self._logger = logger
         self._limits: dict[str, RateLimitConfig] = {}
-        self._workers: dict[str, threading.Thread] = {}
-        self._queues: dict[str, queue.PriorityQueue] = {}
-        self._metrics: dict[str, RateLimitMetrics] = {}
+        self._lanes: dict[str, _RateLimitLane] = {}
+        # Heap of (release_time, counter, lane); at most one entry per lane
+        self._schedule: list[tuple[float, int, _RateLimitLane]] = []
+        self._schedule_counter = 0
+        self._scheduler: threading.Thread | None = None
         self._target_input_queue = target_input_queue
         self._shutdown_flag = threading.Event()
         self._lock = threading.RLock()
+        self._condition = threading.Condition(self._lock)
         self._pending_events: int = 0
-        self._pending_lock: threading.Lock = threading.Lock()
 
     def register(self, event_type: str, requests_per_second: int, burst: int = 0) -> None:
         """
@@ -186,18 +253,14 @@ class TickedRateLimiter:
 
         with self._lock:
             # Create config
-            max_tokens = requests_per_second * 60
             config = RateLimitConfig(
                 event_type=event_type,
                 requests_per_second=requests_per_second,
                 burst=burst,
-                max_tokens=max_tokens,
+                max_tokens=max(burst, 1),
             )
             self._limits[event_type] = config
 
-            # Create queue
-            self._queues[event_type] = queue.PriorityQueue()
-
             # Create metrics (tokens start with burst value)
             metrics = RateLimitMetrics(
                 limit=requests_per_second,
@@ -208,17 +271,12 @@ class TickedRateLimiter:
                 total_processed=0,
                 start_time=time.time(),
             )
-            self._metrics[event_type] = metrics
-
-            # Start worker thread
-            worker = threading.Thread(
-                target=self._worker_loop,
-                args=(event_type, requests_per_second, burst),
-                daemon=True,
-                name=f"RateLimiter-{event_type}",
-            )
-            worker.start()
-            self._workers[event_type] = worker
+            self._lanes[event_type] = _RateLimitLane(config, metrics, time.monotonic())
+
+            # Start the shared scheduler thread with the first limit
+            if self._scheduler is None and not self._shutdown_flag.is_set():
+                self._scheduler = threading.Thread(target=self._scheduler_loop, daemon=True, name="RateLimiter")
+                self._scheduler.start()
 
     def submit(self, event_type: str, priority: int, counter: int, event: "Event") -> None:
         """
@@ -240,16 +298,20 @@ class TickedRateLimiter:
         ValueError
             If event_type is not registered
         """
-        with self._lock:
+        with self._condition:
             if event_type not in self._limits:
                 logger.warning("enqueue failed: event_type '%s' is not registered", event_type)
                 raise ValueError(f"event_type '{event_type}' is not registered")
 
             # Increment pending counter BEFORE queuing
-            with self._pending_lock:
-                self._pending_events += 1
+            self._pending_events += 1
 
-            self._queues[event_type].put((priority, counter, event))
+            lane = self._lanes[event_type]
+            heapq.heappush(lane.pending, (priority, counter, event))
+            if not lane.scheduled:
+                now = time.monotonic()
+                lane.refill(now)
+                self._schedule_lane(lane, lane.next_release(now))
 
     def has_limit(self, event_type: str) -> bool:
         """
@@ -291,8 +353,9 @@ class TickedRateLimiter:
             if event_type not in self._limits:
                 logger.warning("get_limit failed: event_type '%s' is not registered", event_type)
                 raise ValueError(f"event_type '{event_type}' is not registered")
-            metrics = self._metrics[event_type]
-            return (metrics.limit, metrics.actual_last_second)
+            lane = self._lanes[event_type]
+            lane.roll_window(time.monotonic())
+            return (lane.metrics.limit, lane.metrics.actual_last_second)
 
     def get_metrics(self, event_type: str) -> dict[str, int | float]:
         """
@@ -317,15 +380,19 @@ class TickedRateLimiter:
             if event_type not in self._limits:
                 logger.warning("get_metrics failed: event_type '%s' is not registered", event_type)
                 raise ValueError(f"event_type '{event_type}' is not registered")
-            metrics = self._metrics[event_type]
-            # Update queued from current queue size
-            queued = self._queues[event_type].qsize()
+            lane = self._lanes[event_type]
+            now = time.monotonic()
+            lane.refill(now)
+            lane.roll_window(now)
+            metrics = lane.metrics
+            metrics.current_tokens = lane.tokens
+            metrics.queued = len(lane.pending)
             return {
                 "limit": metrics.limit,
                 "actual_last_second": metrics.actual_last_second,
                 "burst_config": metrics.burst_config,
                 "current_tokens": metrics.current_tokens,
-                "queued": queued,
+                "queued": metrics.queued,
                 "total_processed": metrics.total_processed,
                 "start_time": metrics.start_time,
             }
@@ -337,13 +404,10 @@ class TickedRateLimiter:
         This blocks until all events submitted via submit() have been
         forwarded to the target input queue.
         """
-        while True:
-            with self._pending_lock:
-                if self._pending_events == 0:
-                    break
-            time.sleep(0.05)
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending_events == 0)
 
-    def shutdown(self, flush: bool = True) -> None:
+    def shutdown(self, flush: bool = True) -> list["Event"]:
         """
         Shutdown rate limiter.
 
@@ -351,14 +415,39 @@ class TickedRateLimiter:
         ----------
         flush : bool, default True
             If True, process remaining events; if False, drop them
+
+        Returns
+        -------
+        list[Event]
+            Dropped events (empty with flush=True); the caller completes them
         """
-        with self._lock:
+        with self._condition:
             self._shutdown_flag.set()
-            worker_threads = list(self._workers.values())
+            self._condition.notify_all()
+            scheduler = self._scheduler
+
+        if scheduler is not None:
+            scheduler.join(timeout=5.0)
 
-        # Join all worker threads
-        for worker in worker_threads:
-            worker.join(timeout=5.0)
+        # Hand over (or drop) what is still waiting for a token
+        with self._condition:
+            remaining: list[tuple[int, int, "Event"]] = []
+            for lane in self._lanes.values():
+                while lane.pending:
+                    remaining.append(heapq.heappop(lane.pending))
+                lane.scheduled = False
+            self._schedule.clear()
+
+        if flush:
+            for priority, counter, event in remaining:
+                self._forward_to_input_queue(priority, counter, event)
+        elif remaining:
+            self._logger.warning("Dropped %d rate-limited events on shutdown", len(remaining))
+            if isinstance(self._target_input_queue, EventQueue):
+                for task in remaining:
+                    self._target_input_queue.discard_admitted(task)
+        self._mark_forwarded(len(remaining))
+        return [] if flush else [event for _, _, event in remaining]
 
     def _forward_to_input_queue(self, priority: int, counter: int, event: "Event") -> None:
         """
@@ -373,92 +462,97 @@ class TickedRateLimiter:
         event : Event
             Event instance
         """
-        self._target_input_queue.put((priority, counter, event))
-
-    def _worker_loop(self, event_type: str, requests_per_second: int, burst: int) -> None:
+        target = self._target_input_queue
+        # EventQueue: the bound was applied at publish time and the event holds a slot,
+        # the scheduler thread must never block
+        if isinstance(target, EventQueue):
+            target.put_internal((priority, counter, event))
+        else:
+            target.put((priority, counter, event))
+
+    def _mark_forwarded(self, count: int) -> None:
         """
-        Worker loop implementing token bucket rate limiting.
+        Decrement the pending counter AFTER events were forwarded.
 
         Parameters
         ----------
-        event_type : str
-            Event type
-        requests_per_second : int
-            Rate limit
-        burst : int
-            Initial token budget
+        count : int
+            Number of events that left the rate limiter
+        """
+        if count == 0:
+            return
+        with self._condition:
+            self._pending_events -= count
+            if self._pending_events == 0:
+                self._condition.notify_all()
+
+    def _schedule_lane(self, lane: _RateLimitLane, release_time: float) -> None:
         """
-        # Initialize token bucket with burst as starting tokens
-        tokens = float(burst)
-        max_tokens = requests_per_second * 60
-        last_second_count = 0
-        last_tick = time.time()
+        Add the next release of a lane to the scheduler heap (caller holds the lock).
 
-        with self._lock:
-            event_queue = self._queues[event_type]
-            metrics = self._metrics[event_type]
+        Parameters
+        ----------
+        lane : _RateLimitLane
+            Lane with pending events
+        release_time : float
+            Monotonic time of its next release
+        """
+        self._schedule_counter += 1
+        heapq.heappush(self._schedule, (release_time, self._schedule_counter, lane))
+        lane.scheduled = True
+        # Only wake the scheduler if this release is now the nearest one
+        if self._schedule[0][2] is lane:
+            self._condition.notify_all()
+
+    def _release_due(self, now: float) -> list[tuple[int, int, "Event"]]:
+        """
+        Take one token and one event from every lane that is due (caller holds the lock).
 
-        while not self._shutdown_flag.is_set():
-            try:
-                # Try to get event with timeout
-                priority, counter, event = event_queue.get(timeout=1.0)
+        Parameters
+        ----------
+        now : float
+            Current time.monotonic()
 
-                # Token bucket: check if we have tokens
-                while tokens < 1.0:
-                    # Check shutdown during wait
+        Returns
+        -------
+        list[tuple[int, int, Event]]
+            Tasks to forward to the input queue
+        """
+        released: list[tuple[int, int, "Event"]] = []
+        while self._schedule and self._schedule[0][0] <= now:
+            _, _, lane = heapq.heappop(self._schedule)
+            lane.refill(now)
+            # The release time was computed for exactly one token; absorb float error
+            lane.tokens = max(lane.tokens, 1.0) - 1.0
+            released.append(heapq.heappop(lane.pending))
+
+            lane.roll_window(now)
+            lane.window_count += 1
+            lane.metrics.total_processed += 1
+            lane.metrics.current_tokens = lane.tokens
+
+            if lane.pending:
+                self._schedule_lane(lane, lane.next_release(now))
+            else:
+                lane.scheduled = False
+        return released
+
+    def _scheduler_loop(self) -> None:
+        """
+        Scheduler thread: sleep until the nearest release time and forward due events.
+        """
+        while True:
+            with self._condition:
+                if self._shutdown_flag.is_set():
+                    return
+                released = self._release_due(time.monotonic())
+                while not released:
                     if self._shutdown_flag.is_set():
                         return
+                    timeout = self._schedule[0][0] - time.monotonic() if self._schedule else None
+                    self._condition.wait(timeout)
+                    released = self._release_due(time.monotonic())
 
-                    # Sleep and refill tokens
-                    time.sleep(1.0)
-                    current_time = time.time()
-                    elapsed = current_time - last_tick
-
-                    if elapsed >= 1.0:
-                        # Refill tokens
-                        tokens = min(tokens + requests_per_second, max_tokens)
-                        # Update IST metric
-                        with self._lock:
-                            metrics.actual_last_second = last_second_count
-                        last_second_count = 0
-                        last_tick = current_time
-
-                # Consume token and forward
-                tokens -= 1.0
+            for priority, counter, event in released:
                 self._forward_to_input_queue(priority, counter, event)
-                last_second_count += 1
-
-                # Decrement pending counter AFTER forwarding
-                with self._pending_lock:
-                    self._pending_events -= 1
-
-                # Update metrics
-                with self._lock:
-                    metrics.current_tokens = tokens
-                    metrics.total_processed += 1
-
-            except queue.Empty:
-                # Timeout - refill tokens and update IST
-                current_time = time.time()
-                elapsed = current_time - last_tick
-
-                if elapsed >= 1.0:
-                    tokens = min(tokens + requests_per_second, max_tokens)
-                    with self._lock:
-                        metrics.current_tokens = tokens
-                        metrics.actual_last_second = last_second_count
-                    last_second_count = 0
-                    last_tick = current_time
-
-        # Shutdown handling
-        with self._lock:
-            flush = True  # Default to flush
-
-        if flush:
-            # Process remaining events
-            while True:
-                try:
-                    priority, counter, event = event_queue.get_nowait()
-                    self._forward_to_input_queue(priority, counter, event)
-                except queue.Empty:
-                    break
+            self._mark_forwarded(len(released))
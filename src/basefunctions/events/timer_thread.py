@@ -13,6 +13,8 @@
   Timer thread context manager for enforcing timeouts
 
   Log:
+  v1.1 : Deadlines served by the shared DeadlineScheduler instead of one
+         threading.Timer per context
   v1.0 : Initial implementation
 =============================================================================
 """
@@ -22,8 +24,8 @@ from __future__ import annotations
 # -------------------------------------------------------------
 # IMPORTS
 # -------------------------------------------------------------
-import threading
 import ctypes
+from basefunctions.events.deadline_scheduler import DeadlineHandle, get_deadline_scheduler
 from basefunctions.utils.logging import get_logger, get_logger
 
 # -------------------------------------------------------------
@@ -64,8 +66,9 @@ class TimerThread:
         Timeout duration in seconds
     thread_id : int
         Target thread identifier (from threading.get_ident())
-    timer : threading.Timer
-        Internal timer that triggers timeout_thread() after timeout seconds
+    handle : DeadlineHandle or None
+        Deadline registered with the shared DeadlineScheduler while the
+        context is active; it triggers timeout_thread() after timeout seconds
 
     Notes
     -----
@@ -79,7 +82,8 @@ class TimerThread:
     **Usage Pattern:**
     - Used internally by EventBus for timeout enforcement
     - Automatically cancelled if execution completes before timeout
-    - Timeout occurs in background timer thread, not target thread
+    - Timeout occurs on the shared scheduler thread, not target thread;
+      entering a context registers a heap entry instead of starting a thread
 
     **Alternative Approaches:**
     Consider safer alternatives for production use:
@@ -111,7 +115,7 @@ class TimerThread:
     See Also
     --------
     EventBus._retry_with_timeout : Uses TimerThread for event timeout
-    threading.Timer : Internal timer implementation
+    DeadlineScheduler : Shared single-thread deadline implementation
     """
 
     def __init__(self, timeout: int, thread_id: int) -> None:
@@ -127,27 +131,23 @@ class TimerThread:
         """
         self.timeout = timeout
         self.thread_id = thread_id
-        self.timer = threading.Timer(
-            interval=self.timeout,
-            function=self.timeout_thread,
-            args=[],
-        )
+        self.handle: DeadlineHandle | None = None
 
     def __enter__(self) -> TimerThread:
         """
-        Start the timer when entering the context.
+        Register the deadline when entering the context.
 
         Returns
         -------
         TimerThread
             Self reference for context manager protocol
         """
-        self.timer.start()
+        self.handle = get_deadline_scheduler().schedule(self.timeout, self.timeout_thread)
         return self
 
     def __exit__(self, _type: type | None, _value: Exception | None, _traceback: object | None) -> bool:
         """
-        Cancel the timer when exiting the context.
+        Cancel the deadline when exiting the context.
 
         Parameters
         ----------
@@ -163,7 +163,8 @@ class TimerThread:
         bool
             False (does not suppress exceptions)
         """
-        self.timer.cancel()
+        if self.handle is not None:
+            self.handle.cancel()
         return False
 
     def timeout_thread(self) -> None:
@@ -18,6 +18,7 @@
  v1.2 : Automatic event ID tracking, removed get() alias
  v1.3 : Robust error handling with metadata structure
  v1.4 : Add warning logging before RuntimeError raises
+ v1.5 : get_sync waits for its own request only (EventBus group) instead of a global join
 =============================================================================
 """
 
@@ -80,9 +81,10 @@ class HttpClient:
             event_type="http_request",
             event_data={"method": "GET", "url": url, **kwargs},
         )
-        self.event_bus.publish(event)
-        self.event_bus.join()
-        results = self.event_bus.get_results([event.event_id])
+        # Wait for this request only, not for other work on the shared bus
+        with self.event_bus.group() as group:
+            group.publish(event)
+        results = group.get_results([event.event_id], join_before=False)
 
         if not results:
             logger.warning("No response received for event_id: %s", event.event_id)
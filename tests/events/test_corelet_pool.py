@@ -0,0 +1,387 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for CoreletPool.
+ Tests dispatching, timeouts, crash recovery and shutdown with real
+ corelet processes.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import multiprocessing
+import os
+import queue
+import time
+import pytest
+from typing import List
+
+# Project imports
+import basefunctions
+from basefunctions.events.corelet_pool import CoreletPool
+
+# Handlers are inherited by forked corelets via the EventFactory registry
+pytestmark = pytest.mark.skipif(multiprocessing.get_start_method() != "fork", reason="fork start method required")
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+class _SquareHandler(basefunctions.EventHandler):
+    """Return the square of event_data."""
+
+    def handle(self, event, context):
+        return basefunctions.EventResult.business_result(event.event_id, True, event.event_data**2)
+
+
+class _SleepHandler(basefunctions.EventHandler):
+    """Sleep for event_data seconds."""
+
+    def handle(self, event, context):
+        time.sleep(event.event_data)
+        return basefunctions.EventResult.business_result(event.event_id, True, os.getpid())
+
+
+class _CrashHandler(basefunctions.EventHandler):
+    """Terminate the corelet process."""
+
+    def handle(self, event, context):
+        os._exit(1)
+
+
+@pytest.fixture
+def pool() -> CoreletPool:
+    """Provide a corelet pool with test handlers registered."""
+    factory = basefunctions.EventFactory()
+    factory.register_event_type("pool_square", _SquareHandler)
+    factory.register_event_type("pool_sleep", _SleepHandler)
+    factory.register_event_type("pool_crash", _CrashHandler)
+
+    corelet_pool = CoreletPool(size=2)
+    yield corelet_pool
+    corelet_pool.shutdown(timeout=30)
+
+
+def _corelet_event(event_type: str, data, timeout: int = 10, max_retries: int = 1) -> basefunctions.Event:
+    """Create a corelet event for the pool."""
+    return basefunctions.Event(
+        event_type,
+        event_exec_mode=basefunctions.EXECUTION_MODE_CORELET,
+        event_data=data,
+        timeout=timeout,
+        max_retries=max_retries,
+    )
+
+
+def _submit(pool: CoreletPool, event: basefunctions.Event) -> "queue.Queue[basefunctions.EventResult]":
+    """Submit an event and return a queue receiving its result."""
+    results: queue.Queue = queue.Queue()
+    pool.submit(event, results.put)
+    return results
+
+
+# -------------------------------------------------------------
+# TESTS: Dispatching
+# -------------------------------------------------------------
+
+
+def test_pool_rejects_invalid_size() -> None:
+    """Test CoreletPool rejects non-positive sizes."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="corelet pool size must be positive"):
+        CoreletPool(size=0)
+
+
+def test_pool_processes_events_with_bounded_corelets(pool: CoreletPool) -> None:
+    """Test many events are served by at most size corelet processes."""
+    # ARRANGE
+    results: queue.Queue = queue.Queue()
+
+    # ACT
+    for i in range(20):
+        pool.submit(_corelet_event("pool_square", i), results.put)
+    collected: List[basefunctions.EventResult] = [results.get(timeout=30) for _ in range(20)]
+
+    # ASSERT
+    assert all(result.success for result in collected)
+    assert sorted(result.data for result in collected) == [i**2 for i in range(20)]
+    assert pool.get_metrics()["corelets"] <= 2
+
+
+def test_pool_runs_events_in_parallel(pool: CoreletPool) -> None:
+    """Test a blocked corelet does not block the other pooled corelet."""
+    # ARRANGE
+    slow = _submit(pool, _corelet_event("pool_sleep", 2))
+
+    # ACT
+    fast = _submit(pool, _corelet_event("pool_square", 3))
+
+    # ASSERT
+    assert fast.get(timeout=1.5).data == 9
+    assert slow.get(timeout=10).success
+
+
+# -------------------------------------------------------------
+# TESTS: Timeouts and crash recovery
+# -------------------------------------------------------------
+
+
+def test_pool_times_out_hung_corelet_and_replaces_it(pool: CoreletPool) -> None:
+    """Test a hung corelet is terminated and the event fails with TimeoutError."""
+    # ACT
+    result: basefunctions.EventResult = _submit(pool, _corelet_event("pool_sleep", 30, timeout=1)).get(timeout=15)
+    followup: basefunctions.EventResult = _submit(pool, _corelet_event("pool_square", 4)).get(timeout=15)
+
+    # ASSERT
+    assert result.success is False
+    assert isinstance(result.exception, TimeoutError)
+    assert followup.data == 16
+
+
+def test_pool_recovers_from_crashed_corelet(pool: CoreletPool) -> None:
+    """Test a crashed corelet yields an error result and is replaced."""
+    # ACT
+    result: basefunctions.EventResult = _submit(pool, _corelet_event("pool_crash", None)).get(timeout=15)
+    followup: basefunctions.EventResult = _submit(pool, _corelet_event("pool_square", 5)).get(timeout=15)
+
+    # ASSERT
+    assert result.success is False
+    assert isinstance(result.exception, basefunctions.EventExecutionError)
+    assert followup.data == 25
+
+
+def test_pool_retries_crashed_event_up_to_max_retries(pool: CoreletPool) -> None:
+    """Test crashes are retried on fresh corelets before failing."""
+    # ACT
+    result: basefunctions.EventResult = _submit(pool, _corelet_event("pool_crash", None, max_retries=3)).get(
+        timeout=30
+    )
+
+    # ASSERT
+    assert result.success is False
+    assert pool.get_metrics()["pending"] == 0
+
+
+# -------------------------------------------------------------
+# TESTS: Pipelining and batching
+# -------------------------------------------------------------
+
+
+def test_pool_rejects_invalid_window_and_batch_size() -> None:
+    """Test CoreletPool rejects non-positive window and batch_size."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="corelet window must be positive"):
+        CoreletPool(size=1, window=0)
+    with pytest.raises(ValueError, match="corelet batch size must be positive"):
+        CoreletPool(size=1, batch_size=0)
+
+
+def test_pool_pipelines_messages_up_to_window() -> None:
+    """Test several messages are in flight on one corelet with window > 1."""
+    # ARRANGE
+    basefunctions.EventFactory().register_event_type("pool_sleep", _SleepHandler)
+    basefunctions.EventFactory().register_event_type("pool_square", _SquareHandler)
+    pool: CoreletPool = CoreletPool(size=1, window=3)
+    slow = _submit(pool, _corelet_event("pool_sleep", 1))
+    fast = [_submit(pool, _corelet_event("pool_square", i)) for i in range(3)]
+
+    # ACT
+    time.sleep(0.5)
+    metrics = pool.get_metrics()
+    results = [slow.get(timeout=15)] + [q.get(timeout=15) for q in fast]
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert metrics["in_flight"] == 3
+    assert metrics["pending"] == 1
+    assert [result.data for result in results[1:]] == [0, 1, 4]
+
+
+def test_pool_batches_pending_events_into_one_message() -> None:
+    """Test batch_size packs pending events into batch messages with one result each."""
+    # ARRANGE
+    basefunctions.EventFactory().register_event_type("pool_square", _SquareHandler)
+    pool: CoreletPool = CoreletPool(size=1, batch_size=8)
+    results: queue.Queue = queue.Queue()
+
+    # ACT
+    for i in range(50):
+        pool.submit(_corelet_event("pool_square", i), results.put)
+    collected: List[basefunctions.EventResult] = [results.get(timeout=30) for _ in range(50)]
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert all(result.success for result in collected)
+    assert sorted(result.data for result in collected) == sorted(i**2 for i in range(50))
+
+
+def test_pool_isolates_crashing_event_of_a_batch() -> None:
+    """Test a crash inside a batch only fails the crashing event."""
+    # ARRANGE
+    factory = basefunctions.EventFactory()
+    factory.register_event_type("pool_square", _SquareHandler)
+    factory.register_event_type("pool_crash", _CrashHandler)
+    pool: CoreletPool = CoreletPool(size=1, batch_size=4)
+    events = [_corelet_event("pool_square", 1), _corelet_event("pool_crash", None), _corelet_event("pool_square", 2)]
+
+    # ACT
+    queues = [_submit(pool, event) for event in events]
+    results = [q.get(timeout=30) for q in queues]
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert [result.success for result in results] == [True, False, True]
+    assert isinstance(results[1].exception, basefunctions.EventExecutionError)
+
+
+# -------------------------------------------------------------
+# TESTS: Start method, preloading and prewarming
+# -------------------------------------------------------------
+
+
+def test_pool_rejects_unknown_start_method() -> None:
+    """Test CoreletPool rejects start methods unknown to multiprocessing."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError):
+        CoreletPool(size=1, start_method="teleport")
+
+
+def test_pool_rejects_non_positive_prewarm_count(pool: CoreletPool) -> None:
+    """Test prewarm() rejects count <= 0."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="prewarm count must be positive"):
+        pool.prewarm(0)
+
+
+def test_pool_prewarm_starts_corelets_before_first_event(pool: CoreletPool) -> None:
+    """Test prewarm() starts corelets without any submitted event."""
+    # ACT
+    pool.prewarm()
+    deadline: float = time.monotonic() + 10
+    while pool.get_corelet_count() < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    # ASSERT
+    assert pool.get_corelet_count() == 2
+    assert pool.get_metrics()["pending"] == 0
+
+
+@pytest.mark.skipif(
+    "forkserver" not in multiprocessing.get_all_start_methods(), reason="forkserver start method required"
+)
+def test_pool_forkserver_corelets_load_handlers_from_module() -> None:
+    """Test forkserver corelets register handlers from corelet_meta and return results."""
+    # ARRANGE
+    basefunctions.EventFactory().register_event_type("pool_square", _SquareHandler)
+    pool: CoreletPool = CoreletPool(size=1, start_method="forkserver", preload_modules=["json"])
+    pool.prewarm()
+
+    # ACT
+    result: basefunctions.EventResult = _submit(pool, _corelet_event("pool_square", 7, timeout=30)).get(timeout=60)
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert result.success is True
+    assert result.data == 49
+
+
+# -------------------------------------------------------------
+# TESTS: Recycling
+# -------------------------------------------------------------
+
+
+def test_pool_recycles_corelet_after_max_tasks() -> None:
+    """Test a corelet reaching max_tasks is replaced without failing events."""
+    # ARRANGE
+    basefunctions.EventFactory().register_event_type("pool_sleep", _SleepHandler)
+    pool: CoreletPool = CoreletPool(size=1, max_tasks=2)
+
+    # ACT
+    pids: List[int] = [_submit(pool, _corelet_event("pool_sleep", 0)).get(timeout=15).data for _ in range(5)]
+    metrics = pool.get_metrics()
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert pids[0] == pids[1] != pids[2] == pids[3] != pids[4]
+    assert metrics["retired"] == 2
+    assert metrics["corelets"] == 1
+
+
+def test_pool_drains_pipelined_messages_before_recycling() -> None:
+    """Test messages pipelined behind the retirement notice still complete."""
+    # ARRANGE
+    basefunctions.EventFactory().register_event_type("pool_square", _SquareHandler)
+    pool: CoreletPool = CoreletPool(size=1, window=4, max_tasks=3)
+    results: queue.Queue = queue.Queue()
+
+    # ACT
+    for i in range(20):
+        pool.submit(_corelet_event("pool_square", i), results.put)
+    collected: List[basefunctions.EventResult] = [results.get(timeout=30) for _ in range(20)]
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert all(result.success for result in collected)
+    assert sorted(result.data for result in collected) == [i**2 for i in range(20)]
+
+
+# -------------------------------------------------------------
+# TESTS: Cancellation
+# -------------------------------------------------------------
+
+
+def test_pool_cancel_removes_pending_event(pool: CoreletPool) -> None:
+    """Test cancel() completes a pending event with EventCancelledError."""
+    # ARRANGE
+    busy = [_submit(pool, _corelet_event("pool_sleep", 1)) for _ in range(2)]
+    event: basefunctions.Event = _corelet_event("pool_square", 5)
+    pending = _submit(pool, event)
+
+    # ACT
+    cancelled: bool = pool.cancel(event.event_id)
+    result: basefunctions.EventResult = pending.get(timeout=5)
+
+    # ASSERT
+    assert cancelled is True
+    assert isinstance(result.exception, basefunctions.EventCancelledError)
+    assert pool.cancel(event.event_id) is False
+    assert all(results.get(timeout=15).success for results in busy)
+
+
+# -------------------------------------------------------------
+# TESTS: Shutdown
+# -------------------------------------------------------------
+
+
+def test_pool_shutdown_stops_corelets(pool: CoreletPool) -> None:
+    """Test shutdown() terminates all pooled corelet processes."""
+    # ARRANGE
+    _submit(pool, _corelet_event("pool_square", 2)).get(timeout=15)
+    assert pool.get_corelet_count() == 1
+
+    # ACT
+    pool.shutdown(timeout=30)
+
+    # ASSERT
+    assert pool.get_corelet_count() == 0
+
+
+def test_pool_rejects_submit_after_shutdown(pool: CoreletPool) -> None:
+    """Test submit() raises EventShutdownError after shutdown."""
+    # ARRANGE
+    pool.shutdown(timeout=30)
+
+    # ACT & ASSERT
+    with pytest.raises(basefunctions.EventShutdownError):
+        pool.submit(_corelet_event("pool_square", 1), lambda result: None)
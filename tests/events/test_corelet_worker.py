@@ -26,7 +26,7 @@ import signal
 import sys
 import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import Mock, MagicMock, patch, call
 
 import pytest
@@ -36,6 +36,7 @@ import psutil
 from basefunctions.events.corelet_worker import (
     CoreletWorker,
     worker_main,
+    CORELET_RETIREMENT_NOTICE,
     IDLE_TIMEOUT,
 )
 import basefunctions
@@ -99,13 +100,14 @@ def sample_event() -> Mock:
     Returns
     -------
     Mock
-        Mock Event with event_type, event_id, corelet_meta
+        Mock Event with event_type, event_id, corelet_meta, timeout
     """
     # ARRANGE
     event: Mock = Mock(spec=basefunctions.Event)
     event.event_type = "test_event"
     event.event_id = "event-123"
     event.corelet_meta = None
+    event.timeout = 30
 
     return event
 
@@ -186,6 +188,11 @@ def test_corelet_worker_uses_slots_for_memory_efficiency() -> None:
         "_signal_handlers_setup",
         "_registered_handlers",
         "_redirector",
+        "_shared_memory_threshold",
+        "_max_tasks",
+        "_max_rss_mb",
+        "_tasks_processed",
+        "_retiring",
     }
 
     actual_slots: set = set(CoreletWorker.__slots__)
@@ -451,10 +458,30 @@ def test_worker_main_creates_worker_and_runs(
     worker_main(worker_id, input_pipe, output_pipe)
 
     # ASSERT
-    mock_worker_class.assert_called_once_with(worker_id, input_pipe, output_pipe)
+    mock_worker_class.assert_called_once_with(worker_id, input_pipe, output_pipe, None, None)
     mock_worker.run.assert_called_once()
 
 
+@patch("basefunctions.events.corelet_worker.importlib.import_module")
+@patch("basefunctions.events.corelet_worker.CoreletWorker")
+def test_worker_main_imports_preload_modules_before_running(
+    mock_worker_class: Mock,
+    mock_import: Mock,
+    mock_pipes: Tuple[Mock, Mock],
+) -> None:
+    """Test worker_main imports preload modules and tolerates import failures."""
+    # ARRANGE
+    input_pipe, output_pipe = mock_pipes
+    mock_import.side_effect = [Mock(), ImportError("missing")]
+
+    # ACT
+    worker_main("worker-1", input_pipe, output_pipe, ("json", "missing_module"))
+
+    # ASSERT
+    assert [call.args[0] for call in mock_import.call_args_list] == ["json", "missing_module"]
+    mock_worker_class.return_value.run.assert_called_once()
+
+
 @pytest.mark.parametrize(
     "worker_id,input_pipe,output_pipe",
     [
@@ -820,6 +847,28 @@ def test_process_event_auto_registers_handler_when_not_registered(
     mock_register.assert_called_once_with(sample_corelet_meta)
 
 
+def test_process_event_registers_handler_named_by_corelet_meta(
+    worker_instance: CoreletWorker,
+    sample_event: Mock,
+    sample_context: Mock,
+    sample_corelet_meta: Dict[str, str],
+) -> None:
+    """Test a map chunk registers the mapped event type from its corelet_meta."""
+    # ARRANGE
+    sample_event.event_type = "_map_chunk"
+    sample_event.corelet_meta = dict(sample_corelet_meta, event_type="mapped_event")
+    worker_instance._handlers["_map_chunk"] = basefunctions.EventHandler
+
+    # Patch at class level due to __slots__
+    with patch.object(CoreletWorker, "_register_from_meta") as mock_register:
+        with patch.object(CoreletWorker, "_get_handler", return_value=Mock(spec=basefunctions.EventHandler)):
+            # ACT
+            worker_instance._process_event(sample_event, sample_context)
+
+    # ASSERT
+    mock_register.assert_called_once_with(sample_event.corelet_meta)
+
+
 def test_process_event_raises_exception_when_handler_fails(
     worker_instance: CoreletWorker,
     sample_event: Mock,
@@ -954,6 +1003,145 @@ def test_send_result_logs_error_when_pickle_fails(
     # ASSERT - error logged (verified by no exception raised)
 
 
+# -------------------------------------------------------------
+# TESTS: _process_batch / _send_batch_results
+# -------------------------------------------------------------
+
+
+def test_process_batch_returns_one_result_per_event_in_order(
+    worker_instance: CoreletWorker,
+    sample_context: Mock,
+) -> None:
+    """Test _process_batch isolates handler errors per event."""
+    # ARRANGE
+    events: List[basefunctions.Event] = [basefunctions.Event("test_event") for _ in range(3)]
+    side_effect: List[Any] = [
+        basefunctions.EventResult.business_result("x", True, "ok"),
+        RuntimeError("boom"),
+        basefunctions.EventResult.business_result("y", True, "ok"),
+    ]
+
+    # ACT
+    with patch.object(CoreletWorker, "_process_event", side_effect=side_effect):
+        results: List[basefunctions.EventResult] = worker_instance._process_batch(events, sample_context)
+
+    # ASSERT
+    assert [result.success for result in results] == [True, False, True]
+    assert [result.event_id for result in results] == [event.event_id for event in events]
+    assert isinstance(results[1].exception, RuntimeError)
+
+
+def test_process_batch_passes_batch_handler_events_to_handle_batch(
+    worker_instance: CoreletWorker,
+    sample_context: Mock,
+) -> None:
+    """Test _process_batch groups events of a BatchEventHandler type into one handle_batch call."""
+    # ARRANGE
+    calls: List[List[Any]] = []
+
+    class TimesTenHandler(basefunctions.BatchEventHandler):
+        def handle_batch(self, events, context):
+            calls.append([event.event_data for event in events])
+            return [basefunctions.EventResult.business_result("x", True, event.event_data * 10) for event in events]
+
+    batch_handler = TimesTenHandler()
+    events: List[basefunctions.Event] = [
+        basefunctions.Event("batch_event", event_data=1),
+        basefunctions.Event("test_event"),
+        basefunctions.Event("batch_event", event_data=2),
+    ]
+    plain_result = basefunctions.EventResult.business_result("y", True, "plain")
+
+    # ACT
+    with patch.object(CoreletWorker, "_is_handler_registered", return_value=True), patch.object(
+        CoreletWorker,
+        "_get_handler",
+        side_effect=lambda event_type, context: batch_handler if event_type == "batch_event" else Mock(),
+    ), patch.object(CoreletWorker, "_process_event", return_value=plain_result):
+        results: List[basefunctions.EventResult] = worker_instance._process_batch(events, sample_context)
+
+    # ASSERT
+    assert calls == [[1, 2]]
+    assert [result.data for result in results] == [10, "plain", 20]
+    assert [result.event_id for result in results] == [event.event_id for event in events]
+
+
+def test_send_batch_results_sends_single_message(
+    worker_instance: CoreletWorker,
+    mock_pipes: Tuple[Mock, Mock],
+) -> None:
+    """Test _send_batch_results sends all results of a batch in one pipe message."""
+    # ARRANGE
+    input_pipe, output_pipe = mock_pipes
+    results: List[basefunctions.EventResult] = [
+        basefunctions.EventResult.business_result(f"event-{i}", True, i) for i in range(3)
+    ]
+
+    # ACT
+    worker_instance._send_batch_results(results)
+
+    # ASSERT
+    output_pipe.send.assert_called_once()
+    sent: List[basefunctions.EventResult] = pickle.loads(output_pipe.send.call_args[0][0])
+    assert [result.data for result in sent] == [0, 1, 2]
+
+
+# -------------------------------------------------------------
+# TESTS: _check_retirement
+# -------------------------------------------------------------
+
+
+def test_check_retirement_sends_notice_once_after_max_tasks(mock_pipes: Tuple[Mock, Mock]) -> None:
+    """Test worker sends one retirement notice when max_tasks is reached."""
+    # ARRANGE
+    input_pipe, output_pipe = mock_pipes
+    worker: CoreletWorker = CoreletWorker("worker-1", input_pipe, output_pipe, max_tasks=2)
+
+    # ACT
+    worker._check_retirement(1)
+    sent_before_limit: int = output_pipe.send.call_count
+    worker._check_retirement(1)
+    worker._check_retirement(1)
+
+    # ASSERT
+    assert sent_before_limit == 0
+    output_pipe.send.assert_called_once()
+    assert pickle.loads(output_pipe.send.call_args[0][0]) == CORELET_RETIREMENT_NOTICE
+
+
+@patch("basefunctions.events.corelet_worker.psutil.Process")
+def test_check_retirement_sends_notice_when_rss_exceeds_limit(
+    mock_process_class: Mock,
+    mock_pipes: Tuple[Mock, Mock],
+) -> None:
+    """Test worker sends retirement notice when RSS exceeds max_rss_mb."""
+    # ARRANGE
+    input_pipe, output_pipe = mock_pipes
+    mock_process_class.return_value.memory_info.return_value.rss = 600 * 1024 * 1024
+    worker: CoreletWorker = CoreletWorker("worker-1", input_pipe, output_pipe, max_rss_mb=512)
+
+    # ACT
+    worker._check_retirement(1)
+
+    # ASSERT
+    assert pickle.loads(output_pipe.send.call_args[0][0]) == CORELET_RETIREMENT_NOTICE
+
+
+def test_check_retirement_without_limits_sends_nothing(
+    worker_instance: CoreletWorker,
+    mock_pipes: Tuple[Mock, Mock],
+) -> None:
+    """Test worker without limits never requests recycling."""
+    # ARRANGE
+    input_pipe, output_pipe = mock_pipes
+
+    # ACT
+    worker_instance._check_retirement(10_000)
+
+    # ASSERT
+    output_pipe.send.assert_not_called()
+
+
 # -------------------------------------------------------------
 # TESTS: _setup_signal_handlers - IMPORTANT
 # -------------------------------------------------------------
@@ -0,0 +1,173 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for DeadlineScheduler.
+ Tests deadline ordering, cancellation, heap compaction and fork reset.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import os
+import threading
+import pytest
+from typing import List
+
+# Project imports
+from basefunctions.events import deadline_scheduler
+from basefunctions.events.deadline_scheduler import (
+    COMPACT_MIN_SIZE,
+    DeadlineScheduler,
+    get_deadline_scheduler,
+)
+
+# -------------------------------------------------------------
+# FIXTURES
+# -------------------------------------------------------------
+
+
+@pytest.fixture
+def scheduler() -> DeadlineScheduler:
+    """Provide a private scheduler instance."""
+    return DeadlineScheduler()
+
+
+# -------------------------------------------------------------
+# TESTS: schedule()
+# -------------------------------------------------------------
+
+
+def test_schedule_fires_callbacks_in_deadline_order(scheduler: DeadlineScheduler) -> None:
+    """Test callbacks fire in deadline order regardless of registration order."""
+    # ARRANGE
+    fired: List[str] = []
+    done: threading.Event = threading.Event()
+
+    # ACT
+    scheduler.schedule(0.15, lambda: (fired.append("late"), done.set()))
+    scheduler.schedule(0.05, lambda: fired.append("early"))
+    done.wait(timeout=5)
+
+    # ASSERT
+    assert fired == ["early", "late"]
+    assert scheduler.pending_count() == 0
+
+
+def test_schedule_does_not_fire_before_deadline(scheduler: DeadlineScheduler) -> None:
+    """Test a callback does not fire before its deadline."""
+    # ARRANGE
+    fired: threading.Event = threading.Event()
+
+    # ACT
+    handle = scheduler.schedule(0.3, fired.set)
+
+    # ASSERT
+    assert not fired.wait(timeout=0.1)
+    assert fired.wait(timeout=5)
+    assert handle.fired
+
+
+def test_schedule_survives_failing_callback(scheduler: DeadlineScheduler) -> None:
+    """Test an exception in one callback does not stop the scheduler thread."""
+    # ARRANGE
+    fired: threading.Event = threading.Event()
+
+    def fail() -> None:
+        raise RuntimeError("boom")
+
+    # ACT
+    scheduler.schedule(0, fail)
+    scheduler.schedule(0.05, fired.set)
+
+    # ASSERT
+    assert fired.wait(timeout=5)
+
+
+# -------------------------------------------------------------
+# TESTS: cancel()
+# -------------------------------------------------------------
+
+
+def test_cancel_prevents_callback(scheduler: DeadlineScheduler) -> None:
+    """Test a cancelled deadline never fires."""
+    # ARRANGE
+    fired: threading.Event = threading.Event()
+    handle = scheduler.schedule(0.05, fired.set)
+
+    # ACT
+    cancelled: bool = handle.cancel()
+
+    # ASSERT
+    assert cancelled is True
+    assert not fired.wait(timeout=0.2)
+    assert handle.cancelled
+    assert handle.cancel() is False
+
+
+def test_cancel_after_fire_returns_false(scheduler: DeadlineScheduler) -> None:
+    """Test cancel() reports False once the callback has fired."""
+    # ARRANGE
+    fired: threading.Event = threading.Event()
+    handle = scheduler.schedule(0, fired.set)
+    fired.wait(timeout=5)
+
+    # ACT & ASSERT
+    assert handle.cancel() is False
+
+
+def test_cancel_compacts_heap_when_mostly_cancelled(scheduler: DeadlineScheduler) -> None:
+    """Test cancelled entries are dropped once they dominate the heap."""
+    # ARRANGE
+    handles = [scheduler.schedule(60, lambda: None) for _ in range(COMPACT_MIN_SIZE * 2)]
+
+    # ACT
+    for handle in handles[:-1]:
+        handle.cancel()
+
+    # ASSERT
+    assert scheduler.pending_count() == 1
+    assert len(scheduler._heap) < COMPACT_MIN_SIZE * 2
+
+
+# -------------------------------------------------------------
+# TESTS: get_deadline_scheduler()
+# -------------------------------------------------------------
+
+
+def test_get_deadline_scheduler_returns_shared_instance() -> None:
+    """Test the process-wide scheduler is created once."""
+    # ACT & ASSERT
+    assert get_deadline_scheduler() is get_deadline_scheduler()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork required")
+def test_forked_child_gets_fresh_scheduler() -> None:
+    """Test deadlines registered in the parent do not exist in a forked child."""
+    # ARRANGE
+    handle = get_deadline_scheduler().schedule(60, lambda: None)
+    read_fd, write_fd = os.pipe()
+
+    # ACT
+    pid: int = os.fork()
+    if pid == 0:
+        fresh = deadline_scheduler._shared_scheduler is None and get_deadline_scheduler().pending_count() == 0
+        os.write(write_fd, b"1" if fresh else b"0")
+        os._exit(0)
+    os.close(write_fd)
+    child_result: bytes = os.read(read_fd, 1)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    handle.cancel()
+
+    # ASSERT
+    assert child_result == b"1"
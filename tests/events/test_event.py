@@ -18,8 +18,9 @@
 # IMPORTS
 # -------------------------------------------------------------
 # External imports
+import pickle
 import pytest
-import uuid
+import time
 from datetime import datetime
 from typing import Any, Optional
 from unittest.mock import Mock, patch
@@ -31,6 +32,7 @@ from basefunctions.events.event import (
     EXECUTION_MODE_THREAD,
     EXECUTION_MODE_CORELET,
     EXECUTION_MODE_CMD,
+    EXECUTION_MODE_ASYNC,
     VALID_EXECUTION_MODES,
     DEFAULT_PRIORITY,
     DEFAULT_TIMEOUT,
@@ -89,16 +91,33 @@ def test_event_minimal_initialization(sample_event_type: str) -> None:
 
 
 def test_event_generates_unique_event_id() -> None:
-    """Test Event generates unique UUID for event_id."""
+    """Test Event generates unique, increasing 64-bit hex IDs for event_id."""
     # ACT
     event1: Event = Event(event_type="type1")
     event2: Event = Event(event_type="type2")
 
     # ASSERT
     assert event1.event_id != event2.event_id
-    # Validate UUID format
-    assert uuid.UUID(event1.event_id)
-    assert uuid.UUID(event2.event_id)
+    # Validate 64-bit hex format
+    assert len(event1.event_id) == 16 and len(event2.event_id) == 16
+    assert int(event1.event_id, 16) < int(event2.event_id, 16)
+
+
+def test_event_id_is_formatted_lazily_and_survives_pickling() -> None:
+    """Test event_id is stored as integer until first access and can be replaced."""
+    # ARRANGE
+    event: Event = Event(event_type="test")
+    unformatted: bool = isinstance(event._event_id, int)
+
+    # ACT
+    copy: Event = pickle.loads(pickle.dumps(event))
+    event_id: str = event.event_id
+
+    # ASSERT
+    assert unformatted is True
+    assert copy.event_id == event_id and event._event_id == event_id
+    event.event_id = "custom"
+    assert event.event_id == "custom"
 
 
 def test_event_with_all_parameters(sample_event_type: str, sample_event_data: dict) -> None:
@@ -163,7 +182,7 @@ def test_event_validation_raises_error_when_execution_mode_invalid() -> None:  #
 @pytest.mark.parametrize(
     "invalid_mode",
     [
-        "async",
+        "asyncio",
         "parallel",
         "sequential",
         "",
@@ -190,6 +209,7 @@ def test_event_validation_rejects_various_invalid_modes(invalid_mode: str) -> No
         EXECUTION_MODE_THREAD,
         EXECUTION_MODE_CORELET,
         EXECUTION_MODE_CMD,
+        EXECUTION_MODE_ASYNC,
     ],
 )
 def test_event_accepts_all_valid_execution_modes(exec_mode: str) -> None:
@@ -217,7 +237,8 @@ def test_valid_execution_modes_constant_contains_all_modes() -> None:
     assert EXECUTION_MODE_THREAD in VALID_EXECUTION_MODES
     assert EXECUTION_MODE_CORELET in VALID_EXECUTION_MODES
     assert EXECUTION_MODE_CMD in VALID_EXECUTION_MODES
-    assert len(VALID_EXECUTION_MODES) == 4
+    assert EXECUTION_MODE_ASYNC in VALID_EXECUTION_MODES
+    assert len(VALID_EXECUTION_MODES) == 5
 
 
 # -------------------------------------------------------------
@@ -390,7 +411,7 @@ def test_event_slots_contain_all_expected_attributes() -> None:
     """Test Event __slots__ contains all expected attributes."""
     # ARRANGE
     expected_slots: set = {
-        "event_id",
+        "_event_id",
         "event_type",
         "event_exec_mode",
         "event_name",
@@ -400,10 +421,13 @@ def test_event_slots_contain_all_expected_attributes() -> None:
         "max_retries",
         "timeout",
         "priority",
-        "timestamp",
+        "_timestamp",
         "corelet_meta",
         "progress_tracker",
         "progress_steps",
+        "depends_on",
+        "inject_results",
+        "partition_key",
     }
 
     # ACT
@@ -444,6 +468,22 @@ def test_event_timestamps_differ_for_different_events() -> None:
     assert event1.timestamp <= event2.timestamp
 
 
+def test_event_created_ns_follows_timestamp() -> None:
+    """Test created_ns matches the creation time and an assigned timestamp."""
+    # ARRANGE
+    before: int = time.time_ns()
+    event: Event = Event(event_type="test")
+    after: int = time.time_ns()
+
+    # ACT
+    created: int = event.created_ns
+    event.timestamp = datetime(2026, 1, 1, 12, 0)
+
+    # ASSERT
+    assert before <= created <= after
+    assert event.created_ns == int(datetime(2026, 1, 1, 12, 0).timestamp() * 1_000_000_000)
+
+
 # -------------------------------------------------------------
 # TESTS: Edge Cases - CRITICAL
 # -------------------------------------------------------------
@@ -576,3 +616,37 @@ def test_event_event_target_can_be_any_type() -> None:
     for target in targets:
         event: Event = Event(event_type="test", event_target=target)
         assert event.event_target == target
+
+
+# -------------------------------------------------------------
+# TESTS: Dependencies
+# -------------------------------------------------------------
+
+
+def test_event_depends_on_defaults_and_inject_results_validation() -> None:
+    """Test depends_on defaults to an empty tuple and inject_results requires dict event_data."""
+    # ACT
+    event: Event = Event(event_type="test")
+    dependent: Event = Event(event_type="test", depends_on=("a", "b"), inject_results=True)
+
+    # ASSERT
+    assert event.depends_on == () and event.inject_results is False
+    assert dependent.depends_on == ["a", "b"]
+    with pytest.raises(ValueError, match="inject_results requires"):
+        Event(event_type="test", event_data="raw", inject_results=True)
+
+
+# -------------------------------------------------------------
+# TESTS: Partition Key
+# -------------------------------------------------------------
+
+
+def test_event_partition_key_defaults_to_none_and_survives_pickling() -> None:
+    """Test partition_key is optional and kept when an event is sent to a corelet."""
+    # ACT
+    event: Event = Event(event_type="test")
+    keyed: Event = Event(event_type="test", partition_key=("account", 42))
+
+    # ASSERT
+    assert event.partition_key is None
+    assert pickle.loads(pickle.dumps(keyed)).partition_key == ("account", 42)
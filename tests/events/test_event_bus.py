@@ -20,11 +20,11 @@
 # IMPORTS
 # -------------------------------------------------------------
 # External imports
+import os
 import pytest
 import queue
 import threading
 import time
-from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from unittest.mock import Mock, MagicMock, patch, call
 
@@ -38,6 +38,7 @@ from basefunctions.events.event_bus import (
     INTERNAL_CMD_EXECUTION_EVENT,
     INTERNAL_SHUTDOWN_EVENT,
 )
+from basefunctions.events.result_store import ResultStore
 
 # -------------------------------------------------------------
 # FIXTURES
@@ -87,6 +88,7 @@ def mock_event_factory() -> Mock:
     """
     factory: Mock = Mock()
     factory.is_handler_available.return_value = True
+    factory.get_batch_limits.return_value = None
     factory.register_event_type.return_value = None
     return factory
 
@@ -124,6 +126,7 @@ def mock_event() -> Mock:
     from basefunctions.events.event import Event
 
     event: Mock = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = "test_event_123"
     event.event_type = "test_event"
     event.event_exec_mode = "thread"
@@ -148,6 +151,7 @@ def mock_sync_event() -> Mock:
     from basefunctions.events.event import Event
 
     event: Mock = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = "test_sync_event"
     event.event_type = "test_event"
     event.event_exec_mode = "sync"
@@ -233,8 +237,7 @@ def test_init_creates_event_bus_with_default_threads(
     # ASSERT
     assert bus._num_threads == 8
     assert isinstance(bus._input_queue, queue.PriorityQueue)
-    assert isinstance(bus._output_queue, queue.Queue)
-    assert isinstance(bus._result_list, OrderedDict)
+    assert isinstance(bus._result_store, ResultStore)
     # Worker threads should be created (daemon threads, will clean up automatically)
     assert len(bus._worker_threads) == 8
 
@@ -404,14 +407,14 @@ def test_ensure_thread_count_updates_max_cached_results(
 
     # ACT - Initialize with 4 threads
     bus: EventBus = EventBus(num_threads=4)
-    max_cached_after_init = bus._max_cached_results
+    max_cached_after_init = bus._result_store.max_results
 
     # Expand to 8 threads
     bus.ensure_thread_count(8)
 
     # ASSERT
     assert max_cached_after_init == 4 * 1000
-    assert bus._max_cached_results == 8 * 1000
+    assert bus._result_store.max_results == 8 * 1000
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -475,7 +478,49 @@ def test_init_calculates_max_cached_results_correctly(
     bus: EventBus = EventBus(num_threads=8)
 
     # ASSERT
-    assert bus._max_cached_results == 8 * 1000
+    assert bus._result_store.max_results == 8 * 1000
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_init_configures_shared_memory_threshold(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test shared_memory_threshold is stored and adjustable."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    # ACT
+    bus: EventBus = EventBus(shared_memory_threshold=4096)
+
+    # ASSERT
+    assert bus.get_shared_memory_threshold() == 4096
+    bus.set_shared_memory_threshold(None)
+    assert bus.get_shared_memory_threshold() is None
+
+
+@pytest.mark.parametrize("threshold", [0, -1])
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_init_rejects_invalid_shared_memory_threshold(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    threshold: int,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test EventBus rejects non-positive shared_memory_threshold."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="shared_memory_threshold must be positive"):
+        EventBus(shared_memory_threshold=threshold)
 
 
 # -------------------------------------------------------------
@@ -485,351 +530,2408 @@ def test_init_calculates_max_cached_results_correctly(
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_publish_sync_event_returns_event_id(
+def test_publish_sync_event_returns_event_id(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_sync_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() returns event_id for synchronous event."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    # Create a mock handler that will be returned by the factory
+    from basefunctions.events.event_handler import EventHandler
+
+    mock_handler: Mock = Mock(spec=EventHandler)
+    mock_result: Mock = Mock()
+    mock_result.success = True
+    mock_result.event_id = "test_sync_event"
+    mock_handler.handle.return_value = mock_result
+    mock_event_factory.create_handler.return_value = mock_handler
+
+    bus: EventBus = EventBus()
+
+    # ACT
+    event_id: str = bus.publish(mock_sync_event)
+
+    # ASSERT
+    assert event_id == mock_sync_event.event_id
+    # Verify the event was processed (result should be in output queue)
+    assert mock_handler.handle.called
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_thread_event_queues_event_correctly(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() queues thread event to input queue."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    bus: EventBus = EventBus()
+
+    # ACT
+    event_id: str = bus.publish(mock_event)
+
+    # ASSERT
+    assert event_id == mock_event.event_id
+    # Verify the event was queued (event_id should be in result_list)
+    assert event_id in bus._result_store
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_increments_event_counter(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() increments internal event counter."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    bus: EventBus = EventBus()
+    initial_counter: int = bus._event_counter
+
+    # ACT
+    bus.publish(mock_event)
+
+    # ASSERT
+    # Counter is incremented twice: once in publish() and once in _handle_thread_and_corelet_event()
+    assert bus._event_counter == initial_counter + 2
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_registers_result_in_cache(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() registers event_id in result cache."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    bus: EventBus = EventBus()
+
+    # ACT
+    event_id: str = bus.publish(mock_event)
+
+    # ASSERT
+    assert event_id in bus._result_store
+    assert bus._result_store[event_id] is None
+
+
+# -------------------------------------------------------------
+# TESTS: publish() - Error Handling CRITICAL
+# -------------------------------------------------------------
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
+@patch("psutil.cpu_count")
+def test_publish_raises_invalid_event_error_when_not_event_instance(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() raises InvalidEventError when event is not Event instance."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda msg: ValueError(msg)
+
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Invalid event type"):
+        bus.publish("not_an_event")
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
+@patch("psutil.cpu_count")
+def test_publish_raises_invalid_event_error_when_event_id_missing(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() raises InvalidEventError when event_id is missing."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda msg: ValueError(msg)
+
+    bus: EventBus = EventBus()
+
+    # Create event without event_id - use spec=Event to pass isinstance check
+    invalid_event: Mock = Mock(spec=Event)
+    invalid_event.depends_on = []
+    invalid_event.event_id = None
+    invalid_event.event_type = "test"
+    invalid_event.event_exec_mode = "thread"
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Event must have a valid event_id"):
+        bus.publish(invalid_event)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
+@patch("psutil.cpu_count")
+def test_publish_raises_invalid_event_error_when_event_type_missing(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() raises InvalidEventError when event_type is missing."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda msg: ValueError(msg)
+
+    bus: EventBus = EventBus()
+
+    # Create event without event_type - use spec=Event to pass isinstance check
+    invalid_event: Mock = Mock(spec=Event)
+    invalid_event.depends_on = []
+    invalid_event.event_id = "123"
+    invalid_event.event_type = None
+    invalid_event.event_exec_mode = "thread"
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Event must have a valid event_type"):
+        bus.publish(invalid_event)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.NoHandlerAvailableError")
+@patch("psutil.cpu_count")
+def test_publish_raises_no_handler_available_error_when_handler_missing(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() raises NoHandlerAvailableError when no handler registered."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_event_factory.is_handler_available.return_value = False
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda et: ValueError(f"No handler for {et}")
+
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="No handler for"):
+        bus.publish(mock_event)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
+@patch("psutil.cpu_count")
+def test_publish_raises_invalid_event_error_for_unknown_execution_mode(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() raises InvalidEventError for unknown execution mode."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda msg: ValueError(msg)
+
+    bus: EventBus = EventBus()
+
+    # Set unknown execution mode
+    mock_event.event_exec_mode = "unknown_mode"
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Unknown execution mode"):
+        bus.publish(mock_event)
+
+
+@pytest.mark.parametrize(
+    "invalid_input",
+    [
+        None,
+        "string",
+        123,
+        {},
+        [],
+    ],
+)
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
+@patch("psutil.cpu_count")
+def test_publish_various_invalid_events(
+    mock_cpu_count: Mock,
+    mock_error_class: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    invalid_input: Any,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish() rejects various invalid event inputs."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+    mock_error_class.side_effect = lambda msg: ValueError(msg)
+
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="Invalid event type"):
+        bus.publish(invalid_input)
+
+
+# -------------------------------------------------------------
+# TESTS: publish() - Edge Cases
+# -------------------------------------------------------------
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_with_progress_tracker_enriches_event(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() enriches event with thread-local progress tracker."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    bus: EventBus = EventBus()
+
+    # Set progress tracker for current thread
+    mock_tracker: Mock = Mock()
+    thread_id: int = threading.get_ident()
+    bus._progress_context[thread_id] = (mock_tracker, 5)
+
+    # Ensure event has no progress tracker initially
+    mock_event.progress_tracker = None
+
+    # ACT
+    bus.publish(mock_event)
+
+    # ASSERT
+    assert mock_event.progress_tracker is mock_tracker
+    assert mock_event.progress_steps == 5
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("basefunctions.events.event_bus.basefunctions.EXECUTION_MODE_CMD", "cmd")
+@patch("psutil.cpu_count")
+def test_publish_skips_handler_check_for_cmd_mode(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    mock_event: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() skips handler availability check for CMD mode."""
+    # ARRANGE
+    mock_cpu_count.return_value = 8
+    mock_factory_class.return_value = mock_event_factory
+
+    bus: EventBus = EventBus()
+
+    # Set CMD mode
+    mock_event.event_exec_mode = "cmd"
+
+    # ACT
+    bus.publish(mock_event)
+
+    # ASSERT
+    mock_event_factory.is_handler_available.assert_not_called()
+
+
+# -------------------------------------------------------------
+# TESTS: publish_many() / publish_iter() - Bulk Publishing
+# -------------------------------------------------------------
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_many_returns_event_ids_in_order(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_many() returns event IDs in input order and registers results."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 2
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events: List[Event] = [Event("test_event", event_data=i) for i in range(25)]
+    initial_counter: int = bus._event_counter
+
+    # ACT
+    event_ids: List[str] = bus.publish_many(events, chunk_size=10)
+
+    # ASSERT
+    assert event_ids == [event.event_id for event in events]
+    assert all(event_id in bus._result_store for event_id in event_ids)
+    assert bus._event_counter == initial_counter + 25
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_iter_checks_handler_once_per_event_type_and_chunk(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_iter() resolves handler availability once per event type per chunk."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 2
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events = (Event("type_a" if i % 2 else "type_b") for i in range(100))
+
+    # ACT
+    event_ids: List[str] = bus.publish_iter(events, chunk_size=50)
+
+    # ASSERT
+    assert len(event_ids) == 100
+    # 2 chunks x 2 event types
+    assert mock_event_factory.is_handler_available.call_count == 4
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_many_rejects_whole_chunk_when_handler_missing(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test publish_many() enqueues nothing from a chunk containing an unknown event type."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import NoHandlerAvailableError
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.is_handler_available.side_effect = lambda event_type: event_type != "unknown"
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events: List[Event] = [Event("test_event"), Event("unknown"), Event("test_event")]
+
+    # ACT & ASSERT
+    with pytest.raises(NoHandlerAvailableError):
+        bus.publish_many(events)
+
+    assert all(event.event_id not in bus._result_store for event in events)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_many_raises_on_invalid_event(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_many() raises InvalidEventError for non-Event items."""
+    # ARRANGE
+    from basefunctions.events.event_exceptions import InvalidEventError
+
+    mock_cpu_count.return_value = 2
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(InvalidEventError):
+        bus.publish_many(["not an event"])
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_many_processes_sync_events_inline(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_many() handles SYNC events before returning."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    mock_cpu_count.return_value = 2
+    mock_handler: Mock = Mock(spec=EventHandler)
+    mock_handler.handle.side_effect = lambda event, context: EventResult.business_result(
+        event.event_id, True, event.event_data
+    )
+    mock_event_factory.create_handler.return_value = mock_handler
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events: List[Event] = [Event("test_event", EXECUTION_MODE_SYNC, event_data=i) for i in range(3)]
+
+    # ACT
+    event_ids: List[str] = bus.publish_many(events)
+    results = bus.get_results(event_ids, join_before=False)
+
+    # ASSERT
+    assert [results[event_id].data for event_id in event_ids] == [0, 1, 2]
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_iter_raises_value_error_on_invalid_chunk_size(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_iter() rejects non-positive chunk sizes."""
+    # ARRANGE
+    mock_cpu_count.return_value = 2
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        bus.publish_iter([], chunk_size=0)
+
+
+# -------------------------------------------------------------
+# TESTS: publish(return_future=True) - Future-Based Results
+# -------------------------------------------------------------
+
+
+def _make_echo_handler():
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class EchoHandler(EventHandler):
+        def handle(self, event, context):
+            return EventResult.business_result(event.event_id, True, event.event_data)
+
+    return EchoHandler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_return_future_resolves_thread_event(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish(return_future=True) returns future resolved by worker thread."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_future import EventFuture
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    event: Event = Event("test_event", event_data="payload")
+
+    # ACT
+    future = bus.publish(event, return_future=True)
+
+    # ASSERT
+    assert isinstance(future, EventFuture)
+    assert future.event_id == event.event_id
+    result = future.result(timeout=5)
+    assert result.success is True
+    assert result.data == "payload"
+    # Future results bypass the result cache
+    assert event.event_id not in bus._result_store
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_return_future_resolves_sync_event_immediately(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test SYNC event future is already resolved when publish() returns."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT
+    future = bus.publish(Event("test_event", EXECUTION_MODE_SYNC, event_data=7), return_future=True)
+
+    # ASSERT
+    assert future.done()
+    assert future.result().data == 7
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_many_return_futures_with_as_completed(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish_many(return_futures=True) futures can be consumed via as_completed()."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 4
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events: List[Event] = [Event("test_event", event_data=i) for i in range(20)]
+
+    # ACT
+    futures = bus.publish_many(events, return_futures=True)
+    values: List[int] = [future.result().data for future in bus.as_completed(futures, timeout=10)]
+
+    # ASSERT
+    assert sorted(values) == list(range(20))
+    assert not bus._futures
+
+
+# -------------------------------------------------------------
+# TESTS: EXECUTION_MODE_ASYNC - Event Loop Execution
+# -------------------------------------------------------------
+
+
+def _make_async_sleep_handler(delay: float):
+    import asyncio
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class AsyncSleepHandler(EventHandler):
+        async def handle(self, event, context):
+            await asyncio.sleep(delay)
+            return EventResult.business_result(event.event_id, True, event.event_data)
+
+    return AsyncSleepHandler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_async_events_run_concurrently_on_event_loop(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test ASYNC coroutine handlers run concurrently independent of num_threads."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_ASYNC
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_async_sleep_handler(0.2) if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    events: List[Event] = [Event("test_event", EXECUTION_MODE_ASYNC, event_data=i) for i in range(100)]
+
+    # ACT
+    start: float = time.monotonic()
+    event_ids: List[str] = bus.publish_many(events)
+    bus.join()
+    elapsed: float = time.monotonic() - start
+    results = bus.get_results(event_ids, join_before=False)
+    bus.shutdown()
+
+    # ASSERT
+    assert len(results) == 100
+    assert all(result.success for result in results.values())
+    assert elapsed < 5.0  # 100 x 0.2s sequentially would take 20s
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_publish_async_returns_event_result(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test await publish_async() returns the EventResult of the event."""
+    # ARRANGE
+    import asyncio
+    from basefunctions.events.event import Event, EXECUTION_MODE_ASYNC
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_async_sleep_handler(0.01) if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    async def caller():
+        events = [Event("test_event", EXECUTION_MODE_ASYNC, event_data=i) for i in range(5)]
+        return await asyncio.gather(*(bus.publish_async(event) for event in events))
+
+    # ACT
+    results = asyncio.run(caller())
+    bus.shutdown()
+
+    # ASSERT
+    assert [result.data for result in results] == [0, 1, 2, 3, 4]
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_async_event_with_sync_handler_runs_in_executor(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test regular handlers in ASYNC mode are executed off the event loop thread."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_ASYNC
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class ThreadNameHandler(EventHandler):
+        def handle(self, event, context):
+            return EventResult.business_result(event.event_id, True, threading.current_thread().name)
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: ThreadNameHandler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT
+    future = bus.publish(Event("test_event", EXECUTION_MODE_ASYNC), return_future=True)
+    result = future.result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert result.success is True
+    assert result.data != "EventBusAsyncLoop"
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_async_event_timeout_returns_timeout_exception_result(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:  # CRITICAL TEST
+    """Test ASYNC coroutine exceeding its timeout is cancelled and reported as TimeoutError."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_ASYNC
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_async_sleep_handler(5) if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    event: Event = Event("test_event", EXECUTION_MODE_ASYNC, timeout=0.1, max_retries=2)
+
+    # ACT
+    result = bus.publish(event, return_future=True).result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert result.success is False
+    assert isinstance(result.exception, TimeoutError)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_async_event_sync_handler_timeout_does_not_retry_running_thread(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a timed-out regular handler in ASYNC mode is not started again while its thread still runs."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_ASYNC
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    calls: List[int] = []
+
+    class SlowHandler(EventHandler):
+        def handle(self, event, context):
+            calls.append(1)
+            time.sleep(0.5)
+            return EventResult.business_result(event.event_id, True, None)
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        SlowHandler() if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    event: Event = Event("test_event", EXECUTION_MODE_ASYNC, timeout=0.1, max_retries=3)
+
+    # ACT
+    result = bus.publish(event, return_future=True).result(timeout=5)
+    time.sleep(0.6)
+    bus.shutdown()
+
+    # ASSERT
+    assert isinstance(result.exception, TimeoutError)
+    assert len(calls) == 1
+
+
+# -------------------------------------------------------------
+# TESTS: cancel - Cooperative Cancellation
+# -------------------------------------------------------------
+
+
+def _make_cooperative_handler(started: threading.Event, calls: List[int]) -> Any:
+    """Create a handler that polls context.check_cancelled() until cancelled."""
+    from basefunctions.events.event_handler import EventHandler
+
+    class CooperativeHandler(EventHandler):
+        def handle(self, event, context):
+            calls.append(1)
+            started.set()
+            while True:
+                context.check_cancelled()
+                time.sleep(0.01)
+
+    return CooperativeHandler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_cancel_stops_running_cooperative_handler_without_retry(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test cancel() ends a running handler that checks its context and skips retries."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventCancelledError
+
+    started: threading.Event = threading.Event()
+    calls: List[int] = []
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_cooperative_handler(started, calls) if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    event: Event = Event("test_event", timeout=30, max_retries=3)
+    future = bus.publish(event, return_future=True)
+    assert started.wait(timeout=5)
+
+    # ACT
+    cancelled: bool = bus.cancel(event.event_id)
+    result = future.result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert cancelled is True
+    assert result.success is False
+    assert isinstance(result.exception, EventCancelledError)
+    assert len(calls) == 1
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_cancel_drops_queued_event(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a cancelled event waiting in the queue never reaches its handler."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventCancelledError
+
+    started: threading.Event = threading.Event()
+    calls: List[int] = []
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_cooperative_handler(started, calls) if event_type == "test_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    blocking: Event = Event("test_event", timeout=30)
+    queued: Event = Event("test_event", timeout=30)
+    blocking_future = bus.publish(blocking, return_future=True)
+    assert started.wait(timeout=5)
+    queued_future = bus.publish(queued, return_future=True)
+
+    # ACT
+    cancelled: bool = bus.cancel(queued.event_id)
+    bus.cancel(blocking.event_id)
+    blocking_future.result(timeout=5)
+    result = queued_future.result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert cancelled is True
+    assert isinstance(result.exception, EventCancelledError)
+    assert len(calls) == 1
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_cancel_unknown_event_returns_false(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test cancel() reports False for unknown or completed events."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    event: Event = Event("test_event")
+    bus.publish(event, return_future=True).result(timeout=5)
+
+    # ACT
+    unknown: bool = bus.cancel("no-such-event")
+    completed: bool = bus.cancel(event.event_id)
+    bus.shutdown()
+
+    # ASSERT
+    assert unknown is False
+    assert completed is False
+
+
+# -------------------------------------------------------------
+# TESTS: max_queue_size - Bounded Input Queue
+# -------------------------------------------------------------
+
+
+def _make_gate_handler(started: threading.Event, gate: threading.Event) -> Any:
+    """Create a handler that blocks its worker thread until gate is set."""
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class GateHandler(EventHandler):
+        def handle(self, event, context):
+            started.set()
+            gate.wait(timeout=10)
+            return EventResult.business_result(event.event_id, True, event.event_data)
+
+    return GateHandler()
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"max_queue_size": 0}, "max_queue_size must be positive"),
+        ({"queue_policy": "drop_random"}, "queue_policy must be one of"),
+        ({"queue_timeout": -1}, "queue_timeout must not be negative"),
+        ({"queue_aging": 0}, "queue_aging must be positive"),
+    ],
+)
+def test_init_rejects_invalid_queue_settings(
+    kwargs: Dict[str, Any], message: str, reset_event_bus_singleton: None
+) -> None:
+    """Test EventBus validates max_queue_size, queue_policy and queue_timeout."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match=message):
+        EventBus(**kwargs)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_bounded_queue_reject_policy_raises_and_unregisters(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() raises EventQueueFullError and leaves no result placeholder."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventQueueFullError
+
+    started, gate = threading.Event(), threading.Event()
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_gate_handler(started, gate)
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(max_queue_size=2, queue_policy="reject")
+    bus.publish(Event("test_event"))
+    assert started.wait(timeout=5)
+    bus.publish(Event("test_event"))
+    bus.publish(Event("test_event"))
+    rejected: Event = Event("test_event")
+
+    # ACT
+    with pytest.raises(EventQueueFullError):
+        bus.publish(rejected)
+    metrics = bus.get_queue_metrics()
+    gate.set()
+    bus.join()
+    results = bus.get_results(None)
+    bus.shutdown()
+
+    # ASSERT
+    assert metrics["rejected"] == 1
+    assert metrics["size"] == 2
+    assert rejected.event_id not in results
+    assert len(results) == 3
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_bounded_queue_drop_lowest_completes_evicted_event(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test the evicted event's future resolves with EventQueueFullError."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventQueueFullError
+
+    started, gate = threading.Event(), threading.Event()
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_gate_handler(started, gate)
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(max_queue_size=1, queue_policy="drop_lowest")
+    bus.publish(Event("test_event"))
+    assert started.wait(timeout=5)
+    low_future = bus.publish(Event("test_event", priority=9), return_future=True)
+
+    # ACT
+    high_future = bus.publish(Event("test_event", priority=1, event_data="high"), return_future=True)
+    low_result = low_future.result(timeout=5)
+    gate.set()
+    high_result = high_future.result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert isinstance(low_result.exception, EventQueueFullError)
+    assert high_result.data == "high"
+
+
+@pytest.mark.parametrize("policy", ["block", "reject", "drop_lowest", "drop_oldest"])
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_rate_limited_backlog_counts_against_queue_bound(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    policy: str,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test rate-limited events waiting for a token hold a queue slot and are forwarded without blocking."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventQueueFullError
+
+    started, gate = threading.Event(), threading.Event()
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_gate_handler(started, gate)
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(max_queue_size=3, queue_policy=policy, queue_timeout=0.05)
+    bus.register_rate_limit("rl_event", 5)
+    bus.publish(Event("test_event"))
+    assert started.wait(timeout=5)
+    futures: List[Any] = []
+    rejected: int = 0
+
+    # ACT
+    for _ in range(8):
+        try:
+            futures.append(bus.publish(Event("rl_event"), return_future=True))
+        except EventQueueFullError:
+            rejected += 1
+    metrics: Dict[str, Any] = bus.get_queue_metrics()
+    gate.set()
+    bus.join()
+    results = [future.result(timeout=5) for future in futures]
+    bus.shutdown()
+
+    # ASSERT
+    assert metrics["size"] + metrics["reserved"] == 3
+    dropped: int = sum(isinstance(result.exception, EventQueueFullError) for result in results)
+    assert rejected + dropped == 5
+    assert sum(result.success for result in results) == 3
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_queue_watermarks_signal_producers(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test water-mark callbacks fire while the queue fills and drains."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    started, gate = threading.Event(), threading.Event()
+    signals: List[str] = []
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_gate_handler(started, gate)
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.set_queue_watermarks(
+        3, 1, on_high=lambda size: signals.append("high"), on_low=lambda size: signals.append("low")
+    )
+    bus.publish(Event("test_event"))
+    assert started.wait(timeout=5)
+
+    # ACT
+    bus.publish_many([Event("test_event") for _ in range(3)])
+    high_signals = list(signals)
+    gate.set()
+    bus.join()
+    bus.shutdown()
+
+    # ASSERT
+    assert high_signals == ["high"]
+    assert signals == ["high", "low"]
+
+
+# -------------------------------------------------------------
+# TESTS: max_threads - Autoscaling Worker Pool
+# -------------------------------------------------------------
+
+
+def _wait_until(condition, timeout: float = 10.0) -> bool:
+    """Poll condition until it is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"min_threads": 2}, "min_threads requires max_threads"),
+        ({"min_threads": 4, "max_threads": 2}, "max_threads must be >= min_threads"),
+        ({"num_threads": 8, "max_threads": 4}, "num_threads must be between"),
+        ({"max_threads": 4, "scale_cooldown": -1}, "scale_cooldown must not be negative"),
+    ],
+)
+def test_init_rejects_invalid_autoscale_settings(
+    kwargs: Dict[str, Any], message: str, reset_event_bus_singleton: None
+) -> None:
+    """Test EventBus validates autoscaling bounds."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match=message):
+        EventBus(**kwargs)
+
+
+@patch("psutil.cpu_count")
+def test_autoscale_metrics_disabled_by_default(mock_cpu_count: Mock, reset_event_bus_singleton: None) -> None:
+    """Test a static pool reports autoscaling as disabled."""
+    # ARRANGE
+    mock_cpu_count.return_value = 2
+    bus: EventBus = EventBus()
+
+    # ACT
+    metrics = bus.get_autoscale_metrics()
+    bus.shutdown()
+
+    # ASSERT
+    assert metrics == {"enabled": False, "threads": 2}
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_autoscaled_pool_grows_under_load_and_shrinks_when_idle(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test queued work adds threads up to max_threads and idle threads retire to min_threads."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class SleepHandler(EventHandler):
+        def handle(self, event, context):
+            time.sleep(0.3)
+            return EventResult.business_result(event.event_id, True, None)
+
+    mock_cpu_count.return_value = 16
+    mock_event_factory.create_handler.side_effect = lambda event_type: SleepHandler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(min_threads=1, max_threads=4, scale_cooldown=0.5)
+    assert len(bus._worker_threads) == 1
+
+    # ACT
+    bus.publish_many([Event("test_event") for _ in range(20)])
+    grew: bool = _wait_until(lambda: bus.get_autoscale_metrics()["threads"] == 4)
+    bus.join()
+    EventBus()  # Singleton access must not resize an autoscaled pool
+    shrank: bool = _wait_until(lambda: bus.get_autoscale_metrics()["threads"] == 1)
+    metrics = bus.get_autoscale_metrics()
+    bus.shutdown()
+
+    # ASSERT
+    assert grew and shrank
+    assert len(bus._worker_threads) == 1
+    assert metrics["enabled"] is True
+    assert metrics["scale_ups"] >= 1 and metrics["scale_downs"] >= 1
+    assert {"grow", "shrink"} <= {decision["action"] for decision in metrics["decisions"]}
+
+
+# -------------------------------------------------------------
+# TESTS: register_concurrency_limit() - Bulkheads
+# -------------------------------------------------------------
+
+
+def _make_counting_gate_handler(state: Dict[str, int], lock: threading.Lock, gate: threading.Event) -> Any:
+    """Create a handler that records its peak concurrency and blocks until gate is set."""
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class CountingGateHandler(EventHandler):
+        def handle(self, event, context):
+            with lock:
+                state["running"] += 1
+                state["started"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            gate.wait(timeout=10)
+            with lock:
+                state["running"] -= 1
+            return EventResult.business_result(event.event_id, True, event.event_data)
+
+    return CountingGateHandler()
+
+
+@patch("psutil.cpu_count")
+def test_register_concurrency_limit_validates_arguments(
+    mock_cpu_count: Mock, reset_event_bus_singleton: None
+) -> None:
+    """Test non-positive limits and unknown event types are rejected."""
+    # ARRANGE
+    mock_cpu_count.return_value = 1
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="max_in_flight must be positive"):
+        bus.register_concurrency_limit("slow_event", 0)
+    with pytest.raises(ValueError, match="No concurrency limit"):
+        bus.get_concurrency_metrics("slow_event")
+    bus.shutdown()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_concurrency_limit_parks_events_and_keeps_workers_free(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a limited type never exceeds its limit while other types keep running."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    state: Dict[str, int] = {"running": 0, "started": 0, "peak": 0}
+    lock, gate = threading.Lock(), threading.Event()
+    mock_cpu_count.return_value = 3
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_counting_gate_handler(state, lock, gate) if event_type == "slow_event" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.register_concurrency_limit("slow_event", 1)
+    slow_futures = [bus.publish(Event("slow_event", event_data=i), return_future=True) for i in range(3)]
+
+    # ACT
+    parked: bool = _wait_until(lambda: bus.get_concurrency_metrics("slow_event")["parked"] == 2)
+    fast_result = bus.publish(Event("fast_event", event_data="fast"), return_future=True).result(timeout=5)
+    metrics = bus.get_concurrency_metrics("slow_event")
+    gate.set()
+    slow_results = [future.result(timeout=10) for future in slow_futures]
+    bus.join()
+    final = bus.get_concurrency_metrics("slow_event")
+    bus.shutdown()
+
+    # ASSERT
+    assert parked
+    assert fast_result.success and fast_result.data == "fast"
+    assert metrics == {"limit": 1, "in_flight": 1, "parked": 2}
+    assert all(result.success for result in slow_results)
+    assert state["peak"] == 1 and state["started"] == 3
+    assert final == {"limit": 1, "in_flight": 0, "parked": 0}
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_raising_concurrency_limit_releases_parked_events(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test parked events start once the limit is raised."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    state: Dict[str, int] = {"running": 0, "started": 0, "peak": 0}
+    lock, gate = threading.Lock(), threading.Event()
+    mock_cpu_count.return_value = 3
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_counting_gate_handler(state, lock, gate)
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.register_concurrency_limit("slow_event", 1)
+    bus.publish_many([Event("slow_event") for _ in range(3)])
+    assert _wait_until(lambda: bus.get_concurrency_metrics("slow_event")["parked"] == 2)
+
+    # ACT
+    bus.register_concurrency_limit("slow_event", 3)
+    all_started: bool = _wait_until(lambda: state["started"] == 3)
+    gate.set()
+    bus.join()
+    bus.shutdown()
+
+    # ASSERT
+    assert all_started
+    assert state["peak"] == 3
+
+
+# -------------------------------------------------------------
+# TESTS: BatchEventHandler - Coalescing
+# -------------------------------------------------------------
+
+
+def _make_recording_batch_handler(calls: List[List[Any]], batch_size: int, fail_once: Any = None) -> Any:
+    """Create a batch handler recording the event_data of each call; fail_once fails one item once."""
+    from basefunctions.events.event_handler import BatchEventHandler, EventResult
+
+    class RecordingBatchHandler(BatchEventHandler):
+        max_batch_size = batch_size
+
+        def handle_batch(self, events, context):
+            calls.append([event.event_data for event in events])
+            failed = fail_once if len(calls) == 1 else None
+            return [
+                EventResult.business_result(event.event_id, event.event_data != failed, event.event_data)
+                for event in events
+            ]
+
+    return RecordingBatchHandler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_batch_handler_receives_queued_events_in_batches(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test queued events of a batch handler type are coalesced up to max_batch_size in priority order."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    calls: List[List[Any]] = []
+    started, gate = threading.Event(), threading.Event()
+    batch_handler = _make_recording_batch_handler(calls, 3)
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: {
+        "gate_event": _make_gate_handler(started, gate),
+        "batch_event": batch_handler,
+    }.get(event_type) or _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.publish(Event("gate_event"))
+    assert started.wait(timeout=5)
+    futures = [
+        bus.publish(Event("batch_event", priority=p, event_data=p), return_future=True) for p in (5, 1, 4, 2, 3)
+    ]
+
+    # ACT
+    gate.set()
+    results = [future.result(timeout=5) for future in futures]
+    bus.shutdown()
+
+    # ASSERT
+    assert calls == [[1, 2, 3], [4, 5]]
+    assert [result.data for result in results] == [5, 1, 4, 2, 3]
+    assert [result.event_id for result in results] == [future.event_id for future in futures]
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_batch_handler_retries_failed_events_individually(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test only the failed event of a batch is retried."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    calls: List[List[Any]] = []
+    started, gate = threading.Event(), threading.Event()
+    batch_handler = _make_recording_batch_handler(calls, 10, fail_once="flaky")
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: {
+        "gate_event": _make_gate_handler(started, gate),
+        "batch_event": batch_handler,
+    }.get(event_type) or _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.publish(Event("gate_event"))
+    assert started.wait(timeout=5)
+    futures = [bus.publish(Event("batch_event", event_data=data), return_future=True) for data in ("a", "flaky", "b")]
+
+    # ACT
+    gate.set()
+    results = [future.result(timeout=5) for future in futures]
+    bus.shutdown()
+
+    # ASSERT
+    assert calls == [["a", "flaky", "b"], ["flaky"]]
+    assert all(result.success for result in results)
+
+
+# -------------------------------------------------------------
+# TESTS: map() - Chunked Streaming
+# -------------------------------------------------------------
+
+
+def _make_square_handler() -> Any:
+    """Create a handler squaring event_data; negative inputs raise."""
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class SquareHandler(EventHandler):
+        def handle(self, event, context):
+            if event.event_data < 0:
+                raise ValueError("negative input")
+            return EventResult.business_result(event.event_id, True, event.event_data**2)
+
+    return SquareHandler()
+
+
+def _map_handler_factory(event_type: str) -> Any:
+    from basefunctions.events.event_handler import MapChunkHandler
+
+    return MapChunkHandler() if event_type == "_map_chunk" else _make_square_handler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_map_streams_results_in_input_order(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test map() chunks inputs, keeps the window bounded and yields results in input order."""
+    # ARRANGE
+    from basefunctions.events.event import EXECUTION_MODE_THREAD
+
+    consumed: List[int] = []
+
+    def inputs():
+        for value in range(20):
+            consumed.append(value)
+            yield value
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = _map_handler_factory
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT
+    results = bus.map("square", inputs(), chunksize=3, mode=EXECUTION_MODE_THREAD, window=2)
+    first = next(results)
+    consumed_after_first: int = len(consumed)
+    rest = list(results)
+    bus.shutdown()
+
+    # ASSERT
+    assert consumed_after_first <= 9  # two chunks in flight plus the refill
+    assert [result.data for result in [first, *rest]] == [value**2 for value in range(20)]
+    assert all(result.success for result in rest)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_map_unordered_reports_failed_inputs_individually(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test map(ordered=False) yields every result and isolates failing inputs."""
+    # ARRANGE
+    from basefunctions.events.event import EXECUTION_MODE_THREAD
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = _map_handler_factory
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT
+    results = list(bus.map("square", [1, -1, 2, 3, -2], chunksize=2, ordered=False, mode=EXECUTION_MODE_THREAD))
+    bus.shutdown()
+
+    # ASSERT
+    assert sorted(result.data for result in results if result.success) == [1, 4, 9]
+    failed = [result for result in results if not result.success]
+    assert len(failed) == 2
+    assert all(isinstance(result.exception, ValueError) for result in failed)
+
+
+@patch("basefunctions.events.event_bus.CoreletPool")
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_map_corelet_mode_sends_chunks_with_handler_meta(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_pool_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test map() in corelet mode sends one chunk event per chunk carrying the mapped handler's meta."""
+    # ARRANGE
+    from basefunctions.events.event_context import EventContext
+    from basefunctions.events.event_handler import MapChunkHandler
+
+    meta: Dict[str, str] = {"module_path": "handlers", "class_name": "SquareHandler", "event_type": "square"}
+    pool: Mock = Mock(size=2)
+    pool.submit.side_effect = lambda event, callback: callback(MapChunkHandler().handle(event, EventContext()))
+    mock_pool_class.return_value = pool
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = _map_handler_factory
+    mock_event_factory.get_handler_meta.return_value = meta
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(corelet_pool_size=2)
+
+    # ACT
+    results = list(bus.map("square", range(10), chunksize=4))
+    bus.shutdown()
+
+    # ASSERT
+    assert [result.data for result in results] == [value**2 for value in range(10)]
+    chunks = [call.args[0] for call in pool.submit.call_args_list]
+    assert [len(chunk.event_data[2]) for chunk in chunks] == [4, 4, 2]
+    assert all(chunk.corelet_meta == meta for chunk in chunks)
+
+
+@pytest.mark.parametrize(
+    "kwargs, message",
+    [
+        ({"chunksize": 0}, "chunksize must be positive"),
+        ({"window": 0}, "window must be positive"),
+        ({"max_retries": 0}, "max_retries must be at least 1"),
+        ({"mode": "sync"}, "map\\(\\) supports thread and corelet mode"),
+    ],
+)
+@patch("psutil.cpu_count")
+def test_map_rejects_invalid_arguments(
+    mock_cpu_count: Mock, kwargs: Dict[str, Any], message: str, reset_event_bus_singleton: None
+) -> None:
+    """Test map() validates its arguments eagerly."""
+    # ARRANGE
+    mock_cpu_count.return_value = 1
+    bus: EventBus = EventBus()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match=message):
+        bus.map("square", range(3), **kwargs)
+    bus.shutdown()
+
+
+# -------------------------------------------------------------
+# TESTS: depends_on - Dependency-Aware Publishing
+# -------------------------------------------------------------
+
+
+def _make_failing_handler(calls: List[str]) -> Any:
+    """Create a handler that records its calls and always raises."""
+    from basefunctions.events.event_handler import EventHandler
+
+    class FailingHandler(EventHandler):
+        def handle(self, event, context):
+            calls.append(event.event_type)
+            raise RuntimeError("upstream failed")
+
+    return FailingHandler()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_dependent_event_runs_after_upstream_with_injected_results(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a dependent event is held until its upstream completes and gets its result data."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    started: threading.Event = threading.Event()
+    gate: threading.Event = threading.Event()
+    handlers: Dict[str, Any] = {"download": _make_gate_handler(started, gate)}
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: handlers.get(event_type, _make_echo_handler())
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+
+    # ACT
+    download = bus.publish(Event("download", event_data="page"), return_future=True)
+    parse = bus.publish(
+        Event("parse", event_data={"format": "html"}, depends_on=[download], inject_results=True),
+        return_future=True,
+    )
+    assert started.wait(timeout=5)
+    held: bool = not parse.done() and parse.event_id in bus._waiting_events
+    gate.set()
+    result = parse.result(timeout=5)
+    bus.join()
+    bus.shutdown()
+
+    # ASSERT
+    assert held is True
+    assert result.success is True
+    assert result.data == {"format": "html", "upstream_results": ["page"]}
+    assert bus._dependents == {} and bus._waiting_events == {}
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_dependent_events_are_skipped_when_upstream_fails(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a failed upstream skips its dependents transitively and join() waits for them."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventDependencyError
+
+    calls: List[str] = []
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_failing_handler(calls) if event_type in ("fetch", "parse") else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    fetch: Event = Event("fetch", max_retries=1)
+    parse: Event = Event("parse", depends_on=[fetch.event_id])
+    persist: Event = Event("persist", depends_on=[parse.event_id])
+
+    # ACT
+    event_ids: List[str] = bus.publish_many([fetch, parse, persist])
+    results = bus.get_results(event_ids)
+    bus.shutdown()
+
+    # ASSERT
+    assert calls == ["fetch"]
+    assert isinstance(results[fetch.event_id].exception, RuntimeError)
+    assert isinstance(results[parse.event_id].exception, EventDependencyError)
+    assert isinstance(results[persist.event_id].exception, EventDependencyError)
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_dependencies_on_completed_and_unknown_events_resolve_at_publish(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test completed upstream events release a dependent at once and unknown ones skip it."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+    from basefunctions.events.event_exceptions import EventDependencyError, InvalidEventError
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    cached_id: str = bus.publish(Event("load", EXECUTION_MODE_SYNC, event_data=1))
+    future = bus.publish(Event("load", EXECUTION_MODE_SYNC, event_data=2), return_future=True)
+    own: Event = Event("combine")
+    own.depends_on = [own.event_id]
+
+    # ACT
+    combined = bus.publish(
+        Event("combine", depends_on=[cached_id, future], inject_results=True),
+        return_future=True,
+    )
+    orphan = bus.publish(Event("combine", depends_on=["unknown-id"]), return_future=True)
+
+    # ASSERT
+    assert combined.result(timeout=5).data == {"upstream_results": [1, 2]}
+    assert isinstance(orphan.result(timeout=5).exception, EventDependencyError)
+    with pytest.raises(InvalidEventError, match="cannot depend on itself"):
+        bus.publish(own)
+    bus.shutdown()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_sync_event_with_dependencies_is_rejected(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test publish() and publish_many() reject SYNC events with depends_on before registering anything."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    upstream = bus.publish(Event("load", event_data=1), return_future=True)
+    dependent: Event = Event("combine", EXECUTION_MODE_SYNC, depends_on=[upstream])
+
+    # ACT / ASSERT
+    with pytest.raises(ValueError, match="depends_on is not supported for sync events"):
+        bus.publish(dependent)
+    with pytest.raises(ValueError, match="depends_on is not supported for sync events"):
+        bus.publish_many([Event("load"), dependent])
+    bus.join()
+    assert dependent.event_id not in bus.get_results(None, join_before=False)
+    bus.shutdown()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_cancel_completes_held_dependent_immediately(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test cancel() completes a held dependent without waiting for its upstream."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventCancelledError
+
+    started: threading.Event = threading.Event()
+    gate: threading.Event = threading.Event()
+    handlers: Dict[str, Any] = {"download": _make_gate_handler(started, gate)}
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: handlers.get(event_type, _make_echo_handler())
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    download = bus.publish(Event("download"), return_future=True)
+    parse = bus.publish(Event("parse", depends_on=[download]), return_future=True)
+
+    # ACT
+    cancelled: bool = bus.cancel(parse.event_id)
+    result = parse.result(timeout=5)
+    gate.set()
+    bus.join()
+    bus.shutdown()
+
+    # ASSERT
+    assert cancelled is True
+    assert isinstance(result.exception, EventCancelledError)
+    assert download.result(timeout=5).success is True
+    assert bus._dependents == {}
+
+
+# -------------------------------------------------------------
+# TESTS: group() - Scoped Join
+# -------------------------------------------------------------
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_group_join_does_not_wait_for_other_events(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a group joins its own events while another event keeps the bus busy."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+
+    started: threading.Event = threading.Event()
+    gate: threading.Event = threading.Event()
+    handlers: Dict[str, Any] = {"slow": _make_gate_handler(started, gate)}
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: handlers.get(event_type, _make_echo_handler())
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.publish(Event("slow"))
+    assert started.wait(timeout=5)
+
+    # ACT
+    with bus.group() as group:
+        event_id: str = group.publish(Event("fast", event_data="mine"))
+        joined: bool = group.join(timeout=5)
+    slow_pending: bool = not gate.is_set()
+    gate.set()
+    bus.join()
+    bus.shutdown()
+
+    # ASSERT
+    assert joined is True and slow_pending is True
+    assert group.get_results()[event_id].data == "mine"
+    assert event_id not in bus._result_store
+
+
+# -------------------------------------------------------------
+# TESTS: delay / publish_at / schedule_every - Timed Publishing
+# -------------------------------------------------------------
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_delayed_event_is_routed_after_delay_and_joined(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a delayed event is held back until its delay expired and join() waits for it."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    start: float = time.monotonic()
+
+    # ACT
+    delayed = bus.publish(Event("echo", event_data="later"), return_future=True, delay=0.2)
+    pending: bool = not delayed.done()
+    past_id: str = bus.publish_at(Event("echo", event_data="now"), time.time() - 10)
+    bus.join()
+    elapsed: float = time.monotonic() - start
+
+    # ASSERT
+    assert pending is True
+    assert delayed.result(timeout=0).data == "later"
+    assert elapsed >= 0.15
+    assert bus.get_results([past_id], join_before=False)[past_id].data == "now"
+    with pytest.raises(ValueError, match="delay must not be negative"):
+        bus.publish(Event("echo"), delay=-1)
+    with pytest.raises(ValueError, match="not supported for sync events"):
+        bus.publish(Event("echo", EXECUTION_MODE_SYNC), delay=1)
+    bus.shutdown()
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_cancel_and_shutdown_complete_pending_delayed_events(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test cancel() and shutdown() complete delayed events at once instead of waiting for them."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventCancelledError
+
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    first = bus.publish(Event("echo"), return_future=True, delay=60)
+    second = bus.publish(Event("echo"), return_future=True, delay=60)
+
+    # ACT
+    cancelled: bool = bus.cancel(first.event_id)
+    first_result = first.result(timeout=5)
+    bus.shutdown()
+
+    # ASSERT
+    assert cancelled is True
+    assert isinstance(first_result.exception, EventCancelledError)
+    assert isinstance(second.result(timeout=0).exception, EventCancelledError)
+    assert bus._delayed_events == {}
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_delayed_release_does_not_block_sync_handler_timeout(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test a delay expiring during a SYNC handler does not stall the scheduler thread enforcing its timeout."""
+    # ARRANGE
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    class SlowSyncHandler(EventHandler):
+        def handle(self, event, context):
+            deadline: float = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                time.sleep(0.01)
+            return EventResult.business_result(event.event_id, True, None)
+
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        SlowSyncHandler() if event_type == "slow_sync" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    delayed = bus.publish(Event("echo", event_data="later"), return_future=True, delay=0.05)
+    start: float = time.monotonic()
+
+    # ACT
+    sync_id: str = bus.publish(Event("slow_sync", EXECUTION_MODE_SYNC, timeout=0.3, max_retries=1))
+    elapsed: float = time.monotonic() - start
+    sync_result = bus.get_results([sync_id], join_before=False)[sync_id]
+    bus.shutdown()
+
+    # ASSERT
+    assert elapsed < 3
+    assert sync_result.success is False
+    assert delayed.result(timeout=5).data == "later"
+
+
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_schedule_every_publishes_until_cancelled(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
-    mock_sync_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() returns event_id for synchronous event."""
+    """Test schedule_every() publishes fresh events at its interval and stops on cancel()."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
-    mock_factory_class.return_value = mock_event_factory
-
-    # Create a mock handler that will be returned by the factory
-    from basefunctions.events.event_handler import EventHandler
-
-    mock_handler: Mock = Mock(spec=EventHandler)
-    mock_result: Mock = Mock()
-    mock_result.success = True
-    mock_result.event_id = "test_sync_event"
-    mock_handler.handle.return_value = mock_result
-    mock_event_factory.create_handler.return_value = mock_handler
+    from basefunctions.events.event import Event
 
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
     bus: EventBus = EventBus()
+    counter: List[int] = []
+    results: List[Any] = []
+
+    def make_event() -> Event:
+        counter.append(len(counter))
+        return Event("kpi", event_data=counter[-1])
 
     # ACT
-    event_id: str = bus.publish(mock_sync_event)
+    schedule = bus.schedule_every(make_event, interval=0.05, start_delay=0, on_result=results.append)
+    assert _wait_until(lambda: len(results) >= 3)
+    stopped: bool = schedule.cancel()
+    time.sleep(0.1)
+    bus.join()
+    runs: int = schedule.runs
+    time.sleep(0.15)
 
     # ASSERT
-    assert event_id == mock_sync_event.event_id
-    # Verify the event was processed (result should be in output queue)
-    assert mock_handler.handle.called
+    assert stopped is True and schedule.cancel() is False
+    assert schedule.runs == runs == len(counter)
+    assert [result.data for result in results][:3] == [0, 1, 2]
+    assert all(result.event_id not in bus._result_store for result in results)
+    with pytest.raises(ValueError, match="interval must be positive"):
+        bus.schedule_every(make_event, interval=0)
+    bus.shutdown()
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_publish_thread_event_queues_event_correctly(
+def test_retry_backoff_requeues_failed_event_and_frees_worker(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() queues thread event to input queue."""
+    """Test a failed attempt is retried after its backoff while the only worker serves other events."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_handler import EventHandler, EventResult
+
+    calls: List[float] = []
+    order: List[str] = []
+
+    class FlakyHandler(EventHandler):
+        def handle(self, event, context):
+            calls.append(time.monotonic())
+            if len(calls) < 3:
+                raise RuntimeError("temporary failure")
+            order.append("flaky")
+            return EventResult.business_result(event.event_id, True, "recovered")
+
+    class RecordingHandler(EventHandler):
+        def handle(self, event, context):
+            order.append("fast")
+            return EventResult.business_result(event.event_id, True, None)
+
+    handlers: Dict[str, Any] = {"flaky": FlakyHandler(), "fast": RecordingHandler()}
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: handlers[event_type]
     mock_factory_class.return_value = mock_event_factory
-
     bus: EventBus = EventBus()
+    bus.register_retry_backoff("flaky", base_delay=0.1, jitter=False)
 
     # ACT
-    event_id: str = bus.publish(mock_event)
+    flaky = bus.publish(Event("flaky", max_retries=3), return_future=True)
+    assert _wait_until(lambda: len(calls) == 1)
+    bus.publish(Event("fast"))
+    result = flaky.result(timeout=5)
+    bus.join()
+    bus.shutdown()
 
     # ASSERT
-    assert event_id == mock_event.event_id
-    # Verify the event was queued (event_id should be in result_list)
-    assert event_id in bus._result_list
+    assert result.success is True and result.data == "recovered"
+    assert order == ["fast", "flaky"]
+    assert calls[1] - calls[0] >= 0.09 and calls[2] - calls[1] >= 0.19
+    assert bus._retry_attempts == {}
+    with pytest.raises(ValueError, match="max_delay must be >= base_delay"):
+        bus.register_retry_backoff("flaky", base_delay=2, max_delay=1)
+
+
+# -------------------------------------------------------------
+# TESTS: store_result / result_ttl - Result Retention
+# -------------------------------------------------------------
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_publish_increments_event_counter(
+def test_publish_without_store_result_keeps_nothing(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() increments internal event counter."""
+    """Test store_result=False events are joined and release dependents, but leave no result behind."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
-    mock_factory_class.return_value = mock_event_factory
+    from basefunctions.events.event import Event
 
+    started: threading.Event = threading.Event()
+    gate: threading.Event = threading.Event()
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_gate_handler(started, gate) if event_type == "gate" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
     bus: EventBus = EventBus()
-    initial_counter: int = bus._event_counter
 
     # ACT
-    bus.publish(mock_event)
+    gated_id: str = bus.publish(Event("gate"), store_result=False)
+    bulk_ids: List[str] = bus.publish_many([Event("echo") for _ in range(3)], store_result=False)
+    dependent = bus.publish(Event("echo", depends_on=[gated_id]), return_future=True)
+    assert started.wait(timeout=5)
+    pending: bool = dependent.done()
+    gate.set()
+    bus.join()
 
     # ASSERT
-    # Counter is incremented twice: once in publish() and once in _handle_thread_and_corelet_event()
-    assert bus._event_counter == initial_counter + 2
+    assert pending is False
+    assert dependent.result(timeout=0).success is True
+    assert bus.get_results(join_before=False) == {}
+    assert bus.get_results([gated_id, *bulk_ids], join_before=False) == {}
+    assert bus._futures == {}
+    assert bus.cancel(gated_id) is False
+    bus.shutdown()
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_publish_registers_result_in_cache(
+def test_results_expire_after_result_ttl(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() registers event_id in result cache."""
+    """Test results expire after the bus result_ttl unless published with a longer one."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
-    mock_factory_class.return_value = mock_event_factory
+    from basefunctions.events.event import Event
 
-    bus: EventBus = EventBus()
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus(result_ttl=0.1)
 
     # ACT
-    event_id: str = bus.publish(mock_event)
+    short_id: str = bus.publish(Event("echo"))
+    long_id: str = bus.publish(Event("echo"), result_ttl=60)
+    bus.join()
+    before: set = set(bus.get_results(join_before=False))
+    time.sleep(0.2)
+    after: set = set(bus.get_results(join_before=False))
 
     # ASSERT
-    assert event_id in bus._result_list
-    assert bus._result_list[event_id] is None
+    assert {short_id, long_id} <= before
+    assert long_id in after and short_id not in after
+    with pytest.raises(ValueError, match="result_ttl must be positive"):
+        bus.publish(Event("echo"), result_ttl=0)
+    bus.shutdown()
 
 
 # -------------------------------------------------------------
-# TESTS: publish() - Error Handling CRITICAL
+# TESTS: enable_metrics() - Instrumentation
 # -------------------------------------------------------------
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
 @patch("psutil.cpu_count")
-def test_publish_raises_invalid_event_error_when_not_event_instance(
+def test_enable_metrics_collects_latencies_per_event_type(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() raises InvalidEventError when event is not Event instance."""
+) -> None:
+    """Test metrics cover only events completed while enabled, with queue waits, runs and retries."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
-    mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda msg: ValueError(msg)
+    from basefunctions.events.event import Event, EXECUTION_MODE_SYNC
 
+    calls: List[str] = []
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_failing_handler(calls) if event_type == "broken" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
     bus: EventBus = EventBus()
+    bus.publish(Event("echo"))
+    bus.join()
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="Invalid event type"):
-        bus.publish("not_an_event")
+    # ACT
+    bus.enable_metrics()
+    for _ in range(5):
+        bus.publish(Event("echo"))
+    bus.publish(Event("broken", max_retries=3))
+    bus.publish(Event("echo", EXECUTION_MODE_SYNC))
+    bus.join()
+    bus.enable_metrics(False)
+    bus.publish(Event("echo"))
+    bus.join()
+    metrics = bus.get_event_metrics().get_metrics()
+    bus.shutdown()
+
+    # ASSERT
+    assert metrics["echo"]["completed"] == 6
+    assert metrics["echo"]["queue_wait"]["count"] == 5
+    assert metrics["echo"]["execution"]["count"] == 6
+    assert metrics["echo"]["end_to_end"]["p99"] >= metrics["echo"]["execution"]["p50"]
+    assert (metrics["broken"]["failed"], metrics["broken"]["retries"]) == (1, 2)
+    assert bus._input_queue.wait_listener is None and bus._run_started == {}
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
 @patch("psutil.cpu_count")
-def test_publish_raises_invalid_event_error_when_event_id_missing(
+def test_enable_tracing_records_lifecycle_spans(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() raises InvalidEventError when event_id is missing."""
+) -> None:
+    """Test tracing records publish, wait and handler spans per event and stops when disabled."""
     # ARRANGE
     from basefunctions.events.event import Event
 
-    mock_cpu_count.return_value = 8
+    mock_cpu_count.return_value = 2
+    mock_event_factory.create_handler.side_effect = lambda event_type: _make_echo_handler()
     mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda msg: ValueError(msg)
-
     bus: EventBus = EventBus()
+    bus.register_rate_limit("limited", 1000, burst=10)
 
-    # Create event without event_id - use spec=Event to pass isinstance check
-    invalid_event: Mock = Mock(spec=Event)
-    invalid_event.event_id = None
-    invalid_event.event_type = "test"
-    invalid_event.event_exec_mode = "thread"
+    # ACT
+    bus.enable_tracing()
+    event_ids: List[str] = [bus.publish(Event("echo")) for _ in range(3)]
+    limited_id: str = bus.publish(Event("limited"))
+    bus.join()
+    bus.enable_tracing(False)
+    bus.publish(Event("echo"))
+    bus.join()
+    spans = bus.get_event_tracer().get_spans()
+    bus.shutdown()
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="Event must have a valid event_id"):
-        bus.publish(invalid_event)
+    # ASSERT
+    names_by_event: Dict[str, set] = {}
+    for name, _, duration, pid, _, event_id, _ in spans:
+        names_by_event.setdefault(event_id, set()).add(name)
+        assert pid == os.getpid() and duration >= 0
+    assert set(names_by_event) == {*event_ids, limited_id}
+    for event_id in event_ids:
+        assert names_by_event[event_id] == {"publish", "queue_wait", "handler"}
+    assert names_by_event[limited_id] == {"publish", "rate_limit_wait", "queue_wait", "handler"}
+    assert bus._input_queue.wait_listener is None and bus._run_started == {}
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
 @patch("psutil.cpu_count")
-def test_publish_raises_invalid_event_error_when_event_type_missing(
+def test_partition_key_runs_events_of_one_key_on_one_worker_in_order(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() raises InvalidEventError when event_type is missing."""
+) -> None:
+    """Test events with the same partition_key are handled by one worker thread in publish order."""
     # ARRANGE
+    import threading
+    import time
     from basefunctions.events.event import Event
+    from basefunctions.events.event_handler import EventHandler, EventResult
 
-    mock_cpu_count.return_value = 8
-    mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda msg: ValueError(msg)
+    runs: List[tuple] = []
 
+    class RecordingHandler(EventHandler):
+        def handle(self, event, context):
+            if event.event_type == "record":
+                time.sleep(0.001)
+                runs.append((event.partition_key, event.event_data, threading.get_ident()))
+            return EventResult.business_result(event.event_id, True, None)
+
+    mock_cpu_count.return_value = 4
+    mock_event_factory.create_handler.side_effect = lambda event_type: RecordingHandler()
+    mock_factory_class.return_value = mock_event_factory
     bus: EventBus = EventBus()
 
-    # Create event without event_type - use spec=Event to pass isinstance check
-    invalid_event: Mock = Mock(spec=Event)
-    invalid_event.event_id = "123"
-    invalid_event.event_type = None
-    invalid_event.event_exec_mode = "thread"
+    # ACT
+    for number in range(10):
+        for key in ("a", "b", "c", "d", "e"):
+            bus.publish(Event("record", event_data=number, partition_key=key))
+    bus.join()
+    partitioned: int = bus._input_queue.get_metrics()["partitioned"]
+    bus.shutdown()
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="Event must have a valid event_type"):
-        bus.publish(invalid_event)
+    # ASSERT
+    assert len(runs) == 50 and partitioned == 0
+    for key in ("a", "b", "c", "d", "e"):
+        key_runs = [(number, thread) for run_key, number, thread in runs if run_key == key]
+        assert [number for number, _ in key_runs] == list(range(10))
+        assert len({thread for _, thread in key_runs}) == 1
+    assert bus._input_queue._held_keys == {}
+
+
+# -------------------------------------------------------------
+# TESTS: corelet_pool_size - Pooled Corelet Execution
+# -------------------------------------------------------------
+
+
+def _make_immediate_pool() -> Mock:
+    from basefunctions.events.event_handler import EventResult
+
+    pool: Mock = Mock()
+    pool.submit.side_effect = lambda event, callback: callback(
+        EventResult.business_result(event.event_id, True, "pooled")
+    )
+    pool.get_corelet_count.return_value = 3
+    pool.get_metrics.return_value = {"size": 4, "corelets": 3, "busy": 1, "pending": 2}
+    return pool
 
 
+@patch("basefunctions.events.event_bus.CoreletPool")
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.NoHandlerAvailableError")
 @patch("psutil.cpu_count")
-def test_publish_raises_no_handler_available_error_when_handler_missing(
+def test_corelet_events_are_routed_to_corelet_pool(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
+    mock_pool_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() raises NoHandlerAvailableError when no handler registered."""
+) -> None:
+    """Test CORELET events bypass the worker threads when a corelet pool is configured."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
-    mock_event_factory.is_handler_available.return_value = False
-    mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda et: ValueError(f"No handler for {et}")
-
-    bus: EventBus = EventBus()
+    from basefunctions.events.event import Event, EXECUTION_MODE_CORELET
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="No handler for"):
-        bus.publish(mock_event)
+    mock_cpu_count.return_value = 2
+    mock_factory_class.return_value = mock_event_factory
+    mock_pool_class.return_value = _make_immediate_pool()
+    bus: EventBus = EventBus(corelet_pool_size=4, corelet_window=2, corelet_batch_size=16)
 
+    # ACT
+    future = bus.publish(Event("test_event", EXECUTION_MODE_CORELET), return_future=True)
+    event_ids: List[str] = bus.publish_many([Event("test_event", EXECUTION_MODE_CORELET) for _ in range(3)])
+    bus.join()
+    results = bus.get_results(event_ids, join_before=False)
 
+    # ASSERT
+    mock_pool_class.assert_called_once_with(
+        4,
+        None,
+        2,
+        16,
+        start_method=None,
+        preload_modules=None,
+        max_tasks=None,
+        max_rss_mb=None,
+    )
+    assert future.result(timeout=1).data == "pooled"
+    assert [result.data for result in results.values()] == ["pooled"] * 3
+    assert mock_pool_class.return_value.submit.call_count == 4
+    assert bus._input_queue.qsize() == 0
+    assert bus._detached_count == 0
+
+
+@patch("basefunctions.events.event_bus.CoreletPool")
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
 @patch("psutil.cpu_count")
-def test_publish_raises_invalid_event_error_for_unknown_execution_mode(
+def test_prewarm_corelets_creates_and_prewarms_pool(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
+    mock_pool_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() raises InvalidEventError for unknown execution mode."""
+) -> None:
+    """Test prewarm_corelets starts a pool of that size with the configured start method."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
+    mock_cpu_count.return_value = 2
     mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda msg: ValueError(msg)
-
-    bus: EventBus = EventBus()
 
-    # Set unknown execution mode
-    mock_event.event_exec_mode = "unknown_mode"
+    # ACT
+    EventBus(prewarm_corelets=3, preload_modules=["json"], corelet_start_method="forkserver")
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="Unknown execution mode"):
-        bus.publish(mock_event)
+    # ASSERT
+    mock_pool_class.assert_called_once_with(
+        3,
+        None,
+        1,
+        1,
+        start_method="forkserver",
+        preload_modules=["json"],
+        max_tasks=None,
+        max_rss_mb=None,
+    )
+    mock_pool_class.return_value.prewarm.assert_called_once_with(3)
 
 
 @pytest.mark.parametrize(
-    "invalid_input",
+    "kwargs,message",
     [
-        None,
-        "string",
-        123,
-        {},
-        [],
+        ({"max_tasks_per_corelet": 0}, "max_tasks_per_corelet must be positive"),
+        ({"max_rss_mb": -1}, "max_rss_mb must be positive"),
     ],
 )
+def test_corelet_limits_reject_non_positive_values(
+    kwargs: Dict[str, int], message: str, reset_event_bus_singleton: None
+) -> None:
+    """Test EventBus rejects non-positive recycling limits."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match=message):
+        EventBus(**kwargs)
+
+
+@patch("basefunctions.events.event_bus.CoreletPool")
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.InvalidEventError")
 @patch("psutil.cpu_count")
-def test_publish_various_invalid_events(
+def test_corelet_limits_are_exposed_and_passed_to_pool(
     mock_cpu_count: Mock,
-    mock_error_class: Mock,
     mock_factory_class: Mock,
+    mock_pool_class: Mock,
     mock_event_factory: Mock,
-    invalid_input: Any,
     reset_event_bus_singleton: None,
-) -> None:  # CRITICAL TEST
-    """Test publish() rejects various invalid event inputs."""
+) -> None:
+    """Test recycling limits are returned by get_corelet_limits() and used by the pool."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
+    mock_cpu_count.return_value = 2
     mock_factory_class.return_value = mock_event_factory
-    mock_error_class.side_effect = lambda msg: ValueError(msg)
 
-    bus: EventBus = EventBus()
+    # ACT
+    bus: EventBus = EventBus(corelet_pool_size=2, max_tasks_per_corelet=100, max_rss_mb=512)
 
-    # ACT & ASSERT
-    with pytest.raises(ValueError, match="Invalid event type"):
-        bus.publish(invalid_input)
+    # ASSERT
+    assert bus.get_corelet_limits() == (100, 512)
+    assert mock_pool_class.call_args.kwargs["max_tasks"] == 100
+    assert mock_pool_class.call_args.kwargs["max_rss_mb"] == 512
 
 
-# -------------------------------------------------------------
-# TESTS: publish() - Edge Cases
-# -------------------------------------------------------------
+def test_prewarm_corelets_rejects_non_positive_value(reset_event_bus_singleton: None) -> None:
+    """Test EventBus raises ValueError for prewarm_corelets <= 0."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="prewarm_corelets must be positive"):
+        EventBus(prewarm_corelets=0)
 
 
+@patch("basefunctions.events.event_bus.CoreletPool")
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_publish_with_progress_tracker_enriches_event(
+def test_corelet_pool_metrics_and_shutdown(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
+    mock_pool_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() enriches event with thread-local progress tracker."""
+    """Test corelet pool is reported in metrics and stopped on shutdown."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
+    mock_cpu_count.return_value = 2
     mock_factory_class.return_value = mock_event_factory
-
-    bus: EventBus = EventBus()
-
-    # Set progress tracker for current thread
-    mock_tracker: Mock = Mock()
-    thread_id: int = threading.get_ident()
-    bus._progress_context[thread_id] = (mock_tracker, 5)
-
-    # Ensure event has no progress tracker initially
-    mock_event.progress_tracker = None
+    mock_pool_class.return_value = _make_immediate_pool()
+    bus: EventBus = EventBus(corelet_pool_size=4)
 
     # ACT
-    bus.publish(mock_event)
+    metrics: Dict[str, int] = bus.get_corelet_metrics()
+    count: int = bus.get_corelet_count()
+    bus.shutdown()
 
     # ASSERT
-    assert mock_event.progress_tracker is mock_tracker
-    assert mock_event.progress_steps == 5
+    assert metrics["pool_size"] == 4
+    assert metrics["pool_busy"] == 1
+    assert metrics["pool_pending"] == 2
+    assert count == 3
+    mock_pool_class.return_value.shutdown.assert_called_once()
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
-@patch("basefunctions.events.event_bus.basefunctions.EXECUTION_MODE_CMD", "cmd")
 @patch("psutil.cpu_count")
-def test_publish_skips_handler_check_for_cmd_mode(
+def test_init_rejects_invalid_corelet_pool_size(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
-    mock_event: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test publish() skips handler availability check for CMD mode."""
+    """Test EventBus rejects non-positive corelet_pool_size."""
     # ARRANGE
-    mock_cpu_count.return_value = 8
+    mock_cpu_count.return_value = 2
     mock_factory_class.return_value = mock_event_factory
 
-    bus: EventBus = EventBus()
-
-    # Set CMD mode
-    mock_event.event_exec_mode = "cmd"
-
-    # ACT
-    bus.publish(mock_event)
-
-    # ASSERT
-    mock_event_factory.is_handler_available.assert_not_called()
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="corelet_pool_size must be positive"):
+        EventBus(corelet_pool_size=0)
 
 
 # -------------------------------------------------------------
@@ -855,7 +2957,7 @@ def test_get_results_returns_specific_event_results_and_removes_from_cache(
 
     # Populate result cache
     event_id: str = "test_event_123"
-    bus._result_list[event_id] = mock_event_result_success
+    bus._result_store[event_id] = mock_event_result_success
 
     # ACT
     results: Dict[str, Mock] = bus.get_results([event_id], join_before=False)
@@ -863,7 +2965,7 @@ def test_get_results_returns_specific_event_results_and_removes_from_cache(
     # ASSERT
     assert event_id in results
     assert results[event_id] is mock_event_result_success
-    assert event_id not in bus._result_list  # Removed from cache
+    assert event_id not in bus._result_store  # Removed from cache
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -883,8 +2985,8 @@ def test_get_results_returns_all_results_when_no_event_ids_provided(
     bus: EventBus = EventBus()
 
     # Populate result cache with multiple results
-    bus._result_list["event_1"] = mock_event_result_success
-    bus._result_list["event_2"] = mock_event_result_success
+    bus._result_store["event_1"] = mock_event_result_success
+    bus._result_store["event_2"] = mock_event_result_success
 
     # ACT
     results: Dict[str, Mock] = bus.get_results(event_ids=None, join_before=False)
@@ -912,14 +3014,14 @@ def test_get_results_preserves_results_when_no_event_ids_provided(
     bus: EventBus = EventBus()
 
     # Populate result cache
-    bus._result_list["event_1"] = mock_event_result_success
+    bus._result_store["event_1"] = mock_event_result_success
 
     # ACT
     results: Dict[str, Mock] = bus.get_results(event_ids=None, join_before=False)
 
     # ASSERT
     assert "event_1" in results
-    assert "event_1" in bus._result_list  # Still in cache
+    assert "event_1" in bus._result_store  # Still in cache
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -940,7 +3042,7 @@ def test_get_results_normalizes_single_string_to_list(
 
     # Populate result cache
     event_id: str = "test_event_123"
-    bus._result_list[event_id] = mock_event_result_success
+    bus._result_store[event_id] = mock_event_result_success
 
     # ACT
     results: Dict[str, Mock] = bus.get_results(event_id, join_before=False)
@@ -952,30 +3054,34 @@ def test_get_results_normalizes_single_string_to_list(
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_get_results_drains_output_queue_before_returning(
+def test_get_results_returns_results_stored_on_completion(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     mock_event_result_success: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test get_results() drains output queue before returning results."""
+    """Test a completed event's result is visible to get_results() at once, without the publish lock."""
     # ARRANGE
+    from basefunctions.events.event import Event
+
     mock_cpu_count.return_value = 8
     mock_factory_class.return_value = mock_event_factory
 
     bus: EventBus = EventBus()
-
-    # Add result to output queue
-    mock_event_result_success.event_id = "queued_event"
-    bus._output_queue.put(mock_event_result_success)
+    event: Event = Event("test_event")
+    bus._result_store.reserve(event.event_id)
 
     # ACT
-    results: Dict[str, Mock] = bus.get_results(join_before=False)
+    bus._publish_lock.acquire()
+    try:
+        bus._complete_event(event, mock_event_result_success)
+        results: Dict[str, Mock] = bus.get_results(join_before=False)
+    finally:
+        bus._publish_lock.release()
 
     # ASSERT
-    assert "queued_event" in results
-    assert bus._output_queue.empty()
+    assert results == {event.event_id: mock_event_result_success}
 
 
 # -------------------------------------------------------------
@@ -1022,7 +3128,7 @@ def test_get_results_handles_nonexistent_event_ids_gracefully(
     bus: EventBus = EventBus()
 
     # Populate result cache with one result
-    bus._result_list["exists"] = mock_event_result_success
+    bus._result_store["exists"] = mock_event_result_success
 
     # ACT
     results: Dict[str, Mock] = bus.get_results(["exists", "not_exists"], join_before=False)
@@ -1283,20 +3389,20 @@ def test_get_handler_raises_type_error_when_factory_returns_invalid_type(
 
 
 # -------------------------------------------------------------
-# TESTS: _add_result_with_lru() - LRU Cache Management
+# TESTS: _result_store - LRU Cache Management
 # -------------------------------------------------------------
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_add_result_with_lru_stores_result(
+def test_result_store_stores_result(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     mock_event_result_success: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test _add_result_with_lru() stores result in cache."""
+    """Test the bus result store stores result in cache."""
     # ARRANGE
     mock_cpu_count.return_value = 8
     mock_factory_class.return_value = mock_event_factory
@@ -1304,75 +3410,75 @@ def test_add_result_with_lru_stores_result(
     bus: EventBus = EventBus()
 
     # ACT
-    bus._add_result_with_lru("event_123", mock_event_result_success)
+    bus._result_store.put("event_123", mock_event_result_success)
 
     # ASSERT
-    assert "event_123" in bus._result_list
-    assert bus._result_list["event_123"] is mock_event_result_success
+    assert "event_123" in bus._result_store
+    assert bus._result_store["event_123"] is mock_event_result_success
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_add_result_with_lru_evicts_oldest_when_limit_exceeded(
+def test_result_store_evicts_oldest_when_limit_exceeded(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     mock_event_result_success: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test _add_result_with_lru() evicts oldest result when limit exceeded."""
+    """Test the bus result store evicts oldest result when limit exceeded."""
     # ARRANGE
     mock_factory_class.return_value = mock_event_factory
 
     bus: EventBus = EventBus(num_threads=1)
-    bus._max_cached_results = 3
+    bus._result_store.max_results = 3
 
     # ACT - Add 4 results (exceeding limit of 3)
-    bus._add_result_with_lru("event_1", mock_event_result_success)
-    bus._add_result_with_lru("event_2", mock_event_result_success)
-    bus._add_result_with_lru("event_3", mock_event_result_success)
-    bus._add_result_with_lru("event_4", mock_event_result_success)
+    bus._result_store.put("event_1", mock_event_result_success)
+    bus._result_store.put("event_2", mock_event_result_success)
+    bus._result_store.put("event_3", mock_event_result_success)
+    bus._result_store.put("event_4", mock_event_result_success)
 
     # ASSERT
-    assert "event_1" not in bus._result_list  # Evicted (oldest)
-    assert "event_2" in bus._result_list
-    assert "event_3" in bus._result_list
-    assert "event_4" in bus._result_list
-    assert len(bus._result_list) == 3
+    assert "event_1" not in bus._result_store  # Evicted (oldest)
+    assert "event_2" in bus._result_store
+    assert "event_3" in bus._result_store
+    assert "event_4" in bus._result_store
+    assert len(bus._result_store) == 3
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("psutil.cpu_count")
-def test_add_result_with_lru_moves_existing_to_end(
+def test_result_store_moves_existing_to_end(
     mock_cpu_count: Mock,
     mock_factory_class: Mock,
     mock_event_factory: Mock,
     mock_event_result_success: Mock,
     reset_event_bus_singleton: None,
 ) -> None:
-    """Test _add_result_with_lru() moves existing result to end (most recent)."""
+    """Test the bus result store moves existing result to end (most recent)."""
     # ARRANGE
     mock_factory_class.return_value = mock_event_factory
 
     bus: EventBus = EventBus(num_threads=1)
-    bus._max_cached_results = 3
+    bus._result_store.max_results = 3
 
     # ACT - Add 3 results
-    bus._add_result_with_lru("event_1", mock_event_result_success)
-    bus._add_result_with_lru("event_2", mock_event_result_success)
-    bus._add_result_with_lru("event_3", mock_event_result_success)
+    bus._result_store.put("event_1", mock_event_result_success)
+    bus._result_store.put("event_2", mock_event_result_success)
+    bus._result_store.put("event_3", mock_event_result_success)
 
     # Re-add event_1 (should move to end)
-    bus._add_result_with_lru("event_1", mock_event_result_success)
+    bus._result_store.put("event_1", mock_event_result_success)
 
     # Add event_4 (should evict event_2, not event_1)
-    bus._add_result_with_lru("event_4", mock_event_result_success)
+    bus._result_store.put("event_4", mock_event_result_success)
 
     # ASSERT
-    assert "event_1" in bus._result_list  # Moved to end, not evicted
-    assert "event_2" not in bus._result_list  # Evicted (oldest)
-    assert "event_3" in bus._result_list
-    assert "event_4" in bus._result_list
+    assert "event_1" in bus._result_store  # Moved to end, not evicted
+    assert "event_2" not in bus._result_store  # Evicted (oldest)
+    assert "event_3" in bus._result_store
+    assert "event_4" in bus._result_store
 
 
 # -------------------------------------------------------------
@@ -1397,7 +3503,7 @@ def test_shutdown_sends_shutdown_event_to_all_workers(
 
     # Verify initial state
     assert len(bus._worker_threads) == 4
-    initial_result_count: int = len(bus._result_list)
+    initial_result_count: int = len(bus._result_store)
 
     # ACT
     bus.shutdown(immediately=False)
@@ -1406,11 +3512,49 @@ def test_shutdown_sends_shutdown_event_to_all_workers(
     # After shutdown completes, the shutdown events should have been processed
     # Each shutdown event gets an entry in the result_list
     # Workers are daemon threads, so they may still be alive but idle
-    assert len(bus._result_list) >= initial_result_count  # Shutdown events were queued
+    assert len(bus._result_store) >= initial_result_count  # Shutdown events were queued
     # Input queue should be empty or nearly empty after join()
     assert bus._input_queue.qsize() <= 4  # At most the shutdown events remain
 
 
+@patch("basefunctions.events.event_bus.basefunctions.EventFactory")
+@patch("psutil.cpu_count")
+def test_shutdown_immediately_completes_dropped_events(
+    mock_cpu_count: Mock,
+    mock_factory_class: Mock,
+    mock_event_factory: Mock,
+    reset_event_bus_singleton: None,
+) -> None:
+    """Test shutdown(immediately=True) completes queued and rate-limited events with EventShutdownError."""
+    # ARRANGE
+    from basefunctions.events.event import Event
+    from basefunctions.events.event_exceptions import EventShutdownError
+
+    started, gate = threading.Event(), threading.Event()
+    mock_cpu_count.return_value = 1
+    mock_event_factory.create_handler.side_effect = lambda event_type: (
+        _make_gate_handler(started, gate) if event_type == "gated" else _make_echo_handler()
+    )
+    mock_factory_class.return_value = mock_event_factory
+    bus: EventBus = EventBus()
+    bus.register_rate_limit("rl_event", 1)
+    running = bus.publish(Event("gated"), return_future=True)
+    assert started.wait(timeout=5)
+    queued = [bus.publish(Event("echo"), return_future=True) for _ in range(3)]
+    limited = [bus.publish(Event("rl_event"), return_future=True) for _ in range(3)]
+    limited_id: str = bus.publish(Event("rl_event"))
+
+    # ACT
+    threading.Timer(0.2, gate.set).start()
+    bus.shutdown(immediately=True)
+
+    # ASSERT
+    assert running.result(timeout=0).success is True
+    dropped = [future.result(timeout=0) for future in queued + limited[1:]]
+    assert all(isinstance(result.exception, EventShutdownError) for result in dropped)
+    assert isinstance(bus.get_results([limited_id], join_before=False)[limited_id].exception, EventShutdownError)
+
+
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
 @patch("basefunctions.events.event_bus.basefunctions.EXECUTION_MODE_CORELET", "corelet")
 @patch("psutil.cpu_count")
@@ -1429,7 +3573,7 @@ def test_shutdown_immediately_uses_high_priority(
 
     # Verify initial state
     assert len(bus._worker_threads) == 2
-    initial_result_count: int = len(bus._result_list)
+    initial_result_count: int = len(bus._result_store)
 
     # ACT
     bus.shutdown(immediately=True)
@@ -1437,7 +3581,7 @@ def test_shutdown_immediately_uses_high_priority(
     # ASSERT
     # Verify shutdown events were processed
     # Workers are daemon threads, so they may still be alive but idle
-    assert len(bus._result_list) >= initial_result_count  # Shutdown events were queued
+    assert len(bus._result_store) >= initial_result_count  # Shutdown events were queued
     # Note: We can't directly verify priority=-1 was used without patching Event,
     # but the immediate shutdown behavior is indicated by the events being processed
 
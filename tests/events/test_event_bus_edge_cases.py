@@ -106,6 +106,7 @@ def mock_event_factory() -> Mock:
     """
     factory = Mock()
     factory.is_handler_available.return_value = True
+    factory.get_batch_limits.return_value = None
     factory.register_event_type.return_value = None
     return factory
 
@@ -182,6 +183,7 @@ def mock_thread_event() -> Mock:
     from basefunctions.events.event import Event
 
     event = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = f"thread_event_{threading.get_ident()}"
     event.event_type = "test_event"
     event.event_exec_mode = "thread"
@@ -206,6 +208,7 @@ def mock_corelet_event() -> Mock:
     from basefunctions.events.event import Event
 
     event = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = f"corelet_event_{threading.get_ident()}"
     event.event_type = "test_event"
     event.event_exec_mode = "corelet"
@@ -262,7 +265,7 @@ def test_lru_cache_eviction_with_large_volume_events(
     mock_factory_class.return_value = mock_event_factory
 
     bus = EventBus(num_threads=2)
-    assert bus._max_cached_results == 2000
+    assert bus._result_store.max_results == 2000
 
     # Create many results to trigger LRU eviction
     num_results = 3000  # Exceeds limit of 2000
@@ -272,22 +275,22 @@ def test_lru_cache_eviction_with_large_volume_events(
         mock_result = Mock()
         mock_result.event_id = f"event_{i}"
         mock_result.success = True
-        bus._add_result_with_lru(f"event_{i}", mock_result)
+        bus._result_store.put(f"event_{i}", mock_result)
 
     # ASSERT
     # Cache should be at max limit, not growing unbounded
-    assert len(bus._result_list) == bus._max_cached_results
-    assert len(bus._result_list) == 2000
+    assert len(bus._result_store) == bus._result_store.max_results
+    assert len(bus._result_store) == 2000
 
     # Oldest 1000 events should be evicted
-    assert "event_0" not in bus._result_list
-    assert "event_500" not in bus._result_list
-    assert "event_999" not in bus._result_list
+    assert "event_0" not in bus._result_store
+    assert "event_500" not in bus._result_store
+    assert "event_999" not in bus._result_store
 
     # Most recent 2000 events should be present
-    assert "event_1000" in bus._result_list
-    assert "event_2000" in bus._result_list
-    assert "event_2999" in bus._result_list
+    assert "event_1000" in bus._result_store
+    assert "event_2000" in bus._result_store
+    assert "event_2999" in bus._result_store
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -312,31 +315,31 @@ def test_lru_cache_preserves_most_recently_accessed_results(
     mock_factory_class.return_value = mock_event_factory
 
     bus = EventBus(num_threads=1)
-    bus._max_cached_results = 5
+    bus._result_store.max_results = 5
 
     # ACT - Add 5 results (at limit)
     for i in range(5):
         mock_result = Mock()
         mock_result.event_id = f"event_{i}"
-        bus._add_result_with_lru(f"event_{i}", mock_result)
+        bus._result_store.put(f"event_{i}", mock_result)
 
     # Re-add event_0 (moves to end)
     mock_result = Mock()
     mock_result.event_id = "event_0"
-    bus._add_result_with_lru("event_0", mock_result)
+    bus._result_store.put("event_0", mock_result)
 
     # Add new event_5 (should evict event_1, not event_0)
     mock_result = Mock()
     mock_result.event_id = "event_5"
-    bus._add_result_with_lru("event_5", mock_result)
+    bus._result_store.put("event_5", mock_result)
 
     # ASSERT
-    assert "event_0" in bus._result_list  # Moved to end, preserved
-    assert "event_1" not in bus._result_list  # Evicted (now oldest)
-    assert "event_2" in bus._result_list
-    assert "event_3" in bus._result_list
-    assert "event_4" in bus._result_list
-    assert "event_5" in bus._result_list
+    assert "event_0" in bus._result_store  # Moved to end, preserved
+    assert "event_1" not in bus._result_store  # Evicted (now oldest)
+    assert "event_2" in bus._result_store
+    assert "event_3" in bus._result_store
+    assert "event_4" in bus._result_store
+    assert "event_5" in bus._result_store
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -354,14 +357,14 @@ def test_lru_cache_eviction_with_concurrent_result_addition(
 
     Notes
     -----
-    CRITICAL: Tests thread-safety of _add_result_with_lru with _publish_lock.
+    CRITICAL: Tests thread-safety of ResultStore eviction across shard locks.
     """
     # ARRANGE
     mock_cpu_count.return_value = 4
     mock_factory_class.return_value = mock_event_factory
 
     bus = EventBus(num_threads=4)
-    bus._max_cached_results = 100
+    bus._result_store.max_results = 100
 
     results_added = []
     errors = []
@@ -373,7 +376,7 @@ def test_lru_cache_eviction_with_concurrent_result_addition(
                 event_id = f"thread_{thread_id}_event_{i}"
                 mock_result = Mock()
                 mock_result.event_id = event_id
-                bus._add_result_with_lru(event_id, mock_result)
+                bus._result_store.put(event_id, mock_result)
                 results_added.append(event_id)
         except Exception as e:
             errors.append(e)
@@ -394,8 +397,8 @@ def test_lru_cache_eviction_with_concurrent_result_addition(
     assert len(errors) == 0
 
     # Cache should not exceed limit
-    assert len(bus._result_list) <= bus._max_cached_results
-    assert len(bus._result_list) == 100
+    assert len(bus._result_store) <= bus._result_store.max_results
+    assert len(bus._result_store) == 100
 
     # Total results added exceeds cache limit (250 > 100)
     assert len(results_added) == 250
@@ -611,6 +614,7 @@ def test_shutdown_with_pending_events_in_queue(
     events = []
     for i in range(10):
         event = Mock(spec=Event)
+        event.depends_on = []
         event.event_id = f"pending_event_{i}"
         event.event_type = "test"
         event.event_exec_mode = "thread"
@@ -635,7 +639,7 @@ def test_shutdown_with_pending_events_in_queue(
 
     # All worker threads received shutdown signal
     # (shutdown events are published for each worker)
-    assert len(bus._result_list) >= len(events)
+    assert len(bus._result_store) >= len(events)
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -668,6 +672,7 @@ def test_shutdown_immediately_preempts_pending_events(
 
     for i in range(10):
         event = Mock(spec=Event)
+        event.depends_on = []
         event.event_id = f"low_priority_event_{i}"
         event.event_type = "test"
         event.event_exec_mode = "thread"
@@ -722,6 +727,7 @@ def test_worker_loop_handles_invalid_task_format(
     from basefunctions.events.event import Event
 
     valid_event = Mock(spec=Event)
+    valid_event.depends_on = []
     valid_event.event_id = "valid_event"
     valid_event.event_type = "test"
     valid_event.event_exec_mode = "thread"
@@ -793,6 +799,7 @@ def test_concurrent_event_publishing_from_multiple_threads(
 
             for i in range(count):
                 event = Mock(spec=Event)
+                event.depends_on = []
                 event.event_id = f"thread_{thread_id}_event_{i}"
                 event.event_type = "test"
                 event.event_exec_mode = "thread"
@@ -826,7 +833,7 @@ def test_concurrent_event_publishing_from_multiple_threads(
     assert len(published_ids) == 200
 
     # All event IDs are registered in result cache
-    assert len(bus._result_list) >= 200
+    assert len(bus._result_store) >= 200
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -871,6 +878,7 @@ def test_concurrent_result_retrieval_during_event_processing(
     event_ids = []
     for i in range(50):
         event = Mock(spec=Event)
+        event.depends_on = []
         event.event_id = f"concurrent_event_{i}"
         event.event_type = "test"
         event.event_exec_mode = "thread"
@@ -956,6 +964,7 @@ def test_concurrent_shutdown_and_publish_race_condition(
             counter = 0
             while not shutdown_complete.is_set():
                 event = Mock(spec=Event)
+                event.depends_on = []
                 event.event_id = f"race_event_{counter}"
                 event.event_type = "test"
                 event.event_exec_mode = "thread"
@@ -1041,6 +1050,7 @@ def test_progress_tracker_with_none_tracker(
     from basefunctions.events.event import Event
 
     event = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = "event_no_tracker"
     event.event_type = "test"
     event.event_exec_mode = "sync"
@@ -1058,8 +1068,8 @@ def test_progress_tracker_with_none_tracker(
     # Handler was called
     mock_handler.handle.assert_called_once()
 
-    # Result is in output queue
-    assert not bus._output_queue.empty()
+    # Result is in the result store
+    assert bus._result_store.get(event_id) is not None
 
 
 @patch("basefunctions.events.event_bus.basefunctions.EventFactory")
@@ -1099,6 +1109,7 @@ def test_progress_tracker_with_zero_steps(
     from basefunctions.events.event import Event
 
     event = Mock(spec=Event)
+    event.depends_on = []
     event.event_id = "event_zero_steps"
     event.event_type = "test"
     event.event_exec_mode = "sync"
@@ -20,11 +20,13 @@
 # External imports
 import pytest
 import threading
+import time
 from datetime import datetime
 from typing import Any
 
 # Project imports
-from basefunctions.events.event_context import EventContext
+from basefunctions.events.event_context import CancellationToken, EventContext
+from basefunctions.events.event_exceptions import EventCancelledError
 
 # -------------------------------------------------------------
 # FIXTURES
@@ -380,3 +382,89 @@ def test_event_context_corelet_mode_pattern(thread_local_data: threading.local,
     assert context.thread_id is None  # Worker process main thread
     assert context.process_id == sample_process_id
     assert context.worker is mock_worker
+
+
+# -------------------------------------------------------------
+# TESTS: CANCELLATION
+# -------------------------------------------------------------
+
+
+def test_cancellation_token_cancel_sets_reason_once() -> None:
+    """Test cancel() reports True only for the first call."""
+    # ARRANGE
+    token: CancellationToken = CancellationToken()
+
+    # ACT & ASSERT
+    assert token.cancelled is False
+    assert token.cancel("stop") is True
+    assert token.cancel("again") is False
+    assert token.cancelled is True
+    assert token.reason == "stop"
+
+
+def test_cancellation_token_check_raises_cancelled_error() -> None:
+    """Test check() raises EventCancelledError after cancel()."""
+    # ARRANGE
+    token: CancellationToken = CancellationToken(time.monotonic() + 60)
+    token.cancel("stop")
+
+    # ACT & ASSERT
+    with pytest.raises(EventCancelledError, match="stop"):
+        token.check()
+
+
+def test_cancellation_token_expired_deadline_raises_timeout() -> None:
+    """Test check() raises TimeoutError once the deadline has passed."""
+    # ARRANGE
+    token: CancellationToken = CancellationToken(time.monotonic() - 1)
+
+    # ACT & ASSERT
+    assert token.cancelled is True
+    assert token.remaining() == 0.0
+    with pytest.raises(TimeoutError):
+        token.check()
+
+
+def test_event_context_without_token_is_never_cancelled() -> None:
+    """Test cancellation helpers are no-ops without a token."""
+    # ARRANGE
+    context: EventContext = EventContext()
+
+    # ACT & ASSERT
+    assert context.cancelled is False
+    assert context.deadline is None
+    assert context.remaining() is None
+    context.check_cancelled()
+
+
+def test_event_context_exposes_token_deadline() -> None:
+    """Test context reports deadline and remaining time of its token."""
+    # ARRANGE
+    deadline: float = time.monotonic() + 60
+    context: EventContext = EventContext()
+    context.cancel_token = CancellationToken(deadline)
+
+    # ACT
+    remaining = context.remaining()
+
+    # ASSERT
+    assert context.deadline == deadline
+    assert remaining is not None and 0 < remaining <= 60
+    assert context.cancelled is False
+
+
+def test_event_context_with_cancel_token_shares_other_attributes(thread_local_data: threading.local) -> None:
+    """Test with_cancel_token() copies the context and binds the new token."""
+    # ARRANGE
+    context: EventContext = EventContext(thread_local_data=thread_local_data, thread_id="t-1")
+    token: CancellationToken = CancellationToken()
+
+    # ACT
+    bound: EventContext = context.with_cancel_token(token)
+
+    # ASSERT
+    assert bound is not context
+    assert bound.cancel_token is token
+    assert context.cancel_token is None
+    assert bound.thread_local_data is thread_local_data
+    assert bound.thread_id == "t-1"
@@ -50,6 +50,8 @@ def fresh_factory() -> EventFactory:
     factory: EventFactory = EventFactory()
     # Clear registry for test isolation
     factory._handler_registry.clear()
+    factory._handler_meta.clear()
+    factory._batch_limits.clear()
     return factory
 
 
@@ -326,6 +328,29 @@ def test_get_handler_meta_returns_metadata(
     assert meta["class_name"] == sample_handler_class.__name__
 
 
+def test_get_handler_meta_is_cached_until_event_type_is_registered_again(
+    fresh_factory: EventFactory, sample_handler_class: Type[EventHandler]
+) -> None:
+    """Test get_handler_meta() returns one shared dict per event type and refreshes it on re-registration."""
+    # ARRANGE
+    event_type: str = "test_event"
+    fresh_factory.register_event_type(event_type, sample_handler_class)
+
+    class ReplacementHandler(EventHandler):
+        def handle(self, event, context):
+            return None
+
+    # ACT
+    first: dict = fresh_factory.get_handler_meta(event_type)
+    second: dict = fresh_factory.get_handler_meta(event_type)
+    fresh_factory.register_event_type(event_type, ReplacementHandler)
+    replaced: dict = fresh_factory.get_handler_meta(event_type)
+
+    # ASSERT
+    assert first is second
+    assert replaced["class_name"] == "ReplacementHandler"
+
+
 def test_get_handler_meta_raises_error_when_event_type_empty(fresh_factory: EventFactory) -> None:  # CRITICAL TEST
     """Test get_handler_meta() raises ValueError for empty event_type."""
     # ACT & ASSERT
@@ -400,6 +425,35 @@ def test_get_handler_type_raises_error_when_not_registered(fresh_factory: EventF
         fresh_factory.get_handler_type("unregistered_event")
 
 
+def test_get_batch_limits_is_cached_until_event_type_is_registered_again(
+    fresh_factory: EventFactory, sample_handler_class: Type[EventHandler]
+) -> None:
+    """Test get_batch_limits() caches None or the limits and refreshes them on re-registration."""
+    # ARRANGE
+    from basefunctions.events.event_handler import BatchEventHandler
+
+    class SampleBatchHandler(BatchEventHandler):
+        max_batch_size = 50
+        max_batch_delay_ms = 2.0
+
+        def handle_batch(self, events, context):
+            return []
+
+    fresh_factory.register_event_type("test_event", sample_handler_class)
+
+    # ACT
+    regular = fresh_factory.get_batch_limits("test_event")
+    cached = "test_event" in fresh_factory._batch_limits
+    fresh_factory.register_event_type("test_event", SampleBatchHandler)
+    batched = fresh_factory.get_batch_limits("test_event")
+
+    # ASSERT
+    assert regular is None and cached
+    assert batched == (50, 2.0)
+    assert fresh_factory.get_batch_limits("unregistered_event") is None
+    assert "unregistered_event" not in fresh_factory._batch_limits
+
+
 # -------------------------------------------------------------
 # TESTS: Thread Safety
 # -------------------------------------------------------------
@@ -0,0 +1,110 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for EventFuture and as_completed.
+ Tests future state handling, result delivery and completion ordering.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import concurrent.futures
+import threading
+import pytest
+from typing import List
+
+# Project imports
+from basefunctions.events.event_future import EventFuture, as_completed
+from basefunctions.events.event_handler import EventResult
+
+# -------------------------------------------------------------
+# TESTS: EventFuture
+# -------------------------------------------------------------
+
+
+def test_event_future_is_concurrent_future() -> None:
+    """Test EventFuture is compatible with concurrent.futures.Future."""
+    # ACT
+    future: EventFuture = EventFuture("event-1")
+
+    # ASSERT
+    assert isinstance(future, concurrent.futures.Future)
+    assert future.event_id == "event-1"
+    assert not future.done()
+
+
+def test_event_future_returns_event_result() -> None:
+    """Test EventFuture.result() returns the EventResult it was resolved with."""
+    # ARRANGE
+    future: EventFuture = EventFuture("event-1")
+    future.set_running_or_notify_cancel()
+    result: EventResult = EventResult.business_result("event-1", True, 42)
+
+    # ACT
+    future.set_result(result)
+
+    # ASSERT
+    assert future.result(timeout=1) is result
+
+
+def test_event_future_cannot_be_cancelled_once_running() -> None:
+    """Test running EventFuture refuses cancel() like executor futures."""
+    # ARRANGE
+    future: EventFuture = EventFuture("event-1")
+    future.set_running_or_notify_cancel()
+
+    # ACT & ASSERT
+    assert future.cancel() is False
+
+
+def test_event_future_repr_contains_event_id() -> None:
+    """Test EventFuture repr includes event ID."""
+    # ACT
+    future: EventFuture = EventFuture("event-42")
+
+    # ASSERT
+    assert "event-42" in repr(future)
+
+
+# -------------------------------------------------------------
+# TESTS: as_completed
+# -------------------------------------------------------------
+
+
+def test_as_completed_yields_in_completion_order() -> None:
+    """Test as_completed() yields futures in the order they complete."""
+    # ARRANGE
+    futures: List[EventFuture] = [EventFuture(f"event-{i}") for i in range(3)]
+    for future in futures:
+        future.set_running_or_notify_cancel()
+
+    def resolve() -> None:
+        for future in reversed(futures):
+            future.set_result(EventResult.business_result(future.event_id, True))
+
+    # ACT
+    threading.Thread(target=resolve).start()
+    completed: List[str] = [future.event_id for future in as_completed(futures, timeout=5)]
+
+    # ASSERT
+    assert sorted(completed) == ["event-0", "event-1", "event-2"]
+
+
+def test_as_completed_raises_timeout_error() -> None:
+    """Test as_completed() raises TimeoutError when futures do not complete."""
+    # ARRANGE
+    future: EventFuture = EventFuture("event-1")
+
+    # ACT & ASSERT
+    with pytest.raises(TimeoutError):
+        list(as_completed([future], timeout=0.05))
@@ -0,0 +1,155 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for EventGroup.
+ Tests per-group counting, join timeouts, result retrieval and cancellation.
+
+ Log:
+ v1.0.0 : Initial test implementation
+ v1.1.0 : Partial failure of publish_many()
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import pytest
+from typing import Dict, List
+from unittest.mock import Mock
+
+# Project imports
+from basefunctions.events.event import Event
+from basefunctions.events.event_future import EventFuture
+from basefunctions.events.event_group import EventGroup
+from basefunctions.events.event_handler import EventResult
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+def _make_bus(futures: Dict[str, EventFuture]) -> Mock:
+    """Create a bus mock returning one running future per published event."""
+
+    def publish(event, return_future=False):
+        future = EventFuture(event.event_id)
+        future.set_running_or_notify_cancel()
+        futures[event.event_id] = future
+        return future
+
+    bus: Mock = Mock()
+    bus.publish.side_effect = publish
+    bus.publish_many.side_effect = lambda events, return_futures=False: [publish(event) for event in events]
+    bus.cancel.side_effect = lambda event_id: not futures[event_id].done()
+    return bus
+
+
+def _resolve(future: EventFuture, data: int) -> None:
+    future.set_result(EventResult.business_result(future.event_id, True, data))
+
+
+# -------------------------------------------------------------
+# TESTS: EventGroup
+# -------------------------------------------------------------
+
+
+def test_group_join_waits_for_own_events_only() -> None:
+    """Test join() returns once the group's events completed and times out before."""
+    # ARRANGE
+    futures: Dict[str, EventFuture] = {}
+    group: EventGroup = EventGroup(_make_bus(futures))
+    first: str = group.publish(Event("test"))
+    second, third = group.publish_many([Event("test"), Event("test")])
+
+    # ACT
+    _resolve(futures[first], 1)
+    timed_out: bool = group.join(timeout=0.05)
+    pending: int = group.pending
+    _resolve(futures[second], 2)
+    _resolve(futures[third], 3)
+
+    # ASSERT
+    assert timed_out is False and pending == 2
+    assert group.join(timeout=1) is True
+    assert len(group) == 3
+    assert {event_id: result.data for event_id, result in group.get_results().items()} == {
+        first: 1,
+        second: 2,
+        third: 3,
+    }
+    assert list(group.get_results([second, "unknown"])) == [second]
+
+
+def test_group_counts_events_completed_before_tracking() -> None:
+    """Test a future resolved before the group tracks it is counted down at once."""
+    # ARRANGE
+    future: EventFuture = EventFuture("done")
+    future.set_running_or_notify_cancel()
+    _resolve(future, 7)
+    bus: Mock = Mock()
+    bus.publish.return_value = future
+    group: EventGroup = EventGroup(bus)
+
+    # ACT
+    group.publish(Mock(event_id="done"))
+
+    # ASSERT
+    assert group.pending == 0
+    assert group.get_results(join_before=False)["done"].data == 7
+
+
+def test_group_context_cancels_pending_events_on_error() -> None:
+    """Test leaving the with block by an exception cancels the pending events."""
+    # ARRANGE
+    futures: Dict[str, EventFuture] = {}
+    bus: Mock = _make_bus(futures)
+    cancelled: List[str] = []
+
+    # ACT
+    with pytest.raises(RuntimeError):
+        with EventGroup(bus) as group:
+            done_id: str = group.publish(Event("test"))
+            pending_id: str = group.publish(Event("test"))
+            _resolve(futures[done_id], 1)
+            raise RuntimeError("abort")
+    cancelled.extend(call.args[0] for call in bus.cancel.call_args_list)
+
+    # ASSERT
+    assert cancelled == [pending_id]
+
+
+def test_group_publish_many_keeps_chunks_published_before_failure() -> None:
+    """Test a failing chunk leaves the earlier chunks tracked, joinable and cancellable."""
+    # ARRANGE
+    from basefunctions.events.event_exceptions import NoHandlerAvailableError
+
+    futures: Dict[str, EventFuture] = {}
+    bus: Mock = _make_bus(futures)
+    publish_chunk = bus.publish_many.side_effect
+
+    def publish_many(events, return_futures=False):
+        if any(event.event_type == "unknown" for event in events):
+            raise NoHandlerAvailableError("unknown")
+        return publish_chunk(events, return_futures)
+
+    bus.publish_many.side_effect = publish_many
+    events: List[Event] = [Event("test"), Event("test"), Event("test"), Event("unknown")]
+
+    # ACT
+    with pytest.raises(NoHandlerAvailableError):
+        with EventGroup(bus) as group:
+            group.publish_many(events, chunk_size=2)
+    pending: int = group.pending
+    joined: bool = group.join(timeout=0.05)
+    cancelled: List[str] = [call.args[0] for call in bus.cancel.call_args_list]
+
+    # ASSERT
+    assert pending == 2
+    assert joined is False
+    assert cancelled == [events[0].event_id, events[1].event_id]
@@ -29,12 +29,15 @@ from unittest.mock import Mock, MagicMock, patch, call
 from basefunctions.events.event_handler import (
     EventResult,
     EventHandler,
+    BatchEventHandler,
     DefaultCmdHandler,
     CoreletForwardingHandler,
     CoreletHandle,
+    MapChunkHandler,
 )
 from basefunctions.events.event import Event, EXECUTION_MODE_CMD, EXECUTION_MODE_CORELET
 from basefunctions.events.event_context import EventContext
+from basefunctions.events.corelet_worker import CORELET_RETIREMENT_NOTICE
 
 # -------------------------------------------------------------
 # FIXTURES
@@ -242,6 +245,61 @@ def test_event_handler_terminate_default_implementation() -> None:
     handler.terminate(context)
 
 
+# -------------------------------------------------------------
+# TESTS: BatchEventHandler
+# -------------------------------------------------------------
+
+
+def test_batch_event_handler_handle_delegates_to_handle_batch() -> None:
+    """Test BatchEventHandler.handle() runs a batch of one."""
+
+    # ARRANGE
+    class DoublingHandler(BatchEventHandler):
+        def handle_batch(self, events, context):
+            return [EventResult.business_result(event.event_id, True, event.event_data * 2) for event in events]
+
+    handler: BatchEventHandler = DoublingHandler()
+    event: Event = Event("batch_event", event_data=21)
+
+    # ACT
+    result: EventResult = handler.handle(event, EventContext())
+
+    # ASSERT
+    assert result.success and result.data == 42
+    assert result.event_id == event.event_id
+    assert handler.max_batch_size == 32 and handler.max_batch_delay_ms == 0
+
+
+def test_map_chunk_handler_batches_items_and_retries_failures() -> None:
+    """Test MapChunkHandler passes a chunk to handle_batch and retries only failed items."""
+
+    # ARRANGE
+    calls: list = []
+
+    class FlakyBatchHandler(BatchEventHandler):
+        def handle_batch(self, events, context):
+            calls.append([event.event_data for event in events])
+            return [
+                EventResult.business_result(
+                    event.event_id, len(calls) > 1 or event.event_data != "b", event.event_data
+                )
+                for event in events
+            ]
+
+    chunk: Event = Event("_map_chunk", event_data=("batch_event", 3, ["a", "b", "c"]))
+    factory: Mock = Mock()
+    factory.create_handler.return_value = FlakyBatchHandler()
+
+    # ACT
+    with patch("basefunctions.EventFactory", return_value=factory):
+        result: EventResult = MapChunkHandler().handle(chunk, EventContext())
+
+    # ASSERT
+    assert result.success
+    assert calls == [["a", "b", "c"], ["b"]]
+    assert result.data == (["a", "b", "c"], {})
+
+
 # -------------------------------------------------------------
 # TESTS: DefaultCmdHandler - Successful Execution - CRITICAL
 # -------------------------------------------------------------
@@ -454,13 +512,14 @@ def test_corelet_handle_initialization() -> None:
     assert handle.process is mock_process
     assert handle.input_pipe is mock_input_pipe
     assert handle.output_pipe is mock_output_pipe
+    assert handle.shared_memory_threshold is None
 
 
 def test_corelet_handle_uses_slots() -> None:
     """Test CoreletHandle uses __slots__ for memory efficiency."""
     # ASSERT
     assert hasattr(CoreletHandle, "__slots__")
-    assert set(CoreletHandle.__slots__) == {"process", "input_pipe", "output_pipe"}
+    assert set(CoreletHandle.__slots__) == {"process", "input_pipe", "output_pipe", "shared_memory_threshold"}
 
 
 # -------------------------------------------------------------
@@ -542,6 +601,63 @@ def test_corelet_forwarding_handler_reuses_existing_corelet(
     assert mock_process_class.call_count == 1
 
 
+@patch("basefunctions.events.event_handler.multiprocessing.Pipe")
+@patch("basefunctions.events.event_handler.Process")
+def test_corelet_forwarding_handler_recycles_corelet_on_retirement_notice(
+    mock_process_class: Mock, mock_pipe: Mock, sample_event_context: EventContext
+) -> None:
+    """Test CoreletForwardingHandler returns the result after a retirement notice and retires the corelet."""
+    # ARRANGE
+    mock_output_pipe_a: Mock = Mock()
+    mock_pipe.side_effect = [(Mock(), Mock()), (mock_output_pipe_a, Mock())]
+    mock_process_class.return_value = Mock(pid=12347)
+    mock_output_pipe_a.poll.return_value = True
+
+    handler: CoreletForwardingHandler = CoreletForwardingHandler()
+    event: Event = Event(event_type="test", event_exec_mode=EXECUTION_MODE_CORELET)
+    mock_result: EventResult = EventResult.business_result(event.event_id, True, "done")
+
+    with patch("pickle.dumps"), patch("pickle.loads") as mock_loads, patch.object(
+        CoreletForwardingHandler, "_retire_corelet"
+    ) as mock_retire:
+        mock_loads.side_effect = [CORELET_RETIREMENT_NOTICE, mock_result]
+
+        # ACT
+        result: EventResult = handler.handle(event, sample_event_context)
+
+    # ASSERT
+    assert result is mock_result
+    assert mock_output_pipe_a.recv.call_count == 2
+    mock_retire.assert_called_once_with(sample_event_context)
+
+
+@patch("basefunctions.events.event_handler.multiprocessing.Pipe")
+@patch("basefunctions.events.event_handler.Process")
+def test_corelet_forwarding_handler_handle_batch_sends_one_message(
+    mock_process_class: Mock, mock_pipe: Mock, sample_event_context: EventContext
+) -> None:
+    """Test handle_batch forwards all events in one message and returns the result list."""
+    # ARRANGE
+    mock_input_pipe_a: Mock = Mock()
+    mock_output_pipe_a: Mock = Mock()
+    mock_pipe.side_effect = [(mock_input_pipe_a, Mock()), (mock_output_pipe_a, Mock())]
+    mock_process_class.return_value = Mock(pid=12348)
+    mock_output_pipe_a.poll.return_value = True
+
+    handler: CoreletForwardingHandler = CoreletForwardingHandler()
+    events: list = [Event(event_type="test", event_exec_mode=EXECUTION_MODE_CORELET) for _ in range(3)]
+    replies: list = [EventResult.business_result(event.event_id, True, None) for event in events]
+
+    with patch("pickle.dumps") as mock_dumps, patch("pickle.loads", return_value=replies):
+        # ACT
+        results: list = handler.handle_batch(events, sample_event_context)
+
+    # ASSERT
+    assert results == replies
+    mock_input_pipe_a.send.assert_called_once()
+    assert mock_dumps.call_args[0][0] == events
+
+
 # -------------------------------------------------------------
 # TESTS: CoreletForwardingHandler - Timeout Handling - CRITICAL
 # -------------------------------------------------------------
@@ -0,0 +1,152 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for LatencyHistogram and EventMetrics.
+ Tests percentile accuracy, counters, KPI keys and KPI table rendering.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import random
+import pytest
+from typing import Any, Dict, List
+
+# Project imports
+from basefunctions.events.event import Event
+from basefunctions.events.event_exceptions import EventCancelledError
+from basefunctions.events.event_handler import EventResult
+from basefunctions.events.event_metrics import EventMetrics, LatencyHistogram
+from basefunctions.kpi import KPICollector, print_kpi_table
+
+# -------------------------------------------------------------
+# TESTS: LatencyHistogram
+# -------------------------------------------------------------
+
+
+def test_histogram_is_exact_for_small_values() -> None:
+    """Test values below the linear limit are reproduced exactly."""
+    # ARRANGE
+    histogram: LatencyHistogram = LatencyHistogram()
+
+    # ACT
+    for micros in range(1, 101):
+        histogram.record(micros)
+
+    # ASSERT
+    assert histogram.percentile(50) == 50
+    assert histogram.percentile(99) == 99
+    assert histogram.min == 1 and histogram.max == 100
+    assert histogram.mean() == pytest.approx(50.5)
+
+
+@pytest.mark.parametrize("percentile", [50, 95, 99])
+def test_histogram_percentiles_within_relative_error(percentile: int) -> None:
+    """Test large values are reported within the bucket resolution of 1/64."""
+    # ARRANGE
+    rng = random.Random(7)
+    values: List[int] = sorted(rng.randint(0, 10_000_000) for _ in range(20_000))
+    histogram: LatencyHistogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    exact: int = values[-(-len(values) * percentile // 100) - 1]
+
+    # ACT
+    reported: int = histogram.percentile(percentile)
+
+    # ASSERT
+    assert exact <= reported <= exact * (1 + 1 / 64)
+
+
+def test_empty_histogram_reports_zero() -> None:
+    """Test an empty histogram reports 0 and clamps negative values."""
+    # ARRANGE
+    histogram: LatencyHistogram = LatencyHistogram()
+
+    # ACT
+    empty: int = histogram.percentile(99)
+    histogram.record(-5)
+
+    # ASSERT
+    assert empty == 0 and histogram.mean() == 0.0
+    assert histogram.count == 1 and histogram.max == 0
+
+
+# -------------------------------------------------------------
+# TESTS: EventMetrics
+# -------------------------------------------------------------
+
+
+def test_event_metrics_counts_outcomes_per_event_type() -> None:
+    """Test completions are split into failed and cancelled, with retries and timeouts per type."""
+    # ARRANGE
+    metrics: EventMetrics = EventMetrics()
+    ok: Event = Event("fetch")
+    failed: Event = Event("fetch")
+    cancelled: Event = Event("parse")
+
+    # ACT
+    metrics.record_queue_wait("fetch", 0.002)
+    metrics.record_execution("fetch", 0.010)
+    metrics.record_retry("fetch")
+    metrics.record_timeout("fetch")
+    metrics.record_completion(ok, EventResult.business_result(ok.event_id, True, None))
+    metrics.record_completion(failed, EventResult.business_result(failed.event_id, False, None))
+    metrics.record_completion(
+        cancelled, EventResult.exception_result(cancelled.event_id, EventCancelledError("cancelled"))
+    )
+    snapshot: Dict[str, Dict[str, Any]] = metrics.get_metrics()
+
+    # ASSERT
+    fetch = snapshot["fetch"]
+    assert (fetch["completed"], fetch["failed"], fetch["cancelled"]) == (2, 1, 0)
+    assert (fetch["retries"], fetch["timeouts"]) == (1, 1)
+    assert fetch["queue_wait"]["p50"] == pytest.approx(0.002, rel=0.02)
+    assert fetch["execution"]["max"] == pytest.approx(0.010, rel=0.02)
+    assert fetch["end_to_end"]["count"] == 2
+    assert fetch["throughput"] > 0
+    assert (snapshot["parse"]["failed"], snapshot["parse"]["cancelled"]) == (0, 1)
+
+
+def test_event_metrics_kpis_render_as_table(capsys: pytest.CaptureFixture) -> None:
+    """Test KPICollector and print_kpi_table() report EventMetrics without adapters."""
+    # ARRANGE
+    metrics: EventMetrics = EventMetrics(lambda: {"size": 3, "dropped": 1, "rejected": 0})
+    event: Event = Event("app.fetch")
+    metrics.record_execution("app.fetch", 0.004)
+    metrics.record_completion(event, EventResult.business_result(event.event_id, True, None))
+
+    # ACT
+    kpis: Dict[str, Any] = KPICollector().collect(metrics)
+    print_kpi_table(kpis)
+    output: str = capsys.readouterr().out
+
+    # ASSERT
+    assert kpis["technical.event_bus.bus.queue_size"] == {"value": 3.0, "unit": None}
+    assert kpis["technical.event_bus.app_fetch.execution_p99"]["unit"] == "ms"
+    assert kpis["technical.event_bus.app_fetch.execution_p99"]["value"] == pytest.approx(4.0, rel=0.02)
+    assert "APP_FETCH" in output and "end_to_end_p95" in output
+
+
+def test_event_metrics_reset_drops_values() -> None:
+    """Test reset() empties all event types."""
+    # ARRANGE
+    metrics: EventMetrics = EventMetrics()
+    metrics.record_retry("fetch")
+
+    # ACT
+    metrics.reset()
+
+    # ASSERT
+    assert metrics.get_metrics() == {}
+    assert metrics.get_subproviders() is None
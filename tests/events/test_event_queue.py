@@ -0,0 +1,595 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for EventQueue.
+ Tests size bound policies, internal puts, water-mark callbacks and
+ partition lanes.
+
+ Log:
+ v1.0.0 : Initial test implementation
+ v1.1.0 : Held keys and priorities of partition lanes
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import queue
+import threading
+import time
+import pytest
+from typing import List
+
+# Project imports
+from basefunctions.events.event_exceptions import EventQueueFullError
+from basefunctions.events.event_queue import (
+    EventQueue,
+    PartitionRing,
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_DROP_LOWEST,
+    QUEUE_POLICY_DROP_OLDEST,
+    QUEUE_POLICY_REJECT,
+)
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+def _fill(event_queue: EventQueue, priorities: List[int]) -> list:
+    """Offer one task per priority, counters in order, and return the tasks."""
+    tasks = [(priority, counter, f"event-{counter}") for counter, priority in enumerate(priorities)]
+    for task in tasks:
+        assert event_queue.offer(task) == []
+    return tasks
+
+
+# -------------------------------------------------------------
+# TESTS: Construction
+# -------------------------------------------------------------
+
+
+def test_event_queue_rejects_invalid_arguments() -> None:
+    """Test EventQueue validates size, policy and timeout."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="maxsize"):
+        EventQueue(-1)
+    with pytest.raises(ValueError, match="Unknown queue policy"):
+        EventQueue(10, "drop_random")
+    with pytest.raises(ValueError, match="put_timeout"):
+        EventQueue(10, QUEUE_POLICY_BLOCK, -1)
+    with pytest.raises(ValueError, match="aging_interval"):
+        EventQueue(aging_interval=0)
+
+
+def test_unbounded_queue_accepts_everything_in_priority_order() -> None:
+    """Test an unbounded queue never drops and keeps priority order."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+
+    # ACT
+    dropped, rejected = event_queue.offer_many([(3, 0, "c"), (1, 1, "a"), (2, 2, "b")])
+
+    # ASSERT
+    assert dropped == [] and rejected == []
+    assert [event_queue.get_nowait()[2] for _ in range(3)] == ["a", "b", "c"]
+    assert event_queue.unfinished_tasks == 3
+
+
+# -------------------------------------------------------------
+# TESTS: Policies
+# -------------------------------------------------------------
+
+
+def test_reject_policy_raises_when_full() -> None:
+    """Test the reject policy raises EventQueueFullError and counts it."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_REJECT)
+    _fill(event_queue, [1, 1])
+
+    # ACT & ASSERT
+    with pytest.raises(EventQueueFullError):
+        event_queue.offer((1, 9, "late"))
+    assert event_queue.qsize() == 2
+    assert event_queue.get_metrics()["rejected"] == 1
+
+
+def test_block_policy_times_out() -> None:
+    """Test the block policy raises after put_timeout without space."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(1, QUEUE_POLICY_BLOCK, 0.1)
+    _fill(event_queue, [1])
+    start: float = time.monotonic()
+
+    # ACT & ASSERT
+    with pytest.raises(EventQueueFullError):
+        event_queue.offer((1, 9, "late"))
+    assert time.monotonic() - start >= 0.1
+
+
+def test_block_policy_waits_for_consumer() -> None:
+    """Test the block policy admits the task once a consumer makes space."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(1, QUEUE_POLICY_BLOCK, 5)
+    _fill(event_queue, [1])
+    consumer = threading.Timer(0.1, event_queue.get)
+    consumer.start()
+
+    # ACT
+    dropped = event_queue.offer((1, 9, "late"))
+    consumer.join()
+
+    # ASSERT
+    assert dropped == []
+    assert event_queue.get_nowait()[2] == "late"
+
+
+def test_drop_lowest_evicts_lowest_priority_task() -> None:
+    """Test drop_lowest evicts the queued task with the highest priority value."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(3, QUEUE_POLICY_DROP_LOWEST)
+    tasks = _fill(event_queue, [1, 9, 5])
+
+    # ACT
+    dropped = event_queue.offer((2, 10, "urgent"))
+
+    # ASSERT
+    assert dropped == [tasks[1]]
+    assert sorted(task[2] for task in event_queue.queue) == ["event-0", "event-2", "urgent"]
+    assert event_queue.unfinished_tasks == 3
+    assert event_queue.get_metrics()["dropped"] == 1
+
+
+def test_drop_lowest_drops_incoming_task_ranking_last() -> None:
+    """Test drop_lowest drops the incoming task if nothing ranks below it."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_DROP_LOWEST)
+    _fill(event_queue, [1, 2])
+    incoming = (9, 10, "unimportant")
+
+    # ACT
+    dropped = event_queue.offer(incoming)
+
+    # ASSERT
+    assert dropped == [incoming]
+    assert event_queue.qsize() == 2
+
+
+def test_drop_oldest_evicts_first_queued_task() -> None:
+    """Test drop_oldest evicts the task with the lowest counter regardless of priority."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_DROP_OLDEST)
+    tasks = _fill(event_queue, [9, 1])
+
+    # ACT
+    dropped = event_queue.offer((5, 10, "new"))
+
+    # ASSERT
+    assert dropped == [tasks[0]]
+    assert [event_queue.get_nowait()[2] for _ in range(2)] == ["event-1", "new"]
+
+
+def test_put_internal_ignores_bound_and_is_never_dropped() -> None:
+    """Test internal tasks exceed the bound and survive drop policies."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(1, QUEUE_POLICY_DROP_OLDEST)
+    internal = (0, 0, "shutdown")
+    event_queue.put_internal(internal)
+
+    # ACT
+    first = event_queue.offer((5, 1, "a"))
+    second = event_queue.offer((5, 2, "b"))
+
+    # ASSERT
+    assert first == []
+    assert second == [(5, 1, "a")]
+    assert event_queue.get_nowait() is internal
+
+
+def test_admitted_task_holds_its_slot_until_added_or_discarded() -> None:
+    """Test admit() reserves a slot that put_internal() fills and discard_admitted() frees."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_REJECT)
+    first, second = (5, 1, "a"), (5, 2, "b")
+    assert event_queue.admit(first) == []
+    assert event_queue.admit(second) == []
+
+    # ACT
+    with pytest.raises(EventQueueFullError):
+        event_queue.offer((5, 3, "c"))
+    event_queue.put_internal((5, 1, "a"))
+    event_queue.discard_admitted(second)
+    freed = event_queue.offer((5, 4, "d"))
+
+    # ASSERT
+    assert freed == []
+    assert event_queue.get_metrics()["reserved"] == 0
+    assert [event_queue.get_nowait()[2] for _ in range(2)] == ["a", "d"]
+
+
+def test_drain_removes_all_tasks_and_releases_join() -> None:
+    """Test drain() returns queued and internal tasks and counts them as done."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_REJECT)
+    tasks = _fill(event_queue, [5, 1])
+    event_queue.put_internal((0, 9, "internal"))
+
+    # ACT
+    drained = event_queue.drain()
+
+    # ASSERT
+    assert sorted(drained) == sorted([*tasks, (0, 9, "internal")])
+    assert event_queue.qsize() == 0
+    assert event_queue.unfinished_tasks == 0
+    event_queue.join()
+
+
+def test_offer_many_rejects_rest_after_first_rejection() -> None:
+    """Test offer_many returns the tasks that did not fit."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(2, QUEUE_POLICY_REJECT)
+    tasks = [(1, counter, f"event-{counter}") for counter in range(4)]
+
+    # ACT
+    dropped, rejected = event_queue.offer_many(tasks)
+
+    # ASSERT
+    assert dropped == []
+    assert rejected == tasks[2:]
+    assert event_queue.unfinished_tasks == 2
+
+
+# -------------------------------------------------------------
+# TESTS: Water marks
+# -------------------------------------------------------------
+
+
+def test_watermark_callbacks_fire_once_per_crossing() -> None:
+    """Test on_high fires at the high mark and on_low after draining to the low mark."""
+    # ARRANGE
+    signals: List[tuple] = []
+    event_queue: EventQueue = EventQueue()
+    event_queue.set_watermarks(
+        3, 1, on_high=lambda size: signals.append(("high", size)), on_low=lambda size: signals.append(("low", size))
+    )
+
+    # ACT
+    _fill(event_queue, [1, 1, 1, 1])
+    for _ in range(3):
+        event_queue.get_nowait()
+
+    # ASSERT
+    assert signals == [("high", 3), ("low", 1)]
+
+
+def test_watermark_callback_may_use_queue() -> None:
+    """Test callbacks run outside the queue lock."""
+    # ARRANGE
+    sizes: List[int] = []
+    event_queue: EventQueue = EventQueue()
+    event_queue.set_watermarks(1, on_high=lambda size: sizes.append(event_queue.qsize()))
+
+    # ACT
+    event_queue.offer((1, 0, "a"))
+
+    # ASSERT
+    assert sizes == [1]
+
+
+def test_set_watermarks_validates_marks() -> None:
+    """Test invalid water marks are rejected."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="high water mark"):
+        event_queue.set_watermarks(0)
+    with pytest.raises(ValueError, match="low water mark"):
+        event_queue.set_watermarks(5, 5)
+
+
+# -------------------------------------------------------------
+# TESTS: Requeue
+# -------------------------------------------------------------
+
+
+def test_requeue_keeps_unfinished_count_and_ignores_bound() -> None:
+    """Test requeued tasks stay unfinished, exceed the bound and are never dropped."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(1, QUEUE_POLICY_DROP_OLDEST)
+    parked = _fill(event_queue, [1])[0]
+    assert event_queue.get_nowait() is parked
+    event_queue.offer((5, 1, "a"))
+
+    # ACT
+    event_queue.requeue([parked])
+    dropped = event_queue.offer((5, 2, "b"))
+
+    # ASSERT
+    assert dropped == [(5, 1, "a")]
+    assert event_queue.unfinished_tasks == 2
+    assert event_queue.get_nowait() is parked
+
+
+# -------------------------------------------------------------
+# TESTS: Take matching
+# -------------------------------------------------------------
+
+
+def test_take_matching_takes_matching_tasks_in_priority_order() -> None:
+    """Test take_matching removes only matching tasks, best priority first, up to limit."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+    event_queue.offer_many([(5, 0, "a1"), (1, 1, "b1"), (3, 2, "a2"), (2, 3, "a3"), (9, 4, "a4")])
+    event_queue.get_nowait()
+
+    # ACT
+    taken = event_queue.take_matching(lambda task: task[2].startswith("a"), 3)
+
+    # ASSERT
+    assert [task[2] for task in taken] == ["a3", "a2", "a1"]
+    assert [event_queue.get_nowait()[2] for _ in range(event_queue.qsize())] == ["a4"]
+    assert event_queue.unfinished_tasks == 5
+
+
+def test_take_matching_stops_at_limit_and_keeps_skipped_order() -> None:
+    """Test take_matching inspects a bucket only up to the limit and keeps skipped tasks in order."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+    event_queue.offer_many([(1, counter, f"{'ab'[counter % 2]}{counter}") for counter in range(8)])
+    inspected: List[str] = []
+
+    def matches(task: tuple) -> bool:
+        inspected.append(task[2])
+        return task[2].startswith("a")
+
+    # ACT
+    taken = event_queue.take_matching(matches, 2)
+
+    # ASSERT
+    assert [task[2] for task in taken] == ["a0", "a2"]
+    assert inspected == ["a0", "b1", "a2"]
+    assert [event_queue.get_nowait()[2] for _ in range(event_queue.qsize())] == ["b1", "b3", "a4", "b5", "a6", "b7"]
+
+
+def test_take_matching_waits_for_late_tasks() -> None:
+    """Test take_matching waits up to timeout for matching tasks to arrive."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+    producer = threading.Timer(0.05, event_queue.offer, args=((1, 0, "late"),))
+    producer.start()
+
+    # ACT
+    taken = event_queue.take_matching(lambda task: True, 1, timeout=5)
+    producer.join()
+
+    # ASSERT
+    assert taken == [(1, 0, "late")]
+
+
+# -------------------------------------------------------------
+# TESTS: Priority buckets and aging
+# -------------------------------------------------------------
+
+
+def test_equal_priorities_are_served_in_arrival_order() -> None:
+    """Test tasks of one priority leave the queue FIFO regardless of their counters."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+    event_queue.offer_many([(5, 9, "first"), (5, 3, "second"), (1, 7, "urgent"), (5, 1, "third")])
+
+    # ACT
+    order = [event_queue.get_nowait()[2] for _ in range(4)]
+
+    # ASSERT
+    assert order == ["urgent", "first", "second", "third"]
+
+
+def test_aging_serves_long_waiting_low_priority_task() -> None:
+    """Test a low-priority task overtakes fresh high-priority tasks after aging."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue(aging_interval=0.01)
+    event_queue.offer((9, 0, "starving"))
+    time.sleep(0.1)  # ten aging intervals: competes as priority -1
+
+    # ACT
+    event_queue.offer_many([(0, counter, f"urgent-{counter}") for counter in range(1, 4)])
+    first = event_queue.get_nowait()[2]
+
+    # ASSERT
+    assert first == "starving"
+    assert EventQueue().aging_interval is None
+
+
+def test_wait_listener_receives_dequeued_tasks_and_waits() -> None:
+    """Test wait_listener is called for get() and take_matching() with the task's wait."""
+    # ARRANGE
+    waits: List[tuple] = []
+    event_queue: EventQueue = EventQueue()
+    event_queue.wait_listener = lambda task, wait: waits.append((task[2], wait))
+    _fill(event_queue, [1, 2])
+    time.sleep(0.02)
+
+    # ACT
+    event_queue.get_nowait()
+    event_queue.take_matching(lambda task: True, 1)
+
+    # ASSERT
+    assert [name for name, _ in waits] == ["event-0", "event-1"]
+    assert all(wait >= 0.02 for _, wait in waits)
+
+
+def test_metrics_report_wait_statistics_per_priority() -> None:
+    """Test get_metrics() reports queued/dequeued counts and waits per priority."""
+    # ARRANGE
+    event_queue: EventQueue = EventQueue()
+    _fill(event_queue, [1, 1, 7])
+    time.sleep(0.02)
+
+    # ACT
+    event_queue.get_nowait()
+    event_queue.get_nowait()
+    priorities = event_queue.get_metrics()["priorities"]
+
+    # ASSERT
+    assert set(priorities) == {1, 7}
+    assert priorities[1]["queued"] == 0 and priorities[1]["dequeued"] == 2
+    assert priorities[1]["max_wait"] >= priorities[1]["avg_wait"] >= 0.02
+    assert priorities[7] == {"queued": 1, "dequeued": 0, "avg_wait": 0.0, "max_wait": 0.0}
+
+
+# -------------------------------------------------------------
+# TESTS: Partition lanes
+# -------------------------------------------------------------
+
+
+def _partitioned_queue(lanes: List[str]) -> EventQueue:
+    """Create an unbounded queue keyed by the first element of (key, number) payloads."""
+    event_queue: EventQueue = EventQueue()
+    event_queue.partition_key = lambda task: task[2][0] if isinstance(task[2], tuple) else None
+    for lane in lanes:
+        event_queue.add_lane(lane)
+    return event_queue
+
+
+def _owner(event_queue: EventQueue, key: str) -> str:
+    """Get the lane whose consumer receives the tasks of key."""
+    return event_queue._ring.lookup(key)
+
+
+def test_partition_ring_moves_few_keys_when_lane_is_added() -> None:
+    """Test adding a lane only reassigns keys to the new lane, about 1/n of them."""
+    # ARRANGE
+    ring: PartitionRing = PartitionRing()
+    for lane in ("a", "b", "c"):
+        ring.add(lane)
+    keys: List[str] = [f"key-{number}" for number in range(3000)]
+    before = {key: ring.lookup(key) for key in keys}
+
+    # ACT
+    ring.add("d")
+    after = {key: ring.lookup(key) for key in keys}
+
+    # ASSERT
+    moved: List[str] = [key for key in keys if before[key] != after[key]]
+    assert all(after[key] == "d" for key in moved)
+    assert 0.15 < len(moved) / len(keys) < 0.35
+    assert PartitionRing().lookup("key") is None
+
+
+def test_keyed_tasks_go_to_their_lane_in_order_and_unkeyed_to_any_lane() -> None:
+    """Test a lane returns its keyed tasks FIFO, regardless of priority, and shares unkeyed tasks."""
+    # ARRANGE
+    event_queue: EventQueue = _partitioned_queue(["a", "b"])
+    key: str = next(f"key-{number}" for number in range(100) if _owner(event_queue, f"key-{number}") == "a")
+    event_queue.put((5, 0, (key, 0)))
+    event_queue.put((1, 1, (key, 1)))
+    event_queue.put((3, 2, "unkeyed"))
+
+    # ACT
+    other = event_queue.get(block=False, lane="b")
+    first = event_queue.get(block=False, lane="a")
+    event_queue.release_key(first)
+    second = event_queue.get(block=False, lane="a")
+
+    # ASSERT
+    assert other == (3, 2, "unkeyed")
+    assert (first[2], second[2]) == ((key, 0), (key, 1))
+    assert event_queue.get_metrics()["partitioned"] == 0
+    with pytest.raises(queue.Empty):
+        event_queue.get(block=False, lane="b")
+
+
+def test_held_key_blocks_next_task_until_released() -> None:
+    """Test the next task of a key waits until release_key() of the running one, even after a lane change."""
+    # ARRANGE
+    event_queue: EventQueue = _partitioned_queue(["a"])
+    event_queue.put((1, 0, ("key", 0)))
+    running = event_queue.get(block=False, lane="a")
+    event_queue.add_lane("b")
+    event_queue.remove_lane("a")
+    event_queue.put((1, 1, ("key", 1)))
+
+    # ACT
+    with pytest.raises(queue.Empty):
+        event_queue.get(timeout=0.05, lane="b")
+    threading.Timer(0.05, event_queue.release_key, args=(running,)).start()
+    next_task = event_queue.get(timeout=2, lane="b")
+
+    # ASSERT
+    assert next_task[2] == ("key", 1)
+
+
+def test_held_key_does_not_block_other_keys_of_the_lane() -> None:
+    """Test a lane skips the tasks of a held key and serves its other keys in order."""
+    # ARRANGE
+    event_queue: EventQueue = _partitioned_queue(["a"])
+    event_queue.put((1, 0, ("held", 0)))
+    running = event_queue.get(block=False, lane="a")
+    event_queue.put((1, 1, ("held", 1)))
+    event_queue.put((1, 2, ("free", 0)))
+    event_queue.put((1, 3, ("free", 1)))
+
+    # ACT
+    free_tasks = []
+    for _ in range(2):
+        free_tasks.append(event_queue.get(block=False, lane="a"))
+        event_queue.release_key(free_tasks[-1])
+    with pytest.raises(queue.Empty):
+        event_queue.get(block=False, lane="a")
+    event_queue.release_key(running)
+    next_task = event_queue.get(block=False, lane="a")
+
+    # ASSERT
+    assert [task[2] for task in free_tasks] == [("free", 0), ("free", 1)]
+    assert next_task[2] == ("held", 1)
+
+
+def test_lane_tasks_compete_with_unkeyed_tasks_by_priority_and_aging() -> None:
+    """Test a better unkeyed task is served before the lane, and an aged lane task before it."""
+    # ARRANGE
+    event_queue: EventQueue = _partitioned_queue(["a"])
+    event_queue.put((5, 0, ("key", 0)))
+    event_queue.put((1, 1, "urgent"))
+    aged_queue: EventQueue = EventQueue(aging_interval=0.01)
+    aged_queue.partition_key = event_queue.partition_key
+    aged_queue.add_lane("a")
+    aged_queue.put((5, 0, ("key", 0)))
+    time.sleep(0.06)
+    aged_queue.put((1, 1, "urgent"))
+
+    # ACT
+    order = [event_queue.get(block=False, lane="a")[2] for _ in range(2)]
+    aged_first = aged_queue.get(block=False, lane="a")[2]
+
+    # ASSERT
+    assert order == ["urgent", ("key", 0)]
+    assert aged_first == ("key", 0)
+
+
+def test_removing_lanes_moves_queued_tasks_and_keeps_order() -> None:
+    """Test tasks of a removed lane move to the new owner, and to the priority buckets without lanes."""
+    # ARRANGE
+    event_queue: EventQueue = _partitioned_queue(["a", "b"])
+    keys: List[str] = [f"key-{number}" for number in range(20)]
+    for number in range(3):
+        for index, key in enumerate(keys):
+            event_queue.put((1, number * len(keys) + index, (key, number)))
+
+    # ACT
+    event_queue.remove_lane("a")
+    moved = [task[2] for _, task in event_queue._lanes["b"]]
+    event_queue.remove_lane("b")
+
+    # ASSERT
+    for key in keys:
+        assert [number for task_key, number in moved if task_key == key] == [0, 1, 2]
+    assert event_queue.get_metrics()["partitioned"] == 0
+    assert event_queue.qsize() == 60
+    assert event_queue.get(block=False)[2][1] == 0
@@ -0,0 +1,131 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for EventSchedule.
+ Tests periodic runs, publish failures, result callbacks and cancellation.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import time
+from typing import List
+from unittest.mock import Mock
+
+# Project imports
+from basefunctions.events.event import Event
+from basefunctions.events.event_exceptions import NoHandlerAvailableError
+from basefunctions.events.event_future import EventFuture
+from basefunctions.events.event_handler import EventResult
+from basefunctions.events.event_schedule import EventSchedule
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it is true or timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _make_bus(published: List[Event]) -> Mock:
+    """Create a bus mock resolving every published event at once."""
+
+    def publish(event, return_future=False, delay=None):
+        future = EventFuture(event.event_id)
+        future.set_running_or_notify_cancel()
+        future.set_result(EventResult.business_result(event.event_id, True, event.event_data))
+        published.append(event)
+        return future
+
+    bus: Mock = Mock()
+    bus.publish.side_effect = publish
+    bus._defer_release.side_effect = lambda release: release()
+    return bus
+
+
+# -------------------------------------------------------------
+# TESTS: EventSchedule
+# -------------------------------------------------------------
+
+
+def test_schedule_publishes_fresh_events_until_cancelled() -> None:
+    """Test every run publishes a new event with zero delay and cancel() stops the runs."""
+    # ARRANGE
+    published: List[Event] = []
+    results: List[EventResult] = []
+    bus: Mock = _make_bus(published)
+    schedule: EventSchedule = EventSchedule(
+        bus, lambda: Event("tick", event_data=len(published)), 0.02, on_result=results.append
+    )
+
+    # ACT
+    schedule.start(0)
+    assert _wait_until(lambda: len(results) >= 3)
+    cancelled: bool = schedule.cancel()
+    time.sleep(0.05)
+    runs: int = schedule.runs
+    time.sleep(0.1)
+
+    # ASSERT
+    assert cancelled is True and schedule.cancelled is True
+    assert schedule.runs == runs == len(published)
+    assert len({event.event_id for event in published}) == len(published)
+    assert [result.data for result in results[:3]] == [0, 1, 2]
+    assert all(call.kwargs == {"return_future": True, "delay": 0} for call in bus.publish.call_args_list)
+
+
+def test_schedule_keeps_running_after_publish_failure() -> None:
+    """Test a run that fails to publish is skipped and the following runs still happen."""
+    # ARRANGE
+    published: List[Event] = []
+    bus: Mock = _make_bus(published)
+    attempts: List[int] = []
+
+    def make_event() -> Event:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise NoHandlerAvailableError("tick")
+        return Event("tick")
+
+    schedule: EventSchedule = EventSchedule(bus, make_event, 0.02)
+
+    # ACT
+    schedule.start(0)
+    assert _wait_until(lambda: len(published) >= 2)
+    schedule.cancel()
+    time.sleep(0.05)
+
+    # ASSERT
+    assert schedule.runs == len(published) == len(attempts) - 1
+
+
+def test_schedule_cancelled_before_start_never_runs() -> None:
+    """Test start() after cancel() schedules nothing."""
+    # ARRANGE
+    published: List[Event] = []
+    schedule: EventSchedule = EventSchedule(_make_bus(published), lambda: Event("tick"), 0.01)
+
+    # ACT
+    schedule.cancel()
+    schedule.start(0)
+    time.sleep(0.05)
+
+    # ASSERT
+    assert published == [] and schedule.cancel() is False
@@ -0,0 +1,176 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for EventTracer.
+ Tests sampling, wait spans, the traced corelet round trip and the Chrome
+ trace export.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import json
+import os
+import time
+import pytest
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock
+
+# Project imports
+from basefunctions.events.corelet_worker import CoreletWorker
+from basefunctions.events.event import Event
+from basefunctions.events.event_handler import EventResult
+from basefunctions.events.event_tracer import EventTracer
+from basefunctions.events.shared_memory_transport import decode_message, encode_message
+
+# -------------------------------------------------------------
+# TESTS: Sampling
+# -------------------------------------------------------------
+
+
+def test_configure_rejects_invalid_arguments() -> None:
+    """Test configure() validates sample_rate and max_spans."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="sample_rate"):
+        tracer.configure(sample_rate=0)
+    with pytest.raises(ValueError, match="sample_rate"):
+        tracer.configure(sample_rate=1.5)
+    with pytest.raises(ValueError, match="max_spans"):
+        tracer.configure(max_spans=0)
+
+
+def test_sampling_is_deterministic_per_event_and_follows_rate() -> None:
+    """Test the sampling decision repeats for an event and matches sample_rate overall."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+    tracer.configure(sample_rate=0.1)
+    events: List[Event] = [Event("fetch") for _ in range(20_000)]
+
+    # ACT
+    sampled: List[bool] = [tracer.is_sampled(event) for event in events]
+
+    # ASSERT
+    assert sampled == [tracer.is_sampled(event) for event in events]
+    assert 0.08 < sum(sampled) / len(events) < 0.12
+
+
+# -------------------------------------------------------------
+# TESTS: Recording
+# -------------------------------------------------------------
+
+
+def test_queue_wait_closes_rate_limit_wait_at_enqueue() -> None:
+    """Test the rate limiter wait ends where the queue wait starts."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+    event: Event = Event("fetch")
+    tracer.begin_rate_limit_wait(event)
+    time.sleep(0.01)
+
+    # ACT
+    tracer.add_queue_wait(event, 0.002)
+    spans = tracer.get_spans()
+
+    # ASSERT
+    (limit_name, limit_start, limit_duration, *_), (queue_name, queue_start, queue_duration, *_) = spans
+    assert (limit_name, queue_name) == ("rate_limit_wait", "queue_wait")
+    assert limit_start + limit_duration == queue_start
+    assert queue_duration == 2_000_000
+    assert limit_duration >= 5_000_000
+
+
+def test_ring_buffer_keeps_newest_spans() -> None:
+    """Test spans beyond max_spans drop the oldest ones."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+    tracer.configure(max_spans=3)
+    event: Event = Event("fetch")
+
+    # ACT
+    for started in range(5):
+        tracer.add_span("handler", event, started, started + 1)
+
+    # ASSERT
+    assert [span[1] for span in tracer.get_spans()] == [2, 3, 4]
+
+
+def test_traced_corelet_round_trip_collects_spans_of_both_processes() -> None:
+    """Test a TracedMessage is unwrapped by CoreletWorker and its reply brings the corelet spans back."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+    worker: CoreletWorker = CoreletWorker("worker-1", Mock(), Mock())
+    event: Event = Event("fetch", event_data={"url": "x"})
+    data, _ = tracer.encode(event, event, None)
+
+    # ACT
+    received, spans = worker._decode_event(data)
+    reply: bytes = worker._encode_reply(EventResult.business_result(received.event_id, True, 42), received, spans)
+    result = tracer.decode(reply, event)
+
+    # ASSERT
+    assert received.event_data == {"url": "x"}
+    assert isinstance(result, EventResult) and result.data == 42
+    assert [span[0] for span in tracer.get_spans()] == ["pickle", "unpickle", "pickle", "unpickle"]
+    assert {span[5] for span in tracer.get_spans()} == {event.event_id}
+
+
+def test_untraced_corelet_messages_stay_plain() -> None:
+    """Test messages without TracedMessage are decoded and answered without spans."""
+    # ARRANGE
+    worker: CoreletWorker = CoreletWorker("worker-1", Mock(), Mock())
+    event: Event = Event("fetch")
+
+    # ACT
+    received, spans = worker._decode_event(encode_message(event)[0])
+    reply: bytes = worker._encode_reply(EventResult.business_result(event.event_id, True, None), received, spans)
+
+    # ASSERT
+    assert spans is None and received.event_id == event.event_id
+    assert isinstance(decode_message(reply)[0], EventResult)
+
+
+# -------------------------------------------------------------
+# TESTS: Export
+# -------------------------------------------------------------
+
+
+def test_write_produces_chrome_trace(tmp_path: Path) -> None:
+    """Test write() emits complete events for work, async pairs for waits and process names."""
+    # ARRANGE
+    tracer: EventTracer = EventTracer()
+    event: Event = Event("fetch")
+    tracer.add_span("publish", event, 1_000, 3_000)
+    tracer.add_queue_wait(event, 0.001)
+    tracer.add_spans([("handler", 5_000, 2_000, 4242, 7, event.event_id, "fetch")])
+    path: Path = tmp_path / "events.trace.json"
+
+    # ACT
+    written: int = tracer.write(str(path))
+    trace: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+
+    # ASSERT
+    entries: List[Dict[str, Any]] = trace["traceEvents"]
+    by_phase: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in entries:
+        by_phase.setdefault(entry["ph"], []).append(entry)
+    assert written == 3
+    assert [entry["name"] for entry in by_phase["X"]] == ["publish", "handler"]
+    assert by_phase["X"][0]["ts"] == 1.0 and by_phase["X"][0]["dur"] == 2.0
+    assert by_phase["X"][0]["args"] == {"event_id": event.event_id, "event_type": "fetch"}
+    assert by_phase["b"][0]["id"] == by_phase["e"][0]["id"] == event.event_id
+    process_names = {entry["pid"]: entry["args"]["name"] for entry in by_phase["M"] if entry["name"] == "process_name"}
+    assert process_names == {os.getpid(): "EventBus", 4242: "Corelet 4242"}
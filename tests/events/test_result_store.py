@@ -0,0 +1,209 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for ResultStore.
+ Tests placeholders, consumption, LRU eviction across shards and TTL expiry.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import threading
+import time
+import pytest
+from typing import List
+
+# Project imports
+from basefunctions.events.event_handler import EventResult
+from basefunctions.events.result_store import ResultStore
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+def _result(event_id: str) -> EventResult:
+    """Create a successful result for event_id."""
+    return EventResult.business_result(event_id, True, event_id)
+
+
+# -------------------------------------------------------------
+# TESTS: Construction
+# -------------------------------------------------------------
+
+
+def test_result_store_rejects_invalid_arguments() -> None:
+    """Test ResultStore validates capacity, shard count and TTL."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError, match="max_results"):
+        ResultStore(0)
+    with pytest.raises(ValueError, match="power of two"):
+        ResultStore(10, num_shards=12)
+    with pytest.raises(ValueError, match="default_ttl"):
+        ResultStore(10, default_ttl=0)
+
+
+# -------------------------------------------------------------
+# TESTS: Placeholders and consumption
+# -------------------------------------------------------------
+
+
+def test_placeholder_is_pending_until_result_is_stored() -> None:
+    """Test reserve() marks an event pending and put() replaces the placeholder."""
+    # ARRANGE
+    store: ResultStore = ResultStore(10)
+    store.reserve("a")
+
+    # ACT
+    pending_before: bool = store.is_pending("a")
+    store.put("a", _result("a"))
+
+    # ASSERT
+    assert pending_before is True
+    assert store.is_pending("a") is False
+    assert store.get("a").data == "a"
+    assert "a" in store and "b" not in store
+    with pytest.raises(KeyError):
+        store["b"]
+
+
+def test_pop_consumes_and_snapshot_preserves_in_store_order() -> None:
+    """Test pop() removes an entry while snapshot() returns all entries in storage order."""
+    # ARRANGE
+    store: ResultStore = ResultStore(100, num_shards=4)
+    for index in range(10):
+        store.reserve(f"event-{index}")
+    for index in range(9, -1, -1):
+        store.put(f"event-{index}", _result(f"event-{index}"))
+    store.reserve("pending")
+
+    # ACT
+    popped: EventResult | None = store.pop("event-5")
+    snapshot = store.snapshot()
+
+    # ASSERT
+    assert popped.data == "event-5" and store.pop("event-5") is None
+    assert list(snapshot) == [f"event-{index}" for index in (9, 8, 7, 6, 4, 3, 2, 1, 0)] + ["pending"]
+    assert snapshot["pending"] is None
+    assert len(store) == 10
+
+
+# -------------------------------------------------------------
+# TESTS: LRU eviction
+# -------------------------------------------------------------
+
+
+def test_eviction_removes_least_recently_stored_entries_across_shards() -> None:
+    """Test the oldest entries are evicted globally, and re-storing an entry refreshes it."""
+    # ARRANGE
+    store: ResultStore = ResultStore(4, num_shards=8)
+    for index in range(4):
+        store.put(f"event-{index}", _result(f"event-{index}"))
+
+    # ACT
+    store.put("event-0", _result("event-0"))
+    store.put("event-4", _result("event-4"))
+    store.put("event-5", _result("event-5"))
+
+    # ASSERT
+    assert sorted(store.snapshot()) == ["event-0", "event-3", "event-4", "event-5"]
+
+
+def test_concurrent_puts_stay_within_capacity() -> None:
+    """Test concurrent writers on different shards never leave the store above max_results."""
+    # ARRANGE
+    store: ResultStore = ResultStore(50)
+    errors: List[Exception] = []
+
+    def writer(prefix: str) -> None:
+        try:
+            for index in range(500):
+                store.put(f"{prefix}-{index}", _result(prefix))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(f"writer-{number}",)) for number in range(8)]
+
+    # ACT
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # ASSERT
+    assert errors == []
+    assert len(store) == 50
+
+
+# -------------------------------------------------------------
+# TESTS: TTL
+# -------------------------------------------------------------
+
+
+def test_results_expire_after_ttl_but_placeholders_do_not() -> None:
+    """Test a TTL counts from put(), reserve() ttl overrides the default and expired entries vanish."""
+    # ARRANGE
+    store: ResultStore = ResultStore(10, default_ttl=0.05)
+    store.reserve("kept", ttl=60)
+    store.reserve("pending")
+    store.put("kept", _result("kept"))
+    store.put("short", _result("short"))
+
+    # ACT
+    time.sleep(0.1)
+
+    # ASSERT
+    assert store.get("short") is None and "short" not in store.snapshot()
+    assert store.get("kept").data == "kept"
+    assert store.is_pending("pending") is True
+    store.close()
+
+
+def test_purge_expired_removes_expired_results() -> None:
+    """Test purge_expired() drops expired results and reports how many."""
+    # ARRANGE
+    store: ResultStore = ResultStore(10, default_ttl=0.05)
+    for index in range(3):
+        store.put(f"event-{index}", _result(f"event-{index}"))
+    store.reserve("pending")
+    time.sleep(0.1)
+
+    # ACT
+    removed: int = store.purge_expired()
+
+    # ASSERT
+    assert removed == 3
+    assert len(store) == 1
+    store.close()
+
+
+def test_purge_expired_skips_replaced_and_consumed_results() -> None:
+    """Test purge_expired() only removes results whose current expiry passed and stale heap items stay bounded."""
+    # ARRANGE
+    store: ResultStore = ResultStore(1000, num_shards=1, default_ttl=0.05)
+    store.put("replaced", _result("replaced"))
+    for index in range(200):
+        store.put(f"consumed-{index}", _result(f"consumed-{index}"))
+        store.pop(f"consumed-{index}")
+    store.reserve("replaced", ttl=60)
+    store.put("replaced", _result("replaced"))
+    time.sleep(0.1)
+
+    # ACT
+    removed: int = store.purge_expired()
+
+    # ASSERT
+    assert removed == 0
+    assert store.get("replaced").data == "replaced"
+    assert len(store._expiry[0]) <= 2 * len(store) + 64
+    store.close()
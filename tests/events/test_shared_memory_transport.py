@@ -0,0 +1,228 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for the shared memory corelet transport.
+ Tests encoding/decoding, segment lifetime and crash cleanup.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import gc
+import os
+import pickle
+import pytest
+import numpy as np
+import pandas as pd
+from multiprocessing import shared_memory
+from typing import Any, Dict, List
+
+# Project imports
+from basefunctions.events import shared_memory_transport
+from basefunctions.events.shared_memory_transport import (
+    SharedMemoryEnvelope,
+    decode_message,
+    encode_message,
+    reclaim_leases,
+    sweep_segments,
+    unlink_segments,
+)
+
+pytestmark = pytest.mark.skipif(
+    not shared_memory_transport.SHARED_MEMORY_SUPPORTED, reason="POSIX shared memory required"
+)
+
+# -------------------------------------------------------------
+# HELPERS
+# -------------------------------------------------------------
+
+
+def _segment_exists(name: str) -> bool:
+    """Check whether a shared memory segment name is still linked."""
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+# -------------------------------------------------------------
+# TESTS: encode_message() / decode_message()
+# -------------------------------------------------------------
+
+
+def test_encode_without_threshold_is_plain_pickle() -> None:
+    """Test encode_message() without threshold produces a plain pickle."""
+    # ARRANGE
+    payload: Dict[str, Any] = {"values": np.arange(10_000)}
+
+    # ACT
+    data, names = encode_message(payload)
+
+    # ASSERT
+    assert names == []
+    assert np.array_equal(pickle.loads(data)["values"], payload["values"])
+
+
+def test_encode_below_threshold_creates_no_segments() -> None:
+    """Test small buffers stay in the pipe message."""
+    # ARRANGE
+    payload: np.ndarray = np.arange(10)
+
+    # ACT
+    data, names = encode_message(payload, threshold=1024)
+    decoded, threshold = decode_message(data)
+
+    # ASSERT
+    assert names == []
+    assert threshold is None
+    assert np.array_equal(decoded, payload)
+
+
+def test_large_buffers_travel_via_shared_memory() -> None:
+    """Test arrays, DataFrames and bytes above threshold are moved to segments."""
+    # ARRANGE
+    array: np.ndarray = np.arange(100_000, dtype=np.float64)
+    frame: pd.DataFrame = pd.DataFrame({"close": np.arange(50_000.0), "volume": np.arange(50_000)})
+    blob: bytes = b"x" * 100_000
+
+    # ACT
+    data, names = encode_message({"array": array, "frame": frame, "blob": blob}, threshold=1024)
+    decoded, threshold = decode_message(data)
+
+    # ASSERT
+    assert len(names) == 4
+    assert len(data) < 4096
+    assert isinstance(pickle.loads(data), SharedMemoryEnvelope)
+    assert threshold == 1024
+    assert np.array_equal(decoded["array"], array)
+    assert decoded["frame"].equals(frame)
+    assert decoded["blob"] == blob
+
+
+def test_decode_unlinks_segments_immediately() -> None:
+    """Test receiver unlinks segment names on attach."""
+    # ARRANGE
+    data, names = encode_message(np.arange(100_000), threshold=1024)
+    assert all(_segment_exists(name) for name in names)
+
+    # ACT
+    decoded, _ = decode_message(data)
+
+    # ASSERT
+    assert not any(_segment_exists(name) for name in names)
+    assert decoded[-1] == 99_999
+
+
+def test_decoded_arrays_are_views_on_shared_memory() -> None:
+    """Test decoded arrays are not copied out of the segment."""
+    # ARRANGE
+    data, _ = encode_message(np.arange(100_000), threshold=1024)
+
+    # ACT
+    decoded, _ = decode_message(data)
+
+    # ASSERT
+    assert not decoded.flags.owndata
+    assert decoded.flags.writeable
+
+
+def test_reclaim_leases_releases_unused_segments() -> None:
+    """Test leases are closed once the decoded objects are released."""
+    # ARRANGE
+    reclaim_leases()
+    data, _ = encode_message(np.arange(100_000), threshold=1024)
+    decoded, _ = decode_message(data)
+    assert reclaim_leases() >= 1
+
+    # ACT
+    del decoded
+    gc.collect()
+    remaining: int = reclaim_leases()
+
+    # ASSERT
+    assert remaining == 0
+
+
+def test_encode_failure_unlinks_created_segments() -> None:
+    """Test segments are removed when pickling fails midway."""
+    # ARRANGE
+    before: List[str] = os.listdir(shared_memory_transport.SHARED_MEMORY_DIR)
+
+    # ACT / ASSERT
+    with pytest.raises(Exception):
+        encode_message([np.arange(100_000), lambda: None], threshold=1024)
+
+    assert os.listdir(shared_memory_transport.SHARED_MEMORY_DIR) == before
+
+
+# -------------------------------------------------------------
+# TESTS: unlink_segments() / sweep_segments()
+# -------------------------------------------------------------
+
+
+def test_unlink_segments_removes_unconsumed_message() -> None:
+    """Test sender can release segments of a message that was never received."""
+    # ARRANGE
+    _, names = encode_message(np.arange(100_000), threshold=1024)
+
+    # ACT
+    count: int = unlink_segments(names)
+
+    # ASSERT
+    assert count == 1
+    assert not _segment_exists(names[0])
+    assert unlink_segments(names) == 0
+
+
+def test_sweep_segments_removes_segments_of_process() -> None:
+    """Test sweep_segments() unlinks all segments created by a PID."""
+    # ARRANGE
+    _, names = encode_message([np.arange(100_000), np.arange(100_000)], threshold=1024)
+
+    # ACT
+    count: int = sweep_segments(os.getpid())
+
+    # ASSERT
+    assert count == len(names) == 2
+    assert not any(_segment_exists(name) for name in names)
+
+
+# -------------------------------------------------------------
+# TESTS: Corelet round trip
+# -------------------------------------------------------------
+
+
+def test_corelet_worker_replies_via_shared_memory() -> None:
+    """Test CoreletWorker decodes shared memory events and replies with the same threshold."""
+    # ARRANGE
+    from unittest.mock import Mock
+    import basefunctions
+    from basefunctions.events.corelet_worker import CoreletWorker
+
+    output_pipe: Mock = Mock()
+    worker: CoreletWorker = CoreletWorker("worker-1", Mock(), output_pipe)
+    event: basefunctions.Event = basefunctions.Event("test_event", event_data=np.arange(100_000))
+    data, _ = encode_message(event, threshold=1024)
+    decoded_event, worker._shared_memory_threshold = decode_message(data)
+    result = basefunctions.EventResult.business_result(decoded_event.event_id, True, decoded_event.event_data * 2)
+
+    # ACT
+    worker._send_result(decoded_event, result)
+    reply, threshold = decode_message(output_pipe.send.call_args[0][0])
+
+    # ASSERT
+    assert threshold == 1024
+    assert reply.success is True
+    assert reply.data[-1] == 199_998
@@ -0,0 +1,171 @@
+"""
+=============================================================================
+ Licensed Materials, Property of neuraldevelopment, Munich
+ Project : basefunctions
+ Copyright (c) by neuraldevelopment
+ All rights reserved.
+
+ Description:
+ Pytest test suite for ThreadAutoscaler and WorkerActivity.
+ Tests grow/shrink decisions, bounds, cool-down and metrics.
+
+ Log:
+ v1.0.0 : Initial test implementation
+=============================================================================
+"""
+
+# -------------------------------------------------------------
+# IMPORTS
+# -------------------------------------------------------------
+# External imports
+import pytest
+
+# Project imports
+from basefunctions.events.thread_autoscaler import (
+    SCALE_ACTION_GROW,
+    SCALE_ACTION_SHRINK,
+    ThreadAutoscaler,
+    WorkerActivity,
+)
+
+# -------------------------------------------------------------
+# FIXTURES
+# -------------------------------------------------------------
+
+
+@pytest.fixture
+def autoscaler() -> ThreadAutoscaler:
+    """Provide an autoscaler for 2..8 threads with a 10 second cool-down."""
+    scaler = ThreadAutoscaler(min_threads=2, max_threads=8, cooldown=10)
+    # First sample only establishes the utilisation baseline
+    scaler.decide(0.0, threads=2, busy_time=0.0, queue_depth=0, queue_wait=0.0, idle_workers=0)
+    return scaler
+
+
+# -------------------------------------------------------------
+# TESTS: Construction
+# -------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"min_threads": 0, "max_threads": 4},
+        {"min_threads": 4, "max_threads": 2},
+        {"min_threads": 1, "max_threads": 2, "cooldown": -1},
+        {"min_threads": 1, "max_threads": 2, "target_utilisation": 0},
+    ],
+)
+def test_autoscaler_rejects_invalid_configuration(kwargs: dict) -> None:
+    """Test invalid bounds and thresholds raise ValueError."""
+    # ACT & ASSERT
+    with pytest.raises(ValueError):
+        ThreadAutoscaler(**kwargs)
+
+
+# -------------------------------------------------------------
+# TESTS: decide()
+# -------------------------------------------------------------
+
+
+def test_decide_grows_on_queue_wait(autoscaler: ThreadAutoscaler) -> None:
+    """Test queued events waiting longer than the target add threads."""
+    # ACT
+    delta: int = autoscaler.decide(1.0, threads=2, busy_time=0.5, queue_depth=50, queue_wait=0.2, idle_workers=0)
+
+    # ASSERT
+    assert delta == 2  # At most doubling
+
+
+def test_decide_grows_on_utilisation(autoscaler: ThreadAutoscaler) -> None:
+    """Test busy workers with a backlog add threads even without measured wait."""
+    # ACT
+    delta: int = autoscaler.decide(1.0, threads=2, busy_time=1.9, queue_depth=1, queue_wait=0.0, idle_workers=0)
+
+    # ASSERT
+    assert delta == 1  # Never more threads than queued events
+
+
+def test_decide_never_exceeds_max_threads(autoscaler: ThreadAutoscaler) -> None:
+    """Test growth stops at max_threads."""
+    # ACT
+    delta: int = autoscaler.decide(1.0, threads=7, busy_time=7.0, queue_depth=100, queue_wait=1.0, idle_workers=0)
+    at_max: int = autoscaler.decide(2.0, threads=8, busy_time=15.0, queue_depth=100, queue_wait=1.0, idle_workers=0)
+
+    # ASSERT
+    assert delta == 1
+    assert at_max == 0
+
+
+def test_decide_holds_with_backlog_below_targets(autoscaler: ThreadAutoscaler) -> None:
+    """Test a short queue served quickly by idle workers does not grow the pool."""
+    # ACT
+    delta: int = autoscaler.decide(1.0, threads=2, busy_time=0.2, queue_depth=1, queue_wait=0.001, idle_workers=0)
+
+    # ASSERT
+    assert delta == 0
+
+
+def test_decide_shrinks_idle_workers_to_min_threads(autoscaler: ThreadAutoscaler) -> None:
+    """Test idle workers are retired down to min_threads once the queue is empty."""
+    # ACT
+    delta: int = autoscaler.decide(20.0, threads=6, busy_time=0.0, queue_depth=0, queue_wait=0.0, idle_workers=6)
+
+    # ASSERT
+    assert delta == -4
+
+
+def test_decide_waits_cooldown_after_growth(autoscaler: ThreadAutoscaler) -> None:
+    """Test no worker is retired within the cool-down after growing."""
+    # ARRANGE
+    autoscaler.decide(1.0, threads=2, busy_time=1.0, queue_depth=10, queue_wait=1.0, idle_workers=0)
+
+    # ACT
+    early: int = autoscaler.decide(5.0, threads=4, busy_time=1.0, queue_depth=0, queue_wait=0.0, idle_workers=2)
+    late: int = autoscaler.decide(12.0, threads=4, busy_time=1.0, queue_depth=0, queue_wait=0.0, idle_workers=2)
+
+    # ASSERT
+    assert early == 0
+    assert late == -2
+
+
+def test_metrics_record_decisions(autoscaler: ThreadAutoscaler) -> None:
+    """Test decisions are exposed with their reason and sample."""
+    # ARRANGE
+    autoscaler.decide(1.0, threads=2, busy_time=0.0, queue_depth=10, queue_wait=0.5, idle_workers=0)
+    autoscaler.decide(20.0, threads=4, busy_time=0.0, queue_depth=0, queue_wait=0.0, idle_workers=4)
+
+    # ACT
+    metrics = autoscaler.get_metrics()
+
+    # ASSERT
+    assert metrics["scale_ups"] == 1
+    assert metrics["scale_downs"] == 1
+    assert [d["action"] for d in metrics["decisions"]] == [SCALE_ACTION_GROW, SCALE_ACTION_SHRINK]
+    assert metrics["decisions"][0]["threads_after"] == 4
+    assert "queue wait" in metrics["decisions"][0]["reason"]
+    assert metrics["queue_depth"] == 0
+
+
+# -------------------------------------------------------------
+# TESTS: WorkerActivity
+# -------------------------------------------------------------
+
+
+def test_worker_activity_accounts_busy_and_idle_time() -> None:
+    """Test begin()/end() accumulate busy time and reset idle time."""
+    # ARRANGE
+    activity: WorkerActivity = WorkerActivity()
+    activity.retire = True
+
+    # ACT
+    activity.begin()
+    busy_now = activity.idle_for(activity.busy_since + 5)
+    activity.end()
+
+    # ASSERT
+    assert busy_now == 0.0
+    assert activity.retire is False
+    assert activity.busy_since is None
+    assert activity.busy_total >= 0.0
+    assert activity.idle_for(activity.last_active + 3) == 3
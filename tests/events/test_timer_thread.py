@@ -13,6 +13,7 @@
  unsafe and can cause deadlocks or interpreter corruption.
 
  Log:
+ v1.1.0 : Deadlines via shared DeadlineScheduler instead of threading.Timer
  v1.0.0 : Initial test implementation
 =============================================================================
 """
@@ -63,17 +64,37 @@ def test_timer_thread_initialization(current_thread_id: int) -> None:
     # ASSERT
     assert timer.timeout == timeout
     assert timer.thread_id == current_thread_id
-    assert timer.timer is not None
+    assert timer.handle is None
 
 
-def test_timer_thread_creates_threading_timer(current_thread_id: int) -> None:
-    """Test TimerThread creates internal threading.Timer."""
-    # ACT
+def test_timer_thread_registers_deadline_with_shared_scheduler(current_thread_id: int) -> None:
+    """Test TimerThread registers a deadline instead of starting a thread."""
+    # ARRANGE
     timer: TimerThread = TimerThread(timeout=3, thread_id=current_thread_id)
 
+    # ACT
+    with timer:
+        remaining: float = timer.handle.deadline - time.monotonic()
+
+    # ASSERT
+    assert 2.5 < remaining <= 3
+    assert timer.handle.cancelled
+
+
+def test_timer_thread_does_not_create_threads_per_context(current_thread_id: int) -> None:
+    """Test repeated TimerThread contexts do not start OS threads."""
+    # ARRANGE
+    with TimerThread(timeout=10, thread_id=current_thread_id):
+        pass
+    threads_before: int = threading.active_count()
+
+    # ACT
+    for _ in range(200):
+        with TimerThread(timeout=10, thread_id=current_thread_id):
+            pass
+
     # ASSERT
-    assert isinstance(timer.timer, threading.Timer)
-    assert timer.timer.interval == 3
+    assert threading.active_count() == threads_before
 
 
 # -------------------------------------------------------------
@@ -89,13 +110,11 @@ def test_timer_thread_context_manager_starts_timer(current_thread_id: int) -> No
     # ACT
     with timer:
         # ASSERT
-        assert timer.timer.is_alive()
+        assert not timer.handle.cancelled
+        assert not timer.handle.fired
 
-    # After exit, timer should be cancelled
-    # Note: cancel() is called but thread may still be alive briefly
-    # The important part is that cancel() was called, which prevents timeout_thread() execution
-    timer.timer.join(timeout=1)  # Wait for thread to finish
-    assert not timer.timer.is_alive()
+    # After exit, the deadline is cancelled and timeout_thread() never runs
+    assert timer.handle.cancelled
 
 
 def test_timer_thread_context_manager_cancels_timer_on_exit(current_thread_id: int) -> None:
@@ -108,8 +127,7 @@ def test_timer_thread_context_manager_cancels_timer_on_exit(current_thread_id: i
         pass
 
     # ASSERT
-    timer.timer.join(timeout=1)  # Wait for thread to finish after cancel
-    assert not timer.timer.is_alive()
+    assert timer.handle.cancelled
 
 
 def test_timer_thread_context_manager_cancels_timer_on_exception(current_thread_id: int) -> None:
@@ -124,9 +142,8 @@ def test_timer_thread_context_manager_cancels_timer_on_exception(current_thread_
     except ValueError:
         pass
 
-    # Timer should be cancelled despite exception
-    timer.timer.join(timeout=1)  # Wait for thread to finish after cancel
-    assert not timer.timer.is_alive()
+    # Deadline should be cancelled despite exception
+    assert timer.handle.cancelled
 
 
 def test_timer_thread_enter_returns_self(current_thread_id: int) -> None:
@@ -311,7 +328,7 @@ def test_timer_thread_with_zero_timeout(current_thread_id: int) -> None:
 
     # ASSERT
     assert timer.timeout == 0
-    assert timer.timer.interval == 0
+    assert timer.handle is None
 
 
 def test_timer_thread_with_negative_timeout(current_thread_id: int) -> None:
@@ -9,6 +9,7 @@
  Log:
  v1.0.0 : Initial implementation
  v1.0.1 : Update tests for new burst semantics
+ v1.1.0 : Add tests for sub-second pacing and the shared scheduler thread
 =============================================================================
 """
 
@@ -16,6 +17,7 @@
 # IMPORTS
 # =============================================================================
 import queue
+import threading
 import time
 import pytest
 from basefunctions.events.event import Event
@@ -299,3 +301,101 @@ class TestTickedRateLimiterTokenPhase:
 
         # Cleanup
         limiter.shutdown(flush=True)
+
+
+class TestTickedRateLimiterScheduler:
+    """Test sub-second pacing on the shared scheduler thread."""
+
+    def test_events_are_released_evenly_within_a_second(self):
+        """Test events are spaced 1/requests_per_second apart instead of per-second waves."""
+        # Arrange
+        target_queue = queue.PriorityQueue()
+        limiter = TickedRateLimiter(target_input_queue=target_queue)
+        limiter.register(event_type="test_event", requests_per_second=20, burst=0)
+        start = time.monotonic()
+
+        # Act
+        for i in range(5):
+            limiter.submit(event_type="test_event", priority=5, counter=i, event=Event(event_type="test_event"))
+        arrivals = []
+        for _ in range(5):
+            target_queue.get(timeout=2)
+            arrivals.append(time.monotonic() - start)
+
+        # Assert - 5 events at 20/s take ~0.25s, each at least ~50ms after the previous
+        assert arrivals[-1] < 0.6
+        gaps = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+        assert all(gap > 0.03 for gap in gaps)
+
+        # Cleanup
+        limiter.shutdown(flush=True)
+
+    def test_many_event_types_share_one_thread(self):
+        """Test registering many event types does not start a thread per type."""
+        # Arrange
+        target_queue = queue.PriorityQueue()
+        limiter = TickedRateLimiter(target_input_queue=target_queue)
+        threads_before = threading.active_count()
+
+        # Act
+        for i in range(40):
+            limiter.register(event_type=f"api_{i}", requests_per_second=50, burst=1)
+            limiter.submit(event_type=f"api_{i}", priority=5, counter=i, event=Event(event_type=f"api_{i}"))
+        limiter.wait_until_empty()
+
+        # Assert
+        assert threading.active_count() - threads_before <= 1
+        assert target_queue.qsize() == 40
+
+        # Cleanup
+        limiter.shutdown(flush=True)
+
+    def test_idle_tokens_are_capped_at_burst(self):
+        """Test an idle event type does not accumulate more than burst tokens."""
+        # Arrange
+        target_queue = queue.PriorityQueue()
+        limiter = TickedRateLimiter(target_input_queue=target_queue)
+        limiter.register(event_type="test_event", requests_per_second=100, burst=2)
+
+        # Act
+        time.sleep(0.1)
+        metrics = limiter.get_metrics(event_type="test_event")
+
+        # Assert
+        assert metrics["current_tokens"] == 2.0
+
+        # Cleanup
+        limiter.shutdown(flush=True)
+
+    def test_shutdown_flush_forwards_pending_events(self):
+        """Test shutdown(flush=True) forwards events still waiting for tokens."""
+        # Arrange
+        target_queue = queue.PriorityQueue()
+        limiter = TickedRateLimiter(target_input_queue=target_queue)
+        limiter.register(event_type="test_event", requests_per_second=1, burst=0)
+        for i in range(3):
+            limiter.submit(event_type="test_event", priority=5, counter=i, event=Event(event_type="test_event"))
+
+        # Act
+        limiter.shutdown(flush=True)
+
+        # Assert
+        assert target_queue.qsize() == 3
+        limiter.wait_until_empty()
+
+    def test_shutdown_drop_discards_pending_events(self):
+        """Test shutdown(flush=False) drops waiting events and releases wait_until_empty()."""
+        # Arrange
+        target_queue = queue.PriorityQueue()
+        limiter = TickedRateLimiter(target_input_queue=target_queue)
+        limiter.register(event_type="test_event", requests_per_second=1, burst=0)
+        for i in range(3):
+            limiter.submit(event_type="test_event", priority=5, counter=i, event=Event(event_type="test_event"))
+
+        # Act
+        dropped = limiter.shutdown(flush=False)
+
+        # Assert
+        assert target_queue.qsize() == 0
+        assert len(dropped) == 3
+        limiter.wait_until_empty()
@@ -58,7 +58,30 @@ def mock_event() -> Mock:
 
 
 @pytest.fixture
-def mock_event_bus() -> Mock:
+def mock_event_group() -> MagicMock:
+    """
+    Create mock EventGroup used as context manager.
+
+    Returns
+    -------
+    MagicMock
+        Mock EventGroup returning itself from __enter__
+
+    Notes
+    -----
+    Mocks the group methods needed by HttpClient.get_sync
+    """
+    # ARRANGE
+    event_group: MagicMock = MagicMock()
+    event_group.__enter__.return_value = event_group
+    event_group.get_results = Mock(return_value={})
+
+    # RETURN
+    return event_group
+
+
+@pytest.fixture
+def mock_event_bus(mock_event_group: MagicMock) -> Mock:
     """
     Create mock EventBus singleton.
 
@@ -76,6 +99,7 @@ def mock_event_bus() -> Mock:
     event_bus.publish = Mock()
     event_bus.join = Mock()
     event_bus.get_results = Mock(return_value={})
+    event_bus.group = Mock(return_value=mock_event_group)
 
     # RETURN
     return event_bus
@@ -257,7 +281,7 @@ def test_init_initializes_empty_pending_list() -> None:  # IMPORTANT TEST
 
 def test_get_sync_returns_data_when_successful(
     http_client_with_mocks: HttpClient,
-    mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_success: Mock,
     sample_url: str,
@@ -271,8 +295,8 @@ def test_get_sync_returns_data_when_successful(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_success : Mock
@@ -286,7 +310,7 @@ def test_get_sync_returns_data_when_successful(
         Test passes if correct data is returned
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_success}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_success}
 
     # ACT
     result: Any = http_client_with_mocks.get_sync(sample_url)
@@ -298,7 +322,7 @@ def test_get_sync_returns_data_when_successful(
 
 def test_get_sync_publishes_event_correctly(
     http_client_with_mocks: HttpClient,
-    mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_success: Mock,
     sample_url: str,
@@ -312,8 +336,8 @@ def test_get_sync_publishes_event_correctly(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_success : Mock
@@ -327,7 +351,7 @@ def test_get_sync_publishes_event_correctly(
         Test passes if event is published correctly
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_success}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_success}
 
     # ACT
     with patch("basefunctions.Event", return_value=mock_event) as mock_event_class:
@@ -341,17 +365,18 @@ def test_get_sync_publishes_event_correctly(
         assert call_kwargs["event_data"]["url"] == sample_url
 
 
-def test_get_sync_waits_for_event_with_join(
+def test_get_sync_waits_for_own_event_only(
     http_client_with_mocks: HttpClient,
     mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_success: Mock,
     sample_url: str,
 ) -> None:  # CRITICAL TEST
     """
-    Test get_sync calls join to wait for event completion.
+    Test get_sync waits for its event via an EventGroup instead of a global join.
 
-    Tests that get_sync synchronously waits for event processing.
+    Tests that get_sync synchronously waits for its own event only.
 
     Parameters
     ----------
@@ -359,6 +384,8 @@ def test_get_sync_waits_for_event_with_join(
         HttpClient with mocked dependencies
     mock_event_bus : Mock
         Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_success : Mock
@@ -369,20 +396,23 @@ def test_get_sync_waits_for_event_with_join(
     Returns
     -------
     None
-        Test passes if join is called
+        Test passes if the group is joined and the bus is not
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_success}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_success}
 
     # ACT
     http_client_with_mocks.get_sync(sample_url)
 
     # ASSERT
-    mock_event_bus.join.assert_called_once()
+    mock_event_group.publish.assert_called_once_with(mock_event)
+    mock_event_group.__exit__.assert_called_once()
+    mock_event_bus.join.assert_not_called()
+    mock_event_bus.get_results.assert_not_called()
 
 
 def test_get_sync_raises_runtime_error_when_no_response(
-    http_client_with_mocks: HttpClient, mock_event_bus: Mock, sample_url: str
+    http_client_with_mocks: HttpClient, mock_event_group: MagicMock, sample_url: str
 ) -> None:  # CRITICAL TEST
     """
     Test get_sync raises RuntimeError when no response received.
@@ -393,8 +423,8 @@ def test_get_sync_raises_runtime_error_when_no_response(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     sample_url : str
         Test URL
 
@@ -404,7 +434,7 @@ def test_get_sync_raises_runtime_error_when_no_response(
         Test passes if RuntimeError is raised
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {}
+    mock_event_group.get_results.return_value = {}
 
     # ACT & ASSERT
     with pytest.raises(RuntimeError, match="No response received for event"):
@@ -413,7 +443,7 @@ def test_get_sync_raises_runtime_error_when_no_response(
 
 def test_get_sync_raises_runtime_error_when_result_not_success(
     http_client_with_mocks: HttpClient,
-    mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_failure: Mock,
     sample_url: str,
@@ -427,8 +457,8 @@ def test_get_sync_raises_runtime_error_when_result_not_success(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_failure : Mock
@@ -442,7 +472,7 @@ def test_get_sync_raises_runtime_error_when_result_not_success(
         Test passes if RuntimeError is raised
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_failure}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_failure}
 
     # ACT & ASSERT
     with pytest.raises(RuntimeError, match="Connection timeout"):
@@ -450,7 +480,7 @@ def test_get_sync_raises_runtime_error_when_result_not_success(
 
 
 def test_get_sync_raises_runtime_error_with_data_message(
-    http_client_with_mocks: HttpClient, mock_event_bus: Mock, mock_event: Mock, sample_url: str
+    http_client_with_mocks: HttpClient, mock_event_group: MagicMock, mock_event: Mock, sample_url: str
 ) -> None:  # CRITICAL TEST
     """
     Test get_sync raises RuntimeError with data message when no exception.
@@ -461,8 +491,8 @@ def test_get_sync_raises_runtime_error_with_data_message(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     sample_url : str
@@ -479,7 +509,7 @@ def test_get_sync_raises_runtime_error_with_data_message(
     result.exception = None
     result.data = "Custom error message"
 
-    mock_event_bus.get_results.return_value = {mock_event.event_id: result}
+    mock_event_group.get_results.return_value = {mock_event.event_id: result}
 
     # ACT & ASSERT
     with pytest.raises(RuntimeError, match="Custom error message"):
@@ -487,7 +517,7 @@ def test_get_sync_raises_runtime_error_with_data_message(
 
 
 def test_get_sync_raises_runtime_error_with_default_message(
-    http_client_with_mocks: HttpClient, mock_event_bus: Mock, mock_event: Mock, sample_url: str
+    http_client_with_mocks: HttpClient, mock_event_group: MagicMock, mock_event: Mock, sample_url: str
 ) -> None:  # CRITICAL TEST
     """
     Test get_sync raises RuntimeError with default message.
@@ -498,8 +528,8 @@ def test_get_sync_raises_runtime_error_with_default_message(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     sample_url : str
@@ -516,7 +546,7 @@ def test_get_sync_raises_runtime_error_with_default_message(
     result.exception = None
     result.data = None
 
-    mock_event_bus.get_results.return_value = {mock_event.event_id: result}
+    mock_event_group.get_results.return_value = {mock_event.event_id: result}
 
     # ACT & ASSERT
     with pytest.raises(RuntimeError, match=f"HTTP request failed for URL: {sample_url}"):
@@ -525,7 +555,7 @@ def test_get_sync_raises_runtime_error_with_default_message(
 
 def test_get_sync_passes_kwargs_to_event_data(
     http_client_with_mocks: HttpClient,
-    mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_success: Mock,
     sample_url: str,
@@ -539,8 +569,8 @@ def test_get_sync_passes_kwargs_to_event_data(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_success : Mock
@@ -554,7 +584,7 @@ def test_get_sync_passes_kwargs_to_event_data(
         Test passes if kwargs are passed correctly
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_success}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_success}
 
     # ACT
     with patch("basefunctions.Event", return_value=mock_event) as mock_event_class:
@@ -1496,7 +1526,7 @@ def test_get_results_includes_event_status_in_metadata(
 )
 def test_get_sync_various_url_formats(
     http_client_with_mocks: HttpClient,
-    mock_event_bus: Mock,
+    mock_event_group: MagicMock,
     mock_event: Mock,
     mock_event_result_success: Mock,
     url: str,
@@ -1511,8 +1541,8 @@ def test_get_sync_various_url_formats(
     ----------
     http_client_with_mocks : HttpClient
         HttpClient with mocked dependencies
-    mock_event_bus : Mock
-        Mocked EventBus
+    mock_event_group : MagicMock
+        Mocked EventGroup
     mock_event : Mock
         Mocked Event
     mock_event_result_success : Mock
@@ -1528,7 +1558,7 @@ def test_get_sync_various_url_formats(
         Test passes if URL handling is correct
     """
     # ARRANGE
-    mock_event_bus.get_results.return_value = {mock_event.event_id: mock_event_result_success}
+    mock_event_group.get_results.return_value = {mock_event.event_id: mock_event_result_success}
 
     # ACT & ASSERT
     if expected_valid: